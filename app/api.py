@@ -3,13 +3,18 @@ FastAPI application factory
 """
 
 import asyncio
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.infrastructure.settings import get_settings
 from app.infrastructure.database.database import Database
-from app.infrastructure.logger import get_logger
-from app.routes.expense_routes import router as expense_router
+from app.infrastructure.cache.cache_factory import close_cache
+from app.infrastructure.logger import get_logger, shutdown_logging
+from app.infrastructure.metrics import CONTENT_TYPE, get_metrics_registry
+from app.infrastructure.metrics_middleware import MetricsMiddleware, track_route
+from app.infrastructure.password_hasher import shutdown_password_hasher
+from app.infrastructure.dependencies.container import get_container, reset_container
+from app.routes.expense_routes import router as expense_router, NEXT_CURSOR_HEADER
 from app.routes.group_routes import router as group_router
 from app.routes.user_private_routes import router as user_private_router
 from app.routes.user_public_routes import router as user_public_router
@@ -25,17 +30,28 @@ logger = get_logger(__name__)
 async def lifespan(app: FastAPI):
     """
     Manage application lifecycle.
-    Startup: Initialize database connection
-    Shutdown: Close database connection
+    Startup: Initialize database connection, build the dependency container
+    and start the background tasks (email outbox, token compaction)
+    Shutdown: Stop the background tasks, close database connection, release
+    shared dependencies and the cache, and flush logs
     """
     try:
         logger.info("Application startup - Initializing database connection")
         await Database.connect()
         logger.info("Application startup - Database connected successfully")
+        container = get_container()
+        container.email_dispatcher.start()
+        container.token_compactor.start()
         yield
+        await container.token_compactor.stop()
+        await container.email_dispatcher.stop()
         logger.info("Application shutdown - Disconnecting from database")
         await Database.disconnect()
+        reset_container()
+        await close_cache()
+        shutdown_password_hasher()
         logger.info("Application shutdown - Database disconnected successfully")
+        shutdown_logging()
     except asyncio.exceptions.CancelledError:  # pragma: no cover
         logger.warning("Application lifespan cancelled")
 
@@ -45,6 +61,7 @@ app = FastAPI(
     version=settings.app_version,
     debug=settings.debug,
     lifespan=lifespan,
+    dependencies=[Depends(track_route)],
 )
 
 app.add_middleware(
@@ -53,7 +70,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(expense_router, prefix=settings.api_v1_str)
 app.include_router(group_router, prefix=settings.api_v1_str)
@@ -73,3 +92,9 @@ async def root():
         "version": settings.app_version,
         "status": "running",
     }
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics endpoint"""
+    return Response(content=get_metrics_registry().render(), media_type=CONTENT_TYPE)
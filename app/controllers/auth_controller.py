@@ -48,10 +48,10 @@ class AuthController:
             Exception: If database operation fails
         """
         try:
-            logger.info(f"Login attempt for email: {login_data.email}")
+            logger.info("Login attempt for email: %s", login_data.email)
             return await self.login_use_case.execute(login_data)
         except Exception as e:
-            logger.error(f"Error logging in: {e}")
+            logger.error("Error logging in: %s", e)
             raise
 
     async def refresh_token(self, refresh_data: RefreshTokenRequest) -> TokenResponse:
@@ -73,5 +73,5 @@ class AuthController:
             logger.info("Refresh token attempt")
             return await self.refresh_token_use_case.execute(refresh_data.refresh_token)
         except Exception as e:
-            logger.error(f"Error refreshing token: {e}")
+            logger.error("Error refreshing token: %s", e)
             raise
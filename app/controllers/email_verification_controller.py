@@ -1,10 +1,12 @@
 """Email verification controller."""
 
+from typing import Optional
 from app.domain.interfaces.user_repository_interface import IUserRepository
 from app.domain.interfaces.email_verification_repository_interface import (
     IEmailVerificationRepository,
 )
 from app.domain.interfaces.email_service_interface import IEmailService
+from app.domain.interfaces.transaction_manager_interface import ITransactionManager
 from app.domain.dtos.email_verification_dtos import (
     VerifyEmailCodeInput,
     ResendVerificationEmailInput,
@@ -33,9 +35,10 @@ class EmailVerificationController:
         user_repository: IUserRepository,
         verification_repository: IEmailVerificationRepository,
         email_service: IEmailService,
+        transaction_manager: Optional[ITransactionManager] = None,
     ):
         self.verify_use_case = VerifyEmailCodeUseCase(
-            user_repository, verification_repository
+            user_repository, verification_repository, transaction_manager
         )
         self.resend_use_case = ResendVerificationEmailUseCase(
             user_repository, verification_repository, email_service
@@ -2,19 +2,48 @@
 Expense controller for handling HTTP coordination and delegating to use cases.
 """
 
-from typing import List, Dict, Optional
+from datetime import datetime
+from typing import AsyncIterator, List, Dict, Optional
+from bson import ObjectId
 from app.domain.interfaces.expense_repository_interface import IExpenseRepository
 from app.domain.interfaces.group_repository_interface import IGroupRepository
 from app.domain.interfaces.user_repository_interface import IUserRepository
-from app.models.expense_schema import ExpenseCreate, ExpenseUpdate, ExpenseResponse
+from app.domain.interfaces.membership_cache_interface import IMembershipCache
+from app.domain.interfaces.group_summary_repository_interface import (
+    IGroupSummaryRepository,
+)
+from app.models.expense_schema import (
+    ExpenseCreate,
+    ExpenseUpdate,
+    ExpenseBulkCreateResponse,
+    ExpenseBulkItemResult,
+    ExpenseResponse,
+    ExpensePageResponse,
+    ExpenseChangesResponse,
+    ExpenseAnalyticsResponse,
+    GroupSummaryResponse,
+)
+from app.domain.enums.analytics_group_by_enum import AnalyticsGroupBy
+from app.domain.enums.export_format_enum import ExportFormat
 from app.use_cases.expense.create_expense import CreateExpenseUseCase
+from app.use_cases.expense.create_expenses import CreateExpensesUseCase
 from app.use_cases.expense.get_all_expenses import GetAllExpensesUseCase
 from app.use_cases.expense.get_expense_by_id import GetExpenseByIdUseCase
+from app.use_cases.expense.get_expense_changes import GetExpenseChangesUseCase
+from app.use_cases.expense.export_expenses import ExportExpensesUseCase
 from app.use_cases.expense.update_expense import UpdateExpenseUseCase
 from app.use_cases.expense.delete_expense import DeleteExpenseUseCase
 from app.use_cases.expense.get_amounts_and_types import GetAmountsAndTypesUseCase
+from app.use_cases.expense.get_expense_analytics import GetExpenseAnalyticsUseCase
+from app.use_cases.expense.get_group_summary import GetGroupSummaryUseCase
 from app.infrastructure.logger import get_logger
-from app.domain.dtos.expense_dtos import GetAllExpensesInput, UpdateExpenseInput
+from app.domain.dtos.expense_dtos import (
+    GetAllExpensesInput,
+    GetExpenseChangesInput,
+    ExportExpensesInput,
+    UpdateExpenseInput,
+    GetExpenseAnalyticsInput,
+)
 
 logger = get_logger(__name__)
 
@@ -31,95 +60,331 @@ class ExpenseController:
         repository: IExpenseRepository,
         group_repository: IGroupRepository,
         user_repository: IUserRepository,
+        membership_cache: Optional[IMembershipCache] = None,
+        summary_repository: Optional[IGroupSummaryRepository] = None,
     ):
         logger.info("Initializing ExpenseController")
         self.repository = repository
         self.group_repository = group_repository
         self.user_repository = user_repository
-        self.create_expense_use_case = CreateExpenseUseCase(repository)
+        self.membership_cache = membership_cache
+        self.create_expense_use_case = CreateExpenseUseCase(
+            repository, summary_repository
+        )
+        self.create_expenses_use_case = CreateExpensesUseCase(
+            repository, summary_repository
+        )
         self.get_all_expenses_use_case = GetAllExpensesUseCase(repository)
         self.get_expense_by_id_use_case = GetExpenseByIdUseCase(repository)
-        self.update_expense_use_case = UpdateExpenseUseCase(repository)
+        self.get_expense_changes_use_case = GetExpenseChangesUseCase(repository)
+        self.export_expenses_use_case = ExportExpensesUseCase(repository)
+        self.update_expense_use_case = UpdateExpenseUseCase(
+            repository, summary_repository
+        )
         self.delete_expense_use_case = DeleteExpenseUseCase(repository)
         self.get_amounts_and_types_use_case = GetAmountsAndTypesUseCase(repository)
+        self.get_expense_analytics_use_case = GetExpenseAnalyticsUseCase(repository)
+        self.get_group_summary_use_case = GetGroupSummaryUseCase(summary_repository)
         logger.info("ExpenseController initialized successfully")
 
-    async def _require_group_membership(self, group_id: str, user_email: str) -> None:
-        """Raise PermissionError if the user is not a member of the group."""
-        user = await self.user_repository.get_by_email(user_email)
-        if user is None:
+    async def _require_group_membership(
+        self, group_id: str, user_email: str, user_id: Optional[str] = None
+    ) -> None:
+        """
+        Raise PermissionError if the user is not an active member of the group.
+        """
+        user_id = await self._require_active_user(user_email, user_id)
+        await self._require_member(group_id, user_id)
+
+    async def _require_active_user(
+        self, user_email: str, user_id: Optional[str] = None
+    ) -> str:
+        """
+        Return the ID of the requesting user, raising PermissionError if the
+        account is gone or deactivated.
+
+        The user is identified by the token's user_id when present (falling back
+        to an email lookup for tokens without it). A user found active is
+        remembered in the membership cache, so a warm check needs no database
+        call; deactivating the user invalidates the entry, so the account loses
+        access at once even though its token is still valid. Otherwise only
+        is_active is fetched.
+        """
+        if user_id is None:
+            user = await self.user_repository.get_by_email(user_email)
+            if user is None:
+                raise PermissionError("You are not a member of this group")
+            return user.id
+
+        if self.membership_cache is not None and self.membership_cache.is_active(
+            user_id
+        ):
+            return user_id
+        user = await self.user_repository.get_fields(user_id, ["is_active"])
+        if user is None or not user.get("is_active"):
             raise PermissionError("You are not a member of this group")
-        group = await self.group_repository.get_by_id(group_id)
-        if group is None or user.id not in group.user_ids:
+        if self.membership_cache is not None:
+            self.membership_cache.set_active(user_id)
+        return user_id
+
+    async def _require_member(self, group_id: str, user_id: str) -> None:
+        """
+        Raise PermissionError if the already verified user is not a member of
+        the group.
+
+        The group's members come from the membership cache, so a warm check
+        needs no database call and a cold one fetches only the group's user_ids.
+        """
+        members = self.membership_cache.get(group_id) if self.membership_cache else None
+        if members is None:
+            group = await self.group_repository.get_fields(group_id, ["user_ids"])
+            if group is None:
+                raise PermissionError("You are not a member of this group")
+            members = frozenset(group.get("user_ids", ()))
+            if self.membership_cache is not None:
+                self.membership_cache.set(group_id, members)
+
+        if user_id not in members:
             raise PermissionError("You are not a member of this group")
 
-    async def create_expense(self, expense_data: ExpenseCreate, user_email: str) -> ExpenseResponse:
-        logger.info(f"Controller: Creating expense for group {expense_data.group_id}")
-        await self._require_group_membership(expense_data.group_id, user_email)
+    async def create_expense(
+        self, expense_data: ExpenseCreate, user_email: str, user_id: Optional[str] = None
+    ) -> ExpenseResponse:
+        logger.info("Controller: Creating expense for group %s", expense_data.group_id)
+        await self._require_group_membership(expense_data.group_id, user_email, user_id)
         result = await self.create_expense_use_case.execute(expense_data)
-        logger.info(f"Controller: Expense created with ID {result.id}")
+        logger.info("Controller: Expense created with ID %s", result.id)
         return result
 
+    async def create_expenses(
+        self,
+        expenses_data: List[ExpenseCreate],
+        user_email: str,
+        user_id: Optional[str] = None,
+    ) -> ExpenseBulkCreateResponse:
+        """
+        Create many expenses, checking the user once and membership once per
+        distinct group. Items of malformed groups or of groups the user is not
+        a member of are reported as failed; the others are written in one batch.
+        """
+        logger.info("Controller: Creating %s expenses in bulk", len(expenses_data))
+        try:
+            user_id = await self._require_active_user(user_email, user_id)
+        except PermissionError:
+            user_id = None
+
+        rejected: Dict[str, str] = {}
+        for group_id in dict.fromkeys(item.group_id for item in expenses_data):
+            if not ObjectId.is_valid(group_id):
+                rejected[group_id] = "Invalid group ID"
+                continue
+            try:
+                if user_id is None:
+                    raise PermissionError("You are not a member of this group")
+                await self._require_member(group_id, user_id)
+            except PermissionError as pe:
+                rejected[group_id] = str(pe)
+
+        accepted = [
+            index
+            for index, item in enumerate(expenses_data)
+            if item.group_id not in rejected
+        ]
+        created = await self.create_expenses_use_case.execute(
+            [expenses_data[index] for index in accepted]
+        )
+
+        results = [
+            ExpenseBulkItemResult(index=index, error=rejected.get(item.group_id))
+            for index, item in enumerate(expenses_data)
+        ]
+        for result in created:
+            results[accepted[result.index]] = result.model_copy(
+                update={"index": accepted[result.index]}
+            )
+
+        failed = sum(1 for result in results if result.error is not None)
+        logger.info(
+            "Controller: Bulk create finished with %s created and %s failed",
+            len(results) - failed,
+            failed,
+        )
+        return ExpenseBulkCreateResponse(
+            created=len(results) - failed, failed=failed, results=results
+        )
+
     async def get_all_expenses(
-        self, group_id: str, user_email: str, skip: int = 0, limit: int = 100
-    ) -> List[ExpenseResponse]:
+        self,
+        group_id: str,
+        user_email: str,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> ExpensePageResponse:
         logger.info(
-            f"Controller: Fetching all expenses for group {group_id} (skip={skip}, limit={limit})"
+            "Controller: Fetching all expenses for group %s (skip=%s, limit=%s, cursor=%s)",
+            group_id,
+            skip,
+            limit,
+            cursor,
+        )
+        await self._require_group_membership(group_id, user_email, user_id)
+        input_data = GetAllExpensesInput(
+            group_id=group_id, skip=skip, limit=limit, cursor=cursor
         )
-        await self._require_group_membership(group_id, user_email)
-        input_data = GetAllExpensesInput(group_id=group_id, skip=skip, limit=limit)
         result = await self.get_all_expenses_use_case.execute(input_data)
         logger.info(
-            f"Controller: Retrieved {len(result)} expenses for group {group_id}"
+            "Controller: Retrieved %s expenses for group %s",
+            len(result.items),
+            group_id,
         )
         return result
 
-    async def get_expense_by_id(self, expense_id: str, user_email: str) -> Optional[ExpenseResponse]:
-        logger.info(f"Controller: Fetching expense with ID {expense_id}")
+    async def get_expense_changes(
+        self,
+        group_id: str,
+        user_email: str,
+        since: Optional[str] = None,
+        limit: int = 100,
+        user_id: Optional[str] = None,
+    ) -> ExpenseChangesResponse:
+        logger.info(
+            "Controller: Fetching expense changes for group %s (since=%s)",
+            group_id,
+            since,
+        )
+        await self._require_group_membership(group_id, user_email, user_id)
+        input_data = GetExpenseChangesInput(group_id=group_id, since=since, limit=limit)
+        result = await self.get_expense_changes_use_case.execute(input_data)
+        logger.info(
+            "Controller: Retrieved %s expense changes for group %s",
+            len(result.items),
+            group_id,
+        )
+        return result
+
+    async def export_expenses(
+        self,
+        group_id: str,
+        user_email: str,
+        export_format: ExportFormat = ExportFormat.NDJSON,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        user_id: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        logger.info(
+            "Controller: Exporting expenses of group %s as %s", group_id, export_format
+        )
+        # Checked once, before the response starts streaming, so a refusal
+        # can still be reported with its own status code.
+        await self._require_group_membership(group_id, user_email, user_id)
+        input_data = ExportExpensesInput(
+            group_id=group_id,
+            export_format=export_format,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return await self.export_expenses_use_case.execute(input_data)
+
+    async def get_expense_by_id(
+        self, expense_id: str, user_email: str, user_id: Optional[str] = None
+    ) -> Optional[ExpenseResponse]:
+        logger.info("Controller: Fetching expense with ID %s", expense_id)
         expense = await self.get_expense_by_id_use_case.execute(expense_id)
         if expense is None:
-            logger.warning(f"Controller: Expense not found with ID {expense_id}")
+            logger.warning("Controller: Expense not found with ID %s", expense_id)
             return None
-        await self._require_group_membership(expense.group_id, user_email)
-        logger.info(f"Controller: Expense found with ID {expense_id}")
+        await self._require_group_membership(expense.group_id, user_email, user_id)
+        logger.info("Controller: Expense found with ID %s", expense_id)
         return expense
 
     async def update_expense(
-        self, expense_id: str, expense_data: ExpenseUpdate, user_email: str
+        self,
+        expense_id: str,
+        expense_data: ExpenseUpdate,
+        user_email: str,
+        user_id: Optional[str] = None,
     ) -> Optional[ExpenseResponse]:
-        logger.info(f"Controller: Updating expense with ID {expense_id}")
+        logger.info("Controller: Updating expense with ID %s", expense_id)
         existing = await self.get_expense_by_id_use_case.execute(expense_id)
         if existing is None:
-            logger.warning(f"Controller: Expense not found for update with ID {expense_id}")
+            logger.warning(
+                "Controller: Expense not found for update with ID %s", expense_id
+            )
             return None
-        await self._require_group_membership(existing.group_id, user_email)
+        await self._require_group_membership(existing.group_id, user_email, user_id)
         input_data = UpdateExpenseInput(expense_id=expense_id, expense_data=expense_data)
         result = await self.update_expense_use_case.execute(input_data)
         if result:
-            logger.info(f"Controller: Expense updated successfully with ID {expense_id}")
+            logger.info(
+                "Controller: Expense updated successfully with ID %s", expense_id
+            )
         return result
 
-    async def delete_expense(self, expense_id: str, user_email: str) -> bool:
-        logger.info(f"Controller: Deleting expense with ID {expense_id}")
+    async def delete_expense(
+        self, expense_id: str, user_email: str, user_id: Optional[str] = None
+    ) -> bool:
+        logger.info("Controller: Deleting expense with ID %s", expense_id)
         existing = await self.get_expense_by_id_use_case.execute(expense_id)
         if existing is None:
-            logger.warning(f"Controller: Expense not found for deletion with ID {expense_id}")
+            logger.warning(
+                "Controller: Expense not found for deletion with ID %s", expense_id
+            )
             return False
-        await self._require_group_membership(existing.group_id, user_email)
+        await self._require_group_membership(existing.group_id, user_email, user_id)
         result = await self.delete_expense_use_case.execute(expense_id)
         if result:
-            logger.info(f"Controller: Expense deleted successfully with ID {expense_id}")
+            logger.info(
+                "Controller: Expense deleted successfully with ID %s", expense_id
+            )
         return result
 
-    async def get_amounts_and_types(self, group_id: str, user_email: str) -> List[Dict[str, any]]:
-        logger.info(f"Controller: Fetching amounts and types for group {group_id}")
-        await self._require_group_membership(group_id, user_email)
+    async def get_amounts_and_types(
+        self, group_id: str, user_email: str, user_id: Optional[str] = None
+    ) -> List[Dict[str, any]]:
+        logger.info("Controller: Fetching amounts and types for group %s", group_id)
+        await self._require_group_membership(group_id, user_email, user_id)
         result = await self.get_amounts_and_types_use_case.execute(group_id)
         logger.info(
-            f"Controller: Retrieved amounts and types for {len(result)} expenses in group {group_id}"
+            "Controller: Retrieved amounts and types for %s expenses in group %s",
+            len(result),
+            group_id,
         )
         return result
 
+    async def get_expense_analytics(
+        self,
+        group_id: str,
+        user_email: str,
+        group_by: AnalyticsGroupBy = AnalyticsGroupBy.TYPE_EXPENSE,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        user_id: Optional[str] = None,
+    ) -> ExpenseAnalyticsResponse:
+        logger.info(
+            "Controller: Fetching %s analytics for group %s", group_by, group_id
+        )
+        await self._require_group_membership(group_id, user_email, user_id)
+        input_data = GetExpenseAnalyticsInput(
+            group_id=group_id,
+            group_by=group_by,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        result = await self.get_expense_analytics_use_case.execute(input_data)
+        logger.info(
+            "Controller: Retrieved %s analytics buckets for group %s",
+            len(result.buckets),
+            group_id,
+        )
+        return result
 
-
-
+    async def get_group_summary(
+        self, group_id: str, user_email: str, user_id: Optional[str] = None
+    ) -> GroupSummaryResponse:
+        logger.info("Controller: Fetching summary for group %s", group_id)
+        await self._require_group_membership(group_id, user_email, user_id)
+        result = await self.get_group_summary_use_case.execute(group_id)
+        logger.info("Controller: Retrieved summary for group %s", group_id)
+        return result
@@ -3,15 +3,22 @@
 from typing import List, Optional
 from app.domain.interfaces.group_repository_interface import IGroupRepository
 from app.domain.interfaces.user_repository_interface import IUserRepository
+from app.domain.interfaces.membership_cache_interface import IMembershipCache
 from app.domain.entities.group_entity import Group
 from app.models.group_schema import GroupCreate, GroupUpdate, GroupResponse, GroupMemberResponse
-from app.domain.dtos.group_dtos import UpdateGroupInput, AddUserToGroupInput, RemoveUserFromGroupInput
+from app.domain.dtos.group_dtos import (
+    UpdateGroupInput,
+    AddUserToGroupInput,
+    AddUsersToGroupInput,
+    RemoveUserFromGroupInput,
+)
 from app.use_cases.group.create_group import CreateGroupUseCase
 from app.use_cases.group.get_all_groups import GetAllGroupsUseCase
 from app.use_cases.group.get_group_by_id import GetGroupByIdUseCase
 from app.use_cases.group.update_group import UpdateGroupUseCase
 from app.use_cases.group.delete_group import DeleteGroupUseCase
 from app.use_cases.group.add_user_to_group import AddUserToGroupUseCase
+from app.use_cases.group.add_users_to_group import AddUsersToGroupUseCase
 from app.use_cases.group.remove_user_from_group import RemoveUserFromGroupUseCase
 from app.use_cases.group.get_groups_by_user_id import GetGroupsByUserIdUseCase
 from app.infrastructure.logger import get_logger
@@ -26,31 +33,56 @@ class GroupController:
         self,
         group_repository: IGroupRepository,
         user_repository: IUserRepository,
+        membership_cache: Optional[IMembershipCache] = None,
     ):
         self.user_repository = user_repository
         self.create_group_use_case = CreateGroupUseCase(group_repository)
         self.get_all_groups_use_case = GetAllGroupsUseCase(group_repository)
         self.get_group_by_id_use_case = GetGroupByIdUseCase(group_repository)
         self.update_group_use_case = UpdateGroupUseCase(group_repository)
-        self.delete_group_use_case = DeleteGroupUseCase(group_repository)
-        self.add_user_to_group_use_case = AddUserToGroupUseCase(group_repository)
-        self.remove_user_from_group_use_case = RemoveUserFromGroupUseCase(group_repository)
+        self.delete_group_use_case = DeleteGroupUseCase(
+            group_repository, membership_cache
+        )
+        self.add_user_to_group_use_case = AddUserToGroupUseCase(
+            group_repository, membership_cache
+        )
+        self.add_users_to_group_use_case = AddUsersToGroupUseCase(
+            group_repository, membership_cache
+        )
+        self.remove_user_from_group_use_case = RemoveUserFromGroupUseCase(
+            group_repository, membership_cache
+        )
         self.get_groups_by_user_id_use_case = GetGroupsByUserIdUseCase(group_repository)
 
+    async def _build_responses(self, groups: List[Group]) -> List[GroupResponse]:
+        """
+        Build GroupResponses with populated user objects from user_ids.
+        Members of all groups are fetched together in a single query.
+        """
+        member_ids = list(
+            dict.fromkeys(user_id for group in groups for user_id in group.user_ids)
+        )
+        names = (
+            await self.user_repository.get_many_by_ids(member_ids) if member_ids else {}
+        )
+        return [
+            GroupResponse(
+                id=group.id,
+                group_name=group.group_name,
+                users=[
+                    GroupMemberResponse(id=user_id, name=names[user_id])
+                    for user_id in group.user_ids
+                    if user_id in names
+                ],
+                created_at=group.created_at,
+                updated_at=group.updated_at,
+            )
+            for group in groups
+        ]
+
     async def _build_response(self, group: Group) -> GroupResponse:
         """Build GroupResponse with populated user objects from user_ids."""
-        users = []
-        for user_id in group.user_ids:
-            user = await self.user_repository.get_by_id(user_id)
-            if user:
-                users.append(GroupMemberResponse(id=user.id, name=user.name))
-        return GroupResponse(
-            id=group.id,
-            group_name=group.group_name,
-            users=users,
-            created_at=group.created_at,
-            updated_at=group.updated_at,
-        )
+        return (await self._build_responses([group]))[0]
 
     async def _require_membership(self, group: Group, user_email: str) -> None:
         """Raise PermissionError if the user is not a member of the group."""
@@ -69,7 +101,7 @@ class GroupController:
     ) -> List[GroupResponse]:
         """Return all groups."""
         groups = await self.get_all_groups_use_case.execute(skip=skip, limit=limit)
-        return [await self._build_response(g) for g in groups]
+        return await self._build_responses(groups)
 
     async def get_group_by_id(self, group_id: str, user_email: str) -> Optional[GroupResponse]:
         group = await self.get_group_by_id_use_case.execute(group_id)
@@ -106,7 +138,7 @@ class GroupController:
         if user is None:
             return []
         groups = await self.get_groups_by_user_id_use_case.execute(user.id)
-        return [await self._build_response(g) for g in groups]
+        return await self._build_responses(groups)
 
     async def add_user_to_group(
         self, group_id: str, user_id: str, requester_email: str
@@ -122,6 +154,20 @@ class GroupController:
             return None
         return await self._build_response(updated)
 
+    async def add_users_to_group(
+        self, group_id: str, user_ids: List[str], requester_email: str
+    ) -> Optional[GroupResponse]:
+        group = await self.get_group_by_id_use_case.execute(group_id)
+        if group is None:
+            return None
+        await self._require_membership(group, requester_email)
+        updated = await self.add_users_to_group_use_case.execute(
+            AddUsersToGroupInput(group_id=group_id, user_ids=user_ids)
+        )
+        if updated is None:
+            return None
+        return await self._build_response(updated)
+
     async def remove_user_from_group(
         self, group_id: str, user_id: str, requester_email: str
     ) -> Optional[GroupResponse]:
@@ -4,6 +4,7 @@ User controller for handling HTTP coordination and delegating to use cases.
 
 from typing import List, Optional
 from app.domain.interfaces.user_repository_interface import IUserRepository
+from app.domain.interfaces.membership_cache_interface import IMembershipCache
 from app.domain.interfaces.email_verification_repository_interface import (
     IEmailVerificationRepository,
 )
@@ -42,6 +43,7 @@ class UserController:
         repository: IUserRepository,
         verification_repository: IEmailVerificationRepository,
         email_service: IEmailService,
+        membership_cache: Optional[IMembershipCache] = None,
     ):
         """
         Initialize the controller with repository and email service dependencies.
@@ -51,6 +53,7 @@ class UserController:
             repository: Implementation of IUserRepository
             verification_repository: Implementation of IEmailVerificationRepository
             email_service: Implementation of IEmailService
+            membership_cache: Cache remembering active users, invalidated on delete
         """
         logger.info("Initializing UserController")
         self.repository = repository
@@ -62,7 +65,7 @@ class UserController:
         self.get_all_users_use_case = GetAllUsersUseCase(repository)
         self.get_user_by_email_use_case = GetUserByEmailUseCase(repository)
         self.update_user_use_case = UpdateUserUseCase(repository)
-        self.delete_user_use_case = DeleteUserUseCase(repository)
+        self.delete_user_use_case = DeleteUserUseCase(repository, membership_cache)
         logger.info("UserController initialized successfully")
 
     async def register_user(self, user_data: UserCreate) -> UserRegisterResponse:
@@ -81,7 +84,7 @@ class UserController:
             Exception: If database operation fails
         """
         try:
-            logger.info(f"Registering new user with email: {user_data.email}")
+            logger.info("Registering new user with email: %s", user_data.email)
             created = await self.create_user_use_case.execute(user_data)
             verification_token = await self.send_verification_use_case.execute(
                 SendVerificationEmailInput(
@@ -97,7 +100,7 @@ class UserController:
                 verification_token=verification_token,
             )
         except Exception as e:
-            logger.error(f"Error registering user: {e}")
+            logger.error("Error registering user: %s", e)
             raise
 
     async def get_user(self, user_id: str) -> Optional[UserResponse]:
@@ -112,10 +115,10 @@ class UserController:
             UserResponse if found, None otherwise
         """
         try:
-            logger.info(f"Getting user with ID: {user_id}")
+            logger.info("Getting user with ID: %s", user_id)
             return await self.get_user_by_id_use_case.execute(user_id)
         except Exception as e:
-            logger.error(f"Error getting user: {e}")
+            logger.error("Error getting user: %s", e)
             raise
 
     async def get_user_by_email(self, email: str) -> Optional[UserResponse]:
@@ -130,11 +133,11 @@ class UserController:
             UserResponse if found, None otherwise
         """
         try:
-            logger.info(f"Getting user with email: {email}")
+            logger.info("Getting user with email: %s", email)
             input_data = GetUserByEmailInput(email=email)
             return await self.get_user_by_email_use_case.execute(input_data)
         except Exception as e:
-            logger.error(f"Error getting user by email: {e}")
+            logger.error("Error getting user by email: %s", e)
             raise
 
     async def get_all_users(
@@ -152,11 +155,11 @@ class UserController:
             List of UserResponse objects
         """
         try:
-            logger.info(f"Getting all users with skip: {skip}, limit: {limit}")
+            logger.info("Getting all users with skip: %s, limit: %s", skip, limit)
             input_data = GetAllUsersInput(skip=skip, limit=limit)
             return await self.get_all_users_use_case.execute(input_data)
         except Exception as e:
-            logger.error(f"Error getting all users: {e}")
+            logger.error("Error getting all users: %s", e)
             raise
 
     async def update_user(
@@ -177,11 +180,11 @@ class UserController:
             ValueError: If new email already exists
         """
         try:
-            logger.info(f"Updating user with ID: {user_id}")
+            logger.info("Updating user with ID: %s", user_id)
             input_data = UpdateUserInput(user_id=user_id, user_data=user_data)
             return await self.update_user_use_case.execute(input_data)
         except Exception as e:
-            logger.error(f"Error updating user: {e}")
+            logger.error("Error updating user: %s", e)
             raise
 
     async def delete_user(self, user_id: str) -> bool:
@@ -196,8 +199,8 @@ class UserController:
             True if user was deleted, False otherwise
         """
         try:
-            logger.info(f"Deleting user with ID: {user_id}")
+            logger.info("Deleting user with ID: %s", user_id)
             return await self.delete_user_use_case.execute(user_id)
         except Exception as e:
-            logger.error(f"Error deleting user: {e}")
+            logger.error("Error deleting user: %s", e)
             raise
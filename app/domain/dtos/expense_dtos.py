@@ -1,6 +1,9 @@
 """Data Transfer Objects for Expense use cases."""
 
-from typing import NamedTuple
+from datetime import datetime
+from typing import NamedTuple, Optional
+from app.domain.enums.analytics_group_by_enum import AnalyticsGroupBy
+from app.domain.enums.export_format_enum import ExportFormat
 from app.models.expense_schema import ExpenseUpdate
 
 
@@ -10,6 +13,15 @@ class GetAllExpensesInput(NamedTuple):
     group_id: str
     skip: int = 0
     limit: int = 100
+    cursor: Optional[str] = None
+
+
+class GetExpenseChangesInput(NamedTuple):
+    """Input data for GetExpenseChangesUseCase."""
+
+    group_id: str
+    since: Optional[str] = None
+    limit: int = 100
 
 
 class UpdateExpenseInput(NamedTuple):
@@ -17,3 +29,21 @@ class UpdateExpenseInput(NamedTuple):
 
     expense_id: str
     expense_data: ExpenseUpdate
+
+
+class GetExpenseAnalyticsInput(NamedTuple):
+    """Input data for GetExpenseAnalyticsUseCase."""
+
+    group_id: str
+    group_by: AnalyticsGroupBy = AnalyticsGroupBy.TYPE_EXPENSE
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+
+
+class ExportExpensesInput(NamedTuple):
+    """Input data for ExportExpensesUseCase."""
+
+    group_id: str
+    export_format: ExportFormat = ExportFormat.NDJSON
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
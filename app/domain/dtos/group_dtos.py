@@ -1,6 +1,6 @@
 """DTOs for group use case inputs."""
 
-from typing import NamedTuple
+from typing import List, NamedTuple
 from app.models.group_schema import GroupUpdate
 
 
@@ -14,6 +14,11 @@ class AddUserToGroupInput(NamedTuple):
     user_id: str
 
 
+class AddUsersToGroupInput(NamedTuple):
+    group_id: str
+    user_ids: List[str]
+
+
 class RemoveUserFromGroupInput(NamedTuple):
     group_id: str
     user_id: str
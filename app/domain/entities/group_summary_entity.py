@@ -0,0 +1,37 @@
+"""
+Group summary entity holding incrementally maintained spending totals.
+"""
+
+from datetime import datetime
+from typing import Dict, Optional
+from pydantic import BaseModel, Field
+
+
+class SummaryTotals(BaseModel):
+    """Total amount and number of expenses of one summary bucket."""
+
+    total_cents: int = Field(0, description="Sum of amounts in cents")
+    count: int = Field(0, description="Number of expenses")
+
+
+class GroupSummary(BaseModel):
+    """
+    Spending totals of a group's active expenses.
+
+    Attributes:
+        group_id: ID of the expense group
+        total_cents: Sum of all active expense amounts in cents
+        count: Number of active expenses
+        by_category: Totals per expense category
+        by_type: Totals per payment method type
+        by_month: Totals per calendar month of the expense date (YYYY-MM, UTC)
+        updated_at: Timestamp of the last change applied to the summary
+    """
+
+    group_id: str = Field(..., min_length=1, description="ID of the expense group")
+    total_cents: int = Field(0, description="Sum of amounts in cents")
+    count: int = Field(0, description="Number of expenses")
+    by_category: Dict[str, SummaryTotals] = Field(default_factory=dict)
+    by_type: Dict[str, SummaryTotals] = Field(default_factory=dict)
+    by_month: Dict[str, SummaryTotals] = Field(default_factory=dict)
+    updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
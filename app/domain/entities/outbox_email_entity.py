@@ -0,0 +1,61 @@
+"""
+Outbox email entity.
+"""
+
+from datetime import datetime, timezone
+from typing import Optional
+from pydantic import Field
+from app.domain.entities.base_entity import BaseEntity
+from app.domain.enums.outbox_status_enum import OutboxStatus
+
+
+class OutboxEmail(BaseEntity):
+    """
+    Entity representing an email waiting in the outbox to be delivered.
+
+    Attributes:
+        to_email: Recipient email address
+        subject: Email subject
+        html: Rendered HTML body, verification code included in plain text
+              (cleared once dead-lettered)
+        status: Pending until delivered, dead once given up on
+        attempts: Number of delivery attempts started
+        next_attempt_at: When the email may next be claimed for delivery
+        expires_at: After this instant the email is pointless and not sent
+        last_error: Error of the latest failed attempt
+    """
+
+    to_email: str = Field(..., description="Recipient email address")
+    subject: str = Field(..., description="Email subject")
+    html: str = Field(..., description="Rendered HTML body")
+    status: OutboxStatus = Field(OutboxStatus.PENDING, description="Delivery state")
+    attempts: int = Field(0, description="Number of delivery attempts started")
+    next_attempt_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="When the email may next be claimed for delivery",
+    )
+    expires_at: Optional[datetime] = Field(
+        None, description="After this instant the email is no longer sent"
+    )
+    last_error: Optional[str] = Field(
+        None, description="Error of the latest failed attempt"
+    )
+
+    class Config:
+        populate_by_name = True
+        use_enum_values = True
+        json_schema_extra = {
+            "example": {
+                "id": "507f1f77bcf86cd799439011",
+                "to_email": "john@example.com",
+                "subject": "Finito — Verifique seu endereço de e-mail",
+                "html": "<div>...</div>",
+                "status": "pending",
+                "attempts": 0,
+                "next_attempt_at": "2026-04-23T12:00:00Z",
+                "expires_at": "2026-04-23T12:15:00Z",
+                "last_error": None,
+                "created_at": "2026-04-23T12:00:00Z",
+                "updated_at": "2026-04-23T12:00:00Z",
+            }
+        }
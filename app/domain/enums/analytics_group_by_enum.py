@@ -0,0 +1,23 @@
+"""
+Grouping dimensions for expense analytics.
+"""
+
+from enum import Enum
+
+
+class AnalyticsGroupBy(str, Enum):
+    """
+    Enum for the dimension expense analytics are grouped by.
+    Either an expense field or a calendar bucket of the expense date (UTC).
+    """
+
+    TYPE_EXPENSE = "type_expense"
+    CATEGORY = "category"
+    SPENT_BY = "spent_by"
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+    def __str__(self) -> str:
+        """Return the string value of the enum."""
+        return self.value
@@ -0,0 +1,19 @@
+"""
+File formats for exporting expenses.
+"""
+
+from enum import Enum
+
+
+class ExportFormat(str, Enum):
+    """
+    Enum for the format of an expense export.
+    NDJSON writes one JSON object per line; CSV starts with a header row.
+    """
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    def __str__(self) -> str:
+        """Return the string value of the enum."""
+        return self.value
@@ -0,0 +1,19 @@
+"""
+Delivery states of an email in the outbox.
+"""
+
+from enum import Enum
+
+
+class OutboxStatus(str, Enum):
+    """
+    Enum for the state of an outbox email.
+    Pending emails are retried until sent (then removed) or dead-lettered.
+    """
+
+    PENDING = "pending"
+    DEAD = "dead"
+
+    def __str__(self) -> str:
+        """Return the string value of the enum."""
+        return self.value
@@ -0,0 +1,63 @@
+"""
+Interface for the key-value cache in front of the repositories.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class ICache(ABC):
+    """
+    Contract for a cache of serialized values.
+    Keys live in namespaces (one per kind of cached object) so equal keys of
+    different kinds never collide.
+    """
+
+    @abstractmethod
+    async def get(self, namespace: str, key: str) -> Optional[str]:
+        """
+        Get a cached value.
+
+        Args:
+            namespace: Kind of cached object (e.g. "users")
+            key: Key within the namespace
+
+        Returns:
+            The value if cached and not expired, None otherwise
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def set(
+        self,
+        namespace: str,
+        key: str,
+        value: str,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        """
+        Cache a value.
+
+        Args:
+            namespace: Kind of cached object
+            key: Key within the namespace
+            value: Serialized value
+            ttl_seconds: How long the entry stays valid (the cache default if None)
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def delete(self, namespace: str, *keys: str) -> None:
+        """
+        Drop cached values after the objects they hold changed.
+
+        Args:
+            namespace: Kind of cached object
+            keys: Keys within the namespace
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release the resources of the cache. Called on application shutdown."""
+        pass  # pragma: no cover
@@ -0,0 +1,78 @@
+"""
+Email outbox repository interface.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+from app.domain.entities.outbox_email_entity import OutboxEmail
+
+
+class IEmailOutboxRepository(ABC):
+    """Contract for the durable queue of emails waiting to be delivered."""
+
+    @abstractmethod
+    async def enqueue(self, email: OutboxEmail) -> OutboxEmail:
+        """
+        Durably store an email for delivery.
+
+        Args:
+            email: Email to deliver
+
+        Returns:
+            The stored email with its ID
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def claim_next(
+        self, now: datetime, lease_seconds: float
+    ) -> Optional[OutboxEmail]:
+        """
+        Atomically claim the pending email due the longest, counting the attempt.
+        The claim is a lease: if it is neither completed nor retried within
+        `lease_seconds`, the email becomes due again.
+
+        Args:
+            now: Current time
+            lease_seconds: How long the claim keeps other workers away
+
+        Returns:
+            The claimed email, None if no email is due
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def mark_sent(self, id: str) -> None:
+        """
+        Remove a delivered email from the outbox.
+
+        Args:
+            id: Outbox email ID
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def schedule_retry(
+        self, id: str, next_attempt_at: datetime, error: str
+    ) -> None:
+        """
+        Release a failed email for another attempt later.
+
+        Args:
+            id: Outbox email ID
+            next_attempt_at: When the email may be claimed again
+            error: Error of the failed attempt
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def dead_letter(self, id: str, error: str) -> None:
+        """
+        Give up on an email: keep it for inspection without its body.
+
+        Args:
+            id: Outbox email ID
+            error: Why the email was given up on
+        """
+        pass  # pragma: no cover
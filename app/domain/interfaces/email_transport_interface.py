@@ -0,0 +1,26 @@
+"""
+Interface for the transport delivering outbox emails.
+"""
+
+from abc import ABC, abstractmethod
+from app.domain.entities.outbox_email_entity import OutboxEmail
+
+
+class IEmailTransport(ABC):
+    """
+    Contract for handing an email to a provider.
+    `send` may block on network I/O: the outbox workers call it from threads.
+    """
+
+    @abstractmethod
+    def send(self, email: OutboxEmail) -> None:
+        """
+        Deliver an email.
+
+        Args:
+            email: Email to deliver
+
+        Raises:
+            Exception: If the provider did not accept the email
+        """
+        pass  # pragma: no cover
@@ -2,7 +2,8 @@
 Interface for email verification token repository.
 """
 
-from typing import Optional
+from datetime import datetime
+from typing import Any, Optional
 from abc import abstractmethod
 from app.domain.interfaces.repository import BaseRepository
 from app.domain.entities.email_verification_token_entity import EmailVerificationToken
@@ -30,47 +31,66 @@ class IEmailVerificationRepository(BaseRepository[EmailVerificationToken]):
         pass  # pragma: no cover
 
     @abstractmethod
-    async def get_latest_by_user_id(
-        self, user_id: str
+    async def issue_token(
+        self, user_id: str, code_hash: str, expires_at: datetime, max_resends: int
     ) -> Optional[EmailVerificationToken]:
         """
-        Get the most recently created token for a user (regardless of status).
-        Used to retrieve resend_count when issuing a new token.
+        Atomically create or replace the active token of a user.
+
+        The new code replaces the previous one and failed attempts are reset,
+        unless the user already reached max_resends. The per-user send count
+        (0 for the first token) is kept apart from the tokens, so removing
+        tokens does not reset it.
 
         Args:
             user_id: The user's ID
+            code_hash: SHA-256 hash of the new verification code
+            expires_at: When the new code expires
+            max_resends: Number of resends allowed after the first token
 
         Returns:
-            Most recent EmailVerificationToken or None
+            The active token, or None if the resend limit was reached
         """
         pass  # pragma: no cover
 
     @abstractmethod
-    async def mark_as_used(self, token_id: str) -> None:
+    async def consume_code(
+        self,
+        user_id: str,
+        code_hash: str,
+        now: datetime,
+        max_attempts: int,
+        session: Optional[Any] = None,
+    ) -> Optional[EmailVerificationToken]:
         """
-        Mark a token as consumed so it cannot be reused.
+        Atomically check a submitted code against the user's active token.
 
-        Args:
-            token_id: Token ID to mark as used
-        """
-        pass  # pragma: no cover
-
-    @abstractmethod
-    async def increment_attempts(self, token_id: str) -> None:
-        """
-        Increment the failed attempt counter for a token.
+        Only an unexpired token below max_attempts is considered. It is
+        marked used if code_hash matches, otherwise its attempts are
+        incremented.
 
         Args:
-            token_id: Token ID to increment attempts for
+            user_id: The user's ID
+            code_hash: SHA-256 hash of the submitted code
+            now: Current time, compared with the token expiry
+            max_attempts: Failed attempts after which the token is refused
+            session: Transaction session, if any
+
+        Returns:
+            The token after the update (is_used tells whether the code
+            matched), or None if the user has no usable token
         """
         pass  # pragma: no cover
 
     @abstractmethod
-    async def invalidate_all_by_user_id(self, user_id: str) -> None:
+    async def delete_used(self, batch_size: int) -> int:
         """
-        Mark all existing tokens for a user as used (e.g., before issuing a new one).
+        Remove used tokens, at most batch_size of them.
 
         Args:
-            user_id: The user's ID
+            batch_size: Maximum number of tokens removed by this call
+
+        Returns:
+            Number of tokens removed
         """
         pass  # pragma: no cover
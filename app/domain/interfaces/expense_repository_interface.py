@@ -2,10 +2,12 @@
 Expense repository interface for expense-specific operations.
 """
 
-from typing import List, Dict
+from typing import Any, AsyncIterator, List, Dict, Optional, Tuple
+from datetime import datetime
 from abc import abstractmethod
 from app.domain.interfaces.repository import BaseRepository
 from app.domain.entities.expense_entity import Expense
+from app.domain.enums.analytics_group_by_enum import AnalyticsGroupBy
 
 
 class IExpenseRepository(BaseRepository[Expense]):
@@ -14,6 +16,20 @@ class IExpenseRepository(BaseRepository[Expense]):
     Extends the base repository with expense-specific queries.
     """
 
+    @abstractmethod
+    async def create_many(self, entities: List[Expense]) -> Dict[int, str]:
+        """
+        Insert many expenses in one unordered batch.
+        A failing document does not stop the others from being inserted.
+
+        Args:
+            entities: Expenses to create; each inserted one gets its ID set
+
+        Returns:
+            Error messages keyed by the index of each expense that was not inserted
+        """
+        pass  # pragma: no cover
+
     @abstractmethod
     async def get_all(
         self, group_id: str, skip: int = 0, limit: int = 100
@@ -32,6 +48,74 @@ class IExpenseRepository(BaseRepository[Expense]):
         """
         pass  # pragma: no cover
 
+    @abstractmethod
+    async def get_all_after(
+        self, group_id: str, after_date: datetime, after_id: str, limit: int = 100
+    ) -> List[Expense]:
+        """
+        Get the next page of expenses for a group using keyset pagination.
+        Returns expenses strictly after (after_date, after_id) in (date, id)
+        descending order, so every page costs the same regardless of depth.
+
+        Args:
+            group_id: ID of the expense group
+            after_date: Date of the last expense of the previous page
+            after_id: ID of the last expense of the previous page
+            limit: Maximum number of expenses to return
+
+        Returns:
+            List of expenses following the given position
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def get_changes(
+        self,
+        group_id: str,
+        after_updated_at: Optional[datetime] = None,
+        after_id: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Expense]:
+        """
+        Get the expenses of a group changed after a watermark, soft-deleted
+        ones included, in (updated_at, id) ascending order.
+        Without a watermark, returns the active expenses from the start.
+
+        Args:
+            group_id: ID of the expense group
+            after_updated_at: updated_at of the last change the client has seen
+            after_id: ID of the last change the client has seen
+            limit: Maximum number of expenses to return
+
+        Returns:
+            List of changed expenses, with is_deleted set on tombstones
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def stream_documents(
+        self,
+        group_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the active expenses of a group as plain documents, oldest first,
+        without building entities. At most `batch_size` documents are held in
+        memory at a time.
+
+        Args:
+            group_id: ID of the expense group
+            start_date: Only include expenses dated on or after this instant
+            end_date: Only include expenses dated before this instant
+            batch_size: Documents fetched from the database per round trip
+
+        Returns:
+            Async iterator of expense documents with `id` instead of `_id`
+        """
+        pass  # pragma: no cover
+
     @abstractmethod
     async def get_amounts_and_types(self, group_id: str) -> List[Dict[str, any]]:
         """
@@ -47,3 +131,62 @@ class IExpenseRepository(BaseRepository[Expense]):
             Example: [{{"amount_cents": 2500, "type_expense": "credit_card"}}, ...]
         """
         pass  # pragma: no cover
+
+    @abstractmethod
+    async def aggregate_amounts(
+        self,
+        group_id: str,
+        group_by: AnalyticsGroupBy,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Dict[str, any]]:
+        """
+        Aggregate amounts of active expenses in a group on the database side.
+        Only one row per bucket leaves the database, however many expenses match.
+
+        Args:
+            group_id: ID of the expense group
+            group_by: Dimension to group the expenses by
+            start_date: Only include expenses dated on or after this instant
+            end_date: Only include expenses dated before this instant
+
+        Returns:
+            One dictionary per bucket, ordered by key, with key, total_cents,
+            count, average_cents, min_cents and max_cents
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def update_fields(
+        self, id: str, fields: Dict[str, Any]
+    ) -> Optional[Expense]:
+        """
+        Set only the given fields of an active expense and return it as stored
+        after the write, in a single round trip.
+
+        Args:
+            id: Expense ID
+            fields: Field names mapped to their new values
+
+        Returns:
+            The updated expense, None if no active expense has this ID
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def update_fields_with_previous(
+        self, id: str, fields: Dict[str, Any]
+    ) -> Optional[Tuple[Expense, Expense]]:
+        """
+        Set only the given fields of an active expense and return it as it
+        was just before and just after this write, in a single round trip.
+        Concurrent updates each get the state their own write replaced.
+
+        Args:
+            id: Expense ID
+            fields: Field names mapped to their new values
+
+        Returns:
+            (previous, updated) expenses, None if no active expense has this ID
+        """
+        pass  # pragma: no cover
@@ -1,7 +1,7 @@
 """Group repository interface."""
 
 from abc import abstractmethod
-from typing import List
+from typing import Any, Dict, List, Optional
 from app.domain.interfaces.repository import BaseRepository
 from app.domain.entities.group_entity import Group
 
@@ -17,3 +17,34 @@ class IGroupRepository(BaseRepository[Group]):
     async def get_by_user_id(self, user_id: str) -> List[Group]:
         """Return all groups that a given user belongs to."""
         ...
+
+    @abstractmethod
+    async def update_fields(self, id: str, fields: Dict[str, Any]) -> Optional[Group]:
+        """Set only the given fields of a group and return it after the write, or None."""
+        ...
+
+    @abstractmethod
+    async def add_member(self, group_id: str, user_id: str) -> Optional[Group]:
+        """
+        Atomically add a user to an active group that does not contain them yet.
+        Returns the group after the write, or None if the group was not found
+        or the user is already a member.
+        """
+        ...
+
+    @abstractmethod
+    async def add_members(self, group_id: str, user_ids: List[str]) -> Optional[Group]:
+        """
+        Atomically add several users to an active group in one operation, skipping
+        users who are already members. Returns the group after the write, or None.
+        """
+        ...
+
+    @abstractmethod
+    async def remove_member(self, group_id: str, user_id: str) -> Optional[Group]:
+        """
+        Atomically remove a member from an active group.
+        Returns the group after the write, or None if the group was not found
+        or the user is not a member.
+        """
+        ...
@@ -0,0 +1,72 @@
+"""
+Group summary repository interface.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from app.domain.entities.expense_entity import Expense
+from app.domain.entities.group_summary_entity import GroupSummary
+
+
+class IGroupSummaryRepository(ABC):
+    """Contract for storing incrementally maintained group spending summaries."""
+
+    @abstractmethod
+    async def apply_change(
+        self,
+        group_id: str,
+        added: Optional[Expense] = None,
+        removed: Optional[Expense] = None,
+    ) -> None:
+        """
+        Apply the effect of an expense change to the group's summary.
+        A created or restored expense is `added`, a deleted one is `removed`
+        and an update passes the old version as `removed` and the new one as `added`.
+
+        Summaries are derived data: a failure is logged rather than raised,
+        so the expense write that triggered it still succeeds. Drift is
+        repaired with `rebuild`.
+
+        Args:
+            group_id: ID of the expense group
+            added: Expense whose amount is added to the summary
+            removed: Expense whose amount is subtracted from the summary
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def apply_additions(self, expenses: List[Expense]) -> None:
+        """
+        Add many newly created expenses to their groups' summaries with one
+        update per group. Failures are logged, as in `apply_change`.
+
+        Args:
+            expenses: Created expenses, possibly from several groups
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def get_by_group_id(self, group_id: str) -> Optional[GroupSummary]:
+        """
+        Get the summary of a group.
+
+        Args:
+            group_id: ID of the expense group
+
+        Returns:
+            GroupSummary if the group has one, None otherwise
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def rebuild(self, group_id: Optional[str] = None) -> int:
+        """
+        Recompute summaries from the active expenses, replacing the stored ones.
+
+        Args:
+            group_id: Only rebuild this group (all groups when None)
+
+        Returns:
+            Number of group summaries written
+        """
+        pass  # pragma: no cover
@@ -0,0 +1,80 @@
+"""
+Interface for the group membership cache.
+"""
+
+from abc import ABC, abstractmethod
+from typing import FrozenSet, Iterable, Optional
+
+
+class IMembershipCache(ABC):
+    """
+    Contract for caching the member ids of each group, and which users were
+    found active, so a warm membership check needs no database call.
+    """
+
+    @abstractmethod
+    def get(self, group_id: str) -> Optional[FrozenSet[str]]:
+        """
+        Get the cached member ids of a group.
+
+        Args:
+            group_id: Group ID
+
+        Returns:
+            Member ids if cached and not expired, None otherwise
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def set(self, group_id: str, user_ids: Iterable[str]) -> None:
+        """
+        Cache the member ids of a group.
+
+        Args:
+            group_id: Group ID
+            user_ids: IDs of the group's members
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def invalidate(self, group_id: str) -> None:
+        """
+        Drop the cached member ids of a group after its membership changed.
+
+        Args:
+            group_id: Group ID
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def is_active(self, user_id: str) -> bool:
+        """
+        Check whether the user was recently found active.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            True if cached as active and not expired; False means unknown
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def set_active(self, user_id: str) -> None:
+        """
+        Remember that the user was found active.
+
+        Args:
+            user_id: User ID
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def invalidate_user(self, user_id: str) -> None:
+        """
+        Forget that the user is active after it was deactivated.
+
+        Args:
+            user_id: User ID
+        """
+        pass  # pragma: no cover
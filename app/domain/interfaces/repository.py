@@ -3,7 +3,7 @@ Base repository interface.
 All repository implementations must follow this contract.
 """
 
-from typing import Generic, TypeVar, Optional, List
+from typing import Any, Dict, Generic, Iterable, TypeVar, Optional, List
 from abc import ABC, abstractmethod
 
 T = TypeVar("T")
@@ -43,6 +43,22 @@ class BaseRepository(ABC, Generic[T]):
         """
         pass  # pragma: no cover
 
+    @abstractmethod
+    async def get_fields(
+        self, id: str, fields: Iterable[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get only some fields of an entity, without loading the whole document.
+
+        Args:
+            id: The entity ID
+            fields: Names of the fields to return ("id" for the ID)
+
+        Returns:
+            The requested fields as stored, or None if not found
+        """
+        pass  # pragma: no cover
+
     @abstractmethod
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[T]:
         """
@@ -0,0 +1,26 @@
+"""
+Interface for running several repository writes in one transaction.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, AsyncContextManager, Optional
+
+
+class ITransactionManager(ABC):
+    """
+    Contract for an optional transaction around repository writes.
+    Backends without transactions yield no session, and the writes then
+    run one by one as they would without a transaction.
+    """
+
+    @abstractmethod
+    def transaction(self) -> AsyncContextManager[Optional[Any]]:
+        """
+        Open a transaction, committed when the block exits normally and
+        aborted when it raises.
+
+        Yields:
+            Session to pass to the repository writes, or None if the
+            backend does not support transactions
+        """
+        pass  # pragma: no cover
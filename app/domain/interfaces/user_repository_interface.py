@@ -2,7 +2,7 @@
 User repository interface for user-specific operations.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from abc import abstractmethod
 from app.domain.interfaces.repository import BaseRepository
 from app.domain.entities.user_entity import User
@@ -28,6 +28,19 @@ class IUserRepository(BaseRepository[User]):
         """
         pass  # pragma: no cover
 
+    @abstractmethod
+    async def get_many_by_ids(self, ids: List[str]) -> Dict[str, str]:
+        """
+        Get the names of several active users in a single query.
+
+        Args:
+            ids: User IDs to look up
+
+        Returns:
+            Mapping of user ID to name for the active users found
+        """
+        pass  # pragma: no cover
+
     @abstractmethod
     async def get_by_email(self, email: str) -> Optional[User]:
         """
@@ -81,3 +94,38 @@ class IUserRepository(BaseRepository[User]):
             User entity if found (active or not), None otherwise
         """
         pass  # pragma: no cover
+
+    @abstractmethod
+    async def update_fields(self, id: str, fields: Dict[str, Any]) -> Optional[User]:
+        """
+        Set only the given fields of an active user and return the user as
+        stored after the write, in a single round trip.
+
+        Args:
+            id: User ID
+            fields: Field names mapped to their new values
+
+        Returns:
+            The updated user, None if no active user has this ID
+
+        Raises:
+            ValueError: If the new email belongs to another user
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def mark_email_verified(
+        self, id: str, session: Optional[Any] = None
+    ) -> Optional[User]:
+        """
+        Set is_email_verified and is_active on a user, whether or not it is
+        active yet, and return the user as stored after the write.
+
+        Args:
+            id: User ID
+            session: Transaction session, if any
+
+        Returns:
+            The updated user, None if no user has this ID
+        """
+        pass  # pragma: no cover
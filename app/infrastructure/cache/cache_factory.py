@@ -0,0 +1,85 @@
+"""
+Builds the repository cache selected by the settings.
+"""
+
+from functools import lru_cache
+from typing import Optional
+from app.domain.interfaces.cache_interface import ICache
+from app.infrastructure.cache.memory_cache import InMemoryCache
+from app.infrastructure.cache.redis_cache import RedisCache
+from app.infrastructure.settings import Settings, get_settings
+from app.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_BACKENDS = ("memory", "redis", "none")
+
+
+def build_cache(settings: Settings) -> Optional[ICache]:
+    """
+    Build the cache for `settings.cache_backend`.
+
+    The "memory" cache lives in one process and its invalidations reach no
+    other, so with several workers (WEB_CONCURRENCY) a user or group updated
+    by one worker could be served stale by the others until the entry
+    expires. It is therefore refused then, unless CACHE_MEMORY_MULTI_WORKER
+    accepts that staleness explicitly.
+
+    Returns:
+        The cache, or None when caching is disabled ("none")
+
+    Raises:
+        ValueError: If the backend is unknown, or "memory" with several
+            workers and without CACHE_MEMORY_MULTI_WORKER
+    """
+    backend = settings.cache_backend.lower()
+    if backend not in CACHE_BACKENDS:
+        raise ValueError(
+            f"Unknown cache backend {settings.cache_backend!r}, "
+            f"expected one of {', '.join(CACHE_BACKENDS)}"
+        )
+
+    if (
+        backend == "memory"
+        and settings.web_concurrency > 1
+        and not settings.cache_memory_multi_worker
+    ):
+        raise ValueError(
+            f"The memory cache is per process and {settings.web_concurrency} "
+            "workers would serve stale entries; use CACHE_BACKEND=redis or set "
+            "CACHE_MEMORY_MULTI_WORKER=true to accept it"
+        )
+
+    logger.info("Repository cache backend: %s", backend)
+    if backend == "memory":
+        return InMemoryCache(
+            default_ttl_seconds=settings.cache_ttl_seconds,
+            max_entries=settings.cache_max_entries,
+        )
+    if backend == "redis":
+        return RedisCache(
+            url=settings.cache_url,
+            key_prefix=settings.cache_key_prefix,
+            default_ttl_seconds=settings.cache_ttl_seconds,
+            timeout_seconds=settings.cache_timeout_seconds,
+            max_connections=settings.cache_max_connections,
+        )
+    return None
+
+
+@lru_cache()
+def get_cache() -> Optional[ICache]:
+    """
+    Returns the process-wide repository cache (singleton pattern).
+    None when caching is disabled.
+    """
+    return build_cache(get_settings())
+
+
+async def close_cache() -> None:
+    """Close the cache if it was created. Called on application shutdown."""
+    if get_cache.cache_info().currsize:
+        cache = get_cache()
+        if cache is not None:
+            await cache.close()
+        get_cache.cache_clear()
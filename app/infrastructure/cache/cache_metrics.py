@@ -0,0 +1,22 @@
+"""
+Cache hit, miss and eviction counters shared by the cache backends.
+"""
+
+from app.infrastructure.metrics import get_metrics_registry
+
+_registry = get_metrics_registry()
+CACHE_LOOKUPS = _registry.counter(
+    "cache_lookups_total",
+    "Cache lookups, by backend, namespace and result (hit or miss).",
+    ("backend", "namespace", "result"),
+)
+CACHE_EVICTIONS = _registry.counter(
+    "cache_evictions_total",
+    "Entries evicted from a full in-process cache, by namespace.",
+    ("namespace",),
+)
+
+
+def record_lookup(backend: str, namespace: str, hit: bool) -> None:
+    """Count a cache lookup as a hit or a miss."""
+    CACHE_LOOKUPS.inc(backend, namespace, "hit" if hit else "miss")
@@ -0,0 +1,73 @@
+"""
+In-process TTL cache with least-recently-used eviction.
+
+Entries live in the memory of one worker process. Invalidations only reach
+that process, so with several replicas the TTL bounds how long the others
+may serve a stale value; use the Redis backend to share one cache instead.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+from app.domain.interfaces.cache_interface import ICache
+from app.infrastructure.cache.cache_metrics import CACHE_EVICTIONS, record_lookup
+
+BACKEND = "memory"
+
+
+class InMemoryCache(ICache):
+    """TTL cache evicting the least recently used entry when full."""
+
+    def __init__(
+        self,
+        default_ttl_seconds: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            default_ttl_seconds: How long an entry stays valid unless set otherwise
+            max_entries: Maximum number of entries kept, all namespaces together
+            clock: Monotonic time source (injectable for tests)
+        """
+        self._default_ttl = default_ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, str]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, namespace: str, key: str) -> Optional[str]:
+        entry = self._entries.get((namespace, key))
+        if entry is not None and entry[0] <= self._clock():
+            del self._entries[(namespace, key)]
+            entry = None
+        record_lookup(BACKEND, namespace, entry is not None)
+        if entry is None:
+            return None
+        self._entries.move_to_end((namespace, key))
+        return entry[1]
+
+    async def set(
+        self,
+        namespace: str,
+        key: str,
+        value: str,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        ttl = self._default_ttl if ttl_seconds is None else ttl_seconds
+        self._entries[(namespace, key)] = (self._clock() + ttl, value)
+        self._entries.move_to_end((namespace, key))
+        while len(self._entries) > self._max_entries:
+            (evicted_namespace, _), _ = self._entries.popitem(last=False)
+            CACHE_EVICTIONS.inc(evicted_namespace)
+
+    async def delete(self, namespace: str, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop((namespace, key), None)
+
+    async def close(self) -> None:
+        self._entries.clear()
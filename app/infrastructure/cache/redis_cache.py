@@ -0,0 +1,249 @@
+"""
+Cache shared by every replica through a server speaking the Redis protocol
+(Redis, Valkey, KeyDB, ...).
+
+The client speaks RESP directly over a small pool of asyncio connections, so
+no driver is needed: each command borrows an idle connection (opening one
+while fewer than `max_connections` exist), so a slow reply only holds up its
+own request. Keys are "<prefix>:<namespace>:<key>" and every entry is written
+with its TTL; bounding the size is left to the server (`maxmemory` with an
+`allkeys-lru` policy).
+
+A cache must never take the API down: when the server is slow or
+unreachable, reads count as misses and writes are skipped, with a log
+record each time.
+"""
+
+import asyncio
+from typing import Any, List, Optional, Union
+from urllib.parse import unquote, urlparse
+from app.domain.interfaces.cache_interface import ICache
+from app.infrastructure.cache.cache_metrics import record_lookup
+from app.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+BACKEND = "redis"
+DEFAULT_PORT = 6379
+DEFAULT_MAX_CONNECTIONS = 10
+
+
+class CacheBackendError(Exception):
+    """The cache server could not be reached or replied with an error."""
+
+
+def encode_command(*args: Union[str, bytes, int]) -> bytes:
+    """Encode a command as a RESP array of bulk strings."""
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if isinstance(arg, int):
+            arg = str(arg)
+        if isinstance(arg, str):
+            arg = arg.encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(parts)
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Any:
+    """
+    Read one RESP reply.
+
+    Returns:
+        bytes for simple and bulk strings, int for integers, a list for
+        arrays and None for null replies
+
+    Raises:
+        CacheBackendError: If the server replied with an error
+    """
+    line = await reader.readuntil(b"\r\n")
+    kind, payload = line[:1], line[1:-2]
+    if kind == b"+":
+        return payload
+    if kind == b"-":
+        raise CacheBackendError(payload.decode(errors="replace"))
+    if kind == b":":
+        return int(payload)
+    if kind == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+        data = await reader.readexactly(length + 2)
+        return data[:-2]
+    if kind == b"*":
+        length = int(payload)
+        if length < 0:
+            return None
+        items: List[Any] = []
+        for _ in range(length):
+            items.append(await read_reply(reader))
+        return items
+    raise CacheBackendError(f"Unexpected reply from cache server: {line!r}")
+
+
+class _Connection:
+    """One connection to the cache server, used by one command at a time."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    async def roundtrip(self, *args: Union[str, bytes, int]) -> Any:
+        self.writer.write(encode_command(*args))
+        await self.writer.drain()
+        return await read_reply(self.reader)
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class RedisCache(ICache):
+    """Cache stored on a Redis-protocol server shared by all API replicas."""
+
+    def __init__(
+        self,
+        url: str,
+        key_prefix: str,
+        default_ttl_seconds: float,
+        timeout_seconds: float = 0.5,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ):
+        """
+        Initialize the cache. Connections are opened on first use.
+
+        Args:
+            url: Server URL, redis://[[user]:password@]host[:port][/db]
+                 (rediss:// for TLS)
+            key_prefix: Prefix of every key, shared by the replicas of one app
+            default_ttl_seconds: How long an entry stays valid unless set otherwise
+            timeout_seconds: Longest wait for the server, including the wait
+                             for a free connection, before giving up
+            max_connections: Most connections open at once, and so most
+                             commands in flight
+        """
+        parsed = urlparse(url)
+        self._host = parsed.hostname or "localhost"
+        self._port = parsed.port or DEFAULT_PORT
+        self._ssl = parsed.scheme == "rediss"
+        self._username = unquote(parsed.username) if parsed.username else None
+        self._password = unquote(parsed.password) if parsed.password else None
+        self._db = int(parsed.path.lstrip("/") or 0)
+        self._key_prefix = key_prefix
+        self._default_ttl = default_ttl_seconds
+        self._timeout = timeout_seconds
+        self._max_connections = max_connections
+        self._idle: List[_Connection] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self._key_prefix}:{namespace}:{key}"
+
+    async def _connect(self) -> _Connection:
+        reader, writer = await asyncio.open_connection(
+            self._host, self._port, ssl=self._ssl or None
+        )
+        connection = _Connection(reader, writer)
+        try:
+            if self._password:
+                credentials = [self._username] if self._username else []
+                await connection.roundtrip("AUTH", *credentials, self._password)
+            if self._db:
+                await connection.roundtrip("SELECT", self._db)
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+    async def _call(self, *args: Union[str, bytes, int]) -> Any:
+        """Run one command on a pooled connection, waiting for a free slot."""
+        async with self._slots:
+            connection = self._idle.pop() if self._idle else await self._connect()
+            try:
+                reply = await connection.roundtrip(*args)
+            except CacheBackendError:
+                # An error reply leaves the connection in step with the server
+                self._idle.append(connection)
+                raise
+            except BaseException:
+                # Failed, timed out or cancelled mid-command (e.g. the client
+                # went away): a reply may still be on its way and would be read
+                # by the next command, so the socket is never reused
+                connection.close()
+                raise
+            self._idle.append(connection)
+            return reply
+
+    async def execute(self, *args: Union[str, bytes, int]) -> Any:
+        """
+        Send one command and return its reply, connecting first if needed.
+        The timeout covers the wait for a free connection as well as the
+        command itself.
+
+        Raises:
+            CacheBackendError: If the server is unreachable, too slow or
+                replied with an error
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Connections and semaphores belong to the loop that created them
+            self._idle = []
+            self._slots = asyncio.Semaphore(self._max_connections)
+            self._loop = loop
+
+        try:
+            return await asyncio.wait_for(self._call(*args), self._timeout)
+        except CacheBackendError:
+            raise
+        except (OSError, EOFError, asyncio.TimeoutError) as e:
+            raise CacheBackendError(
+                f"Cache server {self._host}:{self._port} unavailable: {e!r}"
+            ) from e
+
+    async def get(self, namespace: str, key: str) -> Optional[str]:
+        try:
+            value = await self.execute("GET", self._key(namespace, key))
+        except CacheBackendError as e:
+            logger.warning("Cache read failed in namespace %s: %s", namespace, e)
+            value = None
+        record_lookup(BACKEND, namespace, value is not None)
+        return value.decode() if value is not None else None
+
+    async def set(
+        self,
+        namespace: str,
+        key: str,
+        value: str,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        ttl = self._default_ttl if ttl_seconds is None else ttl_seconds
+        try:
+            await self.execute(
+                "SET", self._key(namespace, key), value, "PX", max(1, int(ttl * 1000))
+            )
+        except CacheBackendError as e:
+            logger.warning("Cache write failed in namespace %s: %s", namespace, e)
+
+    async def delete(self, namespace: str, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            await self.execute("DEL", *(self._key(namespace, key) for key in keys))
+        except CacheBackendError as e:
+            # The entries expire on their own; until then they may be stale
+            logger.error(
+                "Cache invalidation failed in namespace %s for %s: %s",
+                namespace,
+                keys,
+                e,
+            )
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        if self._loop is not asyncio.get_running_loop():
+            return
+        for connection in idle:
+            connection.close()
+            try:
+                await connection.writer.wait_closed()
+            except OSError:  # pragma: no cover
+                pass
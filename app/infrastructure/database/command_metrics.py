@@ -0,0 +1,81 @@
+"""
+pymongo command listener recording MongoDB command latency and document
+counts per collection and command name.
+
+Registered on the client built in Database.connect(). The driver calls it
+from the threads running the commands, so it only touches the lock-free
+metrics registry and a dict of in-flight commands keyed by request id.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+from pymongo import monitoring
+from app.infrastructure.metrics import get_metrics_registry
+
+_registry = get_metrics_registry()
+COMMAND_DURATION = _registry.histogram(
+    "mongodb_command_duration_seconds",
+    "MongoDB command latency in seconds, by collection and command.",
+    ("collection", "command"),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+COMMAND_DOCUMENTS = _registry.counter(
+    "mongodb_command_documents_total",
+    "Documents returned or written by MongoDB commands, by collection and command.",
+    ("collection", "command"),
+)
+COMMAND_FAILURES = _registry.counter(
+    "mongodb_command_failures_total",
+    "MongoDB commands that failed, by collection and command.",
+    ("collection", "command"),
+)
+
+
+def _collection_of(command_name: str, command: Dict[str, Any]) -> Optional[str]:
+    """Collection a command runs on, None for commands not tied to one (ping, hello)."""
+    if command_name == "getMore":
+        target = command.get("collection")
+    else:
+        target = command.get(command_name)
+    return target if isinstance(target, str) else None
+
+
+def _document_count(command_name: str, reply: Dict[str, Any]) -> int:
+    """Documents a command returned (cursor batches) or wrote (n)."""
+    cursor = reply.get("cursor")
+    if isinstance(cursor, dict):
+        batch = cursor.get("firstBatch", cursor.get("nextBatch", ()))
+        return len(batch)
+    if command_name == "findAndModify":
+        return 1 if reply.get("value") is not None else 0
+    n = reply.get("n")
+    return n if isinstance(n, int) else 0
+
+
+class CommandMetricsListener(monitoring.CommandListener):
+    """Records every collection command in the application metrics registry."""
+
+    def __init__(self):
+        self._pending: Dict[Tuple[Any, int], str] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        collection = _collection_of(event.command_name, event.command)
+        if collection is not None:
+            self._pending[(event.connection_id, event.request_id)] = collection
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        collection = self._pending.pop((event.connection_id, event.request_id), None)
+        if collection is None:
+            return
+        labels = (collection, event.command_name)
+        COMMAND_DURATION.observe(event.duration_micros / 1_000_000, *labels)
+        count = _document_count(event.command_name, event.reply)
+        if count:
+            COMMAND_DOCUMENTS.inc(*labels, amount=count)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        collection = self._pending.pop((event.connection_id, event.request_id), None)
+        if collection is None:
+            return
+        labels = (collection, event.command_name)
+        COMMAND_DURATION.observe(event.duration_micros / 1_000_000, *labels)
+        COMMAND_FAILURES.inc(*labels)
@@ -3,13 +3,48 @@ Asynchronous MongoDB database connection management.
 Uses Motor for async operations with MongoDB.
 """
 
+import asyncio
+from typing import Any, Dict
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-from app.infrastructure.settings import get_settings
+from app.infrastructure.settings import Settings, get_settings
 from app.infrastructure.logger import get_logger
+from app.infrastructure.database.indexes import (
+    ensure_indexes,
+    verify_unique_indexes,
+)
+from app.infrastructure.database.command_metrics import CommandMetricsListener
+from app.infrastructure.database.pool_metrics import PoolMetricsListener
 
 logger = get_logger(__name__)
 
 
+def client_options(settings: Settings) -> Dict[str, Any]:
+    """
+    Build the AsyncIOMotorClient options from the settings.
+    Optional settings left unset keep the driver defaults.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Dict[str, Any]: Keyword arguments for AsyncIOMotorClient
+    """
+    options: Dict[str, Any] = {
+        "maxPoolSize": settings.mongodb_max_pool_size,
+        "minPoolSize": settings.mongodb_min_pool_size,
+        "serverSelectionTimeoutMS": settings.mongodb_server_selection_timeout_ms,
+        "appname": settings.mongodb_app_name or settings.app_name,
+        "event_listeners": [CommandMetricsListener(), PoolMetricsListener()],
+    }
+    if settings.mongodb_max_idle_time_ms is not None:
+        options["maxIdleTimeMS"] = settings.mongodb_max_idle_time_ms
+    if settings.mongodb_wait_queue_timeout_ms is not None:
+        options["waitQueueTimeoutMS"] = settings.mongodb_wait_queue_timeout_ms
+    if settings.mongodb_compressors:
+        options["compressors"] = settings.mongodb_compressors
+    return options
+
+
 class Database:
     """
     Manages asynchronous MongoDB connection lifecycle.
@@ -20,26 +55,58 @@ class Database:
     _db: AsyncIOMotorDatabase = None
 
     @classmethod
-    async def connect(cls) -> None:
+    async def connect(cls, apply_indexes: bool = True) -> None:
         """
         Establish asynchronous connection to MongoDB.
         Should be called on application startup.
+
+        Args:
+            apply_indexes: Create the indexes declared by the repositories
+                (also controlled by settings.mongodb_ensure_indexes). When
+                settings disable it, the unique indexes are only checked.
+
+        Raises:
+            MissingUniqueIndexError: If a declared unique index is not in place
         """
         settings = get_settings()
 
         try:
-            logger.info(f"Connecting to MongoDB: {settings.mongodb_db_name}")
-            cls._client = AsyncIOMotorClient(settings.mongodb_url)
+            logger.info("Connecting to MongoDB: %s", settings.mongodb_db_name)
+            cls._client = AsyncIOMotorClient(
+                settings.mongodb_url, **client_options(settings)
+            )
             cls._db = cls._client[settings.mongodb_db_name]
 
             await cls._client.admin.command("ping")
             logger.info(
-                f"Successfully connected to MongoDB: {settings.mongodb_db_name}"
+                "Successfully connected to MongoDB: %s", settings.mongodb_db_name
             )
+
+            if settings.mongodb_min_pool_size > 1:
+                await cls._prewarm_pool(settings.mongodb_min_pool_size)
+
+            if apply_indexes and settings.mongodb_ensure_indexes:
+                await ensure_indexes(cls._db)
+            elif apply_indexes:
+                await verify_unique_indexes(cls._db)
         except Exception as e:
-            logger.error(f"Failed to connect to MongoDB: {e}")
+            logger.error("Failed to connect to MongoDB: %s", e)
             raise
 
+    @classmethod
+    async def _prewarm_pool(cls, size: int) -> None:
+        """
+        Open `size` pooled connections before serving traffic.
+
+        The driver only fills minPoolSize in the background, so the first
+        requests after startup would still pay for connection handshakes.
+        Running `size` pings at once makes each check out its own connection.
+        """
+        await asyncio.gather(
+            *(cls._client.admin.command("ping") for _ in range(size))
+        )
+        logger.info("Pre-warmed %s MongoDB connections", size)
+
     @classmethod
     async def disconnect(cls) -> None:
         """
@@ -0,0 +1,44 @@
+"""
+Data loaders fetching MongoDB documents by the value of one field.
+"""
+
+from typing import Any, Callable, Dict, List
+from motor.motor_asyncio import AsyncIOMotorCollection
+from app.infrastructure.dataloader import DataLoader
+
+
+def document_loader(
+    get_collection: Callable[[], AsyncIOMotorCollection],
+    field: str,
+    query: Dict[str, Any],
+    name: str,
+) -> DataLoader[Any, Dict[str, Any]]:
+    """
+    Build a loader of the documents matching `query` whose `field` equals the key.
+
+    A lone key is fetched with find_one; several keys with one `$in` query.
+    When documents share a value, the first one returned is used, as
+    find_one would.
+
+    Args:
+        get_collection: Returns the collection to query
+        field: Field the keys are matched against (e.g. "_id", "email")
+        query: Conditions every document must also meet
+        name: Label of the loader in the metrics
+
+    Returns:
+        Loader resolving each key to its document, or None
+    """
+
+    async def find(values: List[Any]) -> Dict[Any, Dict[str, Any]]:
+        collection = get_collection()
+        if len(values) == 1:
+            doc = await collection.find_one({field: values[0], **query})
+            return {values[0]: doc} if doc else {}
+
+        docs: Dict[Any, Dict[str, Any]] = {}
+        async for doc in collection.find({field: {"$in": values}, **query}):
+            docs.setdefault(doc[field], doc)
+        return docs
+
+    return DataLoader(find, name)
@@ -0,0 +1,256 @@
+"""
+Declarative MongoDB index bootstrap.
+
+Each Mongo repository declares its index specs in an `indexes` class attribute.
+This module collects them into a registry, applies them idempotently on startup
+and can diff them against the live indexes:
+
+    python -m app.infrastructure.database.indexes          # show the diff
+    python -m app.infrastructure.database.indexes --apply  # create missing indexes
+
+A repository whose data must be fixed before its indexes can be built (e.g.
+duplicates under a new unique index) does it in a `prepare_indexes(db)`
+coroutine, which ensure_indexes runs first.
+"""
+
+import argparse
+import asyncio
+from typing import Any, Dict, List
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import IndexModel
+from app.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Index options compared by the diff (key order is always compared).
+_COMPARED_OPTIONS = (
+    "unique",
+    "sparse",
+    "partialFilterExpression",
+    "expireAfterSeconds",
+    "collation",
+)
+
+
+def _repositories() -> List[Any]:
+    """
+    Instantiate every Mongo repository declaring indexes.
+
+    Repositories are imported lazily because they depend on the Database class.
+    """
+    from app.infrastructure.repositories.expense_repository import (
+        MongoExpenseRepository,
+    )
+    from app.infrastructure.repositories.user_repository import MongoUserRepository
+    from app.infrastructure.repositories.group_repository import MongoGroupRepository
+    from app.infrastructure.repositories.email_verification_repository import (
+        MongoEmailVerificationRepository,
+    )
+    from app.infrastructure.repositories.email_outbox_repository import (
+        MongoEmailOutboxRepository,
+    )
+
+    return [
+        MongoExpenseRepository(),
+        MongoUserRepository(),
+        MongoGroupRepository(),
+        MongoEmailVerificationRepository(),
+        MongoEmailOutboxRepository(),
+    ]
+
+
+def get_index_registry() -> Dict[str, List[IndexModel]]:
+    """
+    Collect the index specs declared by every Mongo repository.
+
+    A repository owning more collections declares their indexes in a
+    `secondary_indexes` mapping of collection name to IndexModel list.
+
+    Returns:
+        Mapping of collection name to its declared IndexModel list
+    """
+    registry: Dict[str, List[IndexModel]] = {}
+    for repository in _repositories():
+        registry.setdefault(repository.collection_name, []).extend(
+            repository.indexes
+        )
+        for collection_name, indexes in getattr(
+            repository, "secondary_indexes", {}
+        ).items():
+            registry.setdefault(collection_name, []).extend(indexes)
+    return registry
+
+
+class MissingUniqueIndexError(RuntimeError):
+    """A declared unique index is missing, so uniqueness is not enforced."""
+
+
+def _unique_index_names(indexes: List[IndexModel]) -> List[str]:
+    return [index.document["name"] for index in indexes if index.document.get("unique")]
+
+
+async def ensure_indexes(db: AsyncIOMotorDatabase) -> None:
+    """
+    Create every declared index, after the repositories' prepare_indexes
+    hooks. Safe to call on every startup: MongoDB treats re-creating an
+    identical index as a no-op.
+
+    A failure on one collection (e.g. an option conflict with an existing
+    index) is logged and does not prevent the other collections from being
+    indexed. It stops the application from starting only when the collection
+    declares unique indexes: writes rely on them to reject duplicates (e.g.
+    user emails), and would silently accept them without.
+
+    Args:
+        db: Target database
+
+    Raises:
+        MissingUniqueIndexError: If the indexes of a collection declaring
+            unique indexes could not be created
+    """
+    for repository in _repositories():
+        prepare = getattr(repository, "prepare_indexes", None)
+        if prepare is not None:
+            await prepare(db)
+
+    failed_unique: List[str] = []
+    for collection_name, indexes in get_index_registry().items():
+        if not indexes:
+            continue
+        try:
+            names = await db[collection_name].create_indexes(indexes)
+            logger.info("Ensured indexes on %s: %s", collection_name, ", ".join(names))
+        except Exception as e:
+            logger.error("Error ensuring indexes on %s: %s", collection_name, e)
+            failed_unique.extend(
+                f"{collection_name}.{name}" for name in _unique_index_names(indexes)
+            )
+
+    if failed_unique:
+        raise MissingUniqueIndexError(
+            "Could not build unique indexes " + ", ".join(failed_unique)
+        )
+
+
+async def verify_unique_indexes(db: AsyncIOMotorDatabase) -> None:
+    """
+    Check that every declared unique index exists with its declared options,
+    for deployments that manage indexes outside the application.
+
+    Args:
+        db: Target database
+
+    Raises:
+        MissingUniqueIndexError: If a declared unique index is missing or differs
+    """
+    diff = await diff_indexes(db)
+    absent = [
+        f"{collection_name}.{name}"
+        for collection_name, indexes in get_index_registry().items()
+        for name in _unique_index_names(indexes)
+        if name in diff[collection_name]["missing"]
+        or name in diff[collection_name]["changed"]
+    ]
+    if absent:
+        for name in absent:
+            logger.error("Unique index %s is missing or differs from declared", name)
+        raise MissingUniqueIndexError(
+            "Unique indexes missing or changed: " + ", ".join(absent)
+        )
+
+
+def _options_match(declared: Any, live: Any) -> bool:
+    """Compare a declared option with its live value (dicts only on declared keys)."""
+    if isinstance(declared, dict) and isinstance(live, dict):
+        return all(
+            _options_match(value, live.get(key)) for key, value in declared.items()
+        )
+    return declared == live
+
+
+async def diff_indexes(db: AsyncIOMotorDatabase) -> Dict[str, Dict[str, List[str]]]:
+    """
+    Compare declared indexes with the live ones.
+
+    Args:
+        db: Target database
+
+    Returns:
+        Per collection, the index names that are `missing` (declared only),
+        `changed` (same name, different keys or options) and `extra` (live only)
+    """
+    result: Dict[str, Dict[str, List[str]]] = {}
+    for collection_name, indexes in get_index_registry().items():
+        live = await db[collection_name].index_information()
+        missing, changed = [], []
+        declared_names = set()
+
+        for index in indexes:
+            document = index.document
+            name = document["name"]
+            declared_names.add(name)
+
+            if name not in live:
+                missing.append(name)
+                continue
+
+            live_info = live[name]
+            same_keys = list(document["key"].items()) == [
+                (field, direction) for field, direction in live_info["key"]
+            ]
+            same_options = all(
+                _options_match(document[option], live_info.get(option))
+                for option in _COMPARED_OPTIONS
+                if option in document
+            ) and all(
+                option in document for option in _COMPARED_OPTIONS if option in live_info
+            )
+            if not (same_keys and same_options):
+                changed.append(name)
+
+        extra = sorted(n for n in live if n != "_id_" and n not in declared_names)
+        result[collection_name] = {
+            "missing": missing,
+            "changed": changed,
+            "extra": extra,
+        }
+    return result
+
+
+async def _run_cli(apply: bool) -> int:
+    """Connect, log the diff and optionally apply the declared indexes."""
+    from app.infrastructure.database.database import Database
+
+    await Database.connect(apply_indexes=False)
+    try:
+        db = Database.get_db()
+        if apply:
+            await ensure_indexes(db)
+
+        drift = False
+        for collection_name, diff in (await diff_indexes(db)).items():
+            for kind in ("missing", "changed", "extra"):
+                for name in diff[kind]:
+                    drift = drift or kind != "extra"
+                    logger.warning("%s: %s index %s", collection_name, kind, name)
+            if not any(diff.values()):
+                logger.info("%s: indexes up to date", collection_name)
+        return 1 if drift else 0
+    finally:
+        await Database.disconnect()
+
+
+def main() -> None:
+    """CLI entry point. Exits with status 1 when declared indexes are missing or changed."""
+    parser = argparse.ArgumentParser(
+        description="Diff declared MongoDB indexes against the live database."
+    )
+    parser.add_argument(
+        "--apply", action="store_true", help="create missing indexes before diffing"
+    )
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(_run_cli(args.apply)))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,102 @@
+"""
+pymongo connection pool listener publishing checkout wait times and
+connection counts per server address.
+
+Registered on the client built in Database.connect(). Pool exhaustion shows
+up as growing mongodb_pool_checkout_wait_seconds and, once
+waitQueueTimeoutMS is exceeded, as mongodb_pool_checkout_failures_total.
+"""
+
+from pymongo import monitoring
+from app.infrastructure.metrics import get_metrics_registry
+from app.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+_registry = get_metrics_registry()
+CHECKOUT_WAIT = _registry.histogram(
+    "mongodb_pool_checkout_wait_seconds",
+    "Time spent waiting to check a connection out of the pool, by server.",
+    ("address",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0, 5.0),
+)
+CHECKOUT_FAILURES = _registry.counter(
+    "mongodb_pool_checkout_failures_total",
+    "Connection checkouts that failed, by server and reason.",
+    ("address", "reason"),
+)
+CONNECTIONS = _registry.gauge(
+    "mongodb_pool_connections",
+    "Open connections in the pool, by server.",
+    ("address",),
+)
+CONNECTIONS_IN_USE = _registry.gauge(
+    "mongodb_pool_connections_in_use",
+    "Connections checked out of the pool, by server.",
+    ("address",),
+)
+POOL_CLEARED = _registry.counter(
+    "mongodb_pool_cleared_total",
+    "Times the pool was cleared after a server error, by server.",
+    ("address",),
+)
+
+
+def _address(event) -> str:
+    host, port = event.address
+    return f"{host}:{port}"
+
+
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    """Records pool checkouts and connection counts in the metrics registry."""
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        pass
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        pass
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        POOL_CLEARED.inc(_address(event))
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        pass
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        CONNECTIONS.inc(_address(event))
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        pass
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        CONNECTIONS.dec(_address(event))
+
+    def connection_check_out_started(
+        self, event: monitoring.ConnectionCheckOutStartedEvent
+    ) -> None:
+        pass
+
+    def connection_check_out_failed(
+        self, event: monitoring.ConnectionCheckOutFailedEvent
+    ) -> None:
+        address = _address(event)
+        CHECKOUT_WAIT.observe(event.duration, address)
+        CHECKOUT_FAILURES.inc(address, str(event.reason))
+        logger.warning(
+            "MongoDB connection checkout failed on %s after %.3fs: %s",
+            address,
+            event.duration,
+            event.reason,
+        )
+
+    def connection_checked_out(
+        self, event: monitoring.ConnectionCheckedOutEvent
+    ) -> None:
+        address = _address(event)
+        CHECKOUT_WAIT.observe(event.duration, address)
+        CONNECTIONS_IN_USE.inc(address)
+
+    def connection_checked_in(
+        self, event: monitoring.ConnectionCheckedInEvent
+    ) -> None:
+        CONNECTIONS_IN_USE.dec(_address(event))
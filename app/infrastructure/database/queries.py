@@ -0,0 +1,66 @@
+"""
+Existence and field lookups that fetch as little of a document as possible.
+"""
+
+from typing import Any, Dict, Iterable, Optional
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+# Returns nothing but the key of the matched document
+ID_ONLY = {"_id": 1}
+
+
+async def document_exists(
+    collection: AsyncIOMotorCollection,
+    query: Dict[str, Any],
+    projection: Dict[str, Any] = ID_ONLY,
+) -> bool:
+    """
+    Check whether a document matches `query`.
+
+    find_one stops at the first match and the projection keeps the document
+    itself off the wire. When an index holds every queried and projected
+    field (e.g. {"email": 1} with {"_id": 0, "email": 1}), the query is
+    covered and never loads the document.
+
+    Args:
+        collection: Collection to search
+        query: Conditions the document must meet
+        projection: Fields to return; exclude _id to let a secondary index cover it
+
+    Returns:
+        True if a document matches, False otherwise
+    """
+    return await collection.find_one(query, projection) is not None
+
+
+async def find_fields(
+    collection: AsyncIOMotorCollection,
+    query: Dict[str, Any],
+    fields: Iterable[str],
+) -> Optional[Dict[str, Any]]:
+    """
+    Fetch only the given fields of the document matching `query`.
+
+    Fields are returned as stored. "id" stands for the document key and is
+    returned as a string, as in the entities.
+
+    Args:
+        collection: Collection to search
+        query: Conditions the document must meet
+        fields: Names of the fields to return
+
+    Returns:
+        The requested fields the document has, or None if none matches
+    """
+    fields = set(fields)
+    projection: Dict[str, Any] = {field: 1 for field in fields - {"id"}}
+    # Without any other field an _id exclusion would return the whole document
+    projection["_id"] = 1 if "id" in fields or not projection else 0
+
+    doc = await collection.find_one(query, projection)
+    if doc is None:
+        return None
+    key = doc.pop("_id", None)
+    if "id" in fields:
+        doc["id"] = str(key)
+    return doc
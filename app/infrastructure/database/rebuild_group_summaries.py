@@ -0,0 +1,49 @@
+"""
+Rebuild the group spending summaries from the expenses collection.
+
+Summaries are maintained incrementally on every expense write; this command
+recomputes them from scratch to repair drift (e.g. after a failed summary
+update or a manual data fix):
+
+    python -m app.infrastructure.database.rebuild_group_summaries
+    python -m app.infrastructure.database.rebuild_group_summaries --group-id <id>
+"""
+
+import argparse
+import asyncio
+from typing import Optional
+from app.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+async def _run_cli(group_id: Optional[str]) -> int:
+    """Connect and rebuild the summaries of one group or of every group."""
+    from app.infrastructure.database.database import Database
+    from app.infrastructure.repositories.group_summary_repository import (
+        MongoGroupSummaryRepository,
+    )
+
+    await Database.connect(apply_indexes=False)
+    try:
+        rebuilt = await MongoGroupSummaryRepository().rebuild(group_id)
+        logger.info("Rebuilt %s group summaries", rebuilt)
+        return 0
+    finally:
+        await Database.disconnect()
+
+
+def main() -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Recompute group spending summaries from the expenses."
+    )
+    parser.add_argument(
+        "--group-id", default=None, help="only rebuild the summary of this group"
+    )
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(_run_cli(args.group_id)))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,50 @@
+"""
+MongoDB transactions for writes spanning several collections.
+
+Transactions need a replica set or a sharded cluster. Against a standalone
+server the manager yields no session, so the same code runs unchanged in
+local development.
+"""
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+from app.domain.interfaces.transaction_manager_interface import ITransactionManager
+from app.infrastructure.database.database import Database
+from app.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class MongoTransactionManager(ITransactionManager):
+    """ITransactionManager backed by MongoDB client sessions."""
+
+    def __init__(self):
+        self._client = None
+        self._supported = False
+
+    async def supports_transactions(self) -> bool:
+        """
+        Check once per client whether the deployment supports transactions.
+
+        Returns:
+            True for a replica set member or a mongos router
+        """
+        client = Database.get_client()
+        if client is not self._client:
+            hello = await client.admin.command("hello")
+            self._supported = "setName" in hello or hello.get("msg") == "isdbgrid"
+            self._client = client
+            logger.info(
+                "MongoDB transactions %s",
+                "enabled" if self._supported else "unavailable (standalone server)",
+            )
+        return self._supported
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[Optional[Any]]:
+        if not await self.supports_transactions():
+            yield None
+            return
+        async with await self._client.start_session() as session:
+            async with session.start_transaction():
+                yield session
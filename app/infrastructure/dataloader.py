@@ -0,0 +1,141 @@
+"""
+Request coalescing for hot repository reads.
+
+A DataLoader turns concurrent loads into as few queries as possible:
+
+  - single flight: a load for a key that is already being fetched awaits
+    the same future instead of issuing another query
+  - batching: distinct keys requested during the same event-loop tick are
+    fetched together by one call of the batch function (one `$in` query)
+
+Nothing is kept once a batch completes, so results are never staler than
+the query that produced them; caching belongs to the cache layer.
+"""
+
+import asyncio
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    TypeVar,
+)
+from app.infrastructure.metrics import get_metrics_registry
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+DEFAULT_MAX_BATCH_SIZE = 100
+
+_registry = get_metrics_registry()
+LOADS = _registry.counter(
+    "dataloader_loads_total",
+    "Keys requested from a data loader, by loader.",
+    ("loader",),
+)
+COALESCED = _registry.counter(
+    "dataloader_coalesced_total",
+    "Loads that joined a query already pending or in flight for the same key, by loader.",
+    ("loader",),
+)
+BATCH_SIZE = _registry.histogram(
+    "dataloader_batch_size",
+    "Distinct keys fetched by one batched query, by loader.",
+    ("loader",),
+    buckets=(1, 2, 5, 10, 25, 50, 100),
+)
+
+
+def _retrieve_exception(future: "asyncio.Future") -> None:
+    """Mark a failure as seen when every caller awaiting it was cancelled."""
+    if not future.cancelled():
+        future.exception()
+
+
+class DataLoader(Generic[K, V]):
+    """Coalesces concurrent loads by key and batches distinct keys per tick."""
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[K]], Awaitable[Mapping[K, V]]],
+        name: str,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ):
+        """
+        Initialize the loader.
+
+        Args:
+            batch_fn: Fetches several keys at once; keys missing from the
+                      returned mapping load as None
+            name: Label of the loader in the metrics
+            max_batch_size: Most keys fetched by one call of batch_fn
+        """
+        self._batch_fn = batch_fn
+        self.name = name
+        self._max_batch_size = max_batch_size
+        self._pending: Dict[K, "asyncio.Future[Optional[V]]"] = {}
+        self._in_flight: Dict[K, "asyncio.Future[Optional[V]]"] = {}
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def load(self, key: K) -> Optional[V]:
+        """
+        Load the value of a key, sharing the query of concurrent loads.
+
+        Returns:
+            The value fetched for the key, None if the batch function had none
+
+        Raises:
+            Exception: Whatever the batch function raised for the batch
+        """
+        LOADS.inc(self.name)
+        future = self._pending.get(key)
+        if future is None:
+            future = self._in_flight.get(key)
+
+        if future is not None:
+            COALESCED.inc(self.name)
+        else:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            future.add_done_callback(_retrieve_exception)
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            self._pending[key] = future
+            if len(self._pending) >= self._max_batch_size:
+                self._dispatch()
+
+        # A cancelled caller must not cancel the load shared with the others
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+        self._in_flight.update(batch)
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: Dict[K, "asyncio.Future[Optional[V]]"]) -> None:
+        BATCH_SIZE.observe(len(batch), self.name)
+        try:
+            results = await self._batch_fn(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for key, future in batch.items():
+                if not future.done():
+                    future.set_result(results.get(key))
+        finally:
+            for key, future in batch.items():
+                if not future.done():
+                    future.cancel()
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
@@ -1,19 +1,30 @@
 """Authentication dependencies for FastAPI."""
 
-from app.infrastructure.repositories.user_repository import MongoUserRepository
+from fastapi import Depends
+
+from app.domain.interfaces.user_repository_interface import IUserRepository
 from app.controllers.auth_controller import AuthController
+from app.infrastructure.dependencies.container import get_container
 
 
 class AuthDependencies:
     """Container for managing authentication-related dependencies."""
 
     @staticmethod
-    def get_controller() -> AuthController:
+    def get_repository() -> IUserRepository:
+        return get_container().user_repository
+
+    @staticmethod
+    def get_controller(
+        repository: IUserRepository = Depends(get_repository.__func__),
+    ) -> AuthController:
         """
         Get the authentication controller instance.
 
         Returns:
-            AuthController instance with repository dependency
+            The shared AuthController, or a new one around an overridden repository
         """
-        repository = MongoUserRepository()
+        container = get_container()
+        if container.owns(repository):
+            return container.auth_controller
         return AuthController(repository)
@@ -0,0 +1,169 @@
+"""
+Application-scoped dependency container.
+
+Repositories, services and controllers hold no per-request state, so one
+instance of each is built at startup and shared by every request instead of
+being rebuilt by the dependency providers on each call.
+
+The providers in the *_dependencies modules keep their signatures, so
+`app.dependency_overrides` still works: when a provider receives an
+overridden dependency, it builds a fresh object around it instead of
+returning the shared one.
+"""
+
+from functools import lru_cache
+from typing import Any
+from app.controllers.auth_controller import AuthController
+from app.controllers.email_verification_controller import EmailVerificationController
+from app.controllers.expense_controller import ExpenseController
+from app.controllers.group_controller import GroupController
+from app.controllers.user_controller import UserController
+from app.infrastructure.cache.cache_factory import get_cache
+from app.infrastructure.database.transactions import MongoTransactionManager
+from app.infrastructure.membership_cache import get_membership_cache
+from app.infrastructure.repositories.cached_repositories import (
+    CachedGroupRepository,
+    CachedUserRepository,
+)
+from app.infrastructure.repositories.email_outbox_repository import (
+    MongoEmailOutboxRepository,
+)
+from app.infrastructure.repositories.email_verification_repository import (
+    MongoEmailVerificationRepository,
+)
+from app.infrastructure.repositories.expense_repository import MongoExpenseRepository
+from app.infrastructure.repositories.group_repository import MongoGroupRepository
+from app.infrastructure.repositories.group_summary_repository import (
+    MongoGroupSummaryRepository,
+)
+from app.infrastructure.repositories.user_repository import MongoUserRepository
+from app.domain.interfaces.email_transport_interface import IEmailTransport
+from app.services.email_outbox_dispatcher import EmailOutboxDispatcher
+from app.services.fake_email_transport import FakeEmailTransport
+from app.services.outbox_email_service import OutboxEmailService
+from app.services.resend_email_transport import ResendEmailTransport
+from app.services.verification_token_compactor import VerificationTokenCompactor
+from app.infrastructure.settings import Settings, get_settings
+from app.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def build_email_transport(settings: Settings) -> IEmailTransport:
+    """
+    Build the email transport selected by settings.email_transport.
+
+    Raises:
+        ValueError: If the transport is unknown
+    """
+    if settings.email_transport == "resend":
+        return ResendEmailTransport()
+    if settings.email_transport == "fake":
+        return FakeEmailTransport()
+    raise ValueError(f"Unknown email transport: {settings.email_transport}")
+
+
+class AppContainer:
+    """Holds the shared repositories, services and controllers of the application."""
+
+    def __init__(self):
+        settings = get_settings()
+        self.cache = get_cache()
+        self.user_repository = MongoUserRepository()
+        self.group_repository = MongoGroupRepository()
+        if self.cache is not None:
+            self.user_repository = CachedUserRepository(
+                self.user_repository, self.cache
+            )
+            self.group_repository = CachedGroupRepository(
+                self.group_repository, self.cache
+            )
+        self.summary_repository = MongoGroupSummaryRepository()
+        self.expense_repository = MongoExpenseRepository(self.summary_repository)
+        self.verification_repository = MongoEmailVerificationRepository(
+            audit=settings.email_verification_audit
+        )
+        self.token_compactor = VerificationTokenCompactor(
+            self.verification_repository,
+            interval_seconds=settings.verification_compaction_interval_seconds,
+            batch_size=settings.verification_compaction_batch_size,
+        )
+        self.outbox_repository = MongoEmailOutboxRepository()
+        self.email_dispatcher = EmailOutboxDispatcher(
+            self.outbox_repository,
+            build_email_transport(settings),
+            workers=settings.email_outbox_workers,
+            max_attempts=settings.email_outbox_max_attempts,
+            backoff_base_seconds=settings.email_outbox_backoff_base_seconds,
+            backoff_max_seconds=settings.email_outbox_backoff_max_seconds,
+            poll_interval_seconds=settings.email_outbox_poll_interval_seconds,
+            lease_seconds=settings.email_outbox_lease_seconds,
+        )
+        self.email_service = OutboxEmailService(
+            self.outbox_repository, notify=self.email_dispatcher.wake
+        )
+        self.membership_cache = get_membership_cache()
+        self.transaction_manager = MongoTransactionManager()
+
+        self.expense_controller = ExpenseController(
+            self.expense_repository,
+            self.group_repository,
+            self.user_repository,
+            self.membership_cache,
+            self.summary_repository,
+        )
+        self.group_controller = GroupController(
+            group_repository=self.group_repository,
+            user_repository=self.user_repository,
+            membership_cache=self.membership_cache,
+        )
+        self.user_controller = UserController(
+            self.user_repository,
+            self.verification_repository,
+            self.email_service,
+            self.membership_cache,
+        )
+        self.email_verification_controller = EmailVerificationController(
+            self.user_repository,
+            self.verification_repository,
+            self.email_service,
+            self.transaction_manager,
+        )
+        self.auth_controller = AuthController(self.user_repository)
+
+        self._components = (
+            self.user_repository,
+            self.group_repository,
+            self.summary_repository,
+            self.expense_repository,
+            self.verification_repository,
+            self.email_service,
+            self.membership_cache,
+        )
+
+    def owns(self, *dependencies: Any) -> bool:
+        """
+        Check whether every dependency is one of the container's own instances.
+
+        Providers use this to decide between the shared controller and a
+        fresh one built around overridden dependencies.
+        """
+        return all(
+            any(dependency is component for component in self._components)
+            for dependency in dependencies
+        )
+
+
+@lru_cache()
+def get_container() -> AppContainer:
+    """
+    Returns the application container (singleton pattern).
+    Built during application startup; built on first use otherwise.
+    """
+    logger.info("Building application dependency container")
+    return AppContainer()
+
+
+def reset_container() -> None:
+    """Drop the container so the next get_container() builds a new one."""
+    get_container.cache_clear()
@@ -8,11 +8,7 @@ from app.domain.interfaces.email_verification_repository_interface import (
 )
 from app.domain.interfaces.user_repository_interface import IUserRepository
 from app.domain.interfaces.email_service_interface import IEmailService
-from app.infrastructure.repositories.email_verification_repository import (
-    MongoEmailVerificationRepository,
-)
-from app.infrastructure.repositories.user_repository import MongoUserRepository
-from app.services.resend_email_service import ResendEmailService
+from app.infrastructure.dependencies.container import get_container
 
 
 class EmailVerificationDependencies:
@@ -20,15 +16,15 @@ class EmailVerificationDependencies:
 
     @staticmethod
     def get_verification_repository() -> IEmailVerificationRepository:
-        return MongoEmailVerificationRepository()
+        return get_container().verification_repository
 
     @staticmethod
     def get_user_repository() -> IUserRepository:
-        return MongoUserRepository()
+        return get_container().user_repository
 
     @staticmethod
     def get_email_service() -> IEmailService:
-        return ResendEmailService()
+        return get_container().email_service
 
     @staticmethod
     def get_controller(
@@ -38,6 +34,9 @@ class EmailVerificationDependencies:
         ),
         email_service: IEmailService = Depends(get_email_service.__func__),
     ) -> EmailVerificationController:
+        container = get_container()
+        if container.owns(user_repository, verification_repository, email_service):
+            return container.email_verification_controller
         return EmailVerificationController(
             user_repository, verification_repository, email_service
         )
@@ -6,30 +6,71 @@ from app.controllers.expense_controller import ExpenseController
 from app.domain.interfaces.expense_repository_interface import IExpenseRepository
 from app.domain.interfaces.group_repository_interface import IGroupRepository
 from app.domain.interfaces.user_repository_interface import IUserRepository
+from app.domain.interfaces.membership_cache_interface import IMembershipCache
+from app.domain.interfaces.group_summary_repository_interface import (
+    IGroupSummaryRepository,
+)
 from app.infrastructure.repositories.expense_repository import MongoExpenseRepository
-from app.infrastructure.repositories.group_repository import MongoGroupRepository
-from app.infrastructure.repositories.user_repository import MongoUserRepository
+from app.infrastructure.dependencies.container import get_container
 
 
 class ExpenseDependencies:
-    """Container for managing expense-related dependencies."""
+    """
+    Container for managing expense-related dependencies.
+    Hands out the shared instances of the application container; overridden
+    dependencies get a fresh object built around them.
+    """
 
     @staticmethod
-    def get_repository() -> IExpenseRepository:
-        return MongoExpenseRepository()
+    def get_summary_repository() -> IGroupSummaryRepository:
+        return get_container().summary_repository
+
+    @staticmethod
+    def get_repository(
+        summary_repository: IGroupSummaryRepository = Depends(
+            get_summary_repository.__func__
+        ),
+    ) -> IExpenseRepository:
+        container = get_container()
+        if container.owns(summary_repository):
+            return container.expense_repository
+        return MongoExpenseRepository(summary_repository)
 
     @staticmethod
     def get_group_repository() -> IGroupRepository:
-        return MongoGroupRepository()
+        return get_container().group_repository
 
     @staticmethod
     def get_user_repository() -> IUserRepository:
-        return MongoUserRepository()
+        return get_container().user_repository
+
+    @staticmethod
+    def get_membership_cache() -> IMembershipCache:
+        return get_container().membership_cache
 
     @staticmethod
     def get_controller(
         repository: IExpenseRepository = Depends(get_repository.__func__),
         group_repository: IGroupRepository = Depends(get_group_repository.__func__),
         user_repository: IUserRepository = Depends(get_user_repository.__func__),
+        membership_cache: IMembershipCache = Depends(get_membership_cache.__func__),
+        summary_repository: IGroupSummaryRepository = Depends(
+            get_summary_repository.__func__
+        ),
     ) -> ExpenseController:
-        return ExpenseController(repository, group_repository, user_repository)
+        container = get_container()
+        if container.owns(
+            repository,
+            group_repository,
+            user_repository,
+            membership_cache,
+            summary_repository,
+        ):
+            return container.expense_controller
+        return ExpenseController(
+            repository,
+            group_repository,
+            user_repository,
+            membership_cache,
+            summary_repository,
+        )
@@ -4,8 +4,8 @@ from fastapi import Depends
 from app.controllers.group_controller import GroupController
 from app.domain.interfaces.group_repository_interface import IGroupRepository
 from app.domain.interfaces.user_repository_interface import IUserRepository
-from app.infrastructure.repositories.group_repository import MongoGroupRepository
-from app.infrastructure.repositories.user_repository import MongoUserRepository
+from app.domain.interfaces.membership_cache_interface import IMembershipCache
+from app.infrastructure.dependencies.container import get_container
 
 
 class GroupDependencies:
@@ -13,18 +13,27 @@ class GroupDependencies:
 
     @staticmethod
     def get_group_repository() -> IGroupRepository:
-        return MongoGroupRepository()
+        return get_container().group_repository
 
     @staticmethod
     def get_user_repository() -> IUserRepository:
-        return MongoUserRepository()
+        return get_container().user_repository
+
+    @staticmethod
+    def get_membership_cache() -> IMembershipCache:
+        return get_container().membership_cache
 
     @staticmethod
     def get_controller(
         group_repository: IGroupRepository = Depends(get_group_repository.__func__),
         user_repository: IUserRepository = Depends(get_user_repository.__func__),
+        membership_cache: IMembershipCache = Depends(get_membership_cache.__func__),
     ) -> GroupController:
+        container = get_container()
+        if container.owns(group_repository, user_repository, membership_cache):
+            return container.group_controller
         return GroupController(
             group_repository=group_repository,
             user_repository=user_repository,
+            membership_cache=membership_cache,
         )
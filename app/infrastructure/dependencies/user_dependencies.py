@@ -8,11 +8,8 @@ from app.domain.interfaces.email_verification_repository_interface import (
     IEmailVerificationRepository,
 )
 from app.domain.interfaces.email_service_interface import IEmailService
-from app.infrastructure.repositories.user_repository import MongoUserRepository
-from app.infrastructure.repositories.email_verification_repository import (
-    MongoEmailVerificationRepository,
-)
-from app.services.resend_email_service import ResendEmailService
+from app.domain.interfaces.membership_cache_interface import IMembershipCache
+from app.infrastructure.dependencies.container import get_container
 
 
 class UserDependencies:
@@ -20,15 +17,19 @@ class UserDependencies:
 
     @staticmethod
     def get_repository() -> IUserRepository:
-        return MongoUserRepository()
+        return get_container().user_repository
 
     @staticmethod
     def get_verification_repository() -> IEmailVerificationRepository:
-        return MongoEmailVerificationRepository()
+        return get_container().verification_repository
 
     @staticmethod
     def get_email_service() -> IEmailService:
-        return ResendEmailService()
+        return get_container().email_service
+
+    @staticmethod
+    def get_membership_cache() -> IMembershipCache:
+        return get_container().membership_cache
 
     @staticmethod
     def get_controller(
@@ -37,5 +38,13 @@ class UserDependencies:
             get_verification_repository.__func__
         ),
         email_service: IEmailService = Depends(get_email_service.__func__),
+        membership_cache: IMembershipCache = Depends(get_membership_cache.__func__),
     ) -> UserController:
-        return UserController(repository, verification_repository, email_service)
+        container = get_container()
+        if container.owns(
+            repository, verification_repository, email_service, membership_cache
+        ):
+            return container.user_controller
+        return UserController(
+            repository, verification_repository, email_service, membership_cache
+        )
@@ -1,15 +1,162 @@
 """
 Centralized logging configuration for the application.
 Logs are captured by cloud infrastructure (CloudWatch, Datadog, etc).
+
+Loggers only put records on an in-memory queue; a QueueListener thread
+formats them and writes them to stdout, so request handlers never block on
+the stream. Messages use lazy %-style arguments, which are only formatted
+on the listener thread, and only for records that pass the level check.
+
+Settings:
+    log_level: Level of the application loggers (INFO by default)
+    log_json: Write one JSON object per line instead of plain text
+    log_rate_limit_per_second: Per logger, how many records below WARNING
+        with the same message template are written per second (0 disables)
+    log_rate_limits: Per-logger overrides of log_rate_limit_per_second
 """
 
+import atexit
+import json
 import logging
+import queue
 import sys
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Tuple
+from app.infrastructure.settings import get_settings
+
+_TEXT_FORMAT = "[%(levelname)s]: %(message)s - %(asctime)s"
+_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+class TextFormatter(logging.Formatter):
+    """Plain text lines, noting how many similar records were rate limited."""
+
+    def __init__(self):
+        super().__init__(_TEXT_FORMAT, datefmt=_DATE_FORMAT)
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            message += f" ({suppressed} similar suppressed)"
+        return message
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, for log pipelines that parse structured logs."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(
+                record.created, tz=timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            payload["suppressed"] = suppressed
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Let at most `max_per_second` records per message template through each
+    second. Records at WARNING and above are never dropped.
+
+    Lazy %-style messages share their template across calls, so a noisy line
+    such as "Retrieved %s expenses for group: %s" is limited as a whole. The
+    first record let through after a drop carries the number of dropped
+    records in `record.suppressed`.
+    """
+
+    def __init__(self, max_per_second: int):
+        super().__init__()
+        self.max_per_second = max_per_second
+        self._windows: Dict[str, Tuple[float, int, int]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+
+        template = str(record.msg)
+        now = time.monotonic()
+        with self._lock:
+            start, passed, dropped = self._windows.get(template, (now, 0, 0))
+            if now - start >= 1.0:
+                start, passed = now, 0
+            if passed >= self.max_per_second:
+                self._windows[template] = (start, passed, dropped + 1)
+                return False
+            self._windows[template] = (start, passed + 1, 0)
+
+        if dropped:
+            record.suppressed = dropped
+        return True
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread.
+
+    The stock prepare() formats the message on the calling thread so records
+    can be pickled; ours never leave the process, so it is skipped.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if _listener is None:
+            _start_listener()
+        super().emit(record)
+
+
+def _start_listener() -> None:
+    """Start the thread writing queued records to stdout, once."""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            return
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(
+            JsonFormatter() if get_settings().log_json else TextFormatter()
+        )
+        _listener = QueueListener(_queue, stream_handler)
+        _listener.start()
+
+
+def shutdown_logging() -> None:
+    """
+    Write out the queued records and stop the listener thread.
+    Logging again afterwards starts a new listener.
+    """
+    global _listener
+    with _listener_lock:
+        listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+
+
+atexit.register(shutdown_logging)
+
+_queue_handler = _DeferredQueueHandler(_queue)
 
 
 def get_logger(name: str) -> logging.Logger:
     """
-    Gets a logger configured for stdout/stderr.
+    Gets a logger that writes to stdout through the logging queue.
 
     Args:
         name: Logger name (usually __name__)
@@ -22,14 +169,15 @@ def get_logger(name: str) -> logging.Logger:
     if logger.hasHandlers():
         return logger
 
-    logger.setLevel(logging.INFO)
+    settings = get_settings()
+    logger.setLevel(settings.log_level.upper())
 
-    formatter = logging.Formatter(
-        "[%(levelname)s]: %(message)s - %(asctime)s", datefmt="%Y-%m-%d %H:%M:%S"
+    rate_limit = settings.log_rate_limits.get(
+        name, settings.log_rate_limit_per_second
     )
+    if rate_limit > 0:
+        logger.addFilter(RateLimitFilter(rate_limit))
 
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    logger.addHandler(_queue_handler)
 
     return logger
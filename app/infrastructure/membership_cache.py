@@ -0,0 +1,91 @@
+"""
+In-process TTL cache of group member ids and of active users.
+
+Expense endpoints check on every call that the user is active and a member of
+the group. Caching each group's member set and the users found active lets a
+warm check run without touching MongoDB. Membership changes and user
+deactivations made through this process invalidate the entry immediately; the
+TTL bounds how long other worker processes may keep serving a stale one.
+"""
+
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, FrozenSet, Iterable, Optional, Tuple
+from app.domain.interfaces.membership_cache_interface import IMembershipCache
+from app.infrastructure.settings import get_settings
+
+
+class InMemoryMembershipCache(IMembershipCache):
+    """
+    TTL cache of group member ids and active users, each evicting its least
+    recently used entry when full.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: How long an entry stays valid
+            max_entries: Maximum number of groups, and of users, kept
+            clock: Monotonic time source (injectable for tests)
+        """
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, FrozenSet[str]]]" = OrderedDict()
+        self._active_users: "OrderedDict[str, Tuple[float, bool]]" = OrderedDict()
+
+    def _lookup(self, entries: OrderedDict, key: str) -> Any:
+        entry = entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del entries[key]
+            return None
+        entries.move_to_end(key)
+        return value
+
+    def _store(self, entries: OrderedDict, key: str, value: Any) -> None:
+        entries[key] = (self._clock() + self._ttl, value)
+        entries.move_to_end(key)
+        while len(entries) > self._max_entries:
+            entries.popitem(last=False)
+
+    def get(self, group_id: str) -> Optional[FrozenSet[str]]:
+        return self._lookup(self._entries, group_id)
+
+    def set(self, group_id: str, user_ids: Iterable[str]) -> None:
+        self._store(self._entries, group_id, frozenset(user_ids))
+
+    def invalidate(self, group_id: str) -> None:
+        self._entries.pop(group_id, None)
+
+    def is_active(self, user_id: str) -> bool:
+        return self._lookup(self._active_users, user_id) is True
+
+    def set_active(self, user_id: str) -> None:
+        self._store(self._active_users, user_id, True)
+
+    def invalidate_user(self, user_id: str) -> None:
+        self._active_users.pop(user_id, None)
+
+
+@lru_cache()
+def get_membership_cache() -> IMembershipCache:
+    """
+    Returns the process-wide membership cache (singleton pattern).
+    TTL and size come from settings.
+    """
+    settings = get_settings()
+    return InMemoryMembershipCache(
+        ttl_seconds=settings.membership_cache_ttl_seconds,
+        max_entries=settings.membership_cache_max_entries,
+    )
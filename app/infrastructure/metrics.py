@@ -0,0 +1,226 @@
+"""
+In-process metrics registry exposed in the Prometheus text format.
+
+Recording never takes a lock: every thread writes to its own shard (a plain
+dict reached through threading.local), and a scrape sums the shards. The
+event loop and the driver threads that report MongoDB commands therefore
+never contend, and a request pays for a couple of dict lookups and
+additions.
+"""
+
+import threading
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_Key = Tuple[str, Tuple[str, ...]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Metric:
+    """Base of the metric types: a name, help text and label names."""
+
+    kind = ""
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ):
+        self._registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _new_cell(self) -> List[float]:
+        return [0.0]
+
+    def _cell(self, labels: Tuple[str, ...]) -> List[float]:
+        shard = self._registry._shard()
+        key = (self.name, labels)
+        cell = shard.get(key)
+        if cell is None:
+            cell = shard[key] = self._new_cell()
+        return cell
+
+    def _render(self, cells: Dict[Tuple[str, ...], List[float]]) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(cell[0])}"
+            for labels, cell in cells.items()
+        ]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._cell(labels)[0] += amount
+
+
+class Gauge(_Metric):
+    """Value that goes up and down, such as requests in flight."""
+
+    kind = "gauge"
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._cell(labels)[0] += amount
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self._cell(labels)[0] -= amount
+
+
+class Histogram(_Metric):
+    """
+    Distribution of observed values over fixed buckets.
+    A cell holds [count, sum, per-bucket counts..., overflow count].
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(registry, name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_cell(self) -> List[float]:
+        return [0, 0.0] + [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float, *labels: str) -> None:
+        cell = self._cell(labels)
+        cell[0] += 1
+        cell[1] += value
+        cell[2 + bisect_left(self.buckets, value)] += 1
+
+    def _render(self, cells: Dict[Tuple[str, ...], List[float]]) -> List[str]:
+        lines = []
+        bucket_labelnames = self.labelnames + ("le",)
+        for labels, cell in cells.items():
+            cumulative = 0
+            bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+            for bound, count in zip(bounds, cell[2:]):
+                cumulative += count
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(bucket_labelnames, labels + (bound,))} {_format_value(cumulative)}"
+                )
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(cell[1])}")
+            lines.append(f"{self.name}_count{label_text} {_format_value(cell[0])}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds the declared metrics and the per-thread shards of their values."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._shards: List[Dict[_Key, List[float]]] = []
+        self._local = threading.local()
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> Dict[_Key, List[float]]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            # Taken once per thread, never on the recording path afterwards
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def _register(self, metric: _Metric) -> _Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric):
+                raise ValueError(f"Metric {metric.name} already registered")
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self._register(Counter(self, name, documentation, labelnames))
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        return self._register(Gauge(self, name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(
+            Histogram(self, name, documentation, labelnames, buckets)
+        )
+
+    def _collect(self) -> Dict[_Key, List[float]]:
+        """Sum the cells of every shard."""
+        with self._shards_lock:
+            shards = list(self._shards)
+        merged: Dict[_Key, List[float]] = {}
+        for shard in shards:
+            for key, cell in list(shard.items()):
+                total = merged.get(key)
+                if total is None:
+                    merged[key] = list(cell)
+                else:
+                    for i, value in enumerate(cell):
+                        total[i] += value
+        return merged
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: The exposition text, ending with a newline
+        """
+        by_metric: Dict[str, Dict[Tuple[str, ...], List[float]]] = {}
+        for (name, labels), cell in self._collect().items():
+            by_metric.setdefault(name, {})[labels] = cell
+
+        lines = []
+        for name, metric in self._metrics.items():
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric._render(dict(sorted(by_metric.get(name, {}).items()))))
+        return "\n".join(lines) + "\n"
+
+
+@lru_cache()
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    Returns the application metrics registry (singleton pattern).
+    """
+    return MetricsRegistry()
@@ -0,0 +1,90 @@
+"""
+HTTP request metrics per route template.
+
+Requests are labelled with the path template of the route that serves them,
+as declared on its router ("/expenses/{group_id}"), rather than the raw
+path, so ids do not create a new series per request. Requests matching no route share the
+"unmatched" label.
+
+Two pieces work together because the router hands included routes a copy
+of the ASGI scope, so a middleware cannot see which route matched:
+
+  - MetricsMiddleware times the whole request and counts it by status code
+  - track_route, an application-wide dependency, runs once the route is
+    known; it reports the template back to the middleware through a slot
+    shared by the scope copies and counts the request as in flight while
+    its handler runs
+"""
+
+import time
+from typing import AsyncIterator, List
+from fastapi import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.infrastructure.metrics import get_metrics_registry
+
+UNMATCHED_ROUTE = "unmatched"
+ROUTE_SCOPE_KEY = "metrics.route"
+
+_registry = get_metrics_registry()
+REQUESTS = _registry.counter(
+    "http_requests_total",
+    "HTTP requests handled, by route template and status code.",
+    ("method", "route", "status"),
+)
+REQUEST_DURATION = _registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency in seconds, by route template.",
+    ("method", "route"),
+)
+REQUESTS_IN_FLIGHT = _registry.gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being handled, by route template.",
+    ("method", "route"),
+)
+
+
+class MetricsMiddleware:
+    """Records the count and latency of every HTTP request."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route_slot: List[str] = [UNMATCHED_ROUTE]
+        scope[ROUTE_SCOPE_KEY] = route_slot
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            method, route = scope["method"], route_slot[0]
+            REQUEST_DURATION.observe(time.perf_counter() - start, method, route)
+            REQUESTS.inc(method, route, str(status_code))
+
+
+async def track_route(request: Request) -> AsyncIterator[None]:
+    """
+    Application-wide dependency reporting the matched route template to
+    MetricsMiddleware and counting the request as in flight meanwhile.
+    """
+    route = getattr(request.scope.get("route"), "path", UNMATCHED_ROUTE)
+    route_slot = request.scope.get(ROUTE_SCOPE_KEY)
+    if route_slot is not None:
+        route_slot[0] = route
+
+    REQUESTS_IN_FLIGHT.inc(request.method, route)
+    try:
+        yield
+    finally:
+        REQUESTS_IN_FLIGHT.dec(request.method, route)
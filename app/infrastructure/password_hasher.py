@@ -0,0 +1,104 @@
+"""
+Bounded worker pool for password hashing.
+
+bcrypt with rounds=12 takes ~250 ms of CPU per call. Running it directly in an
+async handler blocks the event loop, so every other request on the worker waits.
+The hasher runs it on a thread pool instead (bcrypt releases the GIL while
+hashing) and rejects new work once the pool and its queue are full.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, TypeVar
+from app.infrastructure.settings import get_settings
+from app.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class PasswordHasherBusyError(Exception):
+    """Raised when the password hashing pool has no free capacity."""
+
+
+class PasswordHasher:
+    """
+    Runs blocking password hashing functions on a bounded thread pool.
+
+    At most `max_workers` calls run at once and up to `max_queue` more wait
+    for a worker; beyond that, calls fail fast with PasswordHasherBusyError.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        """
+        Initialize the pool.
+
+        Args:
+            max_workers: Number of worker threads
+            max_queue: Number of calls allowed to wait for a free worker
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hasher"
+        )
+        self._capacity = max_workers + max_queue
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently running or queued."""
+        return self._in_flight
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run func(*args) on the pool without blocking the event loop.
+
+        Args:
+            func: Blocking function to run
+            *args: Positional arguments for func
+
+        Returns:
+            The function's return value
+
+        Raises:
+            PasswordHasherBusyError: If the pool and its queue are full
+        """
+        if self._in_flight >= self._capacity:
+            logger.warning(
+                "Password hasher saturated (%s calls in flight)", self._in_flight
+            )
+            raise PasswordHasherBusyError(
+                "Server is busy processing credentials. Please try again shortly."
+            )
+
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._in_flight -= 1
+
+    def shutdown(self) -> None:
+        """Stop the worker threads, dropping calls that have not started yet."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+@lru_cache()
+def get_password_hasher() -> PasswordHasher:
+    """
+    Returns the process-wide password hasher (singleton pattern).
+    Pool sizes come from settings.
+    """
+    settings = get_settings()
+    return PasswordHasher(
+        max_workers=settings.password_hash_workers,
+        max_queue=settings.password_hash_queue_size,
+    )
+
+
+def shutdown_password_hasher() -> None:
+    """Shut down the password hasher if it was created. Called on application shutdown."""
+    if get_password_hasher.cache_info().currsize:
+        get_password_hasher().shutdown()
+        get_password_hasher.cache_clear()
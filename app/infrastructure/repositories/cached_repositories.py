@@ -0,0 +1,310 @@
+"""
+Read-through caching wrappers around the user and group repositories.
+
+Every authenticated request looks its user up by email, and expense
+endpoints load the group to check membership, so these reads are served
+from the cache and only misses reach MongoDB. Entities are cached as JSON,
+which keeps callers from sharing (and mutating) cached instances and lets
+the Redis backend share entries between replicas. Password hashes are never
+cached: users read from the cache come back without one.
+
+Writes go through the same wrappers and drop the entries of the objects
+they touched. Absent objects are not cached, so a created object is visible
+at once. A read that races a write may still cache the old value; the TTL
+bounds how long it is served.
+"""
+
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+)
+from pydantic import BaseModel, Field, ValidationError
+from app.domain.entities.group_entity import Group
+from app.domain.entities.user_entity import User
+from app.domain.interfaces.cache_interface import ICache
+from app.domain.interfaces.group_repository_interface import IGroupRepository
+from app.domain.interfaces.user_repository_interface import IUserRepository
+from app.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+E = TypeVar("E", bound=BaseModel)
+
+
+class _CachedUser(User):
+    """A user as read from the cache, without its password hash."""
+
+    password: str = Field("", description="Never cached; empty")
+
+
+class _ReadThroughCache(Generic[E]):
+    """Loads entities of one namespace through the cache."""
+
+    def __init__(
+        self,
+        cache: ICache,
+        namespace: str,
+        model: Type[E],
+        ttl_seconds: Optional[float] = None,
+        exclude: FrozenSet[str] = frozenset(),
+    ):
+        """
+        Args:
+            cache: Cache holding the entries
+            namespace: Namespace of the entries
+            model: Model the entries are read as; it must default the
+                   excluded fields
+            ttl_seconds: How long entries stay cached (the cache default if None)
+            exclude: Fields of the entities left out of the cache
+        """
+        self.cache = cache
+        self.namespace = namespace
+        self.model = model
+        self.ttl_seconds = ttl_seconds
+        self.exclude = exclude
+
+    async def get(self, key: str) -> Optional[E]:
+        raw = await self.cache.get(self.namespace, key)
+        if raw is None:
+            return None
+        try:
+            return self.model.model_validate_json(raw)
+        except ValidationError as e:
+            # Written by a release with another schema: reload from the database
+            logger.warning("Discarding cached %s %s: %s", self.namespace, key, e)
+            return None
+
+    async def load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Optional[E]]],
+        expected_id: Optional[str] = None,
+    ) -> Optional[E]:
+        entity = await self.get(key)
+        if entity is not None and expected_id is not None and entity.id != expected_id:
+            # Never serve one object for another, whatever corrupted the entry
+            logger.error(
+                "Cached %s %s holds id %s; discarding it",
+                self.namespace,
+                key,
+                entity.id,
+            )
+            await self.invalidate(key)
+            entity = None
+        if entity is None:
+            entity = await loader()
+            if entity is not None:
+                await self.store(key, entity)
+        return entity
+
+    async def store(self, key: str, entity: E) -> None:
+        await self.cache.set(
+            self.namespace,
+            key,
+            entity.model_dump_json(exclude=self.exclude),
+            self.ttl_seconds,
+        )
+
+    async def get_reference(self, key: str) -> Optional[str]:
+        """Get a plain string entry, such as the id an alternate key maps to."""
+        return await self.cache.get(self.namespace, key)
+
+    async def store_reference(self, key: str, value: str) -> None:
+        await self.cache.set(self.namespace, key, value, self.ttl_seconds)
+
+    async def invalidate(self, *keys: str) -> None:
+        await self.cache.delete(self.namespace, *keys)
+
+
+class CachedUserRepository(IUserRepository):
+    """
+    User repository serving get_by_id and get_by_email from the cache.
+
+    Users are cached by id; an email maps to the id, and the user found is
+    checked to still have that email, so writes only need to drop the id.
+    Users served from the cache have an empty password: callers needing the
+    hash read it with get_fields.
+    """
+
+    NAMESPACE = "users"
+
+    def __init__(
+        self,
+        repository: IUserRepository,
+        cache: ICache,
+        ttl_seconds: Optional[float] = None,
+    ):
+        """
+        Wrap a user repository.
+
+        Args:
+            repository: Repository reading and writing the database
+            cache: Cache shared by the wrapped repositories
+            ttl_seconds: How long users stay cached (the cache default if None)
+        """
+        self.repository = repository
+        self._users = _ReadThroughCache(
+            cache,
+            self.NAMESPACE,
+            _CachedUser,
+            ttl_seconds,
+            exclude=frozenset({"password"}),
+        )
+
+    @staticmethod
+    def _id_key(id: str) -> str:
+        return f"id:{id}"
+
+    @staticmethod
+    def _email_key(email: str) -> str:
+        return f"email:{email}"
+
+    async def _written(self, id: str, result: Any) -> Any:
+        await self._users.invalidate(self._id_key(id))
+        return result
+
+    async def create(self, entity: User) -> User:
+        return await self.repository.create(entity)
+
+    async def get_by_id(self, id: str) -> Optional[User]:
+        return await self._users.load(
+            self._id_key(id), lambda: self.repository.get_by_id(id), expected_id=id
+        )
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        user_id = await self._users.get_reference(self._email_key(email))
+        if user_id is not None:
+            user = await self.get_by_id(user_id)
+            if user is not None and user.email == email:
+                return user
+
+        user = await self.repository.get_by_email(email)
+        if user is not None and user.id:
+            await self._users.store(self._id_key(user.id), user)
+            await self._users.store_reference(self._email_key(email), user.id)
+        return user
+
+    async def get_fields(
+        self, id: str, fields: Iterable[str]
+    ) -> Optional[Dict[str, Any]]:
+        return await self.repository.get_fields(id, fields)
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
+        return await self.repository.get_all(skip, limit)
+
+    async def get_many_by_ids(self, ids: List[str]) -> Dict[str, str]:
+        return await self.repository.get_many_by_ids(ids)
+
+    async def email_exists(self, email: str) -> bool:
+        return await self.repository.email_exists(email)
+
+    async def get_by_id_unverified(self, id: str) -> Optional[User]:
+        return await self.repository.get_by_id_unverified(id)
+
+    async def get_by_email_unverified(self, email: str) -> Optional[User]:
+        return await self.repository.get_by_email_unverified(email)
+
+    async def update(self, id: str, entity: User) -> Optional[User]:
+        return await self._written(id, await self.repository.update(id, entity))
+
+    async def update_fields(self, id: str, fields: Dict[str, Any]) -> Optional[User]:
+        return await self._written(id, await self.repository.update_fields(id, fields))
+
+    async def mark_email_verified(
+        self, id: str, session: Optional[Any] = None
+    ) -> Optional[User]:
+        return await self._written(
+            id, await self.repository.mark_email_verified(id, session=session)
+        )
+
+    async def delete(self, id: str) -> bool:
+        return await self._written(id, await self.repository.delete(id))
+
+    async def exists(self, id: str) -> bool:
+        return await self.repository.exists(id)
+
+
+class CachedGroupRepository(IGroupRepository):
+    """Group repository serving get_by_id from the cache."""
+
+    NAMESPACE = "groups"
+
+    def __init__(
+        self,
+        repository: IGroupRepository,
+        cache: ICache,
+        ttl_seconds: Optional[float] = None,
+    ):
+        """
+        Wrap a group repository.
+
+        Args:
+            repository: Repository reading and writing the database
+            cache: Cache shared by the wrapped repositories
+            ttl_seconds: How long groups stay cached (the cache default if None)
+        """
+        self.repository = repository
+        self._groups = _ReadThroughCache(cache, self.NAMESPACE, Group, ttl_seconds)
+
+    @staticmethod
+    def _id_key(id: str) -> str:
+        return f"id:{id}"
+
+    async def _written(self, id: str, result: Any) -> Any:
+        await self._groups.invalidate(self._id_key(id))
+        return result
+
+    async def create(self, entity: Group) -> Group:
+        return await self.repository.create(entity)
+
+    async def get_by_id(self, id: str) -> Optional[Group]:
+        return await self._groups.load(
+            self._id_key(id), lambda: self.repository.get_by_id(id), expected_id=id
+        )
+
+    async def get_fields(
+        self, id: str, fields: Iterable[str]
+    ) -> Optional[Dict[str, Any]]:
+        return await self.repository.get_fields(id, fields)
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Group]:
+        return await self.repository.get_all(skip, limit)
+
+    async def get_by_user_id(self, user_id: str) -> List[Group]:
+        return await self.repository.get_by_user_id(user_id)
+
+    async def update(self, id: str, entity: Group) -> Optional[Group]:
+        return await self._written(id, await self.repository.update(id, entity))
+
+    async def update_fields(self, id: str, fields: Dict[str, Any]) -> Optional[Group]:
+        return await self._written(id, await self.repository.update_fields(id, fields))
+
+    async def add_member(self, group_id: str, user_id: str) -> Optional[Group]:
+        return await self._written(
+            group_id, await self.repository.add_member(group_id, user_id)
+        )
+
+    async def add_members(self, group_id: str, user_ids: List[str]) -> Optional[Group]:
+        return await self._written(
+            group_id, await self.repository.add_members(group_id, user_ids)
+        )
+
+    async def remove_member(self, group_id: str, user_id: str) -> Optional[Group]:
+        return await self._written(
+            group_id, await self.repository.remove_member(group_id, user_id)
+        )
+
+    async def delete(self, id: str) -> bool:
+        return await self._written(id, await self.repository.delete(id))
+
+    async def exists(self, id: str) -> bool:
+        return await self.repository.exists(id)
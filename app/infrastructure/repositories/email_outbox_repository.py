@@ -0,0 +1,139 @@
+"""
+MongoDB implementation of the email outbox repository.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from bson import ObjectId
+from pymongo import IndexModel, ASCENDING, ReturnDocument
+from pymongo.write_concern import WriteConcern
+
+from app.domain.interfaces.email_outbox_repository_interface import (
+    IEmailOutboxRepository,
+)
+from app.domain.entities.outbox_email_entity import OutboxEmail
+from app.domain.enums.outbox_status_enum import OutboxStatus
+from app.infrastructure.database.database import Database
+from app.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+# The caller is told the email will be sent once enqueue returns, so the
+# write must survive a primary failover.
+DURABLE_WRITE_CONCERN = WriteConcern(w="majority", j=True)
+
+
+class MongoEmailOutboxRepository(IEmailOutboxRepository):
+    """MongoDB implementation of IEmailOutboxRepository."""
+
+    indexes = [
+        # Serves claim_next: the pending email due the longest
+        IndexModel(
+            [("status", ASCENDING), ("next_attempt_at", ASCENDING)],
+            name="status_next_attempt_at",
+        ),
+    ]
+
+    def __init__(self):
+        self.collection_name = "email_outbox"
+
+    def _get_collection(self):
+        return Database.get_db()[self.collection_name]
+
+    def _entity_to_document(self, entity: OutboxEmail) -> dict:
+        doc = entity.model_dump(exclude={"id"})
+        doc["_id"] = ObjectId(entity.id) if entity.id else ObjectId()
+        return doc
+
+    def _document_to_entity(self, doc: dict) -> Optional[OutboxEmail]:
+        if doc:
+            doc["id"] = str(doc.pop("_id"))
+            return OutboxEmail(**doc)
+        return None
+
+    async def enqueue(self, email: OutboxEmail) -> OutboxEmail:
+        try:
+            collection = self._get_collection().with_options(
+                write_concern=DURABLE_WRITE_CONCERN
+            )
+            doc = self._entity_to_document(email)
+            result = await collection.insert_one(doc)
+            email.id = str(result.inserted_id)
+            logger.info("Enqueued outbox email with ID: %s", email.id)
+            return email
+        except Exception as e:
+            logger.error("Error enqueuing outbox email: %s", e)
+            raise
+
+    async def claim_next(
+        self, now: datetime, lease_seconds: float
+    ) -> Optional[OutboxEmail]:
+        try:
+            collection = self._get_collection()
+            doc = await collection.find_one_and_update(
+                {
+                    "status": OutboxStatus.PENDING.value,
+                    "next_attempt_at": {"$lte": now},
+                },
+                {
+                    "$set": {
+                        "next_attempt_at": now + timedelta(seconds=lease_seconds),
+                        "updated_at": now,
+                    },
+                    "$inc": {"attempts": 1},
+                },
+                sort=[("next_attempt_at", ASCENDING)],
+                return_document=ReturnDocument.AFTER,
+            )
+            return self._document_to_entity(doc) if doc else None
+        except Exception as e:
+            logger.error("Error claiming outbox email: %s", e)
+            raise
+
+    async def mark_sent(self, id: str) -> None:
+        try:
+            collection = self._get_collection()
+            await collection.delete_one({"_id": ObjectId(id)})
+            logger.info("Outbox email %s sent", id)
+        except Exception as e:
+            logger.error("Error removing sent outbox email %s: %s", id, e)
+            raise
+
+    async def schedule_retry(
+        self, id: str, next_attempt_at: datetime, error: str
+    ) -> None:
+        try:
+            collection = self._get_collection()
+            await collection.update_one(
+                {"_id": ObjectId(id)},
+                {
+                    "$set": {
+                        "next_attempt_at": next_attempt_at,
+                        "last_error": error,
+                        "updated_at": datetime.now(timezone.utc),
+                    }
+                },
+            )
+        except Exception as e:
+            logger.error("Error scheduling retry of outbox email %s: %s", id, e)
+            raise
+
+    async def dead_letter(self, id: str, error: str) -> None:
+        try:
+            collection = self._get_collection()
+            await collection.update_one(
+                {"_id": ObjectId(id)},
+                {
+                    "$set": {
+                        "status": OutboxStatus.DEAD.value,
+                        # The body may carry a verification code
+                        "html": "",
+                        "last_error": error,
+                        "updated_at": datetime.now(timezone.utc),
+                    }
+                },
+            )
+            logger.warning("Outbox email %s dead-lettered: %s", id, error)
+        except Exception as e:
+            logger.error("Error dead-lettering outbox email %s: %s", id, e)
+            raise
@@ -1,30 +1,149 @@
 """
 MongoDB implementation of the email verification token repository.
+
+Each user has at most one active token, upserted on every send. Sends are
+counted in a small per-user document of email_verification_resends, so the
+resend limit survives the removal of tokens: expired ones by a TTL index,
+used ones by delete_used (see VerificationTokenCompactor).
 """
 
-from typing import List, Optional
-from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+from datetime import datetime, timedelta, timezone
 from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo import IndexModel, ASCENDING, DESCENDING, ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
 from app.domain.interfaces.email_verification_repository_interface import (
     IEmailVerificationRepository,
 )
 from app.domain.entities.email_verification_token_entity import EmailVerificationToken
 from app.infrastructure.database.database import Database
+from app.infrastructure.database.queries import document_exists, find_fields
 from app.infrastructure.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Expired tokens are kept this long before MongoDB's TTL monitor removes
+# them, so a late attempt is told the code expired rather than missing.
+TOKEN_TTL_GRACE = timedelta(hours=24)
+
+# Resend counters outlive the tokens they count: a user at the limit stays
+# there for this long after the latest send, even once the tokens are gone.
+RESEND_COUNTER_TTL = timedelta(days=7)
+
+ACTIVE_TOKEN_INDEX = "user_id_active_unique"
+
 
 class MongoEmailVerificationRepository(IEmailVerificationRepository):
     """MongoDB implementation of IEmailVerificationRepository."""
 
-    def __init__(self):
+    indexes = [
+        # At most one active token per user: issue_token upserts it
+        IndexModel(
+            [("user_id", ASCENDING)],
+            name=ACTIVE_TOKEN_INDEX,
+            unique=True,
+            partialFilterExpression={"is_used": False},
+        ),
+        # Serves delete_used
+        IndexModel(
+            [("is_used", ASCENDING)],
+            name="used",
+            partialFilterExpression={"is_used": True},
+        ),
+        IndexModel(
+            [("expires_at", ASCENDING)],
+            name="expires_at_ttl",
+            expireAfterSeconds=int(TOKEN_TTL_GRACE.total_seconds()),
+        ),
+    ]
+    secondary_indexes = {
+        "email_verification_resends": [
+            IndexModel(
+                [("expires_at", ASCENDING)],
+                name="expires_at_ttl",
+                expireAfterSeconds=0,
+            ),
+        ],
+    }
+
+    def __init__(self, audit: bool = False):
+        """
+        Args:
+            audit: Also record every issued token in the history collection
+        """
         self.collection_name = "email_verification_tokens"
+        self.counter_collection_name = "email_verification_resends"
+        self.history_collection_name = "email_verification_token_history"
+        self.audit = audit
 
     def _get_collection(self):
         return Database.get_db()[self.collection_name]
 
+    async def prepare_indexes(self, db: AsyncIOMotorDatabase) -> None:
+        """
+        Make the collection fit the declared indexes; run by ensure_indexes
+        before it builds them.
+
+        Tokens used to be invalidated and re-created in two writes, so a race
+        could leave a user with several active tokens, on which the
+        user_id_active_unique build fails. Until that index exists, every
+        active token but the newest of each user is retired. Once it exists,
+        no duplicate can be written and nothing is done.
+        """
+        collection = db[self.collection_name]
+        if ACTIVE_TOKEN_INDEX in await collection.index_information():
+            return
+        retired = await self.retire_duplicate_active_tokens(collection)
+        if retired:
+            logger.warning(
+                "Retired %s duplicate active verification tokens before "
+                "building %s",
+                retired,
+                ACTIVE_TOKEN_INDEX,
+            )
+
+    async def retire_duplicate_active_tokens(
+        self, collection: Optional[AsyncIOMotorCollection] = None
+    ) -> int:
+        """
+        Mark used every active token but the newest of each user.
+
+        Args:
+            collection: Collection to clean (defaults to the tokens collection)
+
+        Returns:
+            Number of tokens retired
+        """
+        try:
+            if collection is None:
+                collection = self._get_collection()
+            cursor = collection.aggregate(
+                [
+                    {"$match": {"is_used": False}},
+                    {"$sort": {"created_at": DESCENDING, "_id": DESCENDING}},
+                    {"$group": {"_id": "$user_id", "ids": {"$push": "$_id"}}},
+                    {"$match": {"ids.1": {"$exists": True}}},
+                ],
+                allowDiskUse=True,
+            )
+            stale = [
+                token_id
+                for group in await cursor.to_list(length=None)
+                for token_id in group["ids"][1:]
+            ]
+            if not stale:
+                return 0
+            result = await collection.update_many(
+                {"_id": {"$in": stale}, "is_used": False},
+                {"$set": {"is_used": True, "updated_at": datetime.now(timezone.utc)}},
+            )
+            return result.modified_count
+        except Exception as e:
+            logger.error("Error retiring duplicate verification tokens: %s", e)
+            raise
+
     def _entity_to_document(self, entity: EmailVerificationToken) -> dict:
         doc = entity.model_dump(exclude={"id"})
         doc["_id"] = ObjectId(entity.id) if entity.id else ObjectId()
@@ -44,10 +163,10 @@ class MongoEmailVerificationRepository(IEmailVerificationRepository):
             doc = self._entity_to_document(entity)
             result = await collection.insert_one(doc)
             entity.id = str(result.inserted_id)
-            logger.info(f"Created email verification token with ID: {entity.id}")
+            logger.info("Created email verification token with ID: %s", entity.id)
             return entity
         except Exception as e:
-            logger.error(f"Error creating email verification token: {e}")
+            logger.error("Error creating email verification token: %s", e)
             raise
 
     async def get_by_id(self, id: str) -> Optional[EmailVerificationToken]:
@@ -56,7 +175,18 @@ class MongoEmailVerificationRepository(IEmailVerificationRepository):
             doc = await collection.find_one({"_id": ObjectId(id)})
             return self._document_to_entity(doc) if doc else None
         except Exception as e:
-            logger.error(f"Error fetching email verification token by id: {e}")
+            logger.error("Error fetching email verification token by id: %s", e)
+            raise
+
+    async def get_fields(
+        self, id: str, fields: Iterable[str]
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            return await find_fields(
+                self._get_collection(), {"_id": ObjectId(id)}, fields
+            )
+        except Exception as e:
+            logger.error("Error retrieving email verification token fields: %s", e)
             raise
 
     async def get_all(
@@ -68,7 +198,7 @@ class MongoEmailVerificationRepository(IEmailVerificationRepository):
             docs = await cursor.to_list(length=limit)
             return [self._document_to_entity(d) for d in docs if d]
         except Exception as e:
-            logger.error(f"Error fetching email verification tokens: {e}")
+            logger.error("Error fetching email verification tokens: %s", e)
             raise
 
     async def update(
@@ -80,16 +210,14 @@ class MongoEmailVerificationRepository(IEmailVerificationRepository):
             result = await collection.replace_one({"_id": ObjectId(id)}, doc)
             return entity if result.matched_count > 0 else None
         except Exception as e:
-            logger.error(f"Error updating email verification token: {e}")
+            logger.error("Error updating email verification token: %s", e)
             raise
 
     async def exists(self, id: str) -> bool:
         try:
-            collection = self._get_collection()
-            count = await collection.count_documents({"_id": ObjectId(id)})
-            return count > 0
+            return await document_exists(self._get_collection(), {"_id": ObjectId(id)})
         except Exception as e:
-            logger.error(f"Error checking email verification token existence: {e}")
+            logger.error("Error checking email verification token existence: %s", e)
             raise
 
     async def delete(self, id: str) -> bool:
@@ -100,7 +228,7 @@ class MongoEmailVerificationRepository(IEmailVerificationRepository):
             )
             return result.modified_count > 0
         except Exception as e:
-            logger.error(f"Error deleting email verification token: {e}")
+            logger.error("Error deleting email verification token: %s", e)
             raise
 
     # -------------------------------------------------------- Custom methods
@@ -111,64 +239,166 @@ class MongoEmailVerificationRepository(IEmailVerificationRepository):
         """Return the active (not used) token for a user."""
         try:
             collection = self._get_collection()
-            doc = await collection.find_one(
-                {"user_id": user_id, "is_used": False},
-                sort=[("created_at", -1)],
-            )
+            doc = await collection.find_one({"user_id": user_id, "is_used": False})
             return self._document_to_entity(doc) if doc else None
         except Exception as e:
-            logger.error(f"Error fetching valid verification token: {e}")
+            logger.error("Error fetching valid verification token: %s", e)
             raise
 
-    async def get_latest_by_user_id(
-        self, user_id: str
+    async def issue_token(
+        self, user_id: str, code_hash: str, expires_at: datetime, max_resends: int
     ) -> Optional[EmailVerificationToken]:
-        """Return the most recent token for a user regardless of status."""
+        """
+        Count the send in the user's resend counter, then upsert the active
+        token. The resend limit is part of the counter filter: a user at the
+        limit matches no counter, so the upsert tries to insert a second one
+        with the same _id and is rejected.
+        """
         try:
-            collection = self._get_collection()
-            doc = await collection.find_one(
-                {"user_id": user_id},
-                sort=[("created_at", -1)],
-            )
-            return self._document_to_entity(doc) if doc else None
-        except Exception as e:
-            logger.error(f"Error fetching latest verification token: {e}")
-            raise
-
-    async def mark_as_used(self, token_id: str) -> None:
-        try:
-            collection = self._get_collection()
             now = datetime.now(timezone.utc)
-            await collection.update_one(
-                {"_id": ObjectId(token_id)},
-                {"$set": {"is_used": True, "updated_at": now}},
+            resend_count = await self._count_send(user_id, now, max_resends)
+            if resend_count is None:
+                return None
+
+            doc = await self._upsert(
+                self._get_collection(),
+                {"user_id": user_id, "is_used": False},
+                [
+                    {
+                        "$set": {
+                            "code_hash": code_hash,
+                            "expires_at": expires_at,
+                            "attempts": 0,
+                            "resend_count": resend_count,
+                            "created_at": {"$ifNull": ["$created_at", now]},
+                            "updated_at": now,
+                        }
+                    }
+                ],
+            )
+            token = self._document_to_entity(doc)
+            if self.audit:
+                await self._record_history(token)
+            logger.info(
+                "Issued verification token %s for user_id=%s (resend_count=%s)",
+                token.id,
+                user_id,
+                token.resend_count,
             )
-            logger.info(f"Marked verification token {token_id} as used")
+            return token
         except Exception as e:
-            logger.error(f"Error marking token as used: {e}")
+            logger.error("Error issuing verification token: %s", e)
             raise
 
-    async def increment_attempts(self, token_id: str) -> None:
+    async def _count_send(
+        self, user_id: str, now: datetime, max_resends: int
+    ) -> Optional[int]:
+        """Increment the resend counter (0 on the first send), None at the limit."""
+        counters = Database.get_db()[self.counter_collection_name]
+        doc = await self._upsert(
+            counters,
+            {"_id": user_id, "resend_count": {"$lt": max_resends}},
+            [
+                {
+                    "$set": {
+                        "resend_count": {
+                            "$add": [{"$ifNull": ["$resend_count", -1]}, 1]
+                        },
+                        "expires_at": now + RESEND_COUNTER_TTL,
+                    }
+                }
+            ],
+        )
+        return doc["resend_count"] if doc else None
+
+    @staticmethod
+    async def _upsert(collection, query: dict, update: list) -> Optional[dict]:
+        """
+        Upsert and return the document, or None if the insert is rejected
+        twice. A concurrent first upsert can win the insert; the retry then
+        updates its document.
+        """
+        for attempt in range(2):
+            try:
+                return await collection.find_one_and_update(
+                    query,
+                    update,
+                    upsert=True,
+                    return_document=ReturnDocument.AFTER,
+                )
+            except DuplicateKeyError:
+                if attempt:
+                    return None
+
+    async def _record_history(self, token: EmailVerificationToken) -> None:
+        history = Database.get_db()[self.history_collection_name]
+        await history.insert_one(
+            {
+                "token_id": token.id,
+                "user_id": token.user_id,
+                "resend_count": token.resend_count,
+                "expires_at": token.expires_at,
+                "issued_at": token.updated_at,
+            }
+        )
+
+    async def consume_code(
+        self,
+        user_id: str,
+        code_hash: str,
+        now: datetime,
+        max_attempts: int,
+        session: Optional[Any] = None,
+    ) -> Optional[EmailVerificationToken]:
+        """
+        Check and update the active token in a single find_one_and_update:
+        expiry and attempts are in the filter, the code comparison in the
+        pipeline update.
+        """
         try:
             collection = self._get_collection()
-            now = datetime.now(timezone.utc)
-            await collection.update_one(
-                {"_id": ObjectId(token_id)},
-                {"$inc": {"attempts": 1}, "$set": {"updated_at": now}},
+            matches = {"$eq": ["$code_hash", code_hash]}
+            doc = await collection.find_one_and_update(
+                {
+                    "user_id": user_id,
+                    "is_used": False,
+                    "expires_at": {"$gt": now},
+                    "attempts": {"$lt": max_attempts},
+                },
+                [
+                    {
+                        "$set": {
+                            "is_used": matches,
+                            "attempts": {
+                                "$cond": [
+                                    matches,
+                                    "$attempts",
+                                    {"$add": ["$attempts", 1]},
+                                ]
+                            },
+                            "updated_at": now,
+                        }
+                    }
+                ],
+                return_document=ReturnDocument.AFTER,
+                session=session,
             )
+            return self._document_to_entity(doc) if doc else None
         except Exception as e:
-            logger.error(f"Error incrementing token attempts: {e}")
+            logger.error("Error consuming verification code: %s", e)
             raise
 
-    async def invalidate_all_by_user_id(self, user_id: str) -> None:
+    async def delete_used(self, batch_size: int) -> int:
         try:
             collection = self._get_collection()
-            now = datetime.now(timezone.utc)
-            await collection.update_many(
-                {"user_id": user_id, "is_used": False},
-                {"$set": {"is_used": True, "updated_at": now}},
+            cursor = collection.find({"is_used": True}, {"_id": 1}).limit(batch_size)
+            ids = [doc["_id"] for doc in await cursor.to_list(length=batch_size)]
+            if not ids:
+                return 0
+            result = await collection.delete_many(
+                {"_id": {"$in": ids}, "is_used": True}
             )
-            logger.info(f"Invalidated all active tokens for user_id={user_id}")
+            return result.deleted_count
         except Exception as e:
-            logger.error(f"Error invalidating tokens: {e}")
+            logger.error("Error deleting used verification tokens: %s", e)
             raise
@@ -2,16 +2,37 @@
 MongoDB implementation of the Expense repository.
 """
 
-from typing import List, Dict, Optional
+from typing import Any, AsyncIterator, Iterable, List, Dict, Optional, Tuple
 from datetime import datetime, timezone
 from bson import ObjectId
+from pymongo import IndexModel, ASCENDING, DESCENDING, ReturnDocument
+from pymongo.errors import BulkWriteError
 from app.domain.interfaces.expense_repository_interface import IExpenseRepository
+from app.domain.interfaces.group_summary_repository_interface import (
+    IGroupSummaryRepository,
+)
 from app.domain.entities.expense_entity import Expense
+from app.domain.enums.analytics_group_by_enum import AnalyticsGroupBy
 from app.infrastructure.database.database import Database
+from app.infrastructure.database.document_loader import document_loader
+from app.infrastructure.database.queries import document_exists, find_fields
+from app.infrastructure.repositories.group_summary_repository import (
+    MongoGroupSummaryRepository,
+)
 from app.infrastructure.logger import get_logger
 
 logger = get_logger(__name__)
 
+# $group key expression for each analytics dimension (calendar buckets in UTC).
+_ANALYTICS_GROUP_KEYS = {
+    AnalyticsGroupBy.TYPE_EXPENSE: "$type_expense",
+    AnalyticsGroupBy.CATEGORY: "$category",
+    AnalyticsGroupBy.SPENT_BY: "$spent_by",
+    AnalyticsGroupBy.DAY: {"$dateToString": {"format": "%Y-%m-%d", "date": "$date"}},
+    AnalyticsGroupBy.WEEK: {"$dateToString": {"format": "%G-W%V", "date": "$date"}},
+    AnalyticsGroupBy.MONTH: {"$dateToString": {"format": "%Y-%m", "date": "$date"}},
+}
+
 
 class MongoExpenseRepository(IExpenseRepository):
     """
@@ -19,9 +40,35 @@ class MongoExpenseRepository(IExpenseRepository):
     Handles persistence and retrieval of expense entities.
     """
 
-    def __init__(self):
-        """Initialize repository with MongoDB collection."""
+    indexes = [
+        IndexModel(
+            [("group_id", ASCENDING), ("date", DESCENDING), ("_id", DESCENDING)],
+            name="group_id_date_active",
+            partialFilterExpression={"is_deleted": False},
+        ),
+        # Serves the changes feed; not partial, so tombstones are found too
+        IndexModel(
+            [("group_id", ASCENDING), ("updated_at", ASCENDING), ("_id", ASCENDING)],
+            name="group_id_updated_at",
+        ),
+    ]
+
+    def __init__(self, summary_repository: Optional[IGroupSummaryRepository] = None):
+        """
+        Initialize repository with MongoDB collection.
+
+        Args:
+            summary_repository: Group summaries kept in sync on delete/restore
+        """
         self.collection_name = "expenses"
+        self.summary_repository = summary_repository or MongoGroupSummaryRepository()
+        # Coalesces concurrent get_by_id calls, e.g. a shared expense link
+        self._active_by_id = document_loader(
+            lambda: self._get_collection(),
+            "_id",
+            {"is_deleted": False},
+            "expenses_by_id",
+        )
 
     def _get_collection(self):
         """Get the MongoDB collection for expenses."""
@@ -54,7 +101,7 @@ class MongoExpenseRepository(IExpenseRepository):
         """
         if doc:
             doc["id"] = str(doc.pop("_id"))
-            return Expense(**doc)
+            return Expense.model_validate(doc)
         return None
 
     async def create(self, entity: Expense) -> Expense:
@@ -75,11 +122,53 @@ class MongoExpenseRepository(IExpenseRepository):
             entity.id = str(result.inserted_id)
 
             logger.info(
-                f"Created expense with ID: {entity.id} for group: {entity.group_id}"
+                "Created expense with ID: %s for group: %s", entity.id, entity.group_id
             )
             return entity
         except Exception as e:
-            logger.error(f"Error creating expense: {e}")
+            logger.error("Error creating expense: %s", e)
+            raise
+
+    async def create_many(self, entities: List[Expense]) -> Dict[int, str]:
+        """
+        Insert many expenses with a single unordered insert_many.
+        IDs are generated client-side, so the inserted documents are known
+        even when some of the batch fails.
+
+        Args:
+            entities: Expense entities to create
+
+        Returns:
+            Error messages keyed by the index of each expense that was not inserted
+        """
+        if not entities:
+            return {}
+
+        try:
+            collection = self._get_collection()
+            docs = [self._entity_to_document(entity) for entity in entities]
+            errors: Dict[int, str] = {}
+
+            try:
+                await collection.insert_many(docs, ordered=False)
+            except BulkWriteError as bwe:
+                for write_error in bwe.details.get("writeErrors", []):
+                    errors[write_error["index"]] = write_error.get(
+                        "errmsg", "Insert failed"
+                    )
+
+            for index, (entity, doc) in enumerate(zip(entities, docs)):
+                if index not in errors:
+                    entity.id = str(doc["_id"])
+
+            logger.info(
+                "Created %s of %s expenses in bulk",
+                len(entities) - len(errors),
+                len(entities),
+            )
+            return errors
+        except Exception as e:
+            logger.error("Error creating expenses in bulk: %s", e)
             raise
 
     async def get_by_id(self, id: str) -> Optional[Expense]:
@@ -93,17 +182,39 @@ class MongoExpenseRepository(IExpenseRepository):
             Expense entity if found and not deleted, None otherwise
         """
         try:
-            collection = self._get_collection()
-            doc = await collection.find_one({"_id": ObjectId(id), "is_deleted": False})
+            doc = await self._active_by_id.load(ObjectId(id))
 
             if doc:
-                logger.info(f"Retrieved expense with ID: {id}")
-                return self._document_to_entity(doc)
+                logger.info("Retrieved expense with ID: %s", id)
+                return self._document_to_entity(dict(doc))
 
-            logger.warning(f"Expense not found with ID: {id}")
+            logger.warning("Expense not found with ID: %s", id)
             return None
         except Exception as e:
-            logger.error(f"Error retrieving expense by ID {id}: {e}")
+            logger.error("Error retrieving expense by ID %s: %s", id, e)
+            raise
+
+    async def get_fields(
+        self, id: str, fields: Iterable[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get only some fields of an expense (excludes soft-deleted expenses).
+
+        Args:
+            id: Expense ID
+            fields: Names of the fields to return ("id" for the ID)
+
+        Returns:
+            The requested fields as stored, or None if not found or deleted
+        """
+        try:
+            return await find_fields(
+                self._get_collection(),
+                {"_id": ObjectId(id), "is_deleted": False},
+                fields,
+            )
+        except Exception as e:
+            logger.error("Error retrieving fields of expense %s: %s", id, e)
             raise
 
     async def get_all(
@@ -128,7 +239,110 @@ class MongoExpenseRepository(IExpenseRepository):
                 collection.find({"group_id": group_id, "is_deleted": False})
                 .skip(skip)
                 .limit(limit)
-                .sort("date", -1)
+                .sort([("date", -1), ("_id", -1)])
+            )
+
+            expenses = []
+            async for doc in cursor:
+                expenses.append(self._document_to_entity(doc))
+
+            logger.info(
+                "Retrieved %s active expenses for group: %s", len(expenses), group_id
+            )
+            return expenses
+        except Exception as e:
+            logger.error("Error retrieving expenses for group %s: %s", group_id, e)
+            raise
+
+    async def get_all_after(
+        self, group_id: str, after_date: datetime, after_id: str, limit: int = 100
+    ) -> List[Expense]:
+        """
+        Get the next page of active expenses for a group using keyset pagination.
+        Seeks directly to (after_date, after_id) instead of skipping documents.
+
+        Args:
+            group_id: ID of the expense group
+            after_date: Date of the last expense of the previous page
+            after_id: ID of the last expense of the previous page
+            limit: Maximum number of expenses to return
+
+        Returns:
+            List of active expense entities following the given position
+        """
+        try:
+            collection = self._get_collection()
+            after_oid = ObjectId(after_id)
+            cursor = (
+                collection.find(
+                    {
+                        "group_id": group_id,
+                        "is_deleted": False,
+                        "$or": [
+                            {"date": {"$lt": after_date}},
+                            {"date": after_date, "_id": {"$lt": after_oid}},
+                        ],
+                    }
+                )
+                .limit(limit)
+                .sort([("date", -1), ("_id", -1)])
+            )
+
+            expenses = []
+            async for doc in cursor:
+                expenses.append(self._document_to_entity(doc))
+
+            logger.info(
+                "Retrieved %s active expenses for group: %s after %s",
+                len(expenses),
+                group_id,
+                after_id,
+            )
+            return expenses
+        except Exception as e:
+            logger.error("Error retrieving expenses for group %s: %s", group_id, e)
+            raise
+
+    async def get_changes(
+        self,
+        group_id: str,
+        after_updated_at: Optional[datetime] = None,
+        after_id: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Expense]:
+        """
+        Get the expenses of a group changed after (after_updated_at, after_id),
+        soft-deleted ones included, using the group_id_updated_at index.
+        Without a watermark, returns the active expenses from the start.
+
+        Args:
+            group_id: ID of the expense group
+            after_updated_at: updated_at of the last change the client has seen
+            after_id: ID of the last change the client has seen
+            limit: Maximum number of expenses to return
+
+        Returns:
+            List of changed expenses in (updated_at, id) ascending order
+        """
+        try:
+            collection = self._get_collection()
+            if after_updated_at is None:
+                query = {"group_id": group_id, "is_deleted": False}
+            else:
+                query = {
+                    "group_id": group_id,
+                    "$or": [
+                        {"updated_at": {"$gt": after_updated_at}},
+                        {
+                            "updated_at": after_updated_at,
+                            "_id": {"$gt": ObjectId(after_id)},
+                        },
+                    ],
+                }
+            cursor = (
+                collection.find(query)
+                .sort([("updated_at", 1), ("_id", 1)])
+                .limit(limit)
             )
 
             expenses = []
@@ -136,16 +350,65 @@ class MongoExpenseRepository(IExpenseRepository):
                 expenses.append(self._document_to_entity(doc))
 
             logger.info(
-                f"Retrieved {len(expenses)} active expenses for group: {group_id}"
+                "Retrieved %s changed expenses for group: %s", len(expenses), group_id
             )
             return expenses
         except Exception as e:
-            logger.error(f"Error retrieving expenses for group {group_id}: {e}")
+            logger.error(
+                "Error retrieving expense changes for group %s: %s", group_id, e
+            )
+            raise
+
+    async def stream_documents(
+        self,
+        group_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the active expenses of a group as plain documents, oldest first.
+        Served by the group_id_date_active index; the cursor fetches
+        `batch_size` documents per round trip.
+
+        Args:
+            group_id: ID of the expense group
+            start_date: Only include expenses dated on or after this instant
+            end_date: Only include expenses dated before this instant
+            batch_size: Documents fetched from the database per round trip
+
+        Yields:
+            Expense documents with `id` instead of `_id`, without is_deleted
+        """
+        query: Dict[str, Any] = {"group_id": group_id, "is_deleted": False}
+        date_range = {}
+        if start_date is not None:
+            date_range["$gte"] = start_date
+        if end_date is not None:
+            date_range["$lt"] = end_date
+        if date_range:
+            query["date"] = date_range
+
+        try:
+            collection = self._get_collection()
+            cursor = collection.find(
+                query, {"is_deleted": False}, batch_size=batch_size
+            ).sort([("date", 1), ("_id", 1)])
+
+            count = 0
+            async for doc in cursor:
+                doc["id"] = str(doc.pop("_id"))
+                count += 1
+                yield doc
+
+            logger.info("Streamed %s expenses of group: %s", count, group_id)
+        except Exception as e:
+            logger.error("Error streaming expenses of group %s: %s", group_id, e)
             raise
 
     async def update(self, id: str, entity: Expense) -> Optional[Expense]:
         """
-        Update an existing expense.
+        Update an existing active expense and return it as stored after the write.
 
         Args:
             id: Expense ID to update
@@ -159,24 +422,102 @@ class MongoExpenseRepository(IExpenseRepository):
             update_data = entity.model_dump(exclude={"id", "created_at"})
             update_data["updated_at"] = entity.updated_at
 
-            result = await collection.update_one(
-                {"_id": ObjectId(id)}, {"$set": update_data}
+            doc = await collection.find_one_and_update(
+                {"_id": ObjectId(id), "is_deleted": False},
+                {"$set": update_data},
+                return_document=ReturnDocument.AFTER,
+            )
+
+            if doc:
+                logger.info("Updated expense with ID: %s", id)
+                return self._document_to_entity(doc)
+
+            logger.warning("Expense not found for update with ID: %s", id)
+            return None
+        except Exception as e:
+            logger.error("Error updating expense %s: %s", id, e)
+            raise
+
+    async def update_fields(
+        self, id: str, fields: Dict[str, Any]
+    ) -> Optional[Expense]:
+        """
+        Set only the given fields of an active expense with find_one_and_update.
+
+        Args:
+            id: Expense ID to update
+            fields: Field names mapped to their new values
+
+        Returns:
+            Updated expense if found, None otherwise
+        """
+        try:
+            collection = self._get_collection()
+            update_data = dict(fields)
+            update_data["updated_at"] = datetime.now(timezone.utc)
+
+            doc = await collection.find_one_and_update(
+                {"_id": ObjectId(id), "is_deleted": False},
+                {"$set": update_data},
+                return_document=ReturnDocument.AFTER,
+            )
+
+            if doc:
+                logger.info(
+                    "Updated fields %s of expense with ID: %s", sorted(fields), id
+                )
+                return self._document_to_entity(doc)
+
+            logger.warning("Expense not found for update with ID: %s", id)
+            return None
+        except Exception as e:
+            logger.error("Error updating expense %s: %s", id, e)
+            raise
+
+    async def update_fields_with_previous(
+        self, id: str, fields: Dict[str, Any]
+    ) -> Optional[Tuple[Expense, Expense]]:
+        """
+        Set only the given fields of an active expense with find_one_and_update,
+        returning the document it replaced (as delete does) and that document
+        with the `$set` applied.
+
+        Args:
+            id: Expense ID to update
+            fields: Field names mapped to their new values
+
+        Returns:
+            (previous, updated) expenses if found, None otherwise
+        """
+        try:
+            collection = self._get_collection()
+            update_data = dict(fields)
+            update_data["updated_at"] = datetime.now(timezone.utc)
+
+            doc = await collection.find_one_and_update(
+                {"_id": ObjectId(id), "is_deleted": False},
+                {"$set": update_data},
+                return_document=ReturnDocument.BEFORE,
             )
 
-            if result.matched_count > 0:
-                logger.info(f"Updated expense with ID: {id}")
-                return await self.get_by_id(id)
+            if doc:
+                logger.info(
+                    "Updated fields %s of expense with ID: %s", sorted(fields), id
+                )
+                updated = self._document_to_entity({**doc, **update_data})
+                return self._document_to_entity(doc), updated
 
-            logger.warning(f"Expense not found for update with ID: {id}")
+            logger.warning("Expense not found for update with ID: %s", id)
             return None
         except Exception as e:
-            logger.error(f"Error updating expense {id}: {e}")
+            logger.error("Error updating expense %s: %s", id, e)
             raise
 
     async def delete(self, id: str) -> bool:
         """
         Soft delete an expense by marking it as deleted.
         The expense is not removed from the database, only hidden from queries.
+        Its amount is subtracted from the group summary.
 
         Args:
             id: Expense ID to delete
@@ -186,7 +527,7 @@ class MongoExpenseRepository(IExpenseRepository):
         """
         try:
             collection = self._get_collection()
-            result = await collection.update_one(
+            doc = await collection.find_one_and_update(
                 {"_id": ObjectId(id), "is_deleted": False},
                 {
                     "$set": {
@@ -194,16 +535,21 @@ class MongoExpenseRepository(IExpenseRepository):
                         "updated_at": datetime.now(timezone.utc),
                     }
                 },
+                return_document=ReturnDocument.BEFORE,
             )
 
-            if result.matched_count > 0:
-                logger.info(f"Soft deleted expense with ID: {id}")
+            if doc:
+                logger.info("Soft deleted expense with ID: %s", id)
+                expense = self._document_to_entity(doc)
+                await self.summary_repository.apply_change(
+                    expense.group_id, removed=expense
+                )
                 return True
 
-            logger.warning(f"Expense not found for deletion with ID: {id}")
+            logger.warning("Expense not found for deletion with ID: %s", id)
             return False
         except Exception as e:
-            logger.error(f"Error deleting expense {id}: {e}")
+            logger.error("Error deleting expense %s: %s", id, e)
             raise
 
     async def exists(self, id: str) -> bool:
@@ -217,13 +563,11 @@ class MongoExpenseRepository(IExpenseRepository):
             True if exists and not deleted, False otherwise
         """
         try:
-            collection = self._get_collection()
-            count = await collection.count_documents(
-                {"_id": ObjectId(id), "is_deleted": False}, limit=1
+            return await document_exists(
+                self._get_collection(), {"_id": ObjectId(id), "is_deleted": False}
             )
-            return count > 0
         except Exception as e:
-            logger.error(f"Error checking expense existence {id}: {e}")
+            logger.error("Error checking expense existence %s: %s", id, e)
             raise
 
     async def get_amounts_and_types(self, group_id: str) -> List[Dict[str, any]]:
@@ -254,18 +598,83 @@ class MongoExpenseRepository(IExpenseRepository):
                 )
 
             logger.info(
-                f"Retrieved amounts and types for {len(results)} active expenses in group: {group_id}"
+                "Retrieved amounts and types for %s active expenses in group: %s",
+                len(results),
+                group_id,
             )
             return results
         except Exception as e:
             logger.error(
-                f"Error retrieving amounts and types for group {group_id}: {e}"
+                "Error retrieving amounts and types for group %s: %s", group_id, e
             )
             raise
 
+    async def aggregate_amounts(
+        self,
+        group_id: str,
+        group_by: AnalyticsGroupBy,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Dict[str, any]]:
+        """
+        Aggregate amounts of active expenses in a group with a $group pipeline.
+        The $match stage is served by the group_id/date index.
+
+        Args:
+            group_id: ID of the expense group
+            group_by: Dimension to group the expenses by
+            start_date: Only include expenses dated on or after this instant
+            end_date: Only include expenses dated before this instant
+
+        Returns:
+            One dictionary per bucket, ordered by key
+        """
+        try:
+            collection = self._get_collection()
+            match: Dict[str, any] = {"group_id": group_id, "is_deleted": False}
+            date_range = {}
+            if start_date is not None:
+                date_range["$gte"] = start_date
+            if end_date is not None:
+                date_range["$lt"] = end_date
+            if date_range:
+                match["date"] = date_range
+
+            pipeline = [
+                {"$match": match},
+                {
+                    "$group": {
+                        "_id": _ANALYTICS_GROUP_KEYS[group_by],
+                        "total_cents": {"$sum": "$amount_cents"},
+                        "count": {"$sum": 1},
+                        "average_cents": {"$avg": "$amount_cents"},
+                        "min_cents": {"$min": "$amount_cents"},
+                        "max_cents": {"$max": "$amount_cents"},
+                    }
+                },
+                {"$sort": {"_id": 1}},
+            ]
+
+            results = []
+            async for doc in collection.aggregate(pipeline):
+                doc["key"] = str(doc.pop("_id"))
+                results.append(doc)
+
+            logger.info(
+                "Aggregated %s %s buckets for group: %s",
+                len(results),
+                group_by,
+                group_id,
+            )
+            return results
+        except Exception as e:
+            logger.error("Error aggregating expenses for group %s: %s", group_id, e)
+            raise
+
     async def restore(self, id: str) -> bool:
         """
         Restore a soft-deleted expense by marking is_deleted as False.
+        Its amount is added back to the group summary.
 
         Args:
             id: Expense ID to restore
@@ -275,7 +684,7 @@ class MongoExpenseRepository(IExpenseRepository):
         """
         try:
             collection = self._get_collection()
-            result = await collection.update_one(
+            doc = await collection.find_one_and_update(
                 {"_id": ObjectId(id), "is_deleted": True},
                 {
                     "$set": {
@@ -283,18 +692,24 @@ class MongoExpenseRepository(IExpenseRepository):
                         "updated_at": datetime.now(timezone.utc),
                     }
                 },
+                return_document=ReturnDocument.AFTER,
             )
 
-            if result.matched_count > 0:
-                logger.info(f"Restored soft-deleted expense with ID: {id}")
+            if doc:
+                logger.info("Restored soft-deleted expense with ID: %s", id)
+                expense = self._document_to_entity(doc)
+                await self.summary_repository.apply_change(
+                    expense.group_id, added=expense
+                )
                 return True
 
             logger.warning(
-                f"Expense not found for restoration with ID: {id} (might not be deleted)"
+                "Expense not found for restoration with ID: %s (might not be deleted)",
+                id,
             )
             return False
         except Exception as e:
-            logger.error(f"Error restoring expense {id}: {e}")
+            logger.error("Error restoring expense %s: %s", id, e)
             raise
 
     async def delete_permanently(self, id: str) -> bool:
@@ -314,12 +729,12 @@ class MongoExpenseRepository(IExpenseRepository):
 
             if result.deleted_count > 0:
                 logger.warning(
-                    f"Permanently deleted expense with ID: {id} (IRREVERSIBLE)"
+                    "Permanently deleted expense with ID: %s (IRREVERSIBLE)", id
                 )
                 return True
 
-            logger.warning(f"Expense not found for permanent deletion with ID: {id}")
+            logger.warning("Expense not found for permanent deletion with ID: %s", id)
             return False
         except Exception as e:
-            logger.error(f"Error permanently deleting expense {id}: {e}")
+            logger.error("Error permanently deleting expense %s: %s", id, e)
             raise
@@ -1,11 +1,14 @@
 """MongoDB implementation of the Group repository."""
 
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from datetime import datetime, timezone
 from bson import ObjectId
+from pymongo import IndexModel, ASCENDING, DESCENDING, ReturnDocument
 from app.domain.interfaces.group_repository_interface import IGroupRepository
 from app.domain.entities.group_entity import Group
 from app.infrastructure.database.database import Database
+from app.infrastructure.database.document_loader import document_loader
+from app.infrastructure.database.queries import document_exists, find_fields
 from app.infrastructure.logger import get_logger
 
 logger = get_logger(__name__)
@@ -14,8 +17,23 @@ logger = get_logger(__name__)
 class MongoGroupRepository(IGroupRepository):
     """MongoDB implementation of the group repository."""
 
+    indexes = [
+        IndexModel(
+            [("user_ids", ASCENDING), ("created_at", DESCENDING)],
+            name="user_ids_created_at_active",
+            partialFilterExpression={"is_deleted": False},
+        ),
+    ]
+
     def __init__(self):
         self.collection_name = "groups"
+        # Coalesces the concurrent get_by_id calls of a popular group's members
+        self._active_by_id = document_loader(
+            lambda: self._get_collection(),
+            "_id",
+            {"is_deleted": False},
+            "groups_by_id",
+        )
 
     def _get_collection(self):
         return Database.get_db()[self.collection_name]
@@ -28,7 +46,7 @@ class MongoGroupRepository(IGroupRepository):
     def _document_to_entity(self, doc: dict) -> Group:
         if doc:
             doc["id"] = str(doc.pop("_id"))
-            return Group(**doc)
+            return Group.model_validate(doc)
         return None
 
     async def create(self, entity: Group) -> Group:
@@ -37,23 +55,35 @@ class MongoGroupRepository(IGroupRepository):
             doc = entity.model_dump(exclude={"id"})
             result = await collection.insert_one(doc)
             entity.id = str(result.inserted_id)
-            logger.info(f"Created group with ID: {entity.id}")
+            logger.info("Created group with ID: %s", entity.id)
             return entity
         except Exception as e:
-            logger.error(f"Error creating group: {e}")
+            logger.error("Error creating group: %s", e)
             raise
 
     async def get_by_id(self, id: str) -> Optional[Group]:
         try:
-            collection = self._get_collection()
-            doc = await collection.find_one({"_id": ObjectId(id), "is_deleted": False})
+            doc = await self._active_by_id.load(ObjectId(id))
             if doc:
-                logger.info(f"Retrieved group with ID: {id}")
-                return self._document_to_entity(doc)
-            logger.warning(f"Group not found with ID: {id}")
+                logger.info("Retrieved group with ID: %s", id)
+                return self._document_to_entity(dict(doc))
+            logger.warning("Group not found with ID: %s", id)
             return None
         except Exception as e:
-            logger.error(f"Error retrieving group by ID {id}: {e}")
+            logger.error("Error retrieving group by ID %s: %s", id, e)
+            raise
+
+    async def get_fields(
+        self, id: str, fields: Iterable[str]
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            return await find_fields(
+                self._get_collection(),
+                {"_id": ObjectId(id), "is_deleted": False},
+                fields,
+            )
+        except Exception as e:
+            logger.error("Error retrieving fields of group %s: %s", id, e)
             raise
 
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[Group]:
@@ -68,26 +98,114 @@ class MongoGroupRepository(IGroupRepository):
             groups = []
             async for doc in cursor:
                 groups.append(self._document_to_entity(doc))
-            logger.info(f"Retrieved {len(groups)} groups")
+            logger.info("Retrieved %s groups", len(groups))
             return groups
         except Exception as e:
-            logger.error(f"Error retrieving groups: {e}")
+            logger.error("Error retrieving groups: %s", e)
             raise
 
     async def update(self, id: str, entity: Group) -> Optional[Group]:
         try:
             collection = self._get_collection()
             update_data = entity.model_dump(exclude={"id", "created_at"})
-            result = await collection.update_one(
-                {"_id": ObjectId(id)}, {"$set": update_data}
+            doc = await collection.find_one_and_update(
+                {"_id": ObjectId(id), "is_deleted": False},
+                {"$set": update_data},
+                return_document=ReturnDocument.AFTER,
             )
-            if result.matched_count > 0:
-                logger.info(f"Updated group with ID: {id}")
-                return await self.get_by_id(id)
-            logger.warning(f"Group not found for update with ID: {id}")
+            if doc:
+                logger.info("Updated group with ID: %s", id)
+                return self._document_to_entity(doc)
+            logger.warning("Group not found for update with ID: %s", id)
+            return None
+        except Exception as e:
+            logger.error("Error updating group %s: %s", id, e)
+            raise
+
+    async def update_fields(self, id: str, fields: Dict[str, Any]) -> Optional[Group]:
+        try:
+            collection = self._get_collection()
+            update_data = {**fields, "updated_at": datetime.now(timezone.utc)}
+            doc = await collection.find_one_and_update(
+                {"_id": ObjectId(id), "is_deleted": False},
+                {"$set": update_data},
+                return_document=ReturnDocument.AFTER,
+            )
+            if doc:
+                logger.info(
+                    "Updated fields %s of group with ID: %s", sorted(fields), id
+                )
+                return self._document_to_entity(doc)
+            logger.warning("Group not found for update with ID: %s", id)
             return None
         except Exception as e:
-            logger.error(f"Error updating group {id}: {e}")
+            logger.error("Error updating group %s: %s", id, e)
+            raise
+
+    async def _update_members(
+        self, group_id: str, member_filter: dict, update: dict
+    ) -> Optional[Group]:
+        """Apply a membership update to an active group and return the post-image."""
+        collection = self._get_collection()
+        doc = await collection.find_one_and_update(
+            {"_id": ObjectId(group_id), "is_deleted": False, **member_filter},
+            {**update, "$set": {"updated_at": datetime.now(timezone.utc)}},
+            return_document=ReturnDocument.AFTER,
+        )
+        return self._document_to_entity(doc) if doc else None
+
+    async def add_member(self, group_id: str, user_id: str) -> Optional[Group]:
+        try:
+            group = await self._update_members(
+                group_id,
+                {"user_ids": {"$ne": user_id}},
+                {"$addToSet": {"user_ids": user_id}},
+            )
+            if group:
+                logger.info("Added user %s to group %s", user_id, group_id)
+            else:
+                logger.warning(
+                    "User %s not added: group %s not found or already a member",
+                    user_id,
+                    group_id,
+                )
+            return group
+        except Exception as e:
+            logger.error("Error adding user %s to group %s: %s", user_id, group_id, e)
+            raise
+
+    async def add_members(self, group_id: str, user_ids: List[str]) -> Optional[Group]:
+        try:
+            group = await self._update_members(
+                group_id, {}, {"$addToSet": {"user_ids": {"$each": user_ids}}}
+            )
+            if group:
+                logger.info("Added %s users to group %s", len(user_ids), group_id)
+            else:
+                logger.warning("Group not found for adding users with ID: %s", group_id)
+            return group
+        except Exception as e:
+            logger.error("Error adding users to group %s: %s", group_id, e)
+            raise
+
+    async def remove_member(self, group_id: str, user_id: str) -> Optional[Group]:
+        try:
+            group = await self._update_members(
+                group_id, {"user_ids": user_id}, {"$pull": {"user_ids": user_id}}
+            )
+            if group:
+                logger.info("Removed user %s from group %s", user_id, group_id)
+            else:
+                logger.warning(
+                    "User %s not removed: group %s not found or not a member",
+                    user_id,
+                    group_id,
+                )
+            return group
+        except Exception as e:
+            logger.error(
+                "Error removing user %s from group %s: %s", user_id, group_id, e
+            )
             raise
 
     async def delete(self, id: str) -> bool:
@@ -103,23 +221,21 @@ class MongoGroupRepository(IGroupRepository):
                 },
             )
             if result.matched_count > 0:
-                logger.info(f"Soft deleted group with ID: {id}")
+                logger.info("Soft deleted group with ID: %s", id)
                 return True
-            logger.warning(f"Group not found for deletion with ID: {id}")
+            logger.warning("Group not found for deletion with ID: %s", id)
             return False
         except Exception as e:
-            logger.error(f"Error deleting group {id}: {e}")
+            logger.error("Error deleting group %s: %s", id, e)
             raise
 
     async def exists(self, id: str) -> bool:
         try:
-            collection = self._get_collection()
-            count = await collection.count_documents(
-                {"_id": ObjectId(id), "is_deleted": False}, limit=1
+            return await document_exists(
+                self._get_collection(), {"_id": ObjectId(id), "is_deleted": False}
             )
-            return count > 0
         except Exception as e:
-            logger.error(f"Error checking group existence {id}: {e}")
+            logger.error("Error checking group existence %s: %s", id, e)
             raise
 
     async def get_by_user_id(self, user_id: str) -> List[Group]:
@@ -131,8 +247,8 @@ class MongoGroupRepository(IGroupRepository):
             groups = []
             async for doc in cursor:
                 groups.append(self._document_to_entity(doc))
-            logger.info(f"Retrieved {len(groups)} groups for user {user_id}")
+            logger.info("Retrieved %s groups for user %s", len(groups), user_id)
             return groups
         except Exception as e:
-            logger.error(f"Error retrieving groups for user {user_id}: {e}")
+            logger.error("Error retrieving groups for user %s: %s", user_id, e)
             raise
@@ -0,0 +1,268 @@
+"""
+MongoDB implementation of the group summary repository.
+
+Each group has one document keyed by its group_id:
+
+    {
+        "_id": "<group_id>",
+        "total_cents": 7500, "count": 3,
+        "by_category": {"food": {"total_cents": 5000, "count": 2}, ...},
+        "by_type": {"cash": {"total_cents": 2500, "count": 1}, ...},
+        "by_month": {"2026-02": {"total_cents": 7500, "count": 3}, ...},
+        "updated_at": ...
+    }
+
+Expense writes keep it current with `$inc` deltas; reading it is a single
+lookup by _id regardless of how many expenses the group has.
+"""
+
+from collections import defaultdict
+from pymongo import UpdateOne
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+from app.domain.interfaces.group_summary_repository_interface import (
+    IGroupSummaryRepository,
+)
+from app.domain.entities.expense_entity import Expense
+from app.domain.entities.group_summary_entity import GroupSummary
+from app.infrastructure.database.database import Database
+from app.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _month_key(date: datetime) -> str:
+    """Calendar month of a date in UTC (naive dates are already UTC)."""
+    if date.tzinfo is not None:
+        date = date.astimezone(timezone.utc)
+    return date.strftime("%Y-%m")
+
+
+def _expense_increments(expense: Expense, sign: int) -> Dict[str, int]:
+    """Build the `$inc` paths for adding (sign=1) or removing (sign=-1) an expense."""
+    amount = sign * expense.amount_cents
+    increments = {"total_cents": amount, "count": sign}
+    for bucket in (
+        f"by_category.{expense.category}",
+        f"by_type.{expense.type_expense}",
+        f"by_month.{_month_key(expense.date)}",
+    ):
+        increments[f"{bucket}.total_cents"] = amount
+        increments[f"{bucket}.count"] = sign
+    return increments
+
+
+def _merge_increments(changes: Iterable[Tuple[Expense, int]]) -> Dict[str, int]:
+    """Sum the `$inc` paths of several (expense, sign) changes, dropping zeros."""
+    increments: Dict[str, int] = defaultdict(int)
+    for expense, sign in changes:
+        for path, value in _expense_increments(expense, sign).items():
+            increments[path] += value
+    return {path: value for path, value in increments.items() if value}
+
+
+class MongoGroupSummaryRepository(IGroupSummaryRepository):
+    """
+    MongoDB implementation of the group summary repository.
+    Maintains one spending summary document per group.
+    """
+
+    def __init__(self):
+        """Initialize repository with MongoDB collections."""
+        self.collection_name = "group_summaries"
+        self.expenses_collection_name = "expenses"
+
+    def _get_collection(self):
+        """Get the MongoDB collection for group summaries."""
+        db = Database.get_db()
+        return db[self.collection_name]
+
+    async def apply_change(
+        self,
+        group_id: str,
+        added: Optional[Expense] = None,
+        removed: Optional[Expense] = None,
+    ) -> None:
+        """
+        Apply an expense change to the group's summary with a single `$inc`.
+        Errors are logged, not raised (see IGroupSummaryRepository.apply_change).
+
+        Args:
+            group_id: ID of the expense group
+            added: Expense whose amount is added to the summary
+            removed: Expense whose amount is subtracted from the summary
+        """
+        increments = _merge_increments(
+            (expense, sign)
+            for expense, sign in ((added, 1), (removed, -1))
+            if expense is not None
+        )
+        if not increments:
+            return
+
+        try:
+            collection = self._get_collection()
+            await collection.update_one(
+                {"_id": group_id},
+                {
+                    "$inc": increments,
+                    "$set": {"updated_at": datetime.now(timezone.utc)},
+                },
+                upsert=True,
+            )
+            logger.info("Applied expense change to summary of group: %s", group_id)
+        except Exception as e:
+            logger.error(
+                "Error updating summary of group %s, it may have drifted until rebuilt: %s",
+                group_id,
+                e,
+            )
+
+    async def apply_additions(self, expenses: List[Expense]) -> None:
+        """
+        Add many created expenses to their groups' summaries with one unordered
+        bulk_write holding a single `$inc` per group.
+        Errors are logged, not raised (see IGroupSummaryRepository.apply_change).
+
+        Args:
+            expenses: Created expenses, possibly from several groups
+        """
+        by_group: Dict[str, List[Expense]] = defaultdict(list)
+        for expense in expenses:
+            by_group[expense.group_id].append(expense)
+        if not by_group:
+            return
+
+        now = datetime.now(timezone.utc)
+        operations = [
+            UpdateOne(
+                {"_id": group_id},
+                {
+                    "$inc": _merge_increments((expense, 1) for expense in group_expenses),
+                    "$set": {"updated_at": now},
+                },
+                upsert=True,
+            )
+            for group_id, group_expenses in by_group.items()
+        ]
+
+        try:
+            collection = self._get_collection()
+            await collection.bulk_write(operations, ordered=False)
+            logger.info(
+                "Applied %s created expenses to %s group summaries",
+                len(expenses),
+                len(operations),
+            )
+        except Exception as e:
+            logger.error(
+                "Error updating summaries of groups %s, they may have drifted until rebuilt: %s",
+                sorted(by_group),
+                e,
+            )
+
+    async def get_by_group_id(self, group_id: str) -> Optional[GroupSummary]:
+        """
+        Get the summary of a group by its _id.
+
+        Args:
+            group_id: ID of the expense group
+
+        Returns:
+            GroupSummary if the group has one, None otherwise
+        """
+        try:
+            collection = self._get_collection()
+            doc = await collection.find_one({"_id": group_id})
+
+            if doc:
+                doc["group_id"] = doc.pop("_id")
+                return GroupSummary(**doc)
+
+            logger.info("No summary found for group: %s", group_id)
+            return None
+        except Exception as e:
+            logger.error("Error retrieving summary of group %s: %s", group_id, e)
+            raise
+
+    async def rebuild(self, group_id: Optional[str] = None) -> int:
+        """
+        Recompute summaries from the active expenses with one aggregation and
+        replace the stored documents. Summaries of groups without active
+        expenses are removed.
+
+        Args:
+            group_id: Only rebuild this group (all groups when None)
+
+        Returns:
+            Number of group summaries written
+        """
+        try:
+            db = Database.get_db()
+            match = {"is_deleted": False}
+            if group_id is not None:
+                match["group_id"] = group_id
+
+            pipeline = [
+                {"$match": match},
+                {
+                    "$group": {
+                        "_id": {
+                            "group_id": "$group_id",
+                            "category": "$category",
+                            "type_expense": "$type_expense",
+                            "month": {
+                                "$dateToString": {"format": "%Y-%m", "date": "$date"}
+                            },
+                        },
+                        "total_cents": {"$sum": "$amount_cents"},
+                        "count": {"$sum": 1},
+                    }
+                },
+            ]
+
+            summaries: Dict[str, dict] = {}
+            async for row in db[self.expenses_collection_name].aggregate(pipeline):
+                key = row["_id"]
+                summary = summaries.setdefault(
+                    key["group_id"],
+                    {
+                        "total_cents": 0,
+                        "count": 0,
+                        "by_category": {},
+                        "by_type": {},
+                        "by_month": {},
+                    },
+                )
+                summary["total_cents"] += row["total_cents"]
+                summary["count"] += row["count"]
+                for field, bucket in (
+                    ("by_category", key["category"]),
+                    ("by_type", key["type_expense"]),
+                    ("by_month", key["month"]),
+                ):
+                    totals = summary[field].setdefault(
+                        str(bucket), {"total_cents": 0, "count": 0}
+                    )
+                    totals["total_cents"] += row["total_cents"]
+                    totals["count"] += row["count"]
+
+            collection = self._get_collection()
+            now = datetime.now(timezone.utc)
+            for summary_group_id, summary in summaries.items():
+                summary["updated_at"] = now
+                await collection.replace_one(
+                    {"_id": summary_group_id}, summary, upsert=True
+                )
+
+            if group_id is not None:
+                if group_id not in summaries:
+                    await collection.delete_one({"_id": group_id})
+            else:
+                await collection.delete_many({"_id": {"$nin": list(summaries)}})
+
+            logger.info("Rebuilt %s group summaries", len(summaries))
+            return len(summaries)
+        except Exception as e:
+            logger.error("Error rebuilding group summaries: %s", e)
+            raise
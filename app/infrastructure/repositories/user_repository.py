@@ -2,16 +2,30 @@
 MongoDB implementation of the User repository.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from datetime import datetime, date, timezone
 from bson import ObjectId
+from pymongo import IndexModel, ASCENDING, DESCENDING, ReturnDocument
+from pymongo.collation import Collation, CollationStrength
+from pymongo.errors import DuplicateKeyError
 from app.domain.interfaces.user_repository_interface import IUserRepository
 from app.domain.entities.user_entity import User
 from app.infrastructure.database.database import Database
+from app.infrastructure.database.document_loader import document_loader
+from app.infrastructure.database.queries import document_exists, find_fields
 from app.infrastructure.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Compares emails ignoring case, so "Ana@x.com" and "ana@x.com" collide
+EMAIL_COLLATION = Collation(locale="en", strength=CollationStrength.SECONDARY)
+
+
+def _is_duplicate_email(error: DuplicateKeyError) -> bool:
+    """Whether a duplicate key error comes from the unique email index."""
+    key_pattern = (error.details or {}).get("keyPattern")
+    return key_pattern is None or "email" in key_pattern
+
 
 class MongoUserRepository(IUserRepository):
     """
@@ -19,9 +33,40 @@ class MongoUserRepository(IUserRepository):
     Handles persistence and retrieval of user entities.
     """
 
+    indexes = [
+        # Serves the email lookups, which use the default collation
+        IndexModel([("email", ASCENDING)], name="email"),
+        # Rejects a second account for the same email, whatever its case;
+        # create and email changes rely on it instead of checking first
+        IndexModel(
+            [("email", ASCENDING)],
+            name="email_unique",
+            unique=True,
+            collation=EMAIL_COLLATION,
+        ),
+        IndexModel(
+            [("created_at", DESCENDING)],
+            name="created_at_active",
+            partialFilterExpression={"is_active": True},
+        ),
+    ]
+
     def __init__(self):
         """Initialize repository with MongoDB collection."""
         self.collection_name = "users"
+        # Coalesce the user lookups of concurrent requests
+        self._active_by_id = document_loader(
+            lambda: self._get_collection(),
+            "_id",
+            {"is_active": True},
+            "users_by_id",
+        )
+        self._active_by_email = document_loader(
+            lambda: self._get_collection(),
+            "email",
+            {"is_active": True},
+            "users_by_email",
+        )
 
     def _get_collection(self):
         """Get the MongoDB collection for users."""
@@ -38,17 +83,27 @@ class MongoUserRepository(IUserRepository):
         Returns:
             Dictionary suitable for MongoDB insertion
         """
-        doc = entity.model_dump(exclude={"id"})
+        doc = self._convert_date_birth(entity.model_dump(exclude={"id"}))
         doc["_id"] = ObjectId(entity.id) if entity.id else ObjectId()
+        return doc
 
-        # Convert date to datetime for MongoDB compatibility
-        if "date_birth" in doc and isinstance(doc["date_birth"], date):
-            if not isinstance(doc["date_birth"], datetime):
-                doc["date_birth"] = datetime.combine(
-                    doc["date_birth"], datetime.min.time()
-                )
+    @staticmethod
+    def _convert_date_birth(data: dict) -> dict:
+        """
+        Convert date_birth from date to datetime for MongoDB compatibility.
 
-        return doc
+        Args:
+            data: Document or partial update values, modified in place
+
+        Returns:
+            The same dictionary
+        """
+        if "date_birth" in data and isinstance(data["date_birth"], date):
+            if not isinstance(data["date_birth"], datetime):
+                data["date_birth"] = datetime.combine(
+                    data["date_birth"], datetime.min.time()
+                )
+        return data
 
     def _document_to_entity(self, doc: dict) -> User:
         """
@@ -67,7 +122,10 @@ class MongoUserRepository(IUserRepository):
             if "date_birth" in doc and isinstance(doc["date_birth"], datetime):
                 doc["date_birth"] = doc["date_birth"].date()
 
-            return User(**doc)
+            # Stored users were validated when written. Skipping validation
+            # here avoids re-parsing the email (EmailStr), which costs more
+            # than everything else in a read.
+            return User.model_construct(**doc)
         return None
 
     async def create(self, entity: User) -> User:
@@ -87,22 +145,25 @@ class MongoUserRepository(IUserRepository):
         try:
             collection = self._get_collection()
 
-            existing_user = await collection.find_one({"email": entity.email})
-            if existing_user:
-                logger.warning(f"User with email {entity.email} already exists")
-                raise ValueError(f"Email {entity.email} is already registered")
-
             doc = self._entity_to_document(entity)
-            result = await collection.insert_one(doc)
+            try:
+                result = await collection.insert_one(doc)
+            except DuplicateKeyError as e:
+                if not _is_duplicate_email(e):
+                    raise
+                logger.warning("User with email %s already exists", entity.email)
+                raise ValueError(f"Email {entity.email} is already registered")
             entity.id = str(result.inserted_id)
 
-            logger.info(f"Created user with ID: {entity.id} and email: {entity.email}")
+            logger.info(
+                "Created user with ID: %s and email: %s", entity.id, entity.email
+            )
             return entity
         except ValueError as ve:
-            logger.warning(f"Validation error creating user: {ve}")
+            logger.warning("Validation error creating user: %s", ve)
             raise
         except Exception as e:
-            logger.error(f"Error creating user: {e}")
+            logger.error("Error creating user: %s", e)
             raise
 
     async def get_by_id(self, id: str) -> Optional[User]:
@@ -116,17 +177,39 @@ class MongoUserRepository(IUserRepository):
             User entity if found and active, None otherwise
         """
         try:
-            collection = self._get_collection()
-            doc = await collection.find_one({"_id": ObjectId(id), "is_active": True})
+            doc = await self._active_by_id.load(ObjectId(id))
 
             if doc:
-                logger.info(f"Retrieved user with ID: {id}")
-                return self._document_to_entity(doc)
+                logger.info("Retrieved user with ID: %s", id)
+                return self._document_to_entity(dict(doc))
 
-            logger.warning(f"User not found with ID: {id}")
+            logger.warning("User not found with ID: %s", id)
             return None
         except Exception as e:
-            logger.error(f"Error retrieving user by ID {id}: {e}")
+            logger.error("Error retrieving user by ID %s: %s", id, e)
+            raise
+
+    async def get_fields(
+        self, id: str, fields: Iterable[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get only some fields of an active user.
+
+        Args:
+            id: User ID
+            fields: Names of the fields to return ("id" for the ID)
+
+        Returns:
+            The requested fields as stored, or None if not found or inactive
+        """
+        try:
+            return await find_fields(
+                self._get_collection(),
+                {"_id": ObjectId(id), "is_active": True},
+                fields,
+            )
+        except Exception as e:
+            logger.error("Error retrieving fields of user %s: %s", id, e)
             raise
 
     async def get_by_id_unverified(self, id: str) -> Optional[User]:
@@ -136,13 +219,13 @@ class MongoUserRepository(IUserRepository):
             doc = await collection.find_one({"_id": ObjectId(id)})
 
             if doc:
-                logger.info(f"Retrieved unverified user with ID: {id}")
+                logger.info("Retrieved unverified user with ID: %s", id)
                 return self._document_to_entity(doc)
 
-            logger.warning(f"User not found with ID: {id}")
+            logger.warning("User not found with ID: %s", id)
             return None
         except Exception as e:
-            logger.error(f"Error retrieving user by ID {id}: {e}")
+            logger.error("Error retrieving user by ID %s: %s", id, e)
             raise
 
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
@@ -169,10 +252,43 @@ class MongoUserRepository(IUserRepository):
             async for doc in cursor:
                 users.append(self._document_to_entity(doc))
 
-            logger.info(f"Retrieved {len(users)} active users")
+            logger.info("Retrieved %s active users", len(users))
             return users
         except Exception as e:
-            logger.error(f"Error retrieving users: {e}")
+            logger.error("Error retrieving users: %s", e)
+            raise
+
+    async def get_many_by_ids(self, ids: List[str]) -> Dict[str, str]:
+        """
+        Get the names of several active users with one $in query.
+        Only the name is projected, so password hashes never leave the database.
+
+        Args:
+            ids: User IDs to look up (invalid IDs are ignored)
+
+        Returns:
+            Mapping of user ID to name for the active users found
+        """
+        try:
+            object_ids = list(
+                {ObjectId(user_id) for user_id in ids if ObjectId.is_valid(user_id)}
+            )
+            if not object_ids:
+                return {}
+
+            collection = self._get_collection()
+            cursor = collection.find(
+                {"_id": {"$in": object_ids}, "is_active": True}, {"name": 1}
+            )
+
+            names = {}
+            async for doc in cursor:
+                names[str(doc["_id"])] = doc.get("name")
+
+            logger.info("Retrieved %s of %s users by ID", len(names), len(object_ids))
+            return names
+        except Exception as e:
+            logger.error("Error retrieving users by IDs: %s", e)
             raise
 
     async def get_by_email(self, email: str) -> Optional[User]:
@@ -186,17 +302,16 @@ class MongoUserRepository(IUserRepository):
             User entity if found and active, None otherwise
         """
         try:
-            collection = self._get_collection()
-            doc = await collection.find_one({"email": email, "is_active": True})
+            doc = await self._active_by_email.load(email)
 
             if doc:
-                logger.info(f"Retrieved user with email: {email}")
-                return self._document_to_entity(doc)
+                logger.info("Retrieved user with email: %s", email)
+                return self._document_to_entity(dict(doc))
 
-            logger.warning(f"User not found with email: {email}")
+            logger.warning("User not found with email: %s", email)
             return None
         except Exception as e:
-            logger.error(f"Error retrieving user by email {email}: {e}")
+            logger.error("Error retrieving user by email %s: %s", email, e)
             raise
 
     async def get_by_email_unverified(self, email: str) -> Optional[User]:
@@ -206,13 +321,13 @@ class MongoUserRepository(IUserRepository):
             doc = await collection.find_one({"email": email})
 
             if doc:
-                logger.info(f"Retrieved unverified user with email: {email}")
+                logger.info("Retrieved unverified user with email: %s", email)
                 return self._document_to_entity(doc)
 
-            logger.warning(f"User not found with email: {email}")
+            logger.warning("User not found with email: %s", email)
             return None
         except Exception as e:
-            logger.error(f"Error retrieving user by email {email}: {e}")
+            logger.error("Error retrieving user by email %s: %s", email, e)
             raise
 
     async def email_exists(self, email: str) -> bool:
@@ -226,16 +341,17 @@ class MongoUserRepository(IUserRepository):
             True if email exists, False otherwise
         """
         try:
-            collection = self._get_collection()
-            doc = await collection.find_one({"email": email})
-            return doc is not None
+            # Covered by the email index: no user document is read
+            return await document_exists(
+                self._get_collection(), {"email": email}, {"_id": 0, "email": 1}
+            )
         except Exception as e:
-            logger.error(f"Error checking email existence for {email}: {e}")
+            logger.error("Error checking email existence for %s: %s", email, e)
             raise
 
     async def update(self, id: str, entity: User) -> Optional[User]:
         """
-        Update an existing user.
+        Update an existing user and return it as stored after the write.
 
         Args:
             id: User ID to update
@@ -246,29 +362,107 @@ class MongoUserRepository(IUserRepository):
         """
         try:
             collection = self._get_collection()
-            update_data = entity.model_dump(exclude={"id", "created_at"})
+            update_data = self._convert_date_birth(
+                entity.model_dump(exclude={"id", "created_at"})
+            )
             update_data["updated_at"] = entity.updated_at
 
-            if "date_birth" in update_data and isinstance(
-                update_data["date_birth"], date
-            ):
-                if not isinstance(update_data["date_birth"], datetime):
-                    update_data["date_birth"] = datetime.combine(
-                        update_data["date_birth"], datetime.min.time()
-                    )
+            doc = await collection.find_one_and_update(
+                {"_id": ObjectId(id)},
+                {"$set": update_data},
+                return_document=ReturnDocument.AFTER,
+            )
 
-            result = await collection.update_one(
-                {"_id": ObjectId(id)}, {"$set": update_data}
+            if doc:
+                logger.info("Updated user with ID: %s", id)
+                return self._document_to_entity(doc)
+
+            logger.warning("User not found for update with ID: %s", id)
+            return None
+        except Exception as e:
+            logger.error("Error updating user with ID %s: %s", id, e)
+            raise
+
+    async def update_fields(self, id: str, fields: Dict[str, Any]) -> Optional[User]:
+        """
+        Set only the given fields of an active user with find_one_and_update.
+
+        Args:
+            id: User ID to update
+            fields: Field names mapped to their new values
+
+        Returns:
+            Updated user if an active user was found, None otherwise
+
+        Raises:
+            ValueError: If the new email belongs to another user
+            Exception: If database operation fails
+        """
+        try:
+            collection = self._get_collection()
+            update_data = self._convert_date_birth(dict(fields))
+            update_data["updated_at"] = datetime.now(timezone.utc)
+
+            try:
+                doc = await collection.find_one_and_update(
+                    {"_id": ObjectId(id), "is_active": True},
+                    {"$set": update_data},
+                    return_document=ReturnDocument.AFTER,
+                )
+            except DuplicateKeyError as e:
+                if "email" not in fields or not _is_duplicate_email(e):
+                    raise
+                logger.warning("Email %s already exists", fields["email"])
+                raise ValueError(f"Email {fields['email']} is already registered")
+
+            if doc:
+                logger.info("Updated fields %s of user with ID: %s", sorted(fields), id)
+                return self._document_to_entity(doc)
+
+            logger.warning("Active user not found for update with ID: %s", id)
+            return None
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error("Error updating user with ID %s: %s", id, e)
+            raise
+
+    async def mark_email_verified(
+        self, id: str, session: Optional[Any] = None
+    ) -> Optional[User]:
+        """
+        Activate a user once its email is verified, with a targeted $set.
+
+        Args:
+            id: User ID
+            session: Transaction session, if any
+
+        Returns:
+            Updated user if found, None otherwise
+        """
+        try:
+            collection = self._get_collection()
+            doc = await collection.find_one_and_update(
+                {"_id": ObjectId(id)},
+                {
+                    "$set": {
+                        "is_email_verified": True,
+                        "is_active": True,
+                        "updated_at": datetime.now(timezone.utc),
+                    }
+                },
+                return_document=ReturnDocument.AFTER,
+                session=session,
             )
 
-            if result.matched_count > 0:
-                logger.info(f"Updated user with ID: {id}")
-                return await self.get_by_id(id)
+            if doc:
+                logger.info("Marked email verified for user with ID: %s", id)
+                return self._document_to_entity(doc)
 
-            logger.warning(f"User not found for update with ID: {id}")
+            logger.warning("User not found for email verification with ID: %s", id)
             return None
         except Exception as e:
-            logger.error(f"Error updating user with ID {id}: {e}")
+            logger.error("Error marking email verified for user %s: %s", id, e)
             raise
 
     async def delete(self, id: str) -> bool:
@@ -294,13 +488,13 @@ class MongoUserRepository(IUserRepository):
             )
 
             if result.matched_count > 0:
-                logger.info(f"Deleted user with ID: {id}")
+                logger.info("Deleted user with ID: %s", id)
                 return True
 
-            logger.warning(f"User not found for deletion with ID: {id}")
+            logger.warning("User not found for deletion with ID: %s", id)
             return False
         except Exception as e:
-            logger.error(f"Error deleting user with ID {id}: {e}")
+            logger.error("Error deleting user with ID %s: %s", id, e)
             raise
 
     async def exists(self, id: str) -> bool:
@@ -314,9 +508,9 @@ class MongoUserRepository(IUserRepository):
             True if user exists, False otherwise
         """
         try:
-            collection = self._get_collection()
-            doc = await collection.find_one({"_id": ObjectId(id)})
-            return doc is not None
+            return await document_exists(
+                self._get_collection(), {"_id": ObjectId(id)}
+            )
         except Exception as e:
-            logger.error(f"Error checking user existence for ID {id}: {e}")
+            logger.error("Error checking user existence for ID %s: %s", id, e)
             raise
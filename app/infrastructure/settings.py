@@ -5,6 +5,7 @@ Environment variables are loaded from the .env file.
 
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Optional
 
 
 class Settings(BaseSettings):
@@ -15,6 +16,14 @@ class Settings(BaseSettings):
     debug: bool = False
     mongodb_url: str = "mongodb://localhost:27017"
     mongodb_db_name: str = "finito_app"
+    mongodb_ensure_indexes: bool = True
+    mongodb_max_pool_size: int = 100
+    mongodb_min_pool_size: int = 0
+    mongodb_max_idle_time_ms: Optional[int] = None
+    mongodb_wait_queue_timeout_ms: Optional[int] = None
+    mongodb_server_selection_timeout_ms: int = 30_000
+    mongodb_compressors: Optional[str] = None
+    mongodb_app_name: Optional[str] = None
     api_v1_str: str = "/api/v1"
     api_key: str = "your-secret-api-key-change-in-env"
     secret_key: str = "your-secret-jwt-key-change-in-env"
@@ -24,7 +33,34 @@ class Settings(BaseSettings):
     jwt_verification_token_expire_minutes: int = 30
     resend_api_key: str = "re_placeholder_change_in_env"
     resend_from_email: str = "onboarding@resend.dev"
+    email_verification_audit: bool = False
+    verification_compaction_interval_seconds: float = 3600.0
+    verification_compaction_batch_size: int = 1000
+    email_transport: str = "resend"
+    email_outbox_workers: int = 4
+    email_outbox_max_attempts: int = 6
+    email_outbox_backoff_base_seconds: float = 2.0
+    email_outbox_backoff_max_seconds: float = 300.0
+    email_outbox_poll_interval_seconds: float = 1.0
+    email_outbox_lease_seconds: float = 60.0
     cors_origins: list[str] = ["*"]
+    password_hash_workers: int = 4
+    password_hash_queue_size: int = 32
+    membership_cache_ttl_seconds: float = 60.0
+    membership_cache_max_entries: int = 10_000
+    cache_backend: str = "none"
+    cache_memory_multi_worker: bool = False
+    web_concurrency: int = 1
+    cache_url: str = "redis://localhost:6379/0"
+    cache_key_prefix: str = "finito"
+    cache_ttl_seconds: float = 300.0
+    cache_max_entries: int = 10_000
+    cache_timeout_seconds: float = 0.5
+    cache_max_connections: int = 10
+    log_level: str = "INFO"
+    log_json: bool = False
+    log_rate_limit_per_second: int = 50
+    log_rate_limits: dict[str, int] = {}
 
     class Config:
         env_file = ".env"
@@ -3,10 +3,11 @@ Pydantic schemas for Expense API requests and responses.
 """
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field, TypeAdapter
 from app.domain.enums.expense_category_enum import ExpenseCategory
 from app.domain.enums.expense_type_enum import ExpenseType
+from app.domain.enums.analytics_group_by_enum import AnalyticsGroupBy
 
 
 class ExpenseCreate(BaseModel):
@@ -42,6 +43,20 @@ class ExpenseCreate(BaseModel):
         }
 
 
+MAX_BULK_EXPENSES = 1000
+
+
+class ExpenseBulkCreate(BaseModel):
+    """Schema for creating many expenses in one request."""
+
+    items: List[ExpenseCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BULK_EXPENSES,
+        description=f"Expenses to create (at most {MAX_BULK_EXPENSES})",
+    )
+
+
 class ExpenseUpdate(BaseModel):
     """Schema for updating an expense."""
 
@@ -97,3 +112,181 @@ class ExpenseResponse(BaseModel):
                 "updated_at": "2026-02-10T12:00:00Z",
             }
         }
+
+
+# Builds the responses of a list of expense entities in one call:
+# EXPENSE_RESPONSES.validate_python(expenses, from_attributes=True)
+EXPENSE_RESPONSES = TypeAdapter(List[ExpenseResponse])
+
+
+class ExpensePageResponse(BaseModel):
+    """Schema for a page of expenses with its keyset pagination cursor."""
+
+    items: List[ExpenseResponse] = Field(
+        default_factory=list, description="Expenses in this page"
+    )
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page (None on the last page)"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "items": [],
+                "next_cursor": "eyJkIjoiMjAyNi0wMi0xMFQxMjowMDowMCIsImkiOiI1MDdmMWY3N2JjZjg2Y2Q3OTk0MzkwMTEifQ",
+            }
+        }
+
+
+class ExpenseChangesResponse(BaseModel):
+    """Schema for the expenses of a group changed since a sync watermark."""
+
+    items: List[ExpenseResponse] = Field(
+        default_factory=list,
+        description="Created or updated expenses, and tombstones (is_deleted=True)",
+    )
+    since: Optional[str] = Field(
+        None, description="Watermark to send as `since` on the next sync"
+    )
+    has_more: bool = Field(
+        False, description="True when more changes are waiting past this batch"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "items": [],
+                "since": "eyJkIjoiMjAyNi0wMi0xMFQxMjowMDowMCIsImkiOiI1MDdmMWY3N2JjZjg2Y2Q3OTk0MzkwMTEifQ",
+                "has_more": False,
+            }
+        }
+
+
+class ExpenseBulkItemResult(BaseModel):
+    """Schema for the outcome of one item of a bulk create."""
+
+    index: int = Field(..., description="Position of the item in the request")
+    id: Optional[str] = Field(None, description="ID of the created expense")
+    error: Optional[str] = Field(None, description="Why the item was not created")
+
+
+class ExpenseBulkCreateResponse(BaseModel):
+    """Schema for the result of a bulk create, with one entry per requested item."""
+
+    created: int = Field(..., description="Number of expenses created")
+    failed: int = Field(..., description="Number of items that were not created")
+    results: List[ExpenseBulkItemResult] = Field(
+        default_factory=list, description="Per-item results, in request order"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "created": 1,
+                "failed": 1,
+                "results": [
+                    {"index": 0, "id": "507f1f77bcf86cd799439011", "error": None},
+                    {
+                        "index": 1,
+                        "id": None,
+                        "error": "You are not a member of this group",
+                    },
+                ],
+            }
+        }
+
+
+class ExpenseAnalyticsBucket(BaseModel):
+    """Schema for the aggregated amounts of one analytics bucket."""
+
+    key: str = Field(..., description="Bucket key (field value or calendar period)")
+    total_cents: int = Field(..., description="Sum of amounts in cents")
+    count: int = Field(..., description="Number of expenses")
+    average_cents: float = Field(..., description="Average amount in cents")
+    min_cents: int = Field(..., description="Smallest amount in cents")
+    max_cents: int = Field(..., description="Largest amount in cents")
+
+
+class ExpenseAnalyticsResponse(BaseModel):
+    """Schema for server-side aggregated expense analytics of a group."""
+
+    group_id: str = Field(..., description="ID of the expense group")
+    group_by: AnalyticsGroupBy = Field(..., description="Grouping dimension")
+    start_date: Optional[datetime] = Field(None, description="Inclusive range start")
+    end_date: Optional[datetime] = Field(None, description="Exclusive range end")
+    total_cents: int = Field(0, description="Sum of all amounts in cents")
+    count: int = Field(0, description="Number of expenses")
+    buckets: List[ExpenseAnalyticsBucket] = Field(
+        default_factory=list, description="Aggregates per bucket, ordered by key"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "group_id": "507f1f77bcf86cd799439012",
+                "group_by": "month",
+                "start_date": "2026-01-01T00:00:00Z",
+                "end_date": None,
+                "total_cents": 7500,
+                "count": 3,
+                "buckets": [
+                    {
+                        "key": "2026-01",
+                        "total_cents": 5000,
+                        "count": 2,
+                        "average_cents": 2500.0,
+                        "min_cents": 1000,
+                        "max_cents": 4000,
+                    },
+                    {
+                        "key": "2026-02",
+                        "total_cents": 2500,
+                        "count": 1,
+                        "average_cents": 2500.0,
+                        "min_cents": 2500,
+                        "max_cents": 2500,
+                    },
+                ],
+            }
+        }
+
+
+class SummaryTotalsResponse(BaseModel):
+    """Schema for the totals of one group summary bucket."""
+
+    total_cents: int = Field(..., description="Sum of amounts in cents")
+    count: int = Field(..., description="Number of expenses")
+
+
+class GroupSummaryResponse(BaseModel):
+    """Schema for the incrementally maintained spending summary of a group."""
+
+    group_id: str = Field(..., description="ID of the expense group")
+    total_cents: int = Field(0, description="Sum of all amounts in cents")
+    count: int = Field(0, description="Number of expenses")
+    by_category: Dict[str, SummaryTotalsResponse] = Field(
+        default_factory=dict, description="Totals per expense category"
+    )
+    by_type: Dict[str, SummaryTotalsResponse] = Field(
+        default_factory=dict, description="Totals per payment method type"
+    )
+    by_month: Dict[str, SummaryTotalsResponse] = Field(
+        default_factory=dict, description="Totals per month (YYYY-MM, UTC)"
+    )
+    updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "group_id": "507f1f77bcf86cd799439012",
+                "total_cents": 7500,
+                "count": 3,
+                "by_category": {"food": {"total_cents": 7500, "count": 3}},
+                "by_type": {
+                    "cash": {"total_cents": 2500, "count": 1},
+                    "credit_card": {"total_cents": 5000, "count": 2},
+                },
+                "by_month": {"2026-02": {"total_cents": 7500, "count": 3}},
+                "updated_at": "2026-02-10T12:00:00Z",
+            }
+        }
@@ -65,6 +65,24 @@ class AddUserRequest(BaseModel):
         }
 
 
+class AddUsersRequest(BaseModel):
+    """Schema for adding several users to a group at once."""
+
+    user_ids: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="IDs of the users to add",
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "user_ids": ["507f1f77bcf86cd799439012", "507f1f77bcf86cd799439013"],
+            }
+        }
+
+
 class GroupResponse(BaseModel):
     """Schema for group response with populated user objects."""
 
@@ -3,8 +3,8 @@ Pydantic schemas for User API requests and responses.
 """
 
 from datetime import datetime, date
-from typing import Optional
-from pydantic import BaseModel, Field, EmailStr
+from typing import List, Optional
+from pydantic import BaseModel, Field, EmailStr, TypeAdapter
 
 
 class UserCreate(BaseModel):
@@ -73,6 +73,11 @@ class UserResponse(BaseModel):
         }
 
 
+# Builds the responses of a list of user entities in one call:
+# USER_RESPONSES.validate_python(users, from_attributes=True)
+USER_RESPONSES = TypeAdapter(List[UserResponse])
+
+
 class UserResponseWithoutPassword(BaseModel):
     """Schema for user response without sensitive data."""
 
@@ -16,6 +16,7 @@ from app.models.auth_schema import (
     TokenValidationResponse,
     TokenData,
 )
+from app.infrastructure.password_hasher import PasswordHasherBusyError
 from app.infrastructure.logger import get_logger
 
 logger = get_logger(__name__)
@@ -52,6 +53,12 @@ class AuthViews:
         """
         try:
             return await self.controller.login(login_data)
+        except PasswordHasherBusyError as be:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(be),
+                headers={"Retry-After": "1"},
+            )
         except ValueError as ve:
             error_msg = str(ve)
             if error_msg.startswith("EMAIL_NOT_VERIFIED:"):
@@ -59,12 +66,12 @@ class AuthViews:
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail=error_msg.removeprefix("EMAIL_NOT_VERIFIED: "),
                 )
-            logger.error(f"Login validation error: {ve}")
+            logger.error("Login validation error: %s", ve)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED, detail=error_msg
             )
         except Exception as e:
-            logger.error(f"Error logging in: {e}")
+            logger.error("Error logging in: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Error logging in: {str(e)}",
@@ -91,12 +98,12 @@ class AuthViews:
         try:
             return await self.controller.refresh_token(request)
         except ValueError as ve:
-            logger.error(f"Refresh token validation error: {ve}")
+            logger.error("Refresh token validation error: %s", ve)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED, detail=str(ve)
             )
         except Exception as e:
-            logger.error(f"Error refreshing token: {e}")
+            logger.error("Error refreshing token: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Error refreshing token: {str(e)}",
@@ -120,12 +127,12 @@ class AuthViews:
             TokenValidationResponse indicating token is valid
         """
         try:
-            logger.info(f"Token validated for user: {current_user.sub}")
+            logger.info("Token validated for user: %s", current_user.sub)
             return TokenValidationResponse(
                 valid=True, email=current_user.sub, expires_at=current_user.exp
             )
         except Exception as e:  # pragma: no cover
-            logger.error(f"Error validating token: {e}")
+            logger.error("Error validating token: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Error validating token: {str(e)}",
@@ -56,12 +56,12 @@ class EmailVerificationViews:
                 user_id=user_id, code=body.code
             )
         except ValueError as ve:
-            logger.warning(f"Email verification failed: {ve}")
+            logger.warning("Email verification failed: %s", ve)
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(ve)
             )
         except Exception as e:
-            logger.error(f"Error verifying email: {e}")
+            logger.error("Error verifying email: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
             )
@@ -84,12 +84,12 @@ class EmailVerificationViews:
         try:
             return await self.controller.resend_verification(user_id=user_id)
         except ValueError as ve:
-            logger.warning(f"Resend verification failed: {ve}")
+            logger.warning("Resend verification failed: %s", ve)
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(ve)
             )
         except Exception as e:
-            logger.error(f"Error resending verification: {e}")
+            logger.error("Error resending verification: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
             )
@@ -113,12 +113,12 @@ class EmailVerificationViews:
         try:
             return await self.controller.request_verification(email=str(body.email))
         except ValueError as ve:
-            logger.warning(f"Request verification failed: {ve}")
+            logger.warning("Request verification failed: %s", ve)
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(ve)
             )
         except Exception as e:
-            logger.error(f"Error requesting verification: {e}")
+            logger.error("Error requesting verification: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
             )
@@ -1,15 +1,28 @@
 """Expense routes with class-based views using fastapi-utils."""
 
-from fastapi import APIRouter, Depends, Security, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, Security, HTTPException, Response, status
+from datetime import datetime
+from typing import List, Optional
 
+from fastapi.responses import StreamingResponse
 from fastapi_utils.cbv import cbv
 
 from app.controllers.expense_controller import ExpenseController
 from app.infrastructure.dependencies.expense_dependencies import ExpenseDependencies
 from app.infrastructure.dependencies.oauth2_dependencies import verify_oauth2_token
 from app.infrastructure.dependencies.auth_dependencies import verify_api_key
-from app.models.expense_schema import ExpenseCreate, ExpenseUpdate, ExpenseResponse
+from app.models.expense_schema import (
+    ExpenseCreate,
+    ExpenseBulkCreate,
+    ExpenseBulkCreateResponse,
+    ExpenseUpdate,
+    ExpenseResponse,
+    ExpenseChangesResponse,
+    ExpenseAnalyticsResponse,
+    GroupSummaryResponse,
+)
+from app.domain.enums.analytics_group_by_enum import AnalyticsGroupBy
+from app.domain.enums.export_format_enum import ExportFormat
 from app.models.auth_schema import TokenData
 from app.models.response_schema import StandardResponse
 from app.infrastructure.logger import get_logger
@@ -19,6 +32,13 @@ logger = get_logger(__name__)
 
 router = APIRouter(tags=["expenses"])
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
 
 @cbv(router)
 class ExpenseViews:
@@ -36,41 +56,170 @@ class ExpenseViews:
     async def create_expense(self, expense_data: ExpenseCreate) -> StandardResponse:
         """Create a new expense in a group (user must be a group member)."""
         try:
-            await self.controller.create_expense(expense_data, self.current_user.sub)
+            await self.controller.create_expense(
+                expense_data, self.current_user.sub, self.current_user.user_id
+            )
             return StandardResponse(message="Expense created successfully")
         except PermissionError as pe:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(pe))
         except Exception as e:
-            logger.error(f"Error creating expense: {e}")
+            logger.error("Error creating expense: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Error creating expense: {str(e)}",
             )
 
+    @router.post("/expenses/bulk", response_model=ExpenseBulkCreateResponse)
+    async def create_expenses_bulk(
+        self, body: ExpenseBulkCreate
+    ) -> ExpenseBulkCreateResponse:
+        """
+        Create many expenses in one request. Each item succeeds or fails on its
+        own; items for groups the user is not a member of are reported as failed.
+        """
+        try:
+            return await self.controller.create_expenses(
+                body.items, self.current_user.sub, self.current_user.user_id
+            )
+        except Exception as e:
+            logger.error("Error creating expenses in bulk: %s", e)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Error creating expenses: {str(e)}",
+            )
+
     @router.get("/expenses/{group_id}", response_model=List[ExpenseResponse])
     async def list_all_expenses(
         self,
         group_id: str,
+        response: Response,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[ExpenseResponse]:
-        """Get all expenses for a group (user must be a group member)."""
+        """
+        Get all expenses for a group (user must be a group member).
+
+        Pass the X-Next-Cursor response header back as `cursor` to fetch the
+        next page with keyset pagination; skip/limit is kept as a fallback.
+        """
         try:
-            return await self.controller.get_all_expenses(group_id, self.current_user.sub, skip, limit)
+            page = await self.controller.get_all_expenses(
+                group_id,
+                self.current_user.sub,
+                skip,
+                limit,
+                cursor,
+                self.current_user.user_id,
+            )
+            if page.next_cursor:
+                response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+            return page.items
         except PermissionError as pe:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(pe))
+        except ValueError as ve:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(ve)
+            )
         except Exception as e:
-            logger.error(f"Error fetching expenses for group {group_id}: {e}")
+            logger.error("Error fetching expenses for group %s: %s", group_id, e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error fetching expenses: {str(e)}",
             )
 
+    @router.get(
+        "/expenses/{group_id}/changes", response_model=ExpenseChangesResponse
+    )
+    async def list_expense_changes(
+        self,
+        group_id: str,
+        since: Optional[str] = None,
+        limit: int = 100,
+    ) -> ExpenseChangesResponse:
+        """
+        Get the expenses of a group changed since the last sync (user must be a
+        group member), including tombstones (is_deleted=True) for deleted ones.
+
+        Omit `since` for the first sync, then send back the returned `since`;
+        repeat while `has_more` is true.
+        """
+        try:
+            return await self.controller.get_expense_changes(
+                group_id,
+                self.current_user.sub,
+                since,
+                limit,
+                self.current_user.user_id,
+            )
+        except PermissionError as pe:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(pe))
+        except ValueError as ve:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(ve)
+            )
+        except Exception as e:
+            logger.error(
+                "Error fetching expense changes for group %s: %s", group_id, e
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error fetching expense changes: {str(e)}",
+            )
+
+    @router.get("/expenses/{group_id}/export", response_class=StreamingResponse)
+    async def export_expenses(
+        self,
+        group_id: str,
+        format: ExportFormat = ExportFormat.NDJSON,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> StreamingResponse:
+        """
+        Download the expenses of a group as NDJSON or CSV (user must be a group
+        member), optionally limited to start_date <= date < end_date.
+
+        The file is streamed from the database in batches, so exports of any
+        size are served in constant memory.
+        """
+        try:
+            chunks = await self.controller.export_expenses(
+                group_id,
+                self.current_user.sub,
+                format,
+                start_date,
+                end_date,
+                self.current_user.user_id,
+            )
+        except PermissionError as pe:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(pe))
+        except ValueError as ve:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(ve)
+            )
+        except Exception as e:
+            logger.error("Error exporting expenses for group %s: %s", group_id, e)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error exporting expenses: {str(e)}",
+            )
+        return StreamingResponse(
+            chunks,
+            media_type=EXPORT_MEDIA_TYPES[format],
+            headers={
+                "Content-Disposition": (
+                    f'attachment; filename="expenses-{group_id}.{format}"'
+                )
+            },
+        )
+
     @router.get("/expenses/{expense_id}/details", response_model=ExpenseResponse)
     async def get_expense_details(self, expense_id: str) -> ExpenseResponse:
         """Get a specific expense by ID (user must be a member of the expense's group)."""
         try:
-            expense = await self.controller.get_expense_by_id(expense_id, self.current_user.sub)
+            expense = await self.controller.get_expense_by_id(
+                expense_id, self.current_user.sub, self.current_user.user_id
+            )
             if not expense:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -82,7 +231,7 @@ class ExpenseViews:
         except PermissionError as pe:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(pe))
         except Exception as e:
-            logger.error(f"Error fetching expense {expense_id}: {e}")
+            logger.error("Error fetching expense %s: %s", expense_id, e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error fetching expense: {str(e)}",
@@ -97,7 +246,10 @@ class ExpenseViews:
         """Update an existing expense (user must be a member of the expense's group)."""
         try:
             updated_expense = await self.controller.update_expense(
-                expense_id, expense_data, self.current_user.sub
+                expense_id,
+                expense_data,
+                self.current_user.sub,
+                self.current_user.user_id,
             )
             if not updated_expense:
                 raise HTTPException(
@@ -110,7 +262,7 @@ class ExpenseViews:
         except PermissionError as pe:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(pe))
         except Exception as e:
-            logger.error(f"Error updating expense {expense_id}: {e}")
+            logger.error("Error updating expense %s: %s", expense_id, e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error updating expense: {str(e)}",
@@ -120,7 +272,9 @@ class ExpenseViews:
     async def delete_expense(self, expense_id: str) -> None:
         """Delete an expense (user must be a member of the expense's group)."""
         try:
-            result = await self.controller.delete_expense(expense_id, self.current_user.sub)
+            result = await self.controller.delete_expense(
+                expense_id, self.current_user.sub, self.current_user.user_id
+            )
             if not result:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -131,7 +285,7 @@ class ExpenseViews:
         except PermissionError as pe:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(pe))
         except Exception as e:
-            logger.error(f"Error deleting expense {expense_id}: {e}")
+            logger.error("Error deleting expense %s: %s", expense_id, e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error deleting expense: {str(e)}",
@@ -141,12 +295,72 @@ class ExpenseViews:
     async def get_expense_analytics(self, group_id: str) -> List[dict]:
         """Get analytics data (amounts and types) for a group (user must be a member)."""
         try:
-            return await self.controller.get_amounts_and_types(group_id, self.current_user.sub)
+            return await self.controller.get_amounts_and_types(
+                group_id, self.current_user.sub, self.current_user.user_id
+            )
         except PermissionError as pe:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(pe))
         except Exception as e:
-            logger.error(f"Error fetching analytics for group {group_id}: {e}")
+            logger.error("Error fetching analytics for group %s: %s", group_id, e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error fetching analytics: {str(e)}",
             )
+
+    @router.get(
+        "/expenses/{group_id}/analytics/summary",
+        response_model=ExpenseAnalyticsResponse,
+    )
+    async def get_expense_analytics_summary(
+        self,
+        group_id: str,
+        group_by: AnalyticsGroupBy = AnalyticsGroupBy.TYPE_EXPENSE,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> ExpenseAnalyticsResponse:
+        """
+        Get totals, counts, averages and min/max of a group's expenses
+        grouped by type, category, spender or calendar bucket (user must be a member).
+        """
+        try:
+            return await self.controller.get_expense_analytics(
+                group_id,
+                self.current_user.sub,
+                group_by,
+                start_date,
+                end_date,
+                self.current_user.user_id,
+            )
+        except PermissionError as pe:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(pe))
+        except ValueError as ve:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(ve)
+            )
+        except Exception as e:
+            logger.error(
+                "Error fetching analytics summary for group %s: %s", group_id, e
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error fetching analytics: {str(e)}",
+            )
+
+    @router.get("/expenses/{group_id}/totals", response_model=GroupSummaryResponse)
+    async def get_group_totals(self, group_id: str) -> GroupSummaryResponse:
+        """
+        Get the maintained spending totals of a group per category, type
+        and month (user must be a member).
+        """
+        try:
+            return await self.controller.get_group_summary(
+                group_id, self.current_user.sub, self.current_user.user_id
+            )
+        except PermissionError as pe:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(pe))
+        except Exception as e:
+            logger.error("Error fetching totals for group %s: %s", group_id, e)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error fetching totals: {str(e)}",
+            )
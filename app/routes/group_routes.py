@@ -8,7 +8,13 @@ from app.controllers.group_controller import GroupController
 from app.infrastructure.dependencies.group_dependencies import GroupDependencies
 from app.infrastructure.dependencies.oauth2_dependencies import verify_oauth2_token
 from app.infrastructure.dependencies.auth_dependencies import verify_api_key
-from app.models.group_schema import GroupCreate, GroupUpdate, GroupResponse, AddUserRequest
+from app.models.group_schema import (
+    GroupCreate,
+    GroupUpdate,
+    GroupResponse,
+    AddUserRequest,
+    AddUsersRequest,
+)
 from app.models.auth_schema import TokenData
 from app.models.response_schema import StandardResponse
 from app.infrastructure.logger import get_logger
@@ -39,7 +45,7 @@ class GroupViews:
         except PermissionError as pe:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(pe))
         except Exception as e:
-            logger.error(f"Error creating group: {e}")
+            logger.error("Error creating group: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Error creating group: {str(e)}",
@@ -51,7 +57,9 @@ class GroupViews:
         try:
             return await self.controller.get_groups_by_user_email(self.current_user.sub)
         except Exception as e:
-            logger.error(f"Error fetching groups for user {self.current_user.sub}: {e}")
+            logger.error(
+                "Error fetching groups for user %s: %s", self.current_user.sub, e
+            )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Error fetching user groups: {str(e)}",
@@ -77,7 +85,7 @@ class GroupViews:
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(ve)
             )
         except Exception as e:
-            logger.error(f"Error fetching group {group_id}: {e}")
+            logger.error("Error fetching group %s: %s", group_id, e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Error fetching group: {str(e)}",
@@ -103,7 +111,7 @@ class GroupViews:
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(ve)
             )
         except Exception as e:
-            logger.error(f"Error updating group {group_id}: {e}")
+            logger.error("Error updating group %s: %s", group_id, e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Error updating group: {str(e)}",
@@ -124,7 +132,7 @@ class GroupViews:
         except PermissionError as pe:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(pe))
         except Exception as e:
-            logger.error(f"Error deleting group {group_id}: {e}")
+            logger.error("Error deleting group %s: %s", group_id, e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Error deleting group: {str(e)}",
@@ -155,12 +163,43 @@ class GroupViews:
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(ve)
             )
         except Exception as e:
-            logger.error(f"Error adding user to group {group_id}: {e}")
+            logger.error("Error adding user to group %s: %s", group_id, e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Error adding user to group: {str(e)}",
             )
 
+    @router.post(
+        "/groups/{group_id}/users/bulk",
+        response_model=StandardResponse,
+    )
+    async def add_users_to_group(
+        self, group_id: str, body: AddUsersRequest
+    ) -> StandardResponse:
+        """Add several users to a group in one write (only if the authenticated user is a member)."""
+        try:
+            result = await self.controller.add_users_to_group(group_id, body.user_ids, self.current_user.sub)
+            if result is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Group {group_id} not found",
+                )
+            return StandardResponse(message="Users added to group successfully")
+        except HTTPException:
+            raise
+        except PermissionError as pe:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(pe))
+        except ValueError as ve:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(ve)
+            )
+        except Exception as e:
+            logger.error("Error adding users to group %s: %s", group_id, e)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Error adding users to group: {str(e)}",
+            )
+
     @router.delete(
         "/groups/{group_id}/users/{user_id}",
         response_model=StandardResponse,
@@ -186,7 +225,7 @@ class GroupViews:
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(ve)
             )
         except Exception as e:
-            logger.error(f"Error removing user from group {group_id}: {e}")
+            logger.error("Error removing user from group %s: %s", group_id, e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Error removing user from group: {str(e)}",
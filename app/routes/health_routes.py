@@ -37,7 +37,7 @@ class HealthViews:
                 "message": f"{settings.app_name} is healthy",
             }
         except Exception as e:
-            logger.error(f"Health check failed: {e}")
+            logger.error("Health check failed: %s", e)
             return JSONResponse(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 content={
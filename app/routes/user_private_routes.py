@@ -45,7 +45,7 @@ class UserPrivateViews:
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error getting user by email: {e}")
+            logger.error("Error getting user by email: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Error retrieving user: {str(e)}",
@@ -69,7 +69,7 @@ class UserPrivateViews:
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error getting user: {e}")
+            logger.error("Error getting user: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Error retrieving user: {str(e)}",
@@ -91,12 +91,12 @@ class UserPrivateViews:
                 )
             return StandardResponse(message="User updated successfully")
         except ValueError as ve:
-            logger.error(f"Validation error updating user: {ve}")
+            logger.error("Validation error updating user: %s", ve)
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(ve))
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error updating user: {e}")
+            logger.error("Error updating user: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Error updating user: {str(e)}",
@@ -120,7 +120,7 @@ class UserPrivateViews:
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error deleting user: {e}")
+            logger.error("Error deleting user: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Error deleting user: {str(e)}",
@@ -144,7 +144,7 @@ class UserPrivateViews:
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error getting user {user_id}: {e}")
+            logger.error("Error getting user %s: %s", user_id, e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Error retrieving user: {str(e)}",
@@ -166,12 +166,12 @@ class UserPrivateViews:
                 )
             return StandardResponse(message="User updated successfully")
         except ValueError as ve:
-            logger.error(f"Validation error updating user {user_id}: {ve}")
+            logger.error("Validation error updating user %s: %s", user_id, ve)
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(ve))
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error updating user {user_id}: {e}")
+            logger.error("Error updating user %s: %s", user_id, e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Error updating user: {str(e)}",
@@ -193,7 +193,7 @@ class UserPrivateViews:
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error deleting user {user_id}: {e}")
+            logger.error("Error deleting user %s: %s", user_id, e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Error deleting user: {str(e)}",
@@ -9,6 +9,7 @@ from app.infrastructure.dependencies.user_dependencies import UserDependencies
 from app.infrastructure.dependencies.auth_dependencies import verify_api_key
 from app.models.user_schema import UserCreate
 from app.models.email_verification_schema import UserRegisterResponse
+from app.infrastructure.password_hasher import PasswordHasherBusyError
 from app.infrastructure.logger import get_logger
 
 logger = get_logger(__name__)
@@ -33,13 +34,19 @@ class UserPublicViews:
         """Register a new user in the system."""
         try:
             return await self.controller.register_user(user_data)
+        except PasswordHasherBusyError as be:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(be),
+                headers={"Retry-After": "1"},
+            )
         except ValueError as ve:
-            logger.error(f"Validation error registering user: {ve}")
+            logger.error("Validation error registering user: %s", ve)
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(ve)
             )
         except Exception as e:
-            logger.error(f"Error registering user: {e}")
+            logger.error("Error registering user: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Error registering user: {str(e)}",
@@ -25,7 +25,7 @@ class APIKeyAuthService(IAuthService):
         Returns:
             True if the key matches settings.api_key, False otherwise
         """
-        logger.info("Validating API key")
+        logger.debug("Validating API key")
         is_valid = secrets.compare_digest(api_key, self.settings.api_key)
 
         if not is_valid:
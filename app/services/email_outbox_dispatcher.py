@@ -0,0 +1,206 @@
+"""
+Background delivery of the email outbox.
+
+A pool of asyncio workers drains the outbox. Each worker claims the email
+due the longest (a lease, so replicas never send the same email at once)
+and hands it to the transport on a thread of a pool as large as the worker
+pool, which bounds how many sends are in flight. Failed sends are retried
+with exponential backoff and jitter, then dead-lettered once the attempts
+are exhausted. Idle workers poll the outbox and are woken at once when this
+process enqueues an email.
+"""
+
+import asyncio
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional
+from app.domain.entities.outbox_email_entity import OutboxEmail
+from app.domain.interfaces.email_outbox_repository_interface import (
+    IEmailOutboxRepository,
+)
+from app.domain.interfaces.email_transport_interface import IEmailTransport
+from app.infrastructure.metrics import get_metrics_registry
+from app.infrastructure.logger import get_logger
+from app.use_cases.expense.date_range_utils import as_utc
+
+logger = get_logger(__name__)
+
+_registry = get_metrics_registry()
+EMAILS_SENT = _registry.counter("email_outbox_sent_total", "Outbox emails delivered.")
+EMAILS_RETRIED = _registry.counter(
+    "email_outbox_retries_total",
+    "Outbox email deliveries that failed and were rescheduled.",
+)
+EMAILS_DEAD = _registry.counter(
+    "email_outbox_dead_letters_total",
+    "Outbox emails given up on, by reason.",
+    ("reason",),
+)
+SEND_DURATION = _registry.histogram(
+    "email_send_duration_seconds", "Time taken by the email transport to send."
+)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class EmailOutboxDispatcher:
+    """Pool of workers delivering the emails of the outbox."""
+
+    def __init__(
+        self,
+        repository: IEmailOutboxRepository,
+        transport: IEmailTransport,
+        workers: int = 4,
+        max_attempts: int = 6,
+        backoff_base_seconds: float = 2.0,
+        backoff_max_seconds: float = 300.0,
+        poll_interval_seconds: float = 1.0,
+        lease_seconds: float = 60.0,
+        clock: Callable[[], datetime] = _utc_now,
+    ):
+        """
+        Initialize the dispatcher. No worker runs before start().
+
+        Args:
+            repository: Durable queue of emails to deliver
+            transport: Provider the emails are handed to
+            workers: Number of workers, and so of concurrent sends
+            max_attempts: Attempts before an email is dead-lettered
+            backoff_base_seconds: Delay before the first retry, doubled after each
+            backoff_max_seconds: Longest delay between two attempts
+            poll_interval_seconds: How often idle workers look for due emails
+            lease_seconds: How long a claimed email is kept from other workers;
+                           must exceed the longest send
+            clock: Current UTC time (injectable for tests)
+        """
+        self.repository = repository
+        self.transport = transport
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+        self.lease_seconds = lease_seconds
+        self._clock = clock
+        self._tasks: List["asyncio.Task[None]"] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """Start the workers on the running event loop."""
+        if self.running:
+            return
+        logger.info("Starting %s email outbox workers", self.workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="email-outbox"
+        )
+        self._wakeup = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._work(), name=f"email-outbox-{index}")
+            for index in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """
+        Stop the workers. A send already handed to the transport completes
+        in its thread; its email is retried once its lease expires.
+        """
+        if not self.running:
+            return
+        logger.info("Stopping email outbox workers")
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._executor.shutdown(wait=False)
+        self._executor = None
+
+    def wake(self) -> None:
+        """Have the idle workers look for due emails now."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def backoff_seconds(self, attempts: int) -> float:
+        """Delay before the next attempt after `attempts` failed ones, with jitter."""
+        delay = min(
+            self.backoff_max_seconds, self.backoff_base_seconds * 2 ** (attempts - 1)
+        )
+        return delay * (0.5 + random.random() / 2)
+
+    async def _work(self) -> None:
+        while True:
+            try:
+                delivered = await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Email outbox worker error: %s", e)
+                delivered = False
+
+            if not delivered:
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), self.poll_interval_seconds
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+    async def run_once(self) -> bool:
+        """
+        Claim the email due the longest and try to deliver it.
+
+        Returns:
+            True if an email was claimed, False if none was due
+        """
+        now = self._clock()
+        email = await self.repository.claim_next(now, self.lease_seconds)
+        if email is None:
+            return False
+
+        if email.expires_at is not None and as_utc(email.expires_at) <= now:
+            EMAILS_DEAD.inc("expired")
+            await self.repository.dead_letter(email.id, "Expired before delivery")
+            return True
+
+        try:
+            await self._send(email)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            if email.attempts >= self.max_attempts:
+                EMAILS_DEAD.inc("attempts_exhausted")
+                await self.repository.dead_letter(
+                    email.id, f"Gave up after {email.attempts} attempts: {error}"
+                )
+            else:
+                delay = self.backoff_seconds(email.attempts)
+                logger.warning(
+                    "Outbox email %s failed (attempt %s), retrying in %.1fs: %s",
+                    email.id,
+                    email.attempts,
+                    delay,
+                    error,
+                )
+                EMAILS_RETRIED.inc()
+                await self.repository.schedule_retry(
+                    email.id, self._clock() + timedelta(seconds=delay), error
+                )
+        else:
+            EMAILS_SENT.inc()
+            await self.repository.mark_sent(email.id)
+        return True
+
+    async def _send(self, email: OutboxEmail) -> None:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        try:
+            await loop.run_in_executor(self._executor, self.transport.send, email)
+        finally:
+            SEND_DURATION.observe(loop.time() - start)
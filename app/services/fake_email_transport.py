@@ -0,0 +1,44 @@
+"""Email transport keeping emails in memory, for tests and local development."""
+
+import threading
+from typing import List, Optional
+from app.domain.entities.outbox_email_entity import OutboxEmail
+from app.domain.interfaces.email_transport_interface import IEmailTransport
+from app.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class FakeEmailTransport(IEmailTransport):
+    """
+    Records delivered emails instead of sending them.
+    Can be told to fail the next deliveries to exercise retries.
+    """
+
+    def __init__(self, failures: int = 0, error: Optional[Exception] = None):
+        """
+        Initialize the transport.
+
+        Args:
+            failures: Number of upcoming deliveries that fail
+            error: Exception raised by a failing delivery
+        """
+        self.sent: List[OutboxEmail] = []
+        self.attempts = 0
+        self._failures = failures
+        self._error = error or ConnectionError("Fake transport failure")
+        self._lock = threading.Lock()
+
+    def fail_next(self, count: int = 1) -> None:
+        """Make the next `count` deliveries fail."""
+        with self._lock:
+            self._failures = count
+
+    def send(self, email: OutboxEmail) -> None:
+        with self._lock:
+            self.attempts += 1
+            if self._failures > 0:
+                self._failures -= 1
+                raise self._error
+            self.sent.append(email)
+        logger.info("Fake transport delivered email %s", email.id)
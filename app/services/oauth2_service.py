@@ -58,7 +58,7 @@ class OAuth2Service:
 
             return bcrypt.checkpw(plain_password, hashed_password)
         except Exception as e:
-            logger.error(f"Error verifying password: {e}")
+            logger.error("Error verifying password: %s", e)
             return False
 
     def create_access_token(
@@ -90,7 +90,7 @@ class OAuth2Service:
             to_encode, self.settings.secret_key, algorithm=self.algorithm
         )
 
-        logger.debug(f"Access token created for subject: {data.get('sub')}")
+        logger.debug("Access token created for subject: %s", data.get('sub'))
         return encoded_jwt
 
     def create_refresh_token(
@@ -123,7 +123,7 @@ class OAuth2Service:
             to_encode, self.settings.secret_key, algorithm=self.algorithm
         )
 
-        logger.debug(f"Refresh token created for subject: {data.get('sub')}")
+        logger.debug("Refresh token created for subject: %s", data.get('sub'))
         return encoded_jwt
 
     def create_token_pair(self, email: str, user_id: Optional[str] = None) -> Tuple[str, str, datetime]:
@@ -188,16 +188,22 @@ class OAuth2Service:
 
             if token_type_from_payload != token_type:
                 logger.warning(
-                    f"Token type mismatch: expected {token_type}, got {token_type_from_payload}"
+                    "Token type mismatch: expected %s, got %s",
+                    token_type,
+                    token_type_from_payload,
                 )
                 return None
 
             exp_datetime = datetime.utcfromtimestamp(exp)
-            logger.debug(f"Token valid for subject: {sub}, expires at {exp_datetime}")
+            logger.debug(
+                "Token valid for subject: %s, expires at %s", sub, exp_datetime
+            )
 
             token_data = TokenData(sub=sub, user_id=user_id, exp=exp, type=token_type_from_payload)
             logger.debug(
-                f"Token verified for subject: {sub} (type: {token_type_from_payload})"
+                "Token verified for subject: %s (type: %s)",
+                sub,
+                token_type_from_payload,
             )
             return token_data
 
@@ -205,7 +211,7 @@ class OAuth2Service:
             logger.warning("Token has expired")
             return None
         except jwt.InvalidTokenError as e:
-            logger.warning(f"Invalid token: {e}")
+            logger.warning("Invalid token: %s", e)
             return None
 
     def create_verification_token(self, user_id: str) -> str:
@@ -227,7 +233,7 @@ class OAuth2Service:
             "exp": expire,
         }
         token = jwt.encode(payload, self.settings.secret_key, algorithm=self.algorithm)
-        logger.debug(f"Verification token created for user_id={user_id}")
+        logger.debug("Verification token created for user_id=%s", user_id)
         return token
 
     def verify_verification_token(self, token: str) -> Optional[str]:
@@ -253,5 +259,5 @@ class OAuth2Service:
             logger.warning("Verification token has expired")
             return None
         except jwt.InvalidTokenError as e:
-            logger.warning(f"Invalid verification token: {e}")
+            logger.warning("Invalid verification token: %s", e)
             return None
@@ -0,0 +1,85 @@
+"""Email service queueing emails in the outbox for background delivery."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from app.domain.entities.outbox_email_entity import OutboxEmail
+from app.domain.interfaces.email_outbox_repository_interface import (
+    IEmailOutboxRepository,
+)
+from app.domain.interfaces.email_service_interface import IEmailService
+from app.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+VERIFICATION_SUBJECT = "Finito — Verifique seu endereço de e-mail"
+
+# Matches the code lifetime announced in the email; an email still queued
+# after that is no longer worth sending.
+VERIFICATION_EMAIL_TTL_MINUTES = 15
+
+
+class OutboxEmailService(IEmailService):
+    """
+    Writes emails to the outbox and returns; EmailOutboxDispatcher workers
+    deliver them, so requests never wait on the email provider.
+    """
+
+    def __init__(
+        self,
+        outbox_repository: IEmailOutboxRepository,
+        notify: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Args:
+            outbox_repository: Durable queue of emails to deliver
+            notify: Called after each enqueue to wake the local workers
+        """
+        self.outbox_repository = outbox_repository
+        self.notify = notify
+
+    async def send_verification_email(self, to_email: str, code: str) -> None:
+        """
+        Queue a 6-digit verification code email for the user.
+
+        The code is rendered into the queued HTML, so it sits in plain text
+        in the outbox until the email is sent (the entry is deleted), dead-
+        lettered (the body is cleared) or found expired by a worker.
+
+        Args:
+            to_email: Recipient email address
+            code: Plain-text verification code
+
+        Raises:
+            Exception: If the outbox write fails
+        """
+        now = datetime.now(timezone.utc)
+        email = OutboxEmail(
+            to_email=to_email,
+            subject=VERIFICATION_SUBJECT,
+            html=_build_email_html(code),
+            next_attempt_at=now,
+            expires_at=now + timedelta(minutes=VERIFICATION_EMAIL_TTL_MINUTES),
+        )
+        await self.outbox_repository.enqueue(email)
+        logger.info("Verification email to %s*** queued as %s", to_email[:3], email.id)
+        if self.notify is not None:
+            self.notify()
+
+
+def _build_email_html(code: str) -> str:
+    return f"""
+    <div style="font-family:sans-serif;max-width:480px;margin:auto;padding:32px">
+      <h2 style="color:#1a1a1a">Verifique seu e-mail</h2>
+      <p style="color:#555">Use o código abaixo para confirmar seu cadastro no <strong>Finito</strong>.</p>
+      <div style="font-size:36px;font-weight:bold;letter-spacing:8px;
+                  background:#f4f4f4;padding:16px 24px;border-radius:8px;
+                  text-align:center;margin:24px 0">
+        {code}
+      </div>
+      <p style="color:#888;font-size:13px">
+        Este código expira em <strong>15 minutos</strong>.<br>
+        Se você não solicitou este cadastro, ignore este e-mail.
+      </p>
+    </div>
+    """
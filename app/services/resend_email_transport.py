@@ -0,0 +1,40 @@
+"""Email transport delivering outbox emails through the Resend API."""
+
+import resend
+
+from app.domain.entities.outbox_email_entity import OutboxEmail
+from app.domain.interfaces.email_transport_interface import IEmailTransport
+from app.infrastructure.settings import get_settings
+from app.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ResendEmailTransport(IEmailTransport):
+    """
+    Sends emails with the Resend SDK. Its HTTP client is blocking, so
+    `send` is only called from the outbox worker threads.
+    """
+
+    def __init__(self):
+        self.settings = get_settings()
+        resend.api_key = self.settings.resend_api_key
+
+    def send(self, email: OutboxEmail) -> None:
+        """
+        Deliver an outbox email.
+
+        Args:
+            email: Email to deliver
+
+        Raises:
+            Exception: If the Resend API call fails
+        """
+        params: resend.Emails.SendParams = {
+            "from": self.settings.resend_from_email,
+            "to": [email.to_email],
+            "subject": email.subject,
+            "html": email.html,
+        }
+        resend.Emails.send(params)
+        logger.info("Email %s delivered to %s***", email.id, email.to_email[:3])
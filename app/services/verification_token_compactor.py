@@ -0,0 +1,94 @@
+"""
+Background removal of used email verification tokens.
+
+Expired tokens are removed by MongoDB's TTL monitor; used ones are only
+needed until the verification succeeds, so a periodic task deletes them in
+batches. Resend limits are unaffected: they are counted apart from the tokens.
+"""
+
+import asyncio
+from typing import Optional
+from app.domain.interfaces.email_verification_repository_interface import (
+    IEmailVerificationRepository,
+)
+from app.infrastructure.metrics import get_metrics_registry
+from app.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+TOKENS_COMPACTED = get_metrics_registry().counter(
+    "verification_tokens_compacted_total", "Used verification tokens deleted."
+)
+
+
+class VerificationTokenCompactor:
+    """Periodically deletes used verification tokens."""
+
+    def __init__(
+        self,
+        repository: IEmailVerificationRepository,
+        interval_seconds: float = 3600.0,
+        batch_size: int = 1000,
+    ):
+        """
+        Initialize the compactor. Nothing runs before start().
+
+        Args:
+            repository: Verification tokens to compact
+            interval_seconds: Time between two compaction runs
+            batch_size: Tokens deleted per round trip
+        """
+        self.repository = repository
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        """Start compacting on the running event loop."""
+        if self.running:
+            return
+        self._task = asyncio.create_task(
+            self._run(), name="verification-token-compactor"
+        )
+
+    async def stop(self) -> None:
+        """Stop compacting, interrupting the current run if any."""
+        if not self.running:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Verification token compaction failed: %s", e)
+            await asyncio.sleep(self.interval_seconds)
+
+    async def run_once(self) -> int:
+        """
+        Delete every used token, one batch at a time.
+
+        Returns:
+            Number of tokens deleted
+        """
+        total = 0
+        while True:
+            deleted = await self.repository.delete_used(self.batch_size)
+            total += deleted
+            TOKENS_COMPACTED.inc(amount=deleted)
+            if deleted < self.batch_size:
+                break
+            # Let requests through between batches
+            await asyncio.sleep(0)
+        if total:
+            logger.info("Deleted %s used verification tokens", total)
+        return total
@@ -7,7 +7,7 @@ from app.domain.interfaces.user_repository_interface import IUserRepository
 from app.services.oauth2_service import OAuth2Service
 from app.infrastructure.logger import get_logger
 from datetime import datetime, timezone
-from app.use_cases.user.password_utils import verify_password
+from app.use_cases.user.password_utils import verify_password_async
 
 logger = get_logger(__name__)
 
@@ -39,13 +39,21 @@ class LoginUseCase:
             ValueError: If email not found or password is incorrect
         """
         try:
-            logger.info(f"Login attempt for email: {login_data.email}")
+            logger.info("Login attempt for email: %s", login_data.email)
 
             user = await self.repository.get_by_email(login_data.email)
-
-            if not user or not verify_password(login_data.password, user.password):
+            password_hash = user.password if user else None
+            if user and not password_hash:
+                # Users served from the cache carry no password hash
+                fields = await self.repository.get_fields(user.id, ["password"])
+                password_hash = fields.get("password") if fields else None
+
+            if not password_hash or not await verify_password_async(
+                login_data.password, password_hash
+            ):
                 logger.info(
-                    f"Login failed: User not found or incorrect password for email {login_data.email}"
+                    "Login failed: User not found or incorrect password for email %s",
+                    login_data.email,
                 )
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
@@ -54,7 +62,7 @@ class LoginUseCase:
 
             if not getattr(user, "is_email_verified", True):
                 logger.warning(
-                    f"Login blocked — email not verified for {login_data.email}"
+                    "Login blocked — email not verified for %s", login_data.email
                 )
                 raise ValueError(
                     "EMAIL_NOT_VERIFIED: Email not verified. Please verify your email before logging in."
@@ -66,7 +74,7 @@ class LoginUseCase:
 
             expires_in = int((expires_at - datetime.now(timezone.utc)).total_seconds())
 
-            logger.info(f"Login successful for email: {login_data.email}")
+            logger.info("Login successful for email: %s", login_data.email)
             return TokenResponse(
                 access_token=access_token,
                 refresh_token=refresh_token,
@@ -76,8 +84,8 @@ class LoginUseCase:
             )
 
         except ValueError as ve:
-            logger.error(f"Validation error during login: {ve}")
+            logger.error("Validation error during login: %s", ve)
             raise
         except Exception as e:
-            logger.error(f"Error during login: {e}")
+            logger.error("Error during login: %s", e)
             raise
@@ -47,7 +47,7 @@ class RefreshTokenUseCase:
             # Calculate expires_in in seconds
             expires_in = int((expires_at - datetime.now(timezone.utc)).total_seconds())
 
-            logger.info(f"Token refreshed successfully for email: {token_data.sub}")
+            logger.info("Token refreshed successfully for email: %s", token_data.sub)
             return TokenResponse(
                 access_token=access_token,
                 refresh_token=new_refresh_token,
@@ -57,8 +57,8 @@ class RefreshTokenUseCase:
             )
 
         except ValueError as ve:
-            logger.error(f"Validation error during refresh: {ve}")
+            logger.error("Validation error during refresh: %s", ve)
             raise
         except Exception as e:
-            logger.error(f"Error refreshing token: {e}")
+            logger.error("Error refreshing token: %s", e)
             raise
@@ -57,22 +57,22 @@ class RequestVerificationEmailUseCase(
             verification_token="",
         )
         try:
-            logger.info(
-                f"Verification request received for email={input_data.email}"
-            )
+            logger.info("Verification request received for email=%s", input_data.email)
 
             user = await self.user_repository.get_by_email_unverified(
                 input_data.email
             )
             if user is None:
                 logger.info(
-                    f"Request-verification: email not found (silent) email={input_data.email}"
+                    "Request-verification: email not found (silent) email=%s",
+                    input_data.email,
                 )
                 return _GENERIC_RESPONSE
 
             if user.is_email_verified:
                 logger.info(
-                    f"Request-verification: already verified (silent) user_id={user.id}"
+                    "Request-verification: already verified (silent) user_id=%s",
+                    user.id,
                 )
                 return _GENERIC_RESPONSE
 
@@ -89,18 +89,17 @@ class RequestVerificationEmailUseCase(
             except ValueError:
                 # Resend limit reached — do not reveal this to the caller
                 logger.info(
-                    f"Request-verification: resend limit reached (silent) user_id={user.id}"
+                    "Request-verification: resend limit reached (silent) user_id=%s",
+                    user.id,
                 )
                 return _GENERIC_RESPONSE
 
-            logger.info(
-                f"New verification email sent for user_id={user.id}"
-            )
+            logger.info("New verification email sent for user_id=%s", user.id)
             return UserRegisterResponse(
                 message="If this email is registered and unverified, a code has been sent.",
                 verification_token=verification_token,
             )
 
         except Exception as e:
-            logger.error(f"Error on request-verification: {e}")
+            logger.error("Error on request-verification: %s", e)
             raise
@@ -18,8 +18,6 @@ from app.infrastructure.logger import get_logger
 
 logger = get_logger(__name__)
 
-_MAX_RESENDS = 3
-
 
 class ResendVerificationEmailUseCase(
     IUseCase[ResendVerificationEmailInput, StandardResponse]
@@ -55,7 +53,7 @@ class ResendVerificationEmailUseCase(
         """
         try:
             logger.info(
-                f"Resend verification email requested for user_id={input_data.user_id}"
+                "Resend verification email requested for user_id=%s", input_data.user_id
             )
 
             user = await self.user_repository.get_by_id_unverified(input_data.user_id)
@@ -65,21 +63,7 @@ class ResendVerificationEmailUseCase(
             if user.is_email_verified:
                 raise ValueError("Email is already verified.")
 
-            # Check resend limit from latest token
-            latest = await self.verification_repository.get_latest_by_user_id(
-                input_data.user_id
-            )
-            current_resend_count = latest.resend_count if latest else 0
-
-            if current_resend_count >= _MAX_RESENDS:
-                logger.warning(
-                    f"Resend limit reached for user_id={input_data.user_id}"
-                )
-                raise ValueError(
-                    "Maximum number of verification email resends reached. "
-                    "Please contact support."
-                )
-
+            # Enforces the resend limit when it issues the new token
             send_use_case = SendVerificationEmailUseCase(
                 self.verification_repository, self.email_service
             )
@@ -90,16 +74,14 @@ class ResendVerificationEmailUseCase(
                 )
             )
 
-            logger.info(
-                f"Verification email resent for user_id={input_data.user_id}"
-            )
+            logger.info("Verification email resent for user_id=%s", input_data.user_id)
             return StandardResponse(
                 message="Verification email sent. Please check your inbox."
             )
 
         except ValueError as ve:
-            logger.warning(f"Validation error on resend: {ve}")
+            logger.warning("Validation error on resend: %s", ve)
             raise
         except Exception as e:
-            logger.error(f"Error resending verification email: {e}")
+            logger.error("Error resending verification email: %s", e)
             raise
@@ -9,7 +9,6 @@ from app.domain.interfaces.email_verification_repository_interface import (
     IEmailVerificationRepository,
 )
 from app.domain.interfaces.email_service_interface import IEmailService
-from app.domain.entities.email_verification_token_entity import EmailVerificationToken
 from app.domain.dtos.email_verification_dtos import SendVerificationEmailInput
 from app.services.oauth2_service import OAuth2Service
 from app.infrastructure.logger import get_logger
@@ -25,7 +24,8 @@ class SendVerificationEmailUseCase(
     IUseCase[SendVerificationEmailInput, str]
 ):
     """
-    Generates a 6-digit code, persists its SHA-256 hash, sends the email,
+    Generates a 6-digit code, stores its SHA-256 hash as the user's active
+    token (at most 3 resends after the first code), sends the email,
     and returns a short-lived JWT verification token (carries user_id only).
     """
 
@@ -51,29 +51,7 @@ class SendVerificationEmailUseCase(
             Exception: On infrastructure failures
         """
         try:
-            logger.info(f"Sending verification email for user_id={input_data.user_id}")
-
-            # Determine current resend_count from the latest existing token
-            resend_count = 0
-            latest = await self.verification_repository.get_latest_by_user_id(
-                input_data.user_id
-            )
-            if latest is not None:
-                resend_count = latest.resend_count
-
-            if resend_count >= _MAX_RESENDS:
-                logger.warning(
-                    f"Resend limit reached for user_id={input_data.user_id}"
-                )
-                raise ValueError(
-                    "Maximum number of verification email resends reached. "
-                    "Please contact support."
-                )
-
-            # Invalidate any previous active tokens
-            await self.verification_repository.invalidate_all_by_user_id(
-                input_data.user_id
-            )
+            logger.info("Sending verification email for user_id=%s", input_data.user_id)
 
             # Generate 6-digit code and hash it
             code = str(secrets.randbelow(900000) + 100000)  # [100000, 999999]
@@ -83,13 +61,18 @@ class SendVerificationEmailUseCase(
                 minutes=_CODE_TTL_MINUTES
             )
 
-            token_entity = EmailVerificationToken(
-                user_id=input_data.user_id,
-                code_hash=code_hash,
-                expires_at=expires_at,
-                resend_count=resend_count,
+            # Replaces the active token and enforces the resend limit atomically
+            token = await self.verification_repository.issue_token(
+                input_data.user_id, code_hash, expires_at, _MAX_RESENDS
             )
-            await self.verification_repository.create(token_entity)
+            if token is None:
+                logger.warning(
+                    "Resend limit reached for user_id=%s", input_data.user_id
+                )
+                raise ValueError(
+                    "Maximum number of verification email resends reached. "
+                    "Please contact support."
+                )
 
             # Send the plain-text code via email
             await self.email_service.send_verification_email(
@@ -103,13 +86,14 @@ class SendVerificationEmailUseCase(
             )
 
             logger.info(
-                f"Verification email sent and token issued for user_id={input_data.user_id}"
+                "Verification email sent and token issued for user_id=%s",
+                input_data.user_id,
             )
             return verification_token
 
         except ValueError as ve:
-            logger.warning(f"Validation error sending verification email: {ve}")
+            logger.warning("Validation error sending verification email: %s", ve)
             raise
         except Exception as e:
-            logger.error(f"Error sending verification email: {e}")
+            logger.error("Error sending verification email: %s", e)
             raise
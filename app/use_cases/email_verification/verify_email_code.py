@@ -1,13 +1,16 @@
 """Verify email code use case."""
 
 import hashlib
+from contextlib import nullcontext
 from datetime import datetime, timezone
+from typing import Any, AsyncContextManager, NoReturn, Optional
 
 from app.domain.interfaces.use_case import IUseCase
 from app.domain.interfaces.user_repository_interface import IUserRepository
 from app.domain.interfaces.email_verification_repository_interface import (
     IEmailVerificationRepository,
 )
+from app.domain.interfaces.transaction_manager_interface import ITransactionManager
 from app.domain.dtos.email_verification_dtos import VerifyEmailCodeInput
 from app.models.auth_schema import TokenResponse
 from app.services.oauth2_service import OAuth2Service
@@ -20,7 +23,8 @@ _MAX_ATTEMPTS = 5
 
 class VerifyEmailCodeUseCase(IUseCase[VerifyEmailCodeInput, TokenResponse]):
     """
-    Validates the 6-digit code against the stored hash.
+    Validates the 6-digit code against the stored hash with one conditional
+    update of the token.
     On success: activates the user and returns a full login TokenResponse.
     On failure: increments attempt counter; blocks after 5 failures.
     """
@@ -29,9 +33,40 @@ class VerifyEmailCodeUseCase(IUseCase[VerifyEmailCodeInput, TokenResponse]):
         self,
         user_repository: IUserRepository,
         verification_repository: IEmailVerificationRepository,
+        transaction_manager: Optional[ITransactionManager] = None,
     ):
         self.user_repository = user_repository
         self.verification_repository = verification_repository
+        self.transaction_manager = transaction_manager
+
+    def _transaction(self) -> AsyncContextManager[Optional[Any]]:
+        if self.transaction_manager is None:
+            return nullcontext()
+        return self.transaction_manager.transaction()
+
+    async def _raise_unusable_token(self, user_id: str, now: datetime) -> NoReturn:
+        """Tell why the user has no token the code could be checked against."""
+        token = await self.verification_repository.get_valid_token_by_user_id(user_id)
+
+        if token is None:
+            logger.warning(
+                "No active verification token found for user_id=%s", user_id
+            )
+            raise ValueError(
+                "No active verification token found. Request a new code."
+            )
+
+        expires_at = token.expires_at
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        if now >= expires_at:
+            logger.warning("Verification token expired for user_id=%s", user_id)
+            raise ValueError("Verification code has expired. Request a new one.")
+
+        logger.warning("Max attempts reached for user_id=%s", user_id)
+        raise ValueError(
+            "Too many failed attempts. Request a new verification code."
+        )
 
     async def execute(self, input_data: VerifyEmailCodeInput) -> TokenResponse:
         """
@@ -46,69 +81,43 @@ class VerifyEmailCodeUseCase(IUseCase[VerifyEmailCodeInput, TokenResponse]):
             Exception: On infrastructure failures
         """
         try:
-            logger.info(f"Verifying email code for user_id={input_data.user_id}")
-
-            token = await self.verification_repository.get_valid_token_by_user_id(
-                input_data.user_id
-            )
-
-            if token is None:
-                logger.warning(
-                    f"No active verification token found for user_id={input_data.user_id}"
-                )
-                raise ValueError(
-                    "No active verification token found. Request a new code."
-                )
+            logger.info("Verifying email code for user_id=%s", input_data.user_id)
 
-            # Check expiration
+            submitted_hash = hashlib.sha256(input_data.code.encode()).hexdigest()
             now = datetime.now(timezone.utc)
-            expires_at = token.expires_at
-            if expires_at.tzinfo is None:
-                expires_at = expires_at.replace(tzinfo=timezone.utc)
 
-            if now > expires_at:
-                logger.warning(
-                    f"Verification token expired for user_id={input_data.user_id}"
-                )
-                raise ValueError(
-                    "Verification code has expired. Request a new one."
+            # Consuming the code and activating the user commit together
+            # when the database supports transactions.
+            async with self._transaction() as session:
+                token = await self.verification_repository.consume_code(
+                    input_data.user_id,
+                    submitted_hash,
+                    now,
+                    _MAX_ATTEMPTS,
+                    session=session,
                 )
+                user = None
+                if token is not None and token.is_used:
+                    user = await self.user_repository.mark_email_verified(
+                        input_data.user_id, session=session
+                    )
+                    if user is None:
+                        raise ValueError("User not found.")
 
-            # Check attempt limit
-            if token.attempts >= _MAX_ATTEMPTS:
-                logger.warning(
-                    f"Max attempts reached for user_id={input_data.user_id}"
-                )
-                raise ValueError(
-                    "Too many failed attempts. Request a new verification code."
-                )
+            if token is None:
+                await self._raise_unusable_token(input_data.user_id, now)
 
-            # Compare hashes
-            submitted_hash = hashlib.sha256(input_data.code.encode()).hexdigest()
-            if submitted_hash != token.code_hash:
-                await self.verification_repository.increment_attempts(token.id)
-                remaining = _MAX_ATTEMPTS - (token.attempts + 1)
+            if not token.is_used:
+                remaining = _MAX_ATTEMPTS - token.attempts
                 logger.warning(
-                    f"Invalid code for user_id={input_data.user_id}. "
-                    f"{remaining} attempts remaining."
+                    "Invalid code for user_id=%s. %s attempts remaining.",
+                    input_data.user_id,
+                    remaining,
                 )
                 raise ValueError(
                     f"Invalid verification code. {remaining} attempts remaining."
                 )
 
-            # Mark token as used
-            await self.verification_repository.mark_as_used(token.id)
-
-            # Activate user
-            user = await self.user_repository.get_by_id_unverified(input_data.user_id)
-            if user is None:
-                raise ValueError("User not found.")
-
-            user.is_email_verified = True
-            user.is_active = True
-            user.update_timestamp()
-            await self.user_repository.update(user.id, user)
-
             # Issue login tokens
             oauth_service = OAuth2Service()
             access_token, refresh_token, expires_at_dt = oauth_service.create_token_pair(
@@ -118,7 +127,7 @@ class VerifyEmailCodeUseCase(IUseCase[VerifyEmailCodeInput, TokenResponse]):
             expires_in = int((expires_at_dt - datetime.now(timezone.utc)).total_seconds())
 
             logger.info(
-                f"Email verified and user activated for user_id={input_data.user_id}"
+                "Email verified and user activated for user_id=%s", input_data.user_id
             )
             return TokenResponse(
                 access_token=access_token,
@@ -129,8 +138,8 @@ class VerifyEmailCodeUseCase(IUseCase[VerifyEmailCodeInput, TokenResponse]):
             )
 
         except ValueError as ve:
-            logger.warning(f"Validation error verifying email: {ve}")
+            logger.warning("Validation error verifying email: %s", ve)
             raise
         except Exception as e:
-            logger.error(f"Error verifying email code: {e}")
+            logger.error("Error verifying email code: %s", e)
             raise
@@ -1,7 +1,11 @@
 """Create Expense use case."""
 
 from datetime import datetime, timezone
+from typing import Optional
 from app.domain.interfaces.expense_repository_interface import IExpenseRepository
+from app.domain.interfaces.group_summary_repository_interface import (
+    IGroupSummaryRepository,
+)
 from app.domain.entities.expense_entity import Expense
 from app.models.expense_schema import ExpenseCreate, ExpenseResponse
 from app.infrastructure.logger import get_logger
@@ -13,14 +17,20 @@ logger = get_logger(__name__)
 class CreateExpenseUseCase(IUseCase[ExpenseCreate, ExpenseResponse]):
     """Use case for creating a new expense in a group."""
 
-    def __init__(self, repository: IExpenseRepository):
+    def __init__(
+        self,
+        repository: IExpenseRepository,
+        summary_repository: Optional[IGroupSummaryRepository] = None,
+    ):
         """
         Initialize the use case with a repository dependency.
 
         Args:
             repository: Implementation of IExpenseRepository
+            summary_repository: Group summaries to keep in sync (optional)
         """
         self.repository = repository
+        self.summary_repository = summary_repository
 
     async def execute(self, expense_data: ExpenseCreate) -> ExpenseResponse:
         """
@@ -39,7 +49,9 @@ class CreateExpenseUseCase(IUseCase[ExpenseCreate, ExpenseResponse]):
         """
         try:
             logger.info(
-                f"Creating expense for group: {expense_data.group_id} by {expense_data.spent_by}"
+                "Creating expense for group: %s by %s",
+                expense_data.group_id,
+                expense_data.spent_by,
             )
 
             expense = Expense(
@@ -54,9 +66,13 @@ class CreateExpenseUseCase(IUseCase[ExpenseCreate, ExpenseResponse]):
             )
 
             created_expense = await self.repository.create(expense)
+            if self.summary_repository is not None:
+                await self.summary_repository.apply_change(
+                    created_expense.group_id, added=created_expense
+                )
 
-            logger.info(f"Expense created successfully with ID: {created_expense.id}")
-            return ExpenseResponse(**created_expense.model_dump())
+            logger.info("Expense created successfully with ID: %s", created_expense.id)
+            return ExpenseResponse.model_validate(created_expense)
         except Exception as e:
-            logger.error(f"Error creating expense: {e}")
+            logger.error("Error creating expense: %s", e)
             raise
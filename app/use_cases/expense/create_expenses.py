@@ -0,0 +1,91 @@
+"""Create Expenses (bulk) use case."""
+
+from datetime import datetime, timezone
+from typing import List, Optional
+from app.domain.interfaces.expense_repository_interface import IExpenseRepository
+from app.domain.interfaces.group_summary_repository_interface import (
+    IGroupSummaryRepository,
+)
+from app.domain.entities.expense_entity import Expense
+from app.models.expense_schema import ExpenseCreate, ExpenseBulkItemResult
+from app.infrastructure.logger import get_logger
+from app.domain.interfaces.use_case import IUseCase
+
+logger = get_logger(__name__)
+
+
+class CreateExpensesUseCase(
+    IUseCase[List[ExpenseCreate], List[ExpenseBulkItemResult]]
+):
+    """Use case for creating many expenses with a single batched insert."""
+
+    def __init__(
+        self,
+        repository: IExpenseRepository,
+        summary_repository: Optional[IGroupSummaryRepository] = None,
+    ):
+        """
+        Initialize the use case with a repository dependency.
+
+        Args:
+            repository: Implementation of IExpenseRepository
+            summary_repository: Group summaries to keep in sync (optional)
+        """
+        self.repository = repository
+        self.summary_repository = summary_repository
+
+    async def execute(
+        self, expenses_data: List[ExpenseCreate]
+    ) -> List[ExpenseBulkItemResult]:
+        """
+        Create many expenses. Items are inserted independently: one failing
+        insert does not prevent the others.
+
+        Args:
+            expenses_data: ExpenseCreate schemas, possibly for several groups
+
+        Returns:
+            One ExpenseBulkItemResult per item, indexed by its position in expenses_data
+
+        Raises:
+            Exception: If the database operation fails as a whole
+        """
+        try:
+            logger.info("Creating %s expenses in bulk", len(expenses_data))
+            now = datetime.now(timezone.utc)
+            expenses = [
+                Expense(
+                    group_id=expense_data.group_id,
+                    amount_cents=expense_data.amount_cents,
+                    category=expense_data.category,
+                    type_expense=expense_data.type_expense,
+                    spent_by=expense_data.spent_by,
+                    date=expense_data.date or now,
+                    note=expense_data.note,
+                    is_deleted=False,
+                )
+                for expense_data in expenses_data
+            ]
+
+            errors = await self.repository.create_many(expenses) if expenses else {}
+
+            created = [
+                expense
+                for index, expense in enumerate(expenses)
+                if index not in errors
+            ]
+            if created and self.summary_repository is not None:
+                await self.summary_repository.apply_additions(created)
+
+            logger.info(
+                "Bulk create finished: %s created, %s failed", len(created), len(errors)
+            )
+            return [
+                ExpenseBulkItemResult(index=index, error=errors[index])
+                if index in errors
+                else ExpenseBulkItemResult(index=index, id=expense.id)
+                for index, expense in enumerate(expenses)
+            ]
+        except Exception as e:
+            logger.error("Error creating expenses in bulk: %s", e)
+            raise
@@ -0,0 +1,50 @@
+"""Utility functions for opaque keyset pagination cursors."""
+
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+from bson import ObjectId
+from app.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def encode_cursor(date: datetime, expense_id: str) -> str:
+    """
+    Encode the sort key of the last expense of a page into an opaque cursor.
+
+    Args:
+        date: Date of the last expense returned
+        expense_id: ID of the last expense returned
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps({"d": date.isoformat(), "i": expense_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor received from the client
+
+    Returns:
+        Tuple of (date, expense_id) to resume after
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        expense_id = str(payload["i"])
+        if not ObjectId.is_valid(expense_id):
+            raise ValueError(f"not an expense ID: {expense_id!r}")
+        return datetime.fromisoformat(payload["d"]), expense_id
+    except Exception as e:
+        logger.warning("Invalid pagination cursor received: %s", e)
+        raise ValueError("Invalid pagination cursor")
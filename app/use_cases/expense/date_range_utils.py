@@ -0,0 +1,51 @@
+"""Utility functions for the date ranges of expense queries."""
+
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+
+def utc_date_range(
+    start_date: Optional[datetime], end_date: Optional[datetime]
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Bring the bounds of a date range to UTC and check that it is not empty.
+
+    Clients may send either bound with or without an offset; a naive bound is
+    taken as UTC, like the dates MongoDB stores. Mixing the two is otherwise
+    a TypeError as soon as the bounds are compared.
+
+    Args:
+        start_date: Inclusive lower bound, if any
+        end_date: Exclusive upper bound, if any
+
+    Returns:
+        Tuple of (start_date, end_date) as aware UTC datetimes
+
+    Raises:
+        ValueError: If start_date is not before end_date
+    """
+    start_date = as_utc(start_date)
+    end_date = as_utc(end_date)
+    if start_date is not None and end_date is not None and start_date >= end_date:
+        raise ValueError("start_date must be before end_date")
+    return start_date, end_date
+
+
+def as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    Return a datetime as an aware UTC datetime.
+
+    MongoDB returns naive datetimes that are in UTC, so a naive value is
+    taken as UTC; an aware one is converted.
+
+    Args:
+        value: Datetime to convert, if any
+
+    Returns:
+        The aware UTC datetime, or None if value is None
+    """
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
@@ -33,16 +33,16 @@ class DeleteExpenseUseCase(IUseCase[str, bool]):
             Exception: If database operation fails
         """
         try:
-            logger.info(f"Deleting expense with ID: {expense_id}")
+            logger.info("Deleting expense with ID: %s", expense_id)
 
             result = await self.repository.delete(expense_id)
 
             if result:
-                logger.info(f"Expense deleted successfully: {expense_id}")
+                logger.info("Expense deleted successfully: %s", expense_id)
             else:
-                logger.warning(f"Expense not found for deletion: {expense_id}")
+                logger.warning("Expense not found for deletion: %s", expense_id)
 
             return result
         except Exception as e:
-            logger.error(f"Error deleting expense {expense_id}: {e}")
+            logger.error("Error deleting expense %s: %s", expense_id, e)
             raise
@@ -0,0 +1,150 @@
+"""Export Expenses use case."""
+
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List
+from app.domain.interfaces.expense_repository_interface import IExpenseRepository
+from app.domain.enums.export_format_enum import ExportFormat
+from app.infrastructure.logger import get_logger
+from app.domain.interfaces.use_case import IUseCase
+from app.domain.dtos.expense_dtos import ExportExpensesInput
+from app.use_cases.expense.date_range_utils import utc_date_range
+
+logger = get_logger(__name__)
+
+EXPORT_FIELDS = (
+    "id",
+    "group_id",
+    "amount_cents",
+    "category",
+    "type_expense",
+    "spent_by",
+    "date",
+    "note",
+    "created_at",
+    "updated_at",
+)
+
+# Expenses per database round trip and per chunk written to the response.
+EXPORT_BATCH_SIZE = 500
+
+# Leading characters that make spreadsheet applications evaluate a cell.
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _to_json_value(value: Any) -> Any:
+    """MongoDB returns naive UTC datetimes; export them as ISO 8601 in UTC."""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.isoformat()
+    return value
+
+
+def _to_csv_value(value: Any) -> Any:
+    """Format a value for a CSV cell, neutralising spreadsheet formulas in text."""
+    value = _to_json_value(value)
+    if value is None:
+        return ""
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+class ExportExpensesUseCase(IUseCase[ExportExpensesInput, AsyncIterator[str]]):
+    """Use case for streaming the expenses of a group as NDJSON or CSV."""
+
+    def __init__(self, repository: IExpenseRepository):
+        """
+        Initialize the use case with a repository dependency.
+
+        Args:
+            repository: Implementation of IExpenseRepository
+        """
+        self.repository = repository
+
+    async def execute(self, input_data: ExportExpensesInput) -> AsyncIterator[str]:
+        """
+        Validate the export and return the iterator of its text chunks.
+        Nothing is read until the iterator is consumed; each chunk holds the
+        lines of one database batch, so memory stays constant whatever the
+        size of the export.
+
+        Args:
+            input_data: ExportExpensesInput DTO with group_id, format and date range
+
+        Returns:
+            Async iterator of text chunks in the requested format
+
+        Raises:
+            ValueError: If start_date is not before end_date
+        """
+        try:
+            start_date, end_date = utc_date_range(
+                input_data.start_date, input_data.end_date
+            )
+        except ValueError as ve:
+            logger.warning("Validation error exporting expenses: %s", ve)
+            raise
+
+        logger.info(
+            "Exporting expenses of group: %s as %s",
+            input_data.group_id,
+            input_data.export_format,
+        )
+        documents = self.repository.stream_documents(
+            input_data.group_id,
+            start_date=start_date,
+            end_date=end_date,
+            batch_size=EXPORT_BATCH_SIZE,
+        )
+        if input_data.export_format == ExportFormat.CSV:
+            return self._csv_chunks(documents)
+        return self._ndjson_chunks(documents)
+
+    async def _batches(
+        self, documents: AsyncIterator[Dict[str, Any]]
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Group documents into lists of EXPORT_BATCH_SIZE."""
+        batch: List[Dict[str, Any]] = []
+        async for document in documents:
+            batch.append(document)
+            if len(batch) >= EXPORT_BATCH_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def _ndjson_chunks(
+        self, documents: AsyncIterator[Dict[str, Any]]
+    ) -> AsyncIterator[str]:
+        """One JSON object per line, with the export fields in a fixed order."""
+        async for batch in self._batches(documents):
+            yield "".join(
+                json.dumps(
+                    {field: _to_json_value(doc.get(field)) for field in EXPORT_FIELDS},
+                    separators=(",", ":"),
+                )
+                + "\n"
+                for doc in batch
+            )
+
+    async def _csv_chunks(
+        self, documents: AsyncIterator[Dict[str, Any]]
+    ) -> AsyncIterator[str]:
+        """A header row, then one row per expense."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_FIELDS)
+        yield buffer.getvalue()
+
+        async for batch in self._batches(documents):
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(
+                [_to_csv_value(doc.get(field)) for field in EXPORT_FIELDS]
+                for doc in batch
+            )
+            yield buffer.getvalue()
@@ -1,16 +1,16 @@
 """Get All Expenses use case."""
 
-from typing import List
 from app.domain.interfaces.expense_repository_interface import IExpenseRepository
-from app.models.expense_schema import ExpenseResponse
+from app.models.expense_schema import EXPENSE_RESPONSES, ExpensePageResponse
 from app.infrastructure.logger import get_logger
 from app.domain.interfaces.use_case import IUseCase
 from app.domain.dtos.expense_dtos import GetAllExpensesInput
+from app.use_cases.expense.cursor_utils import encode_cursor, decode_cursor
 
 logger = get_logger(__name__)
 
 
-class GetAllExpensesUseCase(IUseCase[GetAllExpensesInput, List[ExpenseResponse]]):
+class GetAllExpensesUseCase(IUseCase[GetAllExpensesInput, ExpensePageResponse]):
     """Use case for retrieving all expenses for a group."""
 
     def __init__(self, repository: IExpenseRepository):
@@ -22,34 +22,61 @@ class GetAllExpensesUseCase(IUseCase[GetAllExpensesInput, List[ExpenseResponse]]
         """
         self.repository = repository
 
-    async def execute(self, input_data: GetAllExpensesInput) -> List[ExpenseResponse]:
+    async def execute(self, input_data: GetAllExpensesInput) -> ExpensePageResponse:
         """
-        Get all expenses for a group from all participants.
+        Get a page of expenses for a group from all participants.
+        Uses keyset pagination when a cursor is given, otherwise falls back
+        to skip/limit. Either way, a full page carries the cursor of its last
+        expense so clients can switch to cursor mode for the following pages.
 
         Args:
-            input_data: GetAllExpensesInput DTO containing group_id, skip, and limit
+            input_data: GetAllExpensesInput DTO containing group_id, skip, limit and cursor
 
         Returns:
-            List of ExpenseResponse objects from all group participants
+            ExpensePageResponse with the expenses and the next page cursor
 
         Raises:
+            ValueError: If the cursor is malformed
             Exception: If database operation fails
         """
         try:
             logger.info(
-                f"Fetching all expenses for group: {input_data.group_id} (skip={input_data.skip}, limit={input_data.limit})"
+                "Fetching all expenses for group: %s (skip=%s, limit=%s, cursor=%s)",
+                input_data.group_id,
+                input_data.skip,
+                input_data.limit,
+                input_data.cursor,
             )
 
-            expenses = await self.repository.get_all(
-                input_data.group_id, skip=input_data.skip, limit=input_data.limit
-            )
+            if input_data.cursor:
+                after_date, after_id = decode_cursor(input_data.cursor)
+                expenses = await self.repository.get_all_after(
+                    input_data.group_id, after_date, after_id, limit=input_data.limit
+                )
+            else:
+                expenses = await self.repository.get_all(
+                    input_data.group_id, skip=input_data.skip, limit=input_data.limit
+                )
+
+            next_cursor = None
+            if expenses and len(expenses) >= input_data.limit:
+                last = expenses[-1]
+                next_cursor = encode_cursor(last.date, last.id)
 
             logger.info(
-                f"Retrieved {len(expenses)} expenses from all participants in group: {input_data.group_id}"
+                "Retrieved %s expenses from all participants in group: %s",
+                len(expenses),
+                input_data.group_id,
             )
-            return [ExpenseResponse(**expense.model_dump()) for expense in expenses]
+            return ExpensePageResponse(
+                items=EXPENSE_RESPONSES.validate_python(expenses, from_attributes=True),
+                next_cursor=next_cursor,
+            )
+        except ValueError as ve:
+            logger.warning("Validation error fetching expenses: %s", ve)
+            raise
         except Exception as e:
             logger.error(
-                f"Error fetching expenses for group {input_data.group_id}: {e}"
+                "Error fetching expenses for group %s: %s", input_data.group_id, e
             )
             raise
@@ -35,14 +35,18 @@ class GetAmountsAndTypesUseCase(IUseCase[str, List[Dict[str, any]]]):
             Exception: If database operation fails
         """
         try:
-            logger.info(f"Fetching amounts and types for group: {group_id}")
+            logger.info("Fetching amounts and types for group: %s", group_id)
 
             data = await self.repository.get_amounts_and_types(group_id)
 
             logger.info(
-                f"Retrieved {len(data)} expense amounts and types for group: {group_id}"
+                "Retrieved %s expense amounts and types for group: %s",
+                len(data),
+                group_id,
             )
             return data
         except Exception as e:
-            logger.error(f"Error fetching amounts and types for group {group_id}: {e}")
+            logger.error(
+                "Error fetching amounts and types for group %s: %s", group_id, e
+            )
             raise
@@ -0,0 +1,85 @@
+"""Get Expense Analytics use case."""
+
+from app.domain.interfaces.expense_repository_interface import IExpenseRepository
+from app.models.expense_schema import ExpenseAnalyticsBucket, ExpenseAnalyticsResponse
+from app.infrastructure.logger import get_logger
+from app.domain.interfaces.use_case import IUseCase
+from app.domain.dtos.expense_dtos import GetExpenseAnalyticsInput
+from app.use_cases.expense.date_range_utils import utc_date_range
+
+logger = get_logger(__name__)
+
+
+class GetExpenseAnalyticsUseCase(
+    IUseCase[GetExpenseAnalyticsInput, ExpenseAnalyticsResponse]
+):
+    """Use case for retrieving database-side aggregated analytics for a group."""
+
+    def __init__(self, repository: IExpenseRepository):
+        """
+        Initialize the use case with a repository dependency.
+
+        Args:
+            repository: Implementation of IExpenseRepository
+        """
+        self.repository = repository
+
+    async def execute(
+        self, input_data: GetExpenseAnalyticsInput
+    ) -> ExpenseAnalyticsResponse:
+        """
+        Get totals, counts, averages and min/max of a group's expenses per bucket.
+        The aggregation runs in the database, so the response size depends on
+        the number of buckets rather than the number of expenses.
+
+        Args:
+            input_data: GetExpenseAnalyticsInput DTO with group_id, group_by and date range
+
+        Returns:
+            ExpenseAnalyticsResponse with overall totals and per-bucket aggregates
+
+        Raises:
+            ValueError: If start_date is not before end_date
+            Exception: If database operation fails
+        """
+        try:
+            start_date, end_date = utc_date_range(
+                input_data.start_date, input_data.end_date
+            )
+
+            logger.info(
+                "Aggregating expenses for group: %s by %s",
+                input_data.group_id,
+                input_data.group_by,
+            )
+
+            rows = await self.repository.aggregate_amounts(
+                input_data.group_id,
+                input_data.group_by,
+                start_date=start_date,
+                end_date=end_date,
+            )
+            buckets = [ExpenseAnalyticsBucket(**row) for row in rows]
+
+            logger.info(
+                "Retrieved %s analytics buckets for group: %s",
+                len(buckets),
+                input_data.group_id,
+            )
+            return ExpenseAnalyticsResponse(
+                group_id=input_data.group_id,
+                group_by=input_data.group_by,
+                start_date=start_date,
+                end_date=end_date,
+                total_cents=sum(bucket.total_cents for bucket in buckets),
+                count=sum(bucket.count for bucket in buckets),
+                buckets=buckets,
+            )
+        except ValueError as ve:
+            logger.warning("Validation error fetching analytics: %s", ve)
+            raise
+        except Exception as e:
+            logger.error(
+                "Error aggregating expenses for group %s: %s", input_data.group_id, e
+            )
+            raise
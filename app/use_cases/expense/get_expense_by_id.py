@@ -35,16 +35,16 @@ class GetExpenseByIdUseCase(IUseCase[str, Optional[ExpenseResponse]]):
             Exception: If database operation fails
         """
         try:
-            logger.info(f"Fetching expense with ID: {expense_id}")
+            logger.info("Fetching expense with ID: %s", expense_id)
 
             expense = await self.repository.get_by_id(expense_id)
 
             if expense:
-                logger.info(f"Expense found: {expense_id}")
-                return ExpenseResponse(**expense.model_dump())
+                logger.info("Expense found: %s", expense_id)
+                return ExpenseResponse.model_validate(expense)
 
-            logger.warning(f"Expense not found: {expense_id}")
+            logger.warning("Expense not found: %s", expense_id)
             return None
         except Exception as e:
-            logger.error(f"Error fetching expense {expense_id}: {e}")
+            logger.error("Error fetching expense %s: %s", expense_id, e)
             raise
@@ -0,0 +1,119 @@
+"""Get Expense Changes use case."""
+
+from datetime import datetime, timedelta, timezone
+from app.domain.interfaces.expense_repository_interface import IExpenseRepository
+from app.models.expense_schema import EXPENSE_RESPONSES, ExpenseChangesResponse
+from app.infrastructure.logger import get_logger
+from app.domain.interfaces.use_case import IUseCase
+from app.domain.dtos.expense_dtos import GetExpenseChangesInput
+from app.use_cases.expense.cursor_utils import encode_cursor, decode_cursor
+from app.use_cases.expense.date_range_utils import as_utc
+
+logger = get_logger(__name__)
+
+# updated_at is stamped by the application before the write commits, so a
+# change can become visible with a timestamp slightly older than changes
+# already handed out. The watermark closing a sync stays this far behind the
+# clock; the few changes re-sent on the next sync are applied idempotently.
+SETTLE_SECONDS = 5
+
+MAX_CHANGES_LIMIT = 1000
+
+_MIN_OBJECT_ID = "0" * 24
+
+
+class GetExpenseChangesUseCase(
+    IUseCase[GetExpenseChangesInput, ExpenseChangesResponse]
+):
+    """Use case for syncing the expenses of a group changed since a watermark."""
+
+    def __init__(self, repository: IExpenseRepository):
+        """
+        Initialize the use case with a repository dependency.
+
+        Args:
+            repository: Implementation of IExpenseRepository
+        """
+        self.repository = repository
+
+    async def execute(
+        self, input_data: GetExpenseChangesInput
+    ) -> ExpenseChangesResponse:
+        """
+        Get the expenses of a group created, updated or soft-deleted after the
+        `since` watermark, and the watermark to send next time.
+        Without `since`, starts a full sync of the active expenses.
+
+        Args:
+            input_data: GetExpenseChangesInput DTO with group_id, since and limit
+
+        Returns:
+            ExpenseChangesResponse with the changes and the new watermark
+
+        Raises:
+            ValueError: If the watermark is malformed or the limit out of range
+            Exception: If database operation fails
+        """
+        try:
+            logger.info(
+                "Fetching expense changes for group: %s (since=%s, limit=%s)",
+                input_data.group_id,
+                input_data.since,
+                input_data.limit,
+            )
+
+            if not 1 <= input_data.limit <= MAX_CHANGES_LIMIT:
+                raise ValueError(f"limit must be between 1 and {MAX_CHANGES_LIMIT}")
+
+            since_key = None
+            if input_data.since:
+                try:
+                    since_date, since_id = decode_cursor(input_data.since)
+                except ValueError:
+                    raise ValueError("Invalid sync watermark")
+                since_key = (as_utc(since_date), since_id)
+
+            expenses = await self.repository.get_changes(
+                input_data.group_id,
+                since_key[0] if since_key else None,
+                since_key[1] if since_key else None,
+                limit=input_data.limit + 1,
+            )
+            has_more = len(expenses) > input_data.limit
+            expenses = expenses[: input_data.limit]
+
+            watermark = since_key
+            if expenses:
+                last = expenses[-1]
+                watermark = (as_utc(last.updated_at), last.id)
+                if not has_more:
+                    settled = datetime.now(timezone.utc) - timedelta(
+                        seconds=SETTLE_SECONDS
+                    )
+                    if watermark[0] > settled:
+                        settled_key = (settled, _MIN_OBJECT_ID)
+                        watermark = (
+                            max(settled_key, since_key) if since_key else settled_key
+                        )
+
+            logger.info(
+                "Retrieved %s expense changes for group: %s (has_more=%s)",
+                len(expenses),
+                input_data.group_id,
+                has_more,
+            )
+            return ExpenseChangesResponse(
+                items=EXPENSE_RESPONSES.validate_python(expenses, from_attributes=True),
+                since=encode_cursor(*watermark) if watermark else None,
+                has_more=has_more,
+            )
+        except ValueError as ve:
+            logger.warning("Validation error fetching expense changes: %s", ve)
+            raise
+        except Exception as e:
+            logger.error(
+                "Error fetching expense changes for group %s: %s",
+                input_data.group_id,
+                e,
+            )
+            raise
@@ -0,0 +1,57 @@
+"""Get Group Summary use case."""
+
+from app.domain.interfaces.group_summary_repository_interface import (
+    IGroupSummaryRepository,
+)
+from app.models.expense_schema import GroupSummaryResponse
+from app.infrastructure.logger import get_logger
+from app.domain.interfaces.use_case import IUseCase
+
+logger = get_logger(__name__)
+
+
+class GetGroupSummaryUseCase(IUseCase[str, GroupSummaryResponse]):
+    """Use case for retrieving the maintained spending summary of a group."""
+
+    def __init__(self, summary_repository: IGroupSummaryRepository):
+        """
+        Initialize the use case with a repository dependency.
+
+        Args:
+            summary_repository: Implementation of IGroupSummaryRepository
+        """
+        self.summary_repository = summary_repository
+
+    async def execute(self, group_id: str) -> GroupSummaryResponse:
+        """
+        Get the spending totals of a group per category, type and month.
+        Reads the single summary document of the group, so the cost does not
+        grow with the number of expenses. Buckets emptied by deletions are omitted.
+
+        Args:
+            group_id: ID of the expense group
+
+        Returns:
+            GroupSummaryResponse (all zeros if the group has no summary yet)
+
+        Raises:
+            Exception: If database operation fails
+        """
+        try:
+            logger.info("Fetching summary for group: %s", group_id)
+
+            summary = await self.summary_repository.get_by_group_id(group_id)
+            if summary is None:
+                return GroupSummaryResponse(group_id=group_id)
+
+            data = summary.model_dump()
+            for field in ("by_category", "by_type", "by_month"):
+                data[field] = {
+                    key: totals
+                    for key, totals in data[field].items()
+                    if totals["count"] > 0
+                }
+            return GroupSummaryResponse(**data)
+        except Exception as e:
+            logger.error("Error fetching summary for group %s: %s", group_id, e)
+            raise
@@ -1,7 +1,11 @@
 """Update Expense use case."""
 
+from enum import Enum
 from typing import Optional
 from app.domain.interfaces.expense_repository_interface import IExpenseRepository
+from app.domain.interfaces.group_summary_repository_interface import (
+    IGroupSummaryRepository,
+)
 from app.models.expense_schema import ExpenseResponse
 from app.infrastructure.logger import get_logger
 from app.domain.interfaces.use_case import IUseCase
@@ -9,18 +13,27 @@ from app.domain.dtos.expense_dtos import UpdateExpenseInput
 
 logger = get_logger(__name__)
 
+# Fields that move an expense between group summary buckets.
+_SUMMARY_FIELDS = frozenset({"amount_cents", "category", "type_expense", "date"})
+
 
 class UpdateExpenseUseCase(IUseCase[UpdateExpenseInput, Optional[ExpenseResponse]]):
     """Use case for updating an existing expense."""
 
-    def __init__(self, repository: IExpenseRepository):
+    def __init__(
+        self,
+        repository: IExpenseRepository,
+        summary_repository: Optional[IGroupSummaryRepository] = None,
+    ):
         """
         Initialize the use case with a repository dependency.
 
         Args:
             repository: Implementation of IExpenseRepository
+            summary_repository: Group summaries to keep in sync (optional)
         """
         self.repository = repository
+        self.summary_repository = summary_repository
 
     async def execute(
         self, input_data: UpdateExpenseInput
@@ -38,30 +51,42 @@ class UpdateExpenseUseCase(IUseCase[UpdateExpenseInput, Optional[ExpenseResponse
             Exception: If database operation fails
         """
         try:
-            logger.info(f"Updating expense with ID: {input_data.expense_id}")
-
-            current_expense = await self.repository.get_by_id(input_data.expense_id)
-            if not current_expense:
-                logger.warning(f"Expense not found for update: {input_data.expense_id}")
-                return None
-
-            update_dict = input_data.expense_data.model_dump(exclude_unset=True)
-            for key, value in update_dict.items():
-                if value is not None:
-                    setattr(current_expense, key, value)
-
-            current_expense.update_timestamp()
-
-            updated_expense = await self.repository.update(
-                input_data.expense_id, current_expense
-            )
+            logger.info("Updating expense with ID: %s", input_data.expense_id)
+
+            fields = {
+                key: value.value if isinstance(value, Enum) else value
+                for key, value in input_data.expense_data.model_dump(
+                    exclude_unset=True
+                ).items()
+                if value is not None
+            }
+
+            # The summary deltas need the values this write replaced: the
+            # repository returns them from the update itself, so concurrent
+            # updates never subtract the same previous values twice.
+            previous_expense = None
+            if self.summary_repository is not None and _SUMMARY_FIELDS & fields.keys():
+                change = await self.repository.update_fields_with_previous(
+                    input_data.expense_id, fields
+                )
+                previous_expense, updated_expense = change or (None, None)
+            else:
+                updated_expense = await self.repository.update_fields(
+                    input_data.expense_id, fields
+                )
 
             if updated_expense:
-                logger.info(f"Expense updated successfully: {input_data.expense_id}")
-                return ExpenseResponse(**updated_expense.model_dump())
-
-            logger.warning(f"Failed to update expense: {input_data.expense_id}")
+                if previous_expense is not None:
+                    await self.summary_repository.apply_change(
+                        updated_expense.group_id,
+                        added=updated_expense,
+                        removed=previous_expense,
+                    )
+                logger.info("Expense updated successfully: %s", input_data.expense_id)
+                return ExpenseResponse.model_validate(updated_expense)
+
+            logger.warning("Expense not found for update: %s", input_data.expense_id)
             return None
         except Exception as e:
-            logger.error(f"Error updating expense {input_data.expense_id}: {e}")
+            logger.error("Error updating expense %s: %s", input_data.expense_id, e)
             raise
@@ -5,6 +5,7 @@ from app.domain.interfaces.group_repository_interface import IGroupRepository
 from app.domain.entities.group_entity import Group
 from app.domain.dtos.group_dtos import AddUserToGroupInput
 from app.domain.interfaces.use_case import IUseCase
+from app.domain.interfaces.membership_cache_interface import IMembershipCache
 from app.infrastructure.logger import get_logger
 
 logger = get_logger(__name__)
@@ -13,36 +14,45 @@ logger = get_logger(__name__)
 class AddUserToGroupUseCase(IUseCase[AddUserToGroupInput, Optional[Group]]):
     """Use case for adding a user to a group."""
 
-    def __init__(self, repository: IGroupRepository):
+    def __init__(
+        self,
+        repository: IGroupRepository,
+        membership_cache: Optional[IMembershipCache] = None,
+    ):
         self.repository = repository
+        self.membership_cache = membership_cache
 
     async def execute(self, input_data: AddUserToGroupInput) -> Optional[Group]:
         try:
             logger.info(
-                f"Adding user {input_data.user_id} to group {input_data.group_id}"
+                "Adding user %s to group %s", input_data.user_id, input_data.group_id
             )
-            group = await self.repository.get_by_id(input_data.group_id)
-            if group is None:
-                logger.warning(f"Group not found: {input_data.group_id}")
-                return None
-
-            if input_data.user_id in group.user_ids:
+            result = await self.repository.add_member(
+                input_data.group_id, input_data.user_id
+            )
+            if result is None:
+                # Only a failed add pays for the lookup that tells the two cases apart.
+                if not await self.repository.exists(input_data.group_id):
+                    logger.warning("Group not found: %s", input_data.group_id)
+                    return None
                 raise ValueError(
                     f"User {input_data.user_id} is already a member of this group"
                 )
 
-            group.user_ids.append(input_data.user_id)
-            group.update_timestamp()
-            result = await self.repository.update(group.id, group)
+            if self.membership_cache is not None:
+                self.membership_cache.invalidate(input_data.group_id)
             logger.info(
-                f"User {input_data.user_id} added to group {input_data.group_id}"
+                "User %s added to group %s", input_data.user_id, input_data.group_id
             )
             return result
         except ValueError as ve:
-            logger.warning(f"Validation error adding user to group: {ve}")
+            logger.warning("Validation error adding user to group: %s", ve)
             raise
         except Exception as e:
             logger.error(
-                f"Error adding user {input_data.user_id} to group {input_data.group_id}: {e}"
+                "Error adding user %s to group %s: %s",
+                input_data.user_id,
+                input_data.group_id,
+                e,
             )
             raise
@@ -0,0 +1,51 @@
+"""Add Users to Group use case."""
+
+from typing import Optional
+from app.domain.interfaces.group_repository_interface import IGroupRepository
+from app.domain.entities.group_entity import Group
+from app.domain.dtos.group_dtos import AddUsersToGroupInput
+from app.domain.interfaces.use_case import IUseCase
+from app.domain.interfaces.membership_cache_interface import IMembershipCache
+from app.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AddUsersToGroupUseCase(IUseCase[AddUsersToGroupInput, Optional[Group]]):
+    """
+    Use case for adding several users to a group in one write.
+    Users who are already members are skipped.
+    """
+
+    def __init__(
+        self,
+        repository: IGroupRepository,
+        membership_cache: Optional[IMembershipCache] = None,
+    ):
+        self.repository = repository
+        self.membership_cache = membership_cache
+
+    async def execute(self, input_data: AddUsersToGroupInput) -> Optional[Group]:
+        try:
+            user_ids = list(dict.fromkeys(input_data.user_ids))
+            if not user_ids:
+                raise ValueError("At least one user ID is required")
+
+            logger.info(
+                "Adding %s users to group %s", len(user_ids), input_data.group_id
+            )
+            result = await self.repository.add_members(input_data.group_id, user_ids)
+            if result is None:
+                logger.warning("Group not found: %s", input_data.group_id)
+                return None
+
+            if self.membership_cache is not None:
+                self.membership_cache.invalidate(input_data.group_id)
+            logger.info("Users added to group %s", input_data.group_id)
+            return result
+        except ValueError as ve:
+            logger.warning("Validation error adding users to group: %s", ve)
+            raise
+        except Exception as e:
+            logger.error("Error adding users to group %s: %s", input_data.group_id, e)
+            raise
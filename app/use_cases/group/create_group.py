@@ -17,15 +17,15 @@ class CreateGroupUseCase(IUseCase[GroupCreate, Group]):
 
     async def execute(self, group_data: GroupCreate, creator_user_id: str) -> Group:
         try:
-            logger.info(f"Creating group: {group_data.group_name}")
+            logger.info("Creating group: %s", group_data.group_name)
             group = Group(
                 group_name=group_data.group_name,
                 creator_id=creator_user_id,
                 user_ids=[creator_user_id],
             )
             result = await self.repository.create(group)
-            logger.info(f"Group created with ID: {result.id}")
+            logger.info("Group created with ID: %s", result.id)
             return result
         except Exception as e:
-            logger.error(f"Error creating group: {e}")
+            logger.error("Error creating group: %s", e)
             raise
@@ -1,7 +1,9 @@
 """Delete Group use case."""
 
+from typing import Optional
 from app.domain.interfaces.group_repository_interface import IGroupRepository
 from app.domain.interfaces.use_case import IUseCase
+from app.domain.interfaces.membership_cache_interface import IMembershipCache
 from app.infrastructure.logger import get_logger
 
 logger = get_logger(__name__)
@@ -10,16 +12,23 @@ logger = get_logger(__name__)
 class DeleteGroupUseCase(IUseCase[str, bool]):
     """Use case for soft-deleting a group."""
 
-    def __init__(self, repository: IGroupRepository):
+    def __init__(
+        self,
+        repository: IGroupRepository,
+        membership_cache: Optional[IMembershipCache] = None,
+    ):
         self.repository = repository
+        self.membership_cache = membership_cache
 
     async def execute(self, group_id: str) -> bool:
         try:
-            logger.info(f"Deleting group: {group_id}")
+            logger.info("Deleting group: %s", group_id)
             result = await self.repository.delete(group_id)
+            if self.membership_cache is not None:
+                self.membership_cache.invalidate(group_id)
             if not result:
-                logger.warning(f"Group not found for deletion: {group_id}")
+                logger.warning("Group not found for deletion: %s", group_id)
             return result
         except Exception as e:
-            logger.error(f"Error deleting group {group_id}: {e}")
+            logger.error("Error deleting group %s: %s", group_id, e)
             raise
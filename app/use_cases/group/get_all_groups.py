@@ -17,10 +17,10 @@ class GetAllGroupsUseCase(IUseCase[None, List[Group]]):
 
     async def execute(self, skip: int = 0, limit: int = 100) -> List[Group]:
         try:
-            logger.info(f"Fetching all groups (skip={skip}, limit={limit})")
+            logger.info("Fetching all groups (skip=%s, limit=%s)", skip, limit)
             result = await self.repository.get_all(skip=skip, limit=limit)
-            logger.info(f"Found {len(result)} groups")
+            logger.info("Found %s groups", len(result))
             return result
         except Exception as e:
-            logger.error(f"Error fetching groups: {e}")
+            logger.error("Error fetching groups: %s", e)
             raise
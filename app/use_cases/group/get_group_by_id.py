@@ -17,11 +17,11 @@ class GetGroupByIdUseCase(IUseCase[str, Optional[Group]]):
 
     async def execute(self, group_id: str) -> Optional[Group]:
         try:
-            logger.info(f"Fetching group by ID: {group_id}")
+            logger.info("Fetching group by ID: %s", group_id)
             result = await self.repository.get_by_id(group_id)
             if result is None:
-                logger.warning(f"Group not found: {group_id}")
+                logger.warning("Group not found: %s", group_id)
             return result
         except Exception as e:
-            logger.error(f"Error fetching group {group_id}: {e}")
+            logger.error("Error fetching group %s: %s", group_id, e)
             raise
@@ -17,10 +17,10 @@ class GetGroupsByUserIdUseCase(IUseCase[str, List[Group]]):
 
     async def execute(self, user_id: str) -> List[Group]:
         try:
-            logger.info(f"Fetching groups for user: {user_id}")
+            logger.info("Fetching groups for user: %s", user_id)
             result = await self.repository.get_by_user_id(user_id)
-            logger.info(f"Found {len(result)} groups for user {user_id}")
+            logger.info("Found %s groups for user %s", len(result), user_id)
             return result
         except Exception as e:
-            logger.error(f"Error fetching groups for user {user_id}: {e}")
+            logger.error("Error fetching groups for user %s: %s", user_id, e)
             raise
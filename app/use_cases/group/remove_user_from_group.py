@@ -5,6 +5,7 @@ from app.domain.interfaces.group_repository_interface import IGroupRepository
 from app.domain.entities.group_entity import Group
 from app.domain.dtos.group_dtos import RemoveUserFromGroupInput
 from app.domain.interfaces.use_case import IUseCase
+from app.domain.interfaces.membership_cache_interface import IMembershipCache
 from app.infrastructure.logger import get_logger
 
 logger = get_logger(__name__)
@@ -13,36 +14,46 @@ logger = get_logger(__name__)
 class RemoveUserFromGroupUseCase(IUseCase[RemoveUserFromGroupInput, Optional[Group]]):
     """Use case for removing a user from a group."""
 
-    def __init__(self, repository: IGroupRepository):
+    def __init__(
+        self,
+        repository: IGroupRepository,
+        membership_cache: Optional[IMembershipCache] = None,
+    ):
         self.repository = repository
+        self.membership_cache = membership_cache
 
     async def execute(self, input_data: RemoveUserFromGroupInput) -> Optional[Group]:
         try:
             logger.info(
-                f"Removing user {input_data.user_id} from group {input_data.group_id}"
+                "Removing user %s from group %s",
+                input_data.user_id,
+                input_data.group_id,
             )
-            group = await self.repository.get_by_id(input_data.group_id)
-            if group is None:
-                logger.warning(f"Group not found: {input_data.group_id}")
-                return None
-
-            if input_data.user_id not in group.user_ids:
+            result = await self.repository.remove_member(
+                input_data.group_id, input_data.user_id
+            )
+            if result is None:
+                if not await self.repository.exists(input_data.group_id):
+                    logger.warning("Group not found: %s", input_data.group_id)
+                    return None
                 raise ValueError(
                     f"User {input_data.user_id} is not a member of this group"
                 )
 
-            group.user_ids.remove(input_data.user_id)
-            group.update_timestamp()
-            result = await self.repository.update(group.id, group)
+            if self.membership_cache is not None:
+                self.membership_cache.invalidate(input_data.group_id)
             logger.info(
-                f"User {input_data.user_id} removed from group {input_data.group_id}"
+                "User %s removed from group %s", input_data.user_id, input_data.group_id
             )
             return result
         except ValueError as ve:
-            logger.warning(f"Validation error removing user from group: {ve}")
+            logger.warning("Validation error removing user from group: %s", ve)
             raise
         except Exception as e:
             logger.error(
-                f"Error removing user {input_data.user_id} from group {input_data.group_id}: {e}"
+                "Error removing user %s from group %s: %s",
+                input_data.user_id,
+                input_data.group_id,
+                e,
             )
             raise
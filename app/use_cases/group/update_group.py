@@ -18,20 +18,23 @@ class UpdateGroupUseCase(IUseCase[UpdateGroupInput, Optional[Group]]):
 
     async def execute(self, input_data: UpdateGroupInput) -> Optional[Group]:
         try:
-            logger.info(f"Updating group: {input_data.group_id}")
-            group = await self.repository.get_by_id(input_data.group_id)
-            if group is None:
-                logger.warning(f"Group not found for update: {input_data.group_id}")
+            logger.info("Updating group: %s", input_data.group_id)
+            update_fields = {
+                field: value
+                for field, value in input_data.group_data.model_dump(
+                    exclude_unset=True
+                ).items()
+                if value is not None
+            }
+
+            result = await self.repository.update_fields(
+                input_data.group_id, update_fields
+            )
+            if result is None:
+                logger.warning("Group not found for update: %s", input_data.group_id)
                 return None
-
-            update_fields = input_data.group_data.model_dump(exclude_unset=True)
-            for field, value in update_fields.items():
-                setattr(group, field, value)
-            group.update_timestamp()
-
-            result = await self.repository.update(input_data.group_id, group)
-            logger.info(f"Group updated: {input_data.group_id}")
+            logger.info("Group updated: %s", input_data.group_id)
             return result
         except Exception as e:
-            logger.error(f"Error updating group {input_data.group_id}: {e}")
+            logger.error("Error updating group %s: %s", input_data.group_id, e)
             raise
@@ -5,7 +5,7 @@ from app.domain.entities.user_entity import User
 from app.models.user_schema import UserCreate, UserResponse
 from app.infrastructure.logger import get_logger
 from app.domain.interfaces.use_case import IUseCase
-from app.use_cases.user.password_utils import hash_password
+from app.use_cases.user.password_utils import hash_password_async
 
 logger = get_logger(__name__)
 
@@ -37,14 +37,9 @@ class CreateUserUseCase(IUseCase[UserCreate, UserResponse]):
             Exception: If database operation fails
         """
         try:
-            logger.info(f"Creating user with email: {user_data.email}")
+            logger.info("Creating user with email: %s", user_data.email)
 
-            existing_user = await self.repository.get_by_email(user_data.email)
-            if existing_user:
-                logger.warning(f"User with email {user_data.email} already exists")
-                raise ValueError(f"Email {user_data.email} is already registered")
-
-            hashed_password = hash_password(user_data.password)
+            hashed_password = await hash_password_async(user_data.password)
 
             user = User(
                 name=user_data.name,
@@ -55,15 +50,18 @@ class CreateUserUseCase(IUseCase[UserCreate, UserResponse]):
                 is_email_verified=False,
             )
 
+            # The unique email index rejects a taken email (ValueError)
             created_user = await self.repository.create(user)
 
             logger.info(
-                f"User created successfully with ID: {created_user.id} and email: {created_user.email}"
+                "User created successfully with ID: %s and email: %s",
+                created_user.id,
+                created_user.email,
             )
-            return UserResponse(**created_user.model_dump())
+            return UserResponse.model_validate(created_user)
         except ValueError as ve:
-            logger.warning(f"Validation error creating user: {ve}")
+            logger.warning("Validation error creating user: %s", ve)
             raise
         except Exception as e:
-            logger.error(f"Error creating user: {e}")
+            logger.error("Error creating user: %s", e)
             raise
@@ -1,6 +1,8 @@
 """Delete User use case."""
 
+from typing import Optional
 from app.domain.interfaces.user_repository_interface import IUserRepository
+from app.domain.interfaces.membership_cache_interface import IMembershipCache
 from app.infrastructure.logger import get_logger
 from app.domain.interfaces.use_case import IUseCase
 
@@ -10,14 +12,20 @@ logger = get_logger(__name__)
 class DeleteUserUseCase(IUseCase[str, bool]):
     """Use case for deleting (deactivating) a user account."""
 
-    def __init__(self, repository: IUserRepository):
+    def __init__(
+        self,
+        repository: IUserRepository,
+        membership_cache: Optional[IMembershipCache] = None,
+    ):
         """
         Initialize the use case with a repository dependency.
 
         Args:
             repository: Implementation of IUserRepository
+            membership_cache: Cache remembering active users, invalidated on delete
         """
         self.repository = repository
+        self.membership_cache = membership_cache
 
     async def execute(self, user_id: str) -> bool:
         """
@@ -33,16 +41,18 @@ class DeleteUserUseCase(IUseCase[str, bool]):
             Exception: If database operation fails
         """
         try:
-            logger.info(f"Deleting user with ID: {user_id}")
+            logger.info("Deleting user with ID: %s", user_id)
 
             deleted = await self.repository.delete(user_id)
+            if self.membership_cache is not None:
+                self.membership_cache.invalidate_user(user_id)
 
             if deleted:
-                logger.info(f"User deleted successfully with ID: {user_id}")
+                logger.info("User deleted successfully with ID: %s", user_id)
                 return True
 
-            logger.warning(f"User not found for deletion with ID: {user_id}")
+            logger.warning("User not found for deletion with ID: %s", user_id)
             return False
         except Exception as e:
-            logger.error(f"Error deleting user with ID {user_id}: {e}")
+            logger.error("Error deleting user with ID %s: %s", user_id, e)
             raise
@@ -3,7 +3,7 @@
 from typing import List
 from app.domain.interfaces.user_repository_interface import IUserRepository
 from app.domain.dtos.user_dtos import GetAllUsersInput
-from app.models.user_schema import UserResponse
+from app.models.user_schema import USER_RESPONSES, UserResponse
 from app.infrastructure.logger import get_logger
 from app.domain.interfaces.use_case import IUseCase
 
@@ -37,15 +37,17 @@ class GetAllUsersUseCase(IUseCase[GetAllUsersInput, List[UserResponse]]):
         """
         try:
             logger.info(
-                f"Retrieving users with skip: {input_data.skip}, limit: {input_data.limit}"
+                "Retrieving users with skip: %s, limit: %s",
+                input_data.skip,
+                input_data.limit,
             )
 
             users = await self.repository.get_all(
                 skip=input_data.skip, limit=input_data.limit
             )
 
-            logger.info(f"Retrieved {len(users)} users")
-            return [UserResponse(**user.model_dump()) for user in users]
+            logger.info("Retrieved %s users", len(users))
+            return USER_RESPONSES.validate_python(users, from_attributes=True)
         except Exception as e:
-            logger.error(f"Error retrieving all users: {e}")
+            logger.error("Error retrieving all users: %s", e)
             raise
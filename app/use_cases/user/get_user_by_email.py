@@ -36,16 +36,16 @@ class GetUserByEmailUseCase(IUseCase[GetUserByEmailInput, Optional[UserResponse]
             Exception: If database operation fails
         """
         try:
-            logger.info(f"Retrieving user with email: {input_data.email}")
+            logger.info("Retrieving user with email: %s", input_data.email)
 
             user = await self.repository.get_by_email(input_data.email)
 
             if user:
-                logger.info(f"User found with email: {input_data.email}")
-                return UserResponse(**user.model_dump())
+                logger.info("User found with email: %s", input_data.email)
+                return UserResponse.model_validate(user)
 
-            logger.warning(f"User not found with email: {input_data.email}")
+            logger.warning("User not found with email: %s", input_data.email)
             return None
         except Exception as e:
-            logger.error(f"Error retrieving user with email {input_data.email}: {e}")
+            logger.error("Error retrieving user with email %s: %s", input_data.email, e)
             raise
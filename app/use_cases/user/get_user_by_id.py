@@ -35,16 +35,16 @@ class GetUserByIdUseCase(IUseCase[str, Optional[UserResponse]]):
             Exception: If database operation fails
         """
         try:
-            logger.info(f"Retrieving user with ID: {user_id}")
+            logger.info("Retrieving user with ID: %s", user_id)
 
             user = await self.repository.get_by_id(user_id)
 
             if user:
-                logger.info(f"User found with ID: {user_id}")
-                return UserResponse(**user.model_dump())
+                logger.info("User found with ID: %s", user_id)
+                return UserResponse.model_validate(user)
 
-            logger.warning(f"User not found with ID: {user_id}")
+            logger.warning("User not found with ID: %s", user_id)
             return None
         except Exception as e:
-            logger.error(f"Error retrieving user with ID {user_id}: {e}")
+            logger.error("Error retrieving user with ID %s: %s", user_id, e)
             raise
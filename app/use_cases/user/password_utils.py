@@ -2,6 +2,7 @@
 
 import bcrypt
 from app.infrastructure.logger import get_logger
+from app.infrastructure.password_hasher import get_password_hasher
 
 logger = get_logger(__name__)
 
@@ -21,7 +22,7 @@ def hash_password(password: str) -> str:
         hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
         return hashed.decode("utf-8")
     except Exception as e:
-        logger.error(f"Error hashing password: {e}")
+        logger.error("Error hashing password: %s", e)
         raise
 
 
@@ -39,5 +40,38 @@ def verify_password(password: str, hashed_password: str) -> bool:
     try:
         return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
     except Exception as e:
-        logger.error(f"Error verifying password: {e}")
+        logger.error("Error verifying password: %s", e)
         return False
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password on the password hasher pool without blocking the event loop.
+
+    Args:
+        password: Plain text password to hash
+
+    Returns:
+        Hashed password string
+
+    Raises:
+        PasswordHasherBusyError: If the hashing pool is saturated
+    """
+    return await get_password_hasher().run(hash_password, password)
+
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    """
+    Verify a password on the password hasher pool without blocking the event loop.
+
+    Args:
+        password: Plain text password to verify
+        hashed_password: Hashed password to check against
+
+    Returns:
+        True if password matches, False otherwise
+
+    Raises:
+        PasswordHasherBusyError: If the hashing pool is saturated
+    """
+    return await get_password_hasher().run(verify_password, password, hashed_password)
@@ -37,49 +37,33 @@ class UpdateUserUseCase(IUseCase[UpdateUserInput, Optional[UserResponse]]):
             Exception: If database operation fails
         """
         try:
-            logger.info(f"Updating user with ID: {input_data.user_id}")
-
-            existing_user = await self.repository.get_by_id(input_data.user_id)
-            if not existing_user:
-                logger.warning(f"User not found with ID: {input_data.user_id}")
-                return None
-
-            if (
-                input_data.user_data.email
-                and input_data.user_data.email != existing_user.email
-            ):
-                existing_email_user = await self.repository.get_by_email(
-                    input_data.user_data.email
-                )
-                if existing_email_user:
-                    logger.warning(f"Email {input_data.user_data.email} already exists")
-                    raise ValueError(
-                        f"Email {input_data.user_data.email} is already registered"
-                    )
-
-            update_data = input_data.user_data.model_dump(exclude_unset=True)
-
-            if "email" in update_data and update_data["email"]:
-                update_data["email"] = update_data["email"].lower()
-
-            for key, value in update_data.items():
-                if value is not None:
-                    setattr(existing_user, key, value)
-
-            existing_user.update_timestamp()
-
-            updated_user = await self.repository.update(
-                input_data.user_id, existing_user
+            logger.info("Updating user with ID: %s", input_data.user_id)
+
+            fields = {
+                key: value
+                for key, value in input_data.user_data.model_dump(
+                    exclude_unset=True
+                ).items()
+                if value is not None
+            }
+
+            if "email" in fields:
+                # The unique email index rejects a taken email (ValueError)
+                fields["email"] = fields["email"].lower()
+
+            updated_user = await self.repository.update_fields(
+                input_data.user_id, fields
             )
 
             if updated_user:
-                logger.info(f"User updated successfully with ID: {input_data.user_id}")
-                return UserResponse(**updated_user.model_dump())
+                logger.info("User updated successfully with ID: %s", input_data.user_id)
+                return UserResponse.model_validate(updated_user)
 
+            logger.warning("User not found with ID: %s", input_data.user_id)
             return None
         except ValueError as ve:
-            logger.warning(f"Validation error updating user: {ve}")
+            logger.warning("Validation error updating user: %s", ve)
             raise
         except Exception as e:
-            logger.error(f"Error updating user with ID {input_data.user_id}: {e}")
+            logger.error("Error updating user with ID %s: %s", input_data.user_id, e)
             raise
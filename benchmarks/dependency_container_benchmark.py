@@ -0,0 +1,164 @@
+"""
+Requests per second on GET /expenses/{group_id} with and without the
+application dependency container.
+
+  - per-request: repositories and the controller (with its use cases) are
+    rebuilt for every request, as the dependency providers used to do
+  - shared:      the providers hand out the container's instances
+
+MongoDB is replaced by an in-memory fake so the numbers isolate the
+framework and dependency overhead. Requests go through the ASGI app
+in-process with httpx, so network time is not included either.
+
+Run from the repository root:
+
+    python -m benchmarks.dependency_container_benchmark [--requests 2000] [--expenses 10]
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timezone
+from unittest.mock import patch
+import httpx
+from bson import ObjectId
+from app.api import app
+from app.infrastructure.dependencies.container import reset_container
+from app.infrastructure.dependencies.expense_dependencies import ExpenseDependencies
+from app.infrastructure.repositories.group_repository import MongoGroupRepository
+from app.infrastructure.repositories.group_summary_repository import (
+    MongoGroupSummaryRepository,
+)
+from app.infrastructure.repositories.user_repository import MongoUserRepository
+from app.infrastructure.settings import get_settings
+from app.services.oauth2_service import OAuth2Service
+
+GROUP_ID = str(ObjectId())
+USER_ID = str(ObjectId())
+
+
+class _FakeCursor:
+    def __init__(self, docs):
+        self._docs = docs
+
+    def skip(self, _):
+        return self
+
+    def limit(self, _):
+        return self
+
+    def sort(self, *_):
+        return self
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self._docs:
+            yield dict(doc)
+
+
+class _FakeCollection:
+    def __init__(self, docs, group_doc):
+        self._docs = docs
+        self._group_doc = group_doc
+
+    def find(self, *_args, **_kwargs):
+        return _FakeCursor(self._docs)
+
+    async def find_one(self, *_args, **_kwargs):
+        return dict(self._group_doc)
+
+
+def _fake_db(expenses: int) -> dict:
+    now = datetime.now(timezone.utc)
+    docs = [
+        {
+            "_id": ObjectId(),
+            "group_id": GROUP_ID,
+            "amount_cents": 1000 + i,
+            "category": "shopping",
+            "type_expense": "cash",
+            "spent_by": "Benchmark",
+            "date": now,
+            "note": None,
+            "is_deleted": False,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(expenses)
+    ]
+    group_doc = {
+        "_id": ObjectId(GROUP_ID),
+        "group_name": "Benchmark",
+        "creator_id": USER_ID,
+        "user_ids": [USER_ID],
+        "is_deleted": False,
+        "created_at": now,
+        "updated_at": now,
+    }
+    collection = _FakeCollection(docs, group_doc)
+    return {"expenses": collection, "groups": collection}
+
+
+def _use_per_request_dependencies() -> None:
+    """Make the providers build new objects on every request, as before the container."""
+    app.dependency_overrides[ExpenseDependencies.get_summary_repository] = (
+        MongoGroupSummaryRepository
+    )
+    app.dependency_overrides[ExpenseDependencies.get_group_repository] = (
+        MongoGroupRepository
+    )
+    app.dependency_overrides[ExpenseDependencies.get_user_repository] = (
+        MongoUserRepository
+    )
+
+
+async def _measure(requests: int, headers: dict) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark", headers=headers
+    ) as client:
+        url = f"{get_settings().api_v1_str}/expenses/{GROUP_ID}"
+        response = await client.get(url)
+        response.raise_for_status()
+
+        start = time.perf_counter()
+        for _ in range(requests):
+            await client.get(url)
+        return requests / (time.perf_counter() - start)
+
+
+async def main(requests: int, expenses: int) -> None:
+    token, _, _ = OAuth2Service().create_token_pair(
+        email="benchmark@example.com", user_id=USER_ID
+    )
+    headers = {
+        "X-API-Key": get_settings().api_key,
+        "Authorization": f"Bearer {token}",
+    }
+
+    with patch(
+        "app.infrastructure.database.database.Database.get_db",
+        return_value=_fake_db(expenses),
+    ):
+        reset_container()
+        original_overrides = app.dependency_overrides.copy()
+        try:
+            _use_per_request_dependencies()
+            per_request = await _measure(requests, headers)
+        finally:
+            app.dependency_overrides = original_overrides
+
+        shared = await _measure(requests, headers)
+
+    print(f"per-request {per_request:9.1f} req/s")
+    print(f"shared      {shared:9.1f} req/s  ({shared / per_request:.2f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--expenses", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.expenses))
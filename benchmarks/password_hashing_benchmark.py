@@ -0,0 +1,82 @@
+"""
+Event loop latency while password hashes run concurrently.
+
+Simulates an "unrelated" endpoint as a coroutine that repeatedly awaits a short
+sleep, and measures how late it wakes up (p50/p99) while a burst of bcrypt
+hashes is in flight:
+
+  - inline: bcrypt called directly on the event loop (previous behaviour)
+  - pool:   bcrypt run through PasswordHasher
+
+Run from the repository root:
+
+    python -m benchmarks.password_hashing_benchmark [--logins 16] [--workers 4]
+"""
+
+import argparse
+import asyncio
+import math
+import statistics
+import time
+from app.infrastructure.password_hasher import PasswordHasher, PasswordHasherBusyError
+from app.use_cases.user.password_utils import hash_password
+
+
+async def _probe(samples: list, done: asyncio.Event) -> None:
+    """Record how late a 5 ms sleep wakes up, standing in for a cheap request."""
+    while not done.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.005)
+        samples.append((time.perf_counter() - start - 0.005) * 1000)
+
+
+async def _inline_login() -> None:
+    await asyncio.sleep(0.01)
+    hash_password("benchmark-password")
+
+
+async def _pool_login(hasher: PasswordHasher) -> None:
+    await asyncio.sleep(0.01)
+    try:
+        await hasher.run(hash_password, "benchmark-password")
+    except PasswordHasherBusyError:
+        pass
+
+
+async def _measure(make_login, logins: int) -> list:
+    samples: list = []
+    done = asyncio.Event()
+    probe = asyncio.create_task(_probe(samples, done))
+    await asyncio.gather(*(make_login() for _ in range(logins)))
+    done.set()
+    await probe
+    return samples
+
+
+def _report(label: str, samples: list) -> None:
+    ordered = sorted(samples)
+    p99 = ordered[math.ceil(len(ordered) * 0.99) - 1]
+    print(
+        f"{label:<7} p50={statistics.median(ordered):8.2f} ms  "
+        f"p99={p99:8.2f} ms  max={ordered[-1]:8.2f} ms"
+    )
+
+
+async def main(logins: int, workers: int) -> None:
+    inline = await _measure(_inline_login, logins)
+    _report("inline", inline)
+
+    hasher = PasswordHasher(max_workers=workers, max_queue=logins)
+    try:
+        pooled = await _measure(lambda: _pool_login(hasher), logins)
+        _report("pool", pooled)
+    finally:
+        hasher.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.workers))
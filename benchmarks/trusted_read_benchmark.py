@@ -0,0 +1,133 @@
+"""
+CPU time to turn a page of stored documents into API responses.
+
+  - before: the entity is built with Model(**doc), then dumped and
+            validated again as ExpenseResponse(**entity.model_dump())
+  - after:  the repositories' _document_to_entity (User skips validation,
+            Expense validates the document directly) and the response list
+            built in one call by the precompiled TypeAdapter of the schema
+
+Only the conversions are timed: documents are built in memory, so neither
+MongoDB nor the event loop is involved.
+
+Run from the repository root:
+
+    python -m benchmarks.trusted_read_benchmark [--pages 2000] [--rows 100]
+"""
+
+import argparse
+import time
+from datetime import datetime, timezone
+from typing import Callable, List
+from bson import ObjectId
+from app.domain.entities.expense_entity import Expense
+from app.domain.entities.user_entity import User
+from app.infrastructure.repositories.expense_repository import MongoExpenseRepository
+from app.infrastructure.repositories.user_repository import MongoUserRepository
+from app.models.expense_schema import EXPENSE_RESPONSES, ExpenseResponse
+from app.models.user_schema import USER_RESPONSES, UserResponse
+
+
+def _expense_docs(rows: int) -> List[dict]:
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "_id": ObjectId(),
+            "group_id": str(ObjectId()),
+            "amount_cents": 1000 + i,
+            "category": "shopping",
+            "type_expense": "cash",
+            "spent_by": "Benchmark",
+            "date": now,
+            "note": None,
+            "is_deleted": False,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(rows)
+    ]
+
+
+def _user_docs(rows: int) -> List[dict]:
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "_id": ObjectId(),
+            "name": "Benchmark User",
+            "email": f"user{i}@example.com",
+            "password": "$2b$12$abcdefghijklmnopqrstuvwxyz1234567890",
+            "date_birth": datetime(1990, 5, 15),
+            "is_active": True,
+            "is_email_verified": True,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(rows)
+    ]
+
+
+def _expenses_before(docs: List[dict]) -> List[ExpenseResponse]:
+    expenses = []
+    for doc in docs:
+        doc = dict(doc)
+        doc["id"] = str(doc.pop("_id"))
+        expenses.append(Expense(**doc))
+    return [ExpenseResponse(**expense.model_dump()) for expense in expenses]
+
+
+def _expenses_after(docs: List[dict]) -> List[ExpenseResponse]:
+    repository = MongoExpenseRepository()
+    expenses = [repository._document_to_entity(dict(doc)) for doc in docs]
+    return EXPENSE_RESPONSES.validate_python(expenses, from_attributes=True)
+
+
+def _users_before(docs: List[dict]) -> List[UserResponse]:
+    users = []
+    for doc in docs:
+        doc = dict(doc)
+        doc["id"] = str(doc.pop("_id"))
+        doc["date_birth"] = doc["date_birth"].date()
+        users.append(User(**doc))
+    return [UserResponse(**user.model_dump()) for user in users]
+
+
+def _users_after(docs: List[dict]) -> List[UserResponse]:
+    repository = MongoUserRepository()
+    users = [repository._document_to_entity(dict(doc)) for doc in docs]
+    return USER_RESPONSES.validate_python(users, from_attributes=True)
+
+
+def _cpu_per_page(convert: Callable[[List[dict]], list], docs, pages: int) -> float:
+    """Process CPU time per page, in microseconds."""
+    convert(docs)
+    start = time.process_time()
+    for _ in range(pages):
+        convert(docs)
+    return (time.process_time() - start) / pages * 1e6
+
+
+def main(pages: int, rows: int) -> None:
+    expense_docs = _expense_docs(rows)
+    user_docs = _user_docs(rows)
+    assert _expenses_before(expense_docs) == _expenses_after(expense_docs)
+    assert _users_before(user_docs) == _users_after(user_docs)
+
+    print(f"CPU per {rows}-row page")
+    for name, before, after, docs in (
+        ("expenses", _expenses_before, _expenses_after, expense_docs),
+        ("users", _users_before, _users_after, user_docs),
+    ):
+        before_us = _cpu_per_page(before, docs, pages)
+        after_us = _cpu_per_page(after, docs, pages)
+        print(
+            f"{name:9s} before {before_us:9.1f} us  after {after_us:9.1f} us"
+            f"  ({before_us / after_us:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=100)
+    args = parser.parse_args()
+    main(args.pages, args.rows)
@@ -39,7 +39,13 @@ def make_async_mock_group_repo():
 
 def make_async_mock_user_repo():
     from app.domain.interfaces.user_repository_interface import IUserRepository
-    return AsyncMock(spec=IUserRepository)
+    mock = AsyncMock(spec=IUserRepository)
+    mock.get_fields.return_value = {"is_active": True}
+    return mock
+
+
+GROUP_A = "507f1f77bcf86cd799439012"
+GROUP_B = "507f1f77bcf86cd799439013"
 
 
 def make_expense_response():
@@ -182,6 +188,154 @@ class TestExpenseControllerCreateExpense:
                 await controller.create_expense(expense_data, "test@example.com")
 
 
+class TestExpenseControllerCreateExpenses:
+    """Test create_expenses method."""
+
+    def _make_create(self, group_id):
+        return ExpenseCreate(
+            group_id=group_id,
+            amount_cents=5000,
+            category=ExpenseCategory.ENTERTAINMENT,
+            type_expense=ExpenseType.CREDIT_CARD,
+            spent_by="John Doe",
+        )
+
+    @pytest.mark.asyncio
+    async def test_checks_membership_once_per_group_and_rejects_non_members(self):
+        from app.models.expense_schema import ExpenseBulkItemResult
+
+        controller = ExpenseController(
+            make_async_mock_repo(), make_async_mock_group_repo(), make_async_mock_user_repo()
+        )
+        items = [
+            self._make_create(GROUP_A),
+            self._make_create(GROUP_B),
+            self._make_create(GROUP_A),
+        ]
+
+        async def require_member(group_id, user_id):
+            if group_id == GROUP_B:
+                raise PermissionError("You are not a member of this group")
+
+        created = [
+            ExpenseBulkItemResult(index=0, id="id-0"),
+            ExpenseBulkItemResult(index=1, id="id-2"),
+        ]
+        with patch.object(
+            controller, "_require_member", new=AsyncMock(side_effect=require_member)
+        ) as membership, patch.object(
+            controller.create_expenses_use_case, "execute", new=AsyncMock(return_value=created)
+        ) as execute:
+            result = await controller.create_expenses(items, "test@example.com", "user-1")
+
+        assert membership.await_count == 2
+        assert execute.call_args[0][0] == [items[0], items[2]]
+        assert result.created == 2
+        assert result.failed == 1
+        assert [(r.index, r.id, r.error) for r in result.results] == [
+            (0, "id-0", None),
+            (1, None, "You are not a member of this group"),
+            (2, "id-2", None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_resolves_user_by_email_once_without_user_id(self):
+        user_repo = make_async_mock_user_repo()
+        user_repo.get_by_email.return_value = MagicMock(id="user-1")
+        controller = ExpenseController(
+            make_async_mock_repo(), make_async_mock_group_repo(), user_repo
+        )
+        items = [self._make_create(GROUP_A), self._make_create(GROUP_B)]
+
+        with patch.object(
+            controller, "_require_member", new=AsyncMock(return_value=None)
+        ) as membership, patch.object(
+            controller.create_expenses_use_case, "execute", new=AsyncMock(return_value=[])
+        ):
+            await controller.create_expenses(items, "test@example.com")
+
+        user_repo.get_by_email.assert_called_once_with("test@example.com")
+        assert all(call.args[1] == "user-1" for call in membership.await_args_list)
+
+    @pytest.mark.asyncio
+    async def test_checks_user_is_active_once_for_all_groups(self):
+        group_repo = make_async_mock_group_repo()
+        group_repo.get_fields.return_value = {"user_ids": ["user-1"]}
+        user_repo = make_async_mock_user_repo()
+        controller = ExpenseController(make_async_mock_repo(), group_repo, user_repo)
+        items = [self._make_create(GROUP_A), self._make_create(GROUP_B)]
+
+        with patch.object(
+            controller.create_expenses_use_case, "execute", new=AsyncMock(return_value=[])
+        ):
+            await controller.create_expenses(items, "test@example.com", "user-1")
+
+        user_repo.get_fields.assert_called_once_with("user-1", ["is_active"])
+        assert group_repo.get_fields.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_inactive_user_rejects_every_item(self):
+        group_repo = make_async_mock_group_repo()
+        user_repo = make_async_mock_user_repo()
+        user_repo.get_fields.return_value = {"is_active": False}
+        controller = ExpenseController(make_async_mock_repo(), group_repo, user_repo)
+
+        with patch.object(
+            controller.create_expenses_use_case, "execute", new=AsyncMock(return_value=[])
+        ) as execute:
+            result = await controller.create_expenses(
+                [self._make_create(GROUP_A)], "test@example.com", "user-1"
+            )
+
+        execute.assert_called_once_with([])
+        group_repo.get_fields.assert_not_called()
+        assert result.failed == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_user_rejects_every_item(self):
+        user_repo = make_async_mock_user_repo()
+        user_repo.get_by_email.return_value = None
+        controller = ExpenseController(
+            make_async_mock_repo(), make_async_mock_group_repo(), user_repo
+        )
+
+        with patch.object(
+            controller.create_expenses_use_case, "execute", new=AsyncMock(return_value=[])
+        ) as execute:
+            result = await controller.create_expenses(
+                [self._make_create(GROUP_A)], "ghost@example.com"
+            )
+
+        execute.assert_called_once_with([])
+        assert result.created == 0
+        assert result.failed == 1
+
+    @pytest.mark.asyncio
+    async def test_malformed_group_id_fails_only_its_items(self):
+        from app.models.expense_schema import ExpenseBulkItemResult
+
+        group_repo = make_async_mock_group_repo()
+        group_repo.get_fields.return_value = {"user_ids": ["user-1"]}
+        controller = ExpenseController(
+            make_async_mock_repo(), group_repo, make_async_mock_user_repo()
+        )
+        items = [self._make_create("not-an-id"), self._make_create(GROUP_A)]
+
+        with patch.object(
+            controller.create_expenses_use_case,
+            "execute",
+            new=AsyncMock(return_value=[ExpenseBulkItemResult(index=0, id="id-1")]),
+        ) as execute:
+            result = await controller.create_expenses(items, "test@example.com", "user-1")
+
+        group_repo.get_fields.assert_called_once_with(GROUP_A, ["user_ids"])
+        execute.assert_called_once_with([items[1]])
+        assert [(r.index, r.id, r.error) for r in result.results] == [
+            (0, None, "Invalid group ID"),
+            (1, "id-1", None),
+        ]
+
+
 class TestExpenseControllerGetAllExpenses:
     """Test get_all_expenses method."""
 
@@ -193,7 +347,7 @@ class TestExpenseControllerGetAllExpenses:
         controller = ExpenseController(mock_repo, make_async_mock_group_repo(), make_async_mock_user_repo())
         with patch.object(controller, "_require_group_membership", new=AsyncMock(return_value=None)):
             result = await controller.get_all_expenses("507f1f77bcf86cd799439012", "test@example.com")
-        assert result == []
+        assert result.items == []
 
     @pytest.mark.asyncio
     async def test_get_all_expenses_with_pagination(self):
@@ -205,7 +359,7 @@ class TestExpenseControllerGetAllExpenses:
             result = await controller.get_all_expenses(
                 "507f1f77bcf86cd799439012", "test@example.com", skip=5, limit=20
             )
-        assert isinstance(result, list)
+        assert isinstance(result.items, list)
 
     @pytest.mark.asyncio
     async def test_get_all_expenses_raises_on_error(self):
@@ -219,6 +373,85 @@ class TestExpenseControllerGetAllExpenses:
                 await controller.get_all_expenses("507f1f77bcf86cd799439012", "test@example.com")
 
 
+class TestExpenseControllerGetExpenseChanges:
+    """Test get_expense_changes method."""
+
+    @pytest.mark.asyncio
+    async def test_get_expense_changes_checks_membership_then_fetches(self):
+        mock_repo = make_async_mock_repo()
+        mock_repo.get_changes.return_value = []
+
+        controller = ExpenseController(mock_repo, make_async_mock_group_repo(), make_async_mock_user_repo())
+        membership = AsyncMock(return_value=None)
+        with patch.object(controller, "_require_group_membership", new=membership):
+            result = await controller.get_expense_changes(
+                "507f1f77bcf86cd799439012", "test@example.com", limit=20, user_id="u1"
+            )
+
+        membership.assert_awaited_once_with(
+            "507f1f77bcf86cd799439012", "test@example.com", "u1"
+        )
+        mock_repo.get_changes.assert_awaited_once_with(
+            "507f1f77bcf86cd799439012", None, None, limit=21
+        )
+        assert result.items == []
+        assert result.has_more is False
+
+    @pytest.mark.asyncio
+    async def test_get_expense_changes_not_member_raises(self):
+        mock_repo = make_async_mock_repo()
+
+        controller = ExpenseController(mock_repo, make_async_mock_group_repo(), make_async_mock_user_repo())
+        with patch.object(
+            controller,
+            "_require_group_membership",
+            new=AsyncMock(side_effect=PermissionError("You are not a member of this group")),
+        ):
+            with pytest.raises(PermissionError):
+                await controller.get_expense_changes("507f1f77bcf86cd799439012", "test@example.com")
+        mock_repo.get_changes.assert_not_awaited()
+
+
+class TestExpenseControllerExportExpenses:
+    """Test export_expenses method."""
+
+    @pytest.mark.asyncio
+    async def test_export_expenses_checks_membership_once(self):
+        mock_repo = make_async_mock_repo()
+
+        async def stream(*args, **kwargs):
+            yield {"id": "1", "amount_cents": 100}
+
+        mock_repo.stream_documents = MagicMock(side_effect=stream)
+
+        controller = ExpenseController(mock_repo, make_async_mock_group_repo(), make_async_mock_user_repo())
+        membership = AsyncMock(return_value=None)
+        with patch.object(controller, "_require_group_membership", new=membership):
+            chunks = await controller.export_expenses(
+                "507f1f77bcf86cd799439012", "test@example.com", user_id="u1"
+            )
+            body = "".join([chunk async for chunk in chunks])
+
+        membership.assert_awaited_once_with(
+            "507f1f77bcf86cd799439012", "test@example.com", "u1"
+        )
+        assert '"amount_cents":100' in body
+
+    @pytest.mark.asyncio
+    async def test_export_expenses_not_member_raises(self):
+        mock_repo = make_async_mock_repo()
+
+        controller = ExpenseController(mock_repo, make_async_mock_group_repo(), make_async_mock_user_repo())
+        with patch.object(
+            controller,
+            "_require_group_membership",
+            new=AsyncMock(side_effect=PermissionError("You are not a member of this group")),
+        ):
+            with pytest.raises(PermissionError):
+                await controller.export_expenses("507f1f77bcf86cd799439012", "test@example.com")
+        mock_repo.stream_documents.assert_not_called()
+
+
 class TestExpenseControllerGetExpenseById:
     """Test get_expense_by_id method."""
 
@@ -358,3 +591,186 @@ class TestExpenseControllerGetAmountsAndTypes:
         with patch.object(controller, "_require_group_membership", new=AsyncMock(return_value=None)):
             with pytest.raises(Exception):
                 await controller.get_amounts_and_types("507f1f77bcf86cd799439012", "test@example.com")
+
+
+class TestExpenseControllerGetExpenseAnalytics:
+    """Test ExpenseController.get_expense_analytics"""
+
+    @pytest.mark.asyncio
+    async def test_get_expense_analytics_passes_filters(self):
+        from app.domain.enums.analytics_group_by_enum import AnalyticsGroupBy
+        mock_repo = make_async_mock_repo()
+        mock_repo.aggregate_amounts.return_value = []
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        controller = ExpenseController(mock_repo, make_async_mock_group_repo(), make_async_mock_user_repo())
+        with patch.object(controller, "_require_group_membership", new=AsyncMock(return_value=None)) as require:
+            result = await controller.get_expense_analytics(
+                "507f1f77bcf86cd799439012",
+                "test@example.com",
+                AnalyticsGroupBy.WEEK,
+                start_date=start,
+                user_id="user-1",
+            )
+
+        assert result.group_by == AnalyticsGroupBy.WEEK
+        assert result.buckets == []
+        require.assert_awaited_once_with("507f1f77bcf86cd799439012", "test@example.com", "user-1")
+        mock_repo.aggregate_amounts.assert_called_once_with(
+            "507f1f77bcf86cd799439012", AnalyticsGroupBy.WEEK, start_date=start, end_date=None
+        )
+
+
+class TestExpenseControllerRequireGroupMembership:
+    """Test membership checks through the token user_id and the membership cache"""
+
+    @pytest.mark.asyncio
+    async def test_warm_cache_with_user_id_makes_no_db_calls(self):
+        from app.infrastructure.membership_cache import InMemoryMembershipCache
+        group_repo = make_async_mock_group_repo()
+        user_repo = make_async_mock_user_repo()
+        cache = InMemoryMembershipCache(ttl_seconds=60, max_entries=10)
+        cache.set("507f1f77bcf86cd799439012", ["user-1"])
+        cache.set_active("user-1")
+        controller = ExpenseController(make_async_mock_repo(), group_repo, user_repo, cache)
+
+        await controller._require_group_membership(
+            "507f1f77bcf86cd799439012", "test@example.com", "user-1"
+        )
+
+        group_repo.get_fields.assert_not_called()
+        user_repo.get_fields.assert_not_called()
+        user_repo.get_by_email.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cold_user_is_checked_once_then_cached(self):
+        from app.infrastructure.membership_cache import InMemoryMembershipCache
+        user_repo = make_async_mock_user_repo()
+        cache = InMemoryMembershipCache(ttl_seconds=60, max_entries=10)
+        cache.set("507f1f77bcf86cd799439012", ["user-1"])
+        controller = ExpenseController(
+            make_async_mock_repo(), make_async_mock_group_repo(), user_repo, cache
+        )
+
+        for _ in range(2):
+            await controller._require_group_membership(
+                "507f1f77bcf86cd799439012", "test@example.com", "user-1"
+            )
+
+        user_repo.get_fields.assert_called_once_with("user-1", ["is_active"])
+        assert cache.is_active("user-1") is True
+
+    @pytest.mark.asyncio
+    async def test_deactivated_user_is_denied_once_invalidated(self):
+        from app.infrastructure.membership_cache import InMemoryMembershipCache
+        user_repo = make_async_mock_user_repo()
+        cache = InMemoryMembershipCache(ttl_seconds=60, max_entries=10)
+        cache.set("507f1f77bcf86cd799439012", ["user-1"])
+        cache.set_active("user-1")
+        controller = ExpenseController(
+            make_async_mock_repo(), make_async_mock_group_repo(), user_repo, cache
+        )
+
+        cache.invalidate_user("user-1")
+        user_repo.get_fields.return_value = {"is_active": False}
+
+        with pytest.raises(PermissionError):
+            await controller._require_group_membership(
+                "507f1f77bcf86cd799439012", "test@example.com", "user-1"
+            )
+        assert cache.is_active("user-1") is False
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fields", [None, {"is_active": False}])
+    async def test_inactive_or_missing_user_raises_permission_error(self, fields):
+        from app.infrastructure.membership_cache import InMemoryMembershipCache
+        group_repo = make_async_mock_group_repo()
+        user_repo = make_async_mock_user_repo()
+        user_repo.get_fields.return_value = fields
+        cache = InMemoryMembershipCache(ttl_seconds=60, max_entries=10)
+        cache.set("507f1f77bcf86cd799439012", ["user-1"])
+        controller = ExpenseController(make_async_mock_repo(), group_repo, user_repo, cache)
+
+        with pytest.raises(PermissionError):
+            await controller._require_group_membership(
+                "507f1f77bcf86cd799439012", "test@example.com", "user-1"
+            )
+        group_repo.get_fields.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cold_cache_loads_group_once(self):
+        from app.infrastructure.membership_cache import InMemoryMembershipCache
+        group_repo = make_async_mock_group_repo()
+        group_repo.get_fields.return_value = {"user_ids": ["user-1", "user-2"]}
+        cache = InMemoryMembershipCache(ttl_seconds=60, max_entries=10)
+        controller = ExpenseController(
+            make_async_mock_repo(), group_repo, make_async_mock_user_repo(), cache
+        )
+
+        await controller._require_group_membership("507f1f77bcf86cd799439012", "a@b.com", "user-1")
+        await controller._require_group_membership("507f1f77bcf86cd799439012", "c@d.com", "user-2")
+
+        group_repo.get_fields.assert_called_once_with(
+            "507f1f77bcf86cd799439012", ["user_ids"]
+        )
+        group_repo.get_by_id.assert_not_called()
+        assert cache.get("507f1f77bcf86cd799439012") == frozenset({"user-1", "user-2"})
+
+    @pytest.mark.asyncio
+    async def test_non_member_raises_permission_error(self):
+        from app.infrastructure.membership_cache import InMemoryMembershipCache
+        cache = InMemoryMembershipCache(ttl_seconds=60, max_entries=10)
+        cache.set("507f1f77bcf86cd799439012", ["user-1"])
+        controller = ExpenseController(
+            make_async_mock_repo(), make_async_mock_group_repo(), make_async_mock_user_repo(), cache
+        )
+
+        with pytest.raises(PermissionError):
+            await controller._require_group_membership(
+                "507f1f77bcf86cd799439012", "test@example.com", "intruder"
+            )
+
+    @pytest.mark.asyncio
+    async def test_missing_group_raises_and_is_not_cached(self):
+        from app.infrastructure.membership_cache import InMemoryMembershipCache
+        group_repo = make_async_mock_group_repo()
+        group_repo.get_fields.return_value = None
+        cache = InMemoryMembershipCache(ttl_seconds=60, max_entries=10)
+        controller = ExpenseController(
+            make_async_mock_repo(), group_repo, make_async_mock_user_repo(), cache
+        )
+
+        with pytest.raises(PermissionError):
+            await controller._require_group_membership(
+                "507f1f77bcf86cd799439012", "test@example.com", "user-1"
+            )
+        assert cache.get("507f1f77bcf86cd799439012") is None
+
+    @pytest.mark.asyncio
+    async def test_without_user_id_falls_back_to_email_lookup(self):
+        from app.domain.entities.user_entity import User
+        from datetime import date
+        group_repo = make_async_mock_group_repo()
+        group_repo.get_fields.return_value = {"user_ids": ["user-1"]}
+        user_repo = make_async_mock_user_repo()
+        user_repo.get_by_email.return_value = User(
+            id="user-1",
+            name="Test User",
+            email="test@example.com",
+            password="$2b$12$hashedpassword",
+            date_birth=date(1990, 1, 1),
+        )
+        controller = ExpenseController(make_async_mock_repo(), group_repo, user_repo)
+
+        await controller._require_group_membership("507f1f77bcf86cd799439012", "test@example.com")
+
+        user_repo.get_by_email.assert_called_once_with("test@example.com")
+
+    @pytest.mark.asyncio
+    async def test_without_user_id_unknown_email_raises(self):
+        user_repo = make_async_mock_user_repo()
+        user_repo.get_by_email.return_value = None
+        controller = ExpenseController(make_async_mock_repo(), make_async_mock_group_repo(), user_repo)
+
+        with pytest.raises(PermissionError):
+            await controller._require_group_membership("507f1f77bcf86cd799439012", "ghost@example.com")
@@ -72,7 +72,7 @@ class TestGroupControllerBuildResponse:
         user = make_user()
         group = make_group(user_ids=[user.id])
         user_repo = make_user_repo()
-        user_repo.get_by_id.return_value = user
+        user_repo.get_many_by_ids.return_value = {user.id: user.name}
         controller = GroupController(make_group_repo(), user_repo)
 
         # Act
@@ -87,7 +87,7 @@ class TestGroupControllerBuildResponse:
         # Arrange
         group = make_group(user_ids=["nonexistent-id"])
         user_repo = make_user_repo()
-        user_repo.get_by_id.return_value = None  # user not found
+        user_repo.get_many_by_ids.return_value = {}  # user not found
         controller = GroupController(make_group_repo(), user_repo)
 
         # Act
@@ -107,6 +107,41 @@ class TestGroupControllerBuildResponse:
         # Assert
         assert response.users == []
 
+    async def test_build_responses_fetches_members_once_for_all_groups(self):
+        # Arrange
+        user_1, user_2 = make_user(), make_user()
+        groups = [
+            make_group(user_ids=[user_1.id, user_2.id]),
+            make_group(user_ids=[user_2.id]),
+        ]
+        user_repo = make_user_repo()
+        user_repo.get_many_by_ids.return_value = {
+            user_1.id: "Ana",
+            user_2.id: "Bruno",
+        }
+        controller = GroupController(make_group_repo(), user_repo)
+
+        # Act
+        responses = await controller._build_responses(groups)
+
+        # Assert
+        user_repo.get_many_by_ids.assert_awaited_once_with([user_1.id, user_2.id])
+        user_repo.get_by_id.assert_not_called()
+        assert [u.name for u in responses[0].users] == ["Ana", "Bruno"]
+        assert [u.name for u in responses[1].users] == ["Bruno"]
+
+    async def test_build_responses_skips_query_without_members(self):
+        # Arrange
+        user_repo = make_user_repo()
+        controller = GroupController(make_group_repo(), user_repo)
+
+        # Act
+        responses = await controller._build_responses([make_group(user_ids=[])])
+
+        # Assert
+        assert responses[0].users == []
+        user_repo.get_many_by_ids.assert_not_called()
+
 
 class TestGroupControllerCreateGroup:
     async def test_create_group_delegates_and_returns_response(self):
@@ -116,7 +151,7 @@ class TestGroupControllerCreateGroup:
         group_repo = make_group_repo()
         user_repo = make_user_repo()
         user_repo.get_by_email.return_value = creator
-        user_repo.get_by_id.return_value = creator
+        user_repo.get_many_by_ids.return_value = {creator.id: creator.name}
         controller = GroupController(group_repo, user_repo)
 
         with patch.object(
@@ -136,7 +171,7 @@ class TestGroupControllerCreateGroup:
         group_repo = make_group_repo()
         user_repo = make_user_repo()
         user_repo.get_by_email.return_value = creator
-        user_repo.get_by_id.return_value = creator
+        user_repo.get_many_by_ids.return_value = {creator.id: creator.name}
         controller = GroupController(group_repo, user_repo)
         execute_mock = AsyncMock(return_value=group)
 
@@ -172,7 +207,7 @@ class TestGroupControllerGetAllGroups:
         user = make_user()
         user_repo = make_user_repo()
         user_repo.get_by_email.return_value = user
-        user_repo.get_by_id.return_value = None
+        user_repo.get_many_by_ids.return_value = {}
         controller = GroupController(make_group_repo(), user_repo)
 
         with patch.object(
@@ -192,7 +227,7 @@ class TestGroupControllerGetAllGroups:
         user = make_user()
         user_repo = make_user_repo()
         user_repo.get_by_email.return_value = user
-        user_repo.get_by_id.return_value = None
+        user_repo.get_many_by_ids.return_value = {}
         controller = GroupController(make_group_repo(), user_repo)
 
         with patch.object(
@@ -322,7 +357,7 @@ class TestGroupControllerAddUser:
         # Arrange
         group = make_group(user_ids=["user1"])
         user_repo = make_user_repo()
-        user_repo.get_by_id.return_value = None  # no users to populate in response
+        user_repo.get_many_by_ids.return_value = {}  # no users to populate in response
         controller = GroupController(make_group_repo(), user_repo)
 
         with patch.object(
@@ -356,6 +391,48 @@ class TestGroupControllerAddUser:
         assert result is None
 
 
+class TestGroupControllerAddUsers:
+    async def test_add_users_to_group_success(self):
+        # Arrange
+        group = make_group(user_ids=["user1", "user2", "user3"])
+        user_repo = make_user_repo()
+        user_repo.get_many_by_ids.return_value = {}
+        controller = GroupController(make_group_repo(), user_repo)
+
+        with patch.object(
+            controller.get_group_by_id_use_case,
+            "execute",
+            new=AsyncMock(return_value=group),
+        ), patch.object(
+            controller.add_users_to_group_use_case,
+            "execute",
+            new=AsyncMock(return_value=group),
+        ) as add_users, patch.object(controller, "_require_membership", new=AsyncMock(return_value=None)):
+            # Act
+            result = await controller.add_users_to_group(
+                "group-id", ["user2", "user3"], "test@example.com"
+            )
+
+        # Assert
+        assert isinstance(result, GroupResponse)
+        assert add_users.call_args[0][0].user_ids == ["user2", "user3"]
+
+    async def test_add_users_group_not_found_returns_none(self):
+        # Arrange
+        controller = GroupController(make_group_repo(), make_user_repo())
+
+        with patch.object(
+            controller.get_group_by_id_use_case,
+            "execute",
+            new=AsyncMock(return_value=None),
+        ):
+            # Act
+            result = await controller.add_users_to_group("nonexistent", ["user1"], "test@example.com")
+
+        # Assert
+        assert result is None
+
+
 class TestGroupControllerRemoveUser:
     async def test_remove_user_from_group_success(self):
         # Arrange
@@ -400,7 +477,7 @@ class TestGroupControllerGetGroupsByUserEmail:
         groups = [make_group(user_ids=[user.id]), make_group(user_ids=[user.id])]
         user_repo = make_user_repo()
         user_repo.get_by_email.return_value = user
-        user_repo.get_by_id.return_value = None  # no user population in response
+        user_repo.get_many_by_ids.return_value = {}  # no user population in response
         controller = GroupController(make_group_repo(), user_repo)
 
         with patch.object(
@@ -1,7 +1,7 @@
 """Tests for controllers/user_controller.py"""
 
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from bson import ObjectId
 from app.controllers.user_controller import UserController
 from app.models.user_schema import UserUpdate
@@ -47,9 +47,7 @@ class TestUserController:
         # Arrange
         mock_user_repository.get_by_email.return_value = None
         mock_user_repository.create.return_value = sample_user_response
-        mock_verification_repository.get_latest_by_user_id.return_value = None
-        mock_verification_repository.invalidate_all_by_user_id.return_value = None
-        mock_verification_repository.create.return_value = None
+        mock_verification_repository.issue_token.return_value = MagicMock()
         mock_email_service.send_verification_email.return_value = None
         controller = make_controller(
             mock_user_repository, mock_verification_repository, mock_email_service
@@ -147,9 +145,7 @@ class TestUserController:
         user_id = str(ObjectId())
         update_data = UserUpdate(name="Updated Name")
 
-        mock_user_repository.get_by_id.return_value = sample_user_entity
-        mock_user_repository.email_exists.return_value = False
-        mock_user_repository.update.return_value = sample_user_entity
+        mock_user_repository.update_fields.return_value = sample_user_entity
         controller = make_controller(
             mock_user_repository, mock_verification_repository, mock_email_service
         )
@@ -0,0 +1,253 @@
+"""Tests for infrastructure/repositories/cached_repositories.py"""
+
+import pytest
+from datetime import date
+from unittest.mock import AsyncMock
+from app.domain.entities.group_entity import Group
+from app.domain.entities.user_entity import User
+from app.domain.interfaces.group_repository_interface import IGroupRepository
+from app.domain.interfaces.user_repository_interface import IUserRepository
+from app.infrastructure.cache.memory_cache import InMemoryCache
+from app.infrastructure.repositories.cached_repositories import (
+    CachedGroupRepository,
+    CachedUserRepository,
+)
+
+USER_ID = "507f1f77bcf86cd799439011"
+GROUP_ID = "507f1f77bcf86cd799439012"
+
+
+def make_user(email="alice@example.com"):
+    return User(
+        id=USER_ID,
+        name="Alice",
+        email=email,
+        password="$2b$12$hashedpassword",
+        date_birth=date(1990, 1, 1),
+        is_active=True,
+    )
+
+
+def make_group(user_ids=("u1",)):
+    return Group(
+        id=GROUP_ID, group_name="Trip", creator_id="u1", user_ids=list(user_ids)
+    )
+
+
+@pytest.fixture
+def cache():
+    return InMemoryCache(default_ttl_seconds=60, max_entries=100)
+
+
+@pytest.fixture
+def inner_users():
+    return AsyncMock(spec=IUserRepository)
+
+
+@pytest.fixture
+def inner_groups():
+    return AsyncMock(spec=IGroupRepository)
+
+
+class TestCachedUserRepository:
+    """Test CachedUserRepository"""
+
+    async def test_get_by_id_reads_database_once(self, cache, inner_users):
+        # Arrange
+        user = make_user()
+        inner_users.get_by_id.return_value = user
+        repository = CachedUserRepository(inner_users, cache)
+
+        # Act
+        first = await repository.get_by_id(USER_ID)
+        second = await repository.get_by_id(USER_ID)
+
+        # Assert
+        assert first == user
+        assert second.model_dump(exclude={"password"}) == user.model_dump(
+            exclude={"password"}
+        )
+        assert first is not second
+        inner_users.get_by_id.assert_awaited_once_with(USER_ID)
+
+    async def test_password_hash_is_not_cached(self, cache, inner_users):
+        # Arrange
+        inner_users.get_by_id.return_value = make_user()
+        repository = CachedUserRepository(inner_users, cache)
+
+        # Act
+        await repository.get_by_id(USER_ID)
+        cached = await repository.get_by_id(USER_ID)
+
+        # Assert
+        assert "hashedpassword" not in await cache.get("users", f"id:{USER_ID}")
+        assert cached.password == ""
+
+    async def test_entry_of_another_user_is_discarded(self, cache, inner_users):
+        # Arrange
+        other = make_user(email="mallory@example.com")
+        other.id = "507f1f77bcf86cd799439099"
+        await cache.set("users", f"id:{USER_ID}", other.model_dump_json())
+        inner_users.get_by_id.return_value = make_user()
+        repository = CachedUserRepository(inner_users, cache)
+
+        # Act
+        user = await repository.get_by_id(USER_ID)
+
+        # Assert
+        assert user.id == USER_ID
+        assert user.email == "alice@example.com"
+        inner_users.get_by_id.assert_awaited_once_with(USER_ID)
+
+    async def test_missing_user_is_not_cached(self, cache, inner_users):
+        # Arrange
+        inner_users.get_by_id.return_value = None
+        repository = CachedUserRepository(inner_users, cache)
+
+        # Act
+        await repository.get_by_id(USER_ID)
+        await repository.get_by_id(USER_ID)
+
+        # Assert
+        assert inner_users.get_by_id.await_count == 2
+
+    async def test_get_by_email_reads_database_once(self, cache, inner_users):
+        # Arrange
+        inner_users.get_by_email.return_value = make_user()
+        repository = CachedUserRepository(inner_users, cache)
+
+        # Act
+        await repository.get_by_email("alice@example.com")
+        user = await repository.get_by_email("alice@example.com")
+        by_id = await repository.get_by_id(USER_ID)
+
+        # Assert
+        assert user.email == "alice@example.com"
+        assert by_id == user
+        inner_users.get_by_email.assert_awaited_once()
+        inner_users.get_by_id.assert_not_awaited()
+
+    @pytest.mark.parametrize(
+        "write, args",
+        [
+            ("update", (USER_ID, make_user())),
+            ("update_fields", (USER_ID, {"name": "Alice B."})),
+            ("delete", (USER_ID,)),
+        ],
+    )
+    async def test_writes_invalidate_user(self, cache, inner_users, write, args):
+        # Arrange
+        inner_users.get_by_id.return_value = make_user()
+        repository = CachedUserRepository(inner_users, cache)
+        await repository.get_by_id(USER_ID)
+
+        # Act
+        await getattr(repository, write)(*args)
+        await repository.get_by_id(USER_ID)
+
+        # Assert
+        getattr(inner_users, write).assert_awaited_once_with(*args)
+        assert inner_users.get_by_id.await_count == 2
+
+    async def test_mark_email_verified_invalidates_user(self, cache, inner_users):
+        # Arrange
+        inner_users.get_by_id.return_value = make_user()
+        repository = CachedUserRepository(inner_users, cache)
+        await repository.get_by_id(USER_ID)
+        session = object()
+
+        # Act
+        await repository.mark_email_verified(USER_ID, session=session)
+        await repository.get_by_id(USER_ID)
+
+        # Assert
+        inner_users.mark_email_verified.assert_awaited_once_with(
+            USER_ID, session=session
+        )
+        assert inner_users.get_by_id.await_count == 2
+
+    async def test_changed_email_no_longer_resolves(self, cache, inner_users):
+        # Arrange
+        inner_users.get_by_email.return_value = make_user()
+        repository = CachedUserRepository(inner_users, cache)
+        await repository.get_by_email("alice@example.com")
+
+        # Act
+        await repository.update_fields(USER_ID, {"email": "new@example.com"})
+        inner_users.get_by_id.return_value = make_user(email="new@example.com")
+        inner_users.get_by_email.return_value = None
+        result = await repository.get_by_email("alice@example.com")
+
+        # Assert
+        assert result is None
+        assert inner_users.get_by_email.await_count == 2
+
+    async def test_other_methods_delegate(self, cache, inner_users):
+        # Arrange
+        inner_users.get_many_by_ids.return_value = {USER_ID: "Alice"}
+        inner_users.email_exists.return_value = True
+        repository = CachedUserRepository(inner_users, cache)
+
+        # Act / Assert
+        assert await repository.get_many_by_ids([USER_ID]) == {USER_ID: "Alice"}
+        assert await repository.email_exists("alice@example.com") is True
+        await repository.get_by_email_unverified("alice@example.com")
+        inner_users.get_by_email_unverified.assert_awaited_once_with(
+            "alice@example.com"
+        )
+
+
+class TestCachedGroupRepository:
+    """Test CachedGroupRepository"""
+
+    async def test_get_by_id_reads_database_once(self, cache, inner_groups):
+        # Arrange
+        inner_groups.get_by_id.return_value = make_group()
+        repository = CachedGroupRepository(inner_groups, cache)
+
+        # Act
+        await repository.get_by_id(GROUP_ID)
+        group = await repository.get_by_id(GROUP_ID)
+
+        # Assert
+        assert group.user_ids == ["u1"]
+        inner_groups.get_by_id.assert_awaited_once_with(GROUP_ID)
+
+    @pytest.mark.parametrize(
+        "write, args",
+        [
+            ("update", (GROUP_ID, make_group())),
+            ("update_fields", (GROUP_ID, {"group_name": "Holiday"})),
+            ("add_member", (GROUP_ID, "u2")),
+            ("add_members", (GROUP_ID, ["u2", "u3"])),
+            ("remove_member", (GROUP_ID, "u1")),
+            ("delete", (GROUP_ID,)),
+        ],
+    )
+    async def test_writes_invalidate_group(self, cache, inner_groups, write, args):
+        # Arrange
+        inner_groups.get_by_id.return_value = make_group()
+        repository = CachedGroupRepository(inner_groups, cache)
+        await repository.get_by_id(GROUP_ID)
+
+        # Act
+        await getattr(repository, write)(*args)
+        await repository.get_by_id(GROUP_ID)
+
+        # Assert
+        getattr(inner_groups, write).assert_awaited_once_with(*args)
+        assert inner_groups.get_by_id.await_count == 2
+
+    async def test_stale_schema_entry_is_reloaded(self, cache, inner_groups):
+        # Arrange
+        stored = make_group()
+        inner_groups.get_by_id.return_value = stored
+        repository = CachedGroupRepository(inner_groups, cache)
+        await cache.set("groups", f"id:{GROUP_ID}", '{"unexpected": true}')
+
+        # Act
+        group = await repository.get_by_id(GROUP_ID)
+
+        # Assert
+        assert group == stored
+        inner_groups.get_by_id.assert_awaited_once_with(GROUP_ID)
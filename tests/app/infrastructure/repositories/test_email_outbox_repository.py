@@ -0,0 +1,208 @@
+"""Tests for infrastructure/repositories/email_outbox_repository.py"""
+
+import pytest
+from unittest.mock import MagicMock, AsyncMock, patch
+from datetime import datetime, timezone, timedelta
+from bson import ObjectId
+from pymongo import ReturnDocument
+
+from app.infrastructure.repositories.email_outbox_repository import (
+    DURABLE_WRITE_CONCERN,
+    MongoEmailOutboxRepository,
+)
+from app.domain.interfaces.email_outbox_repository_interface import (
+    IEmailOutboxRepository,
+)
+from app.domain.entities.outbox_email_entity import OutboxEmail
+from app.domain.enums.outbox_status_enum import OutboxStatus
+
+
+def make_outbox_doc(attempts=1):
+    """Create a sample outbox email document."""
+    now = datetime.now(timezone.utc)
+    return {
+        "_id": ObjectId(),
+        "to_email": "user@example.com",
+        "subject": "Subject",
+        "html": "<p>123456</p>",
+        "status": "pending",
+        "attempts": attempts,
+        "next_attempt_at": now + timedelta(seconds=60),
+        "expires_at": now + timedelta(minutes=15),
+        "last_error": None,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def make_outbox_entity():
+    """Create a sample OutboxEmail entity."""
+    now = datetime.now(timezone.utc)
+    return OutboxEmail(
+        to_email="user@example.com",
+        subject="Subject",
+        html="<p>123456</p>",
+        next_attempt_at=now,
+        expires_at=now + timedelta(minutes=15),
+    )
+
+
+def patch_collection(repo, collection):
+    return patch.object(repo, "_get_collection", return_value=collection)
+
+
+class TestMongoEmailOutboxRepositoryInit:
+    def test_repository_is_instance_of_interface(self):
+        # Arrange / Act
+        repo = MongoEmailOutboxRepository()
+
+        # Assert
+        assert isinstance(repo, IEmailOutboxRepository)
+        assert repo.collection_name == "email_outbox"
+
+    def test_declares_claim_index(self):
+        # Arrange / Act
+        keys = [index.document["key"] for index in MongoEmailOutboxRepository.indexes]
+
+        # Assert
+        assert list(keys[0].items()) == [("status", 1), ("next_attempt_at", 1)]
+
+
+class TestMongoEmailOutboxRepositoryEnqueue:
+    async def test_enqueue_inserts_with_durable_write_concern(self):
+        # Arrange
+        repo = MongoEmailOutboxRepository()
+        inserted_id = ObjectId()
+        durable = MagicMock()
+        durable.insert_one = AsyncMock(return_value=MagicMock(inserted_id=inserted_id))
+        collection = MagicMock()
+        collection.with_options.return_value = durable
+        email = make_outbox_entity()
+
+        # Act
+        with patch_collection(repo, collection):
+            result = await repo.enqueue(email)
+
+        # Assert
+        collection.with_options.assert_called_once_with(
+            write_concern=DURABLE_WRITE_CONCERN
+        )
+        doc = durable.insert_one.await_args.args[0]
+        assert doc["status"] == "pending"
+        assert doc["attempts"] == 0
+        assert "id" not in doc
+        assert result.id == str(inserted_id)
+        assert DURABLE_WRITE_CONCERN.document == {"w": "majority", "j": True}
+
+    async def test_enqueue_propagates_errors(self):
+        # Arrange
+        repo = MongoEmailOutboxRepository()
+        durable = MagicMock()
+        durable.insert_one = AsyncMock(side_effect=Exception("write failed"))
+        collection = MagicMock()
+        collection.with_options.return_value = durable
+
+        # Act / Assert
+        with patch_collection(repo, collection):
+            with pytest.raises(Exception, match="write failed"):
+                await repo.enqueue(make_outbox_entity())
+
+
+class TestMongoEmailOutboxRepositoryClaimNext:
+    async def test_claims_due_pending_email_and_leases_it(self):
+        # Arrange
+        repo = MongoEmailOutboxRepository()
+        doc = make_outbox_doc()
+        collection = MagicMock()
+        collection.find_one_and_update = AsyncMock(return_value=doc)
+        now = datetime.now(timezone.utc)
+
+        # Act
+        with patch_collection(repo, collection):
+            email = await repo.claim_next(now, 30)
+
+        # Assert
+        query, update = collection.find_one_and_update.await_args.args
+        kwargs = collection.find_one_and_update.await_args.kwargs
+        assert query == {"status": "pending", "next_attempt_at": {"$lte": now}}
+        assert update["$set"]["next_attempt_at"] == now + timedelta(seconds=30)
+        assert update["$inc"] == {"attempts": 1}
+        assert kwargs["sort"] == [("next_attempt_at", 1)]
+        assert kwargs["return_document"] == ReturnDocument.AFTER
+        assert isinstance(email, OutboxEmail)
+        assert email.attempts == 1
+
+    async def test_returns_none_when_nothing_is_due(self):
+        # Arrange
+        repo = MongoEmailOutboxRepository()
+        collection = MagicMock()
+        collection.find_one_and_update = AsyncMock(return_value=None)
+
+        # Act
+        with patch_collection(repo, collection):
+            email = await repo.claim_next(datetime.now(timezone.utc), 30)
+
+        # Assert
+        assert email is None
+
+
+class TestMongoEmailOutboxRepositoryOutcomes:
+    async def test_mark_sent_deletes_the_email(self):
+        # Arrange
+        repo = MongoEmailOutboxRepository()
+        email_id = ObjectId()
+        collection = MagicMock()
+        collection.delete_one = AsyncMock()
+
+        # Act
+        with patch_collection(repo, collection):
+            await repo.mark_sent(str(email_id))
+
+        # Assert
+        collection.delete_one.assert_awaited_once_with({"_id": email_id})
+
+    async def test_schedule_retry_sets_next_attempt_and_error(self):
+        # Arrange
+        repo = MongoEmailOutboxRepository()
+        email_id = ObjectId()
+        next_attempt_at = datetime.now(timezone.utc) + timedelta(seconds=8)
+        collection = MagicMock()
+        collection.update_one = AsyncMock()
+
+        # Act
+        with patch_collection(repo, collection):
+            await repo.schedule_retry(str(email_id), next_attempt_at, "timeout")
+
+        # Assert
+        query, update = collection.update_one.await_args.args
+        assert query == {"_id": email_id}
+        assert update["$set"]["next_attempt_at"] == next_attempt_at
+        assert update["$set"]["last_error"] == "timeout"
+
+    async def test_dead_letter_marks_dead_and_drops_body(self):
+        # Arrange
+        repo = MongoEmailOutboxRepository()
+        email_id = ObjectId()
+        collection = MagicMock()
+        collection.update_one = AsyncMock()
+
+        # Act
+        with patch_collection(repo, collection):
+            await repo.dead_letter(str(email_id), "bounced")
+
+        # Assert
+        update = collection.update_one.await_args.args[1]
+        assert update["$set"]["status"] == OutboxStatus.DEAD.value
+        assert update["$set"]["html"] == ""
+        assert update["$set"]["last_error"] == "bounced"
+
+    async def test_dead_letter_propagates_errors(self):
+        # Arrange
+        repo = MongoEmailOutboxRepository()
+        collection = MagicMock()
+        collection.update_one = AsyncMock(side_effect=Exception("db down"))
+
+        # Act / Assert
+        with patch_collection(repo, collection):
+            with pytest.raises(Exception, match="db down"):
+                await repo.dead_letter(str(ObjectId()), "bounced")
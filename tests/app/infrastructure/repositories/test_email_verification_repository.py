@@ -4,8 +4,11 @@ import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from datetime import datetime, timezone, timedelta
 from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
 from app.infrastructure.repositories.email_verification_repository import (
+    TOKEN_TTL_GRACE,
     MongoEmailVerificationRepository,
 )
 from app.domain.interfaces.email_verification_repository_interface import (
@@ -242,160 +245,405 @@ class TestMongoEmailVerificationRepositoryGetValidToken:
                 await repo.get_valid_token_by_user_id("user-123")
 
 
-class TestMongoEmailVerificationRepositoryGetLatest:
-    async def test_get_latest_found(self):
+class TestMongoEmailVerificationRepositoryDelete:
+    async def test_delete_marks_as_used(self):
         # Arrange
         repo = MongoEmailVerificationRepository()
-        doc = make_token_doc()
+        token_id = str(ObjectId())
         mock_col = MagicMock()
-        mock_col.find_one = AsyncMock(return_value=doc)
+        mock_col.update_one = AsyncMock(return_value=MagicMock(modified_count=1))
 
         with patch.object(repo, "_get_collection", return_value=mock_col):
             # Act
-            result = await repo.get_latest_by_user_id("user-123")
+            result = await repo.delete(token_id)
 
         # Assert
-        assert result is not None
-        assert isinstance(result, EmailVerificationToken)
+        assert result is True
+        mock_col.update_one.assert_called_once()
 
-    async def test_get_latest_not_found_returns_none(self):
+    async def test_delete_returns_false_when_not_found(self):
         # Arrange
         repo = MongoEmailVerificationRepository()
         mock_col = MagicMock()
-        mock_col.find_one = AsyncMock(return_value=None)
+        mock_col.update_one = AsyncMock(return_value=MagicMock(modified_count=0))
 
         with patch.object(repo, "_get_collection", return_value=mock_col):
             # Act
-            result = await repo.get_latest_by_user_id("user-123")
+            result = await repo.delete(str(ObjectId()))
 
         # Assert
-        assert result is None
-
+        assert result is False
 
-class TestMongoEmailVerificationRepositoryMarkAsUsed:
-    async def test_mark_as_used_success(self):
+    async def test_delete_propagates_exception(self):
         # Arrange
         repo = MongoEmailVerificationRepository()
-        token_id = str(ObjectId())
         mock_col = MagicMock()
-        mock_col.update_one = AsyncMock()
+        mock_col.update_one = AsyncMock(side_effect=RuntimeError("DB error"))
 
         with patch.object(repo, "_get_collection", return_value=mock_col):
+            # Act / Assert
+            with pytest.raises(RuntimeError):
+                await repo.delete(str(ObjectId()))
+
+
+def make_db(counters, history=None):
+    """Database stub holding the counter and history collections."""
+    collections = {
+        "email_verification_resends": counters,
+        "email_verification_token_history": history or MagicMock(),
+    }
+    return patch(
+        "app.infrastructure.repositories.email_verification_repository.Database.get_db",
+        return_value=collections,
+    )
+
+
+def make_counters(*results):
+    counters = MagicMock()
+    counters.find_one_and_update = AsyncMock(side_effect=list(results))
+    return counters
+
+
+class TestMongoEmailVerificationRepositoryIssueToken:
+    async def test_issue_token_counts_send_then_upserts_active_token(self):
+        # Arrange
+        repo = MongoEmailVerificationRepository()
+        doc = make_token_doc()
+        doc["resend_count"] = 2
+        counters = make_counters({"_id": doc["user_id"], "resend_count": 2})
+        mock_col = MagicMock()
+        mock_col.find_one_and_update = AsyncMock(return_value=doc)
+        expires_at = datetime.now(timezone.utc) + timedelta(minutes=15)
+
+        with patch.object(repo, "_get_collection", return_value=mock_col), make_db(
+            counters
+        ):
             # Act
-            await repo.mark_as_used(token_id)
+            token = await repo.issue_token(doc["user_id"], "hash", expires_at, 3)
 
         # Assert
-        mock_col.update_one.assert_called_once()
-        call_args = mock_col.update_one.call_args
-        assert call_args[0][1]["$set"]["is_used"] is True
+        counter_query, counter_update = counters.find_one_and_update.await_args.args
+        assert counter_query == {"_id": doc["user_id"], "resend_count": {"$lt": 3}}
+        assert counter_update[0]["$set"]["resend_count"] == {
+            "$add": [{"$ifNull": ["$resend_count", -1]}, 1]
+        }
+        assert counters.find_one_and_update.await_args.kwargs["upsert"] is True
+
+        query, update = mock_col.find_one_and_update.await_args.args
+        kwargs = mock_col.find_one_and_update.await_args.kwargs
+        assert query == {"user_id": doc["user_id"], "is_used": False}
+        fields = update[0]["$set"]
+        assert fields["code_hash"] == "hash"
+        assert fields["expires_at"] == expires_at
+        assert fields["attempts"] == 0
+        assert fields["resend_count"] == 2
+        assert kwargs["upsert"] is True
+        assert kwargs["return_document"] == ReturnDocument.AFTER
+        assert isinstance(token, EmailVerificationToken)
+        assert token.resend_count == 2
+
+    async def test_issue_token_returns_none_at_resend_limit(self):
+        # Arrange — the counter at the limit is matched by nothing, and
+        # inserting another one with the same _id is rejected
+        repo = MongoEmailVerificationRepository()
+        counters = make_counters(
+            DuplicateKeyError("E11000"), DuplicateKeyError("E11000")
+        )
+        mock_col = MagicMock()
+        mock_col.find_one_and_update = AsyncMock()
+
+        with patch.object(repo, "_get_collection", return_value=mock_col), make_db(
+            counters
+        ):
+            # Act
+            token = await repo.issue_token(
+                str(ObjectId()), "hash", datetime.now(timezone.utc), 3
+            )
+
+        # Assert
+        assert token is None
+        assert counters.find_one_and_update.await_count == 2
+        mock_col.find_one_and_update.assert_not_awaited()
 
-    async def test_mark_as_used_propagates_exception(self):
+    async def test_issue_token_retries_after_losing_a_concurrent_insert(self):
         # Arrange
         repo = MongoEmailVerificationRepository()
+        doc = make_token_doc()
+        counters = make_counters(
+            DuplicateKeyError("E11000"), {"_id": doc["user_id"], "resend_count": 1}
+        )
         mock_col = MagicMock()
-        mock_col.update_one = AsyncMock(side_effect=RuntimeError("DB error"))
+        mock_col.find_one_and_update = AsyncMock(
+            side_effect=[DuplicateKeyError("E11000"), doc]
+        )
 
-        with patch.object(repo, "_get_collection", return_value=mock_col):
+        with patch.object(repo, "_get_collection", return_value=mock_col), make_db(
+            counters
+        ):
+            # Act
+            token = await repo.issue_token(
+                doc["user_id"], "hash", datetime.now(timezone.utc), 3
+            )
+
+        # Assert
+        assert token is not None
+        assert token.user_id == doc["user_id"]
+        assert mock_col.find_one_and_update.await_args.args[1][0]["$set"][
+            "resend_count"
+        ] == 1
+
+    async def test_issue_token_records_history_only_when_audited(self):
+        # Arrange
+        repo = MongoEmailVerificationRepository(audit=True)
+        doc = make_token_doc()
+        counters = make_counters({"_id": doc["user_id"], "resend_count": 0})
+        mock_col = MagicMock()
+        mock_col.find_one_and_update = AsyncMock(return_value=doc)
+        history = MagicMock()
+        history.insert_one = AsyncMock()
+
+        with patch.object(repo, "_get_collection", return_value=mock_col), make_db(
+            counters, history
+        ):
+            # Act
+            token = await repo.issue_token(
+                doc["user_id"], "hash", datetime.now(timezone.utc), 3
+            )
+
+        # Assert
+        record = history.insert_one.await_args.args[0]
+        assert record["token_id"] == token.id
+        assert record["user_id"] == doc["user_id"]
+        assert "code_hash" not in record
+        assert MongoEmailVerificationRepository().audit is False
+
+    async def test_issue_token_propagates_exception(self):
+        # Arrange
+        repo = MongoEmailVerificationRepository()
+        counters = make_counters(RuntimeError("DB error"))
+
+        with make_db(counters):
             # Act / Assert
             with pytest.raises(RuntimeError):
-                await repo.mark_as_used(str(ObjectId()))
+                await repo.issue_token(
+                    str(ObjectId()), "hash", datetime.now(timezone.utc), 3
+                )
 
 
-class TestMongoEmailVerificationRepositoryIncrementAttempts:
-    async def test_increment_attempts_success(self):
+class TestMongoEmailVerificationRepositoryIndexes:
+    def _indexes(self, indexes):
+        return {index.document["name"]: index.document for index in indexes}
+
+    def test_declares_partial_unique_index_on_active_tokens(self):
+        # Arrange / Act
+        indexes = self._indexes(MongoEmailVerificationRepository.indexes)
+
+        # Assert
+        active = indexes["user_id_active_unique"]
+        assert active["unique"] is True
+        assert active["partialFilterExpression"] == {"is_used": False}
+
+    def test_expired_tokens_are_removed_after_grace_period(self):
+        # Arrange / Act
+        indexes = self._indexes(MongoEmailVerificationRepository.indexes)
+
+        # Assert
+        ttl = indexes["expires_at_ttl"]
+        assert ttl["key"] == {"expires_at": 1}
+        assert ttl["expireAfterSeconds"] == int(TOKEN_TTL_GRACE.total_seconds())
+
+    def test_resend_counters_expire_on_their_own_date(self):
+        # Arrange / Act
+        secondary = MongoEmailVerificationRepository.secondary_indexes
+        indexes = self._indexes(secondary["email_verification_resends"])
+
+        # Assert
+        assert indexes["expires_at_ttl"]["expireAfterSeconds"] == 0
+
+
+class TestMongoEmailVerificationRepositoryRetireDuplicates:
+    async def test_retires_all_but_newest_active_token_per_user(self):
         # Arrange
         repo = MongoEmailVerificationRepository()
-        token_id = str(ObjectId())
+        newest, older, oldest = ObjectId(), ObjectId(), ObjectId()
+        cursor = MagicMock()
+        cursor.to_list = AsyncMock(
+            return_value=[{"_id": "user-1", "ids": [newest, older, oldest]}]
+        )
         mock_col = MagicMock()
-        mock_col.update_one = AsyncMock()
+        mock_col.aggregate.return_value = cursor
+        mock_col.update_many = AsyncMock(return_value=MagicMock(modified_count=2))
 
         with patch.object(repo, "_get_collection", return_value=mock_col):
             # Act
-            await repo.increment_attempts(token_id)
+            retired = await repo.retire_duplicate_active_tokens()
 
         # Assert
-        mock_col.update_one.assert_called_once()
-        call_args = mock_col.update_one.call_args
-        assert "$inc" in call_args[0][1]
-        assert call_args[0][1]["$inc"]["attempts"] == 1
+        assert retired == 2
+        pipeline = mock_col.aggregate.call_args.args[0]
+        assert pipeline[0] == {"$match": {"is_used": False}}
+        assert pipeline[1] == {"$sort": {"created_at": -1, "_id": -1}}
+        query, update = mock_col.update_many.call_args.args
+        assert query == {"_id": {"$in": [older, oldest]}, "is_used": False}
+        assert update["$set"]["is_used"] is True
+
+    async def test_no_duplicates_writes_nothing(self):
+        # Arrange
+        repo = MongoEmailVerificationRepository()
+        cursor = MagicMock()
+        cursor.to_list = AsyncMock(return_value=[])
+        mock_col = MagicMock()
+        mock_col.aggregate.return_value = cursor
+        mock_col.update_many = AsyncMock()
+
+        # Act
+        retired = await repo.retire_duplicate_active_tokens(mock_col)
+
+        # Assert
+        assert retired == 0
+        mock_col.update_many.assert_not_called()
 
-    async def test_increment_attempts_propagates_exception(self):
+    async def test_prepare_indexes_cleans_up_until_unique_index_exists(self):
         # Arrange
         repo = MongoEmailVerificationRepository()
         mock_col = MagicMock()
-        mock_col.update_one = AsyncMock(side_effect=RuntimeError("DB error"))
+        mock_col.index_information = AsyncMock(return_value={"_id_": {}})
+        db = MagicMock()
+        db.__getitem__.return_value = mock_col
 
-        with patch.object(repo, "_get_collection", return_value=mock_col):
-            # Act / Assert
-            with pytest.raises(RuntimeError):
-                await repo.increment_attempts(str(ObjectId()))
+        with patch.object(
+            repo, "retire_duplicate_active_tokens", new=AsyncMock(return_value=1)
+        ) as retire:
+            # Act
+            await repo.prepare_indexes(db)
 
+        # Assert
+        db.__getitem__.assert_called_with("email_verification_tokens")
+        retire.assert_awaited_once_with(mock_col)
 
-class TestMongoEmailVerificationRepositoryInvalidateAll:
-    async def test_invalidate_all_calls_update_many(self):
+    async def test_prepare_indexes_skips_once_unique_index_exists(self):
         # Arrange
         repo = MongoEmailVerificationRepository()
         mock_col = MagicMock()
-        mock_col.update_many = AsyncMock()
+        mock_col.index_information = AsyncMock(
+            return_value={"_id_": {}, "user_id_active_unique": {}}
+        )
+        db = MagicMock()
+        db.__getitem__.return_value = mock_col
+
+        with patch.object(
+            repo, "retire_duplicate_active_tokens", new=AsyncMock()
+        ) as retire:
+            # Act
+            await repo.prepare_indexes(db)
+
+        # Assert
+        retire.assert_not_called()
+
+
+class TestMongoEmailVerificationRepositoryDeleteUsed:
+    async def test_delete_used_removes_one_batch(self):
+        # Arrange
+        repo = MongoEmailVerificationRepository()
+        ids = [ObjectId(), ObjectId()]
+        cursor = MagicMock()
+        cursor.limit.return_value = cursor
+        cursor.to_list = AsyncMock(return_value=[{"_id": i} for i in ids])
+        mock_col = MagicMock()
+        mock_col.find.return_value = cursor
+        mock_col.delete_many = AsyncMock(return_value=MagicMock(deleted_count=2))
 
         with patch.object(repo, "_get_collection", return_value=mock_col):
             # Act
-            await repo.invalidate_all_by_user_id("user-123")
+            deleted = await repo.delete_used(500)
 
         # Assert
-        mock_col.update_many.assert_called_once()
-        call_args = mock_col.update_many.call_args
-        assert call_args[0][0]["user_id"] == "user-123"
-        assert call_args[0][1]["$set"]["is_used"] is True
-
-    async def test_invalidate_all_propagates_exception(self):
+        assert deleted == 2
+        assert mock_col.find.call_args.args == ({"is_used": True}, {"_id": 1})
+        cursor.limit.assert_called_once_with(500)
+        mock_col.delete_many.assert_awaited_once_with(
+            {"_id": {"$in": ids}, "is_used": True}
+        )
+
+    async def test_delete_used_skips_delete_when_nothing_is_used(self):
         # Arrange
         repo = MongoEmailVerificationRepository()
+        cursor = MagicMock()
+        cursor.limit.return_value = cursor
+        cursor.to_list = AsyncMock(return_value=[])
         mock_col = MagicMock()
-        mock_col.update_many = AsyncMock(side_effect=RuntimeError("DB error"))
+        mock_col.find.return_value = cursor
+        mock_col.delete_many = AsyncMock()
 
         with patch.object(repo, "_get_collection", return_value=mock_col):
-            # Act / Assert
-            with pytest.raises(RuntimeError):
-                await repo.invalidate_all_by_user_id("user-123")
+            # Act
+            deleted = await repo.delete_used(500)
 
+        # Assert
+        assert deleted == 0
+        mock_col.delete_many.assert_not_awaited()
 
-class TestMongoEmailVerificationRepositoryDelete:
-    async def test_delete_marks_as_used(self):
+
+class TestMongoEmailVerificationRepositoryConsumeCode:
+    async def test_consume_code_checks_everything_in_one_update(self):
         # Arrange
         repo = MongoEmailVerificationRepository()
-        token_id = str(ObjectId())
+        doc = make_token_doc()
+        doc["is_used"] = True
         mock_col = MagicMock()
-        mock_col.update_one = AsyncMock(return_value=MagicMock(modified_count=1))
+        mock_col.find_one_and_update = AsyncMock(return_value=doc)
+        now = datetime.now(timezone.utc)
+        session = MagicMock()
 
         with patch.object(repo, "_get_collection", return_value=mock_col):
             # Act
-            result = await repo.delete(token_id)
+            token = await repo.consume_code(
+                doc["user_id"], doc["code_hash"], now, 5, session=session
+            )
 
         # Assert
-        assert result is True
-        mock_col.update_one.assert_called_once()
-
-    async def test_delete_returns_false_when_not_found(self):
+        query, update = mock_col.find_one_and_update.await_args.args
+        kwargs = mock_col.find_one_and_update.await_args.kwargs
+        assert query == {
+            "user_id": doc["user_id"],
+            "is_used": False,
+            "expires_at": {"$gt": now},
+            "attempts": {"$lt": 5},
+        }
+        fields = update[0]["$set"]
+        matches = {"$eq": ["$code_hash", doc["code_hash"]]}
+        assert fields["is_used"] == matches
+        assert fields["attempts"] == {
+            "$cond": [matches, "$attempts", {"$add": ["$attempts", 1]}]
+        }
+        assert kwargs["return_document"] == ReturnDocument.AFTER
+        assert kwargs["session"] is session
+        assert token.is_used is True
+
+    async def test_consume_code_returns_none_without_usable_token(self):
         # Arrange
         repo = MongoEmailVerificationRepository()
         mock_col = MagicMock()
-        mock_col.update_one = AsyncMock(return_value=MagicMock(modified_count=0))
+        mock_col.find_one_and_update = AsyncMock(return_value=None)
 
         with patch.object(repo, "_get_collection", return_value=mock_col):
             # Act
-            result = await repo.delete(str(ObjectId()))
+            token = await repo.consume_code(
+                str(ObjectId()), "hash", datetime.now(timezone.utc), 5
+            )
 
         # Assert
-        assert result is False
+        assert token is None
 
-    async def test_delete_propagates_exception(self):
+    async def test_consume_code_propagates_exception(self):
         # Arrange
         repo = MongoEmailVerificationRepository()
         mock_col = MagicMock()
-        mock_col.update_one = AsyncMock(side_effect=RuntimeError("DB error"))
+        mock_col.find_one_and_update = AsyncMock(side_effect=RuntimeError("DB error"))
 
         with patch.object(repo, "_get_collection", return_value=mock_col):
             # Act / Assert
             with pytest.raises(RuntimeError):
-                await repo.delete(str(ObjectId()))
+                await repo.consume_code(
+                    str(ObjectId()), "hash", datetime.now(timezone.utc), 5
+                )
@@ -4,11 +4,17 @@ import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from datetime import datetime, timezone
 from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError
 from app.infrastructure.repositories.expense_repository import MongoExpenseRepository
 from app.domain.interfaces.expense_repository_interface import IExpenseRepository
+from app.domain.interfaces.group_summary_repository_interface import (
+    IGroupSummaryRepository,
+)
 from app.domain.entities.expense_entity import Expense
 from app.domain.enums.expense_category_enum import ExpenseCategory
 from app.domain.enums.expense_type_enum import ExpenseType
+from app.domain.enums.analytics_group_by_enum import AnalyticsGroupBy
 
 
 class AsyncIter:
@@ -339,6 +345,303 @@ class TestMongoExpenseRepositoryGetAll:
                 await repo.get_all(group_id)
 
 
+class TestMongoExpenseRepositoryGetAllAfter:
+    """Test get_all_after keyset pagination method."""
+
+    @pytest.mark.asyncio
+    async def test_get_all_after_seeks_past_position(self):
+        repo = MongoExpenseRepository()
+        group_id = "507f1f77bcf86cd799439012"
+        after_id = str(ObjectId())
+        after_date = datetime(2026, 2, 10, 12, 0, tzinfo=timezone.utc)
+        docs = [make_expense_doc()]
+
+        mock_cursor = MagicMock()
+        mock_cursor.limit.return_value = mock_cursor
+        mock_cursor.sort.return_value = AsyncIter(docs)
+
+        mock_collection = MagicMock()
+        mock_collection.find.return_value = mock_cursor
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.expense_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            result = await repo.get_all_after(group_id, after_date, after_id, limit=10)
+
+        assert len(result) == 1
+        query = mock_collection.find.call_args[0][0]
+        assert query["group_id"] == group_id
+        assert query["is_deleted"] is False
+        assert query["$or"] == [
+            {"date": {"$lt": after_date}},
+            {"date": after_date, "_id": {"$lt": ObjectId(after_id)}},
+        ]
+        mock_cursor.skip.assert_not_called()
+        mock_cursor.limit.assert_called_once_with(10)
+        mock_cursor.sort.assert_called_once_with([("date", -1), ("_id", -1)])
+
+    @pytest.mark.asyncio
+    async def test_get_all_after_raises_on_exception(self):
+        repo = MongoExpenseRepository()
+
+        mock_collection = MagicMock()
+        mock_collection.find.side_effect = Exception("DB error")
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.expense_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            with pytest.raises(Exception):
+                await repo.get_all_after(
+                    "507f1f77bcf86cd799439012", datetime.now(timezone.utc), str(ObjectId())
+                )
+
+
+class TestMongoExpenseRepositoryStreamDocuments:
+    """Test stream_documents export method."""
+
+    def _mock_db(self, docs):
+        mock_cursor = MagicMock()
+        mock_cursor.sort.return_value = AsyncIter(docs)
+
+        mock_collection = MagicMock()
+        mock_collection.find.return_value = mock_cursor
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+        return mock_db, mock_collection, mock_cursor
+
+    @pytest.mark.asyncio
+    async def test_stream_documents_yields_documents_with_string_ids(self):
+        repo = MongoExpenseRepository()
+        doc = make_expense_doc()
+        oid = doc["_id"]
+        mock_db, mock_collection, mock_cursor = self._mock_db([doc])
+
+        with patch(
+            "app.infrastructure.repositories.expense_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            result = [
+                d async for d in repo.stream_documents(
+                    "507f1f77bcf86cd799439012", batch_size=200
+                )
+            ]
+
+        assert len(result) == 1
+        assert result[0]["id"] == str(oid)
+        assert "_id" not in result[0]
+        mock_collection.find.assert_called_once_with(
+            {"group_id": "507f1f77bcf86cd799439012", "is_deleted": False},
+            {"is_deleted": False},
+            batch_size=200,
+        )
+        mock_cursor.sort.assert_called_once_with([("date", 1), ("_id", 1)])
+
+    @pytest.mark.asyncio
+    async def test_stream_documents_filters_by_date_range(self):
+        repo = MongoExpenseRepository()
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2026, 2, 1, tzinfo=timezone.utc)
+        mock_db, mock_collection, _ = self._mock_db([])
+
+        with patch(
+            "app.infrastructure.repositories.expense_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            result = [
+                d async for d in repo.stream_documents(
+                    "507f1f77bcf86cd799439012", start_date=start, end_date=end
+                )
+            ]
+
+        assert result == []
+        query = mock_collection.find.call_args[0][0]
+        assert query["date"] == {"$gte": start, "$lt": end}
+
+    @pytest.mark.asyncio
+    async def test_stream_documents_raises_on_exception(self):
+        repo = MongoExpenseRepository()
+
+        mock_collection = MagicMock()
+        mock_collection.find.side_effect = Exception("DB error")
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.expense_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            with pytest.raises(Exception, match="DB error"):
+                [d async for d in repo.stream_documents("507f1f77bcf86cd799439012")]
+
+
+class TestMongoExpenseRepositoryGetChanges:
+    """Test get_changes delta sync method."""
+
+    def _mock_db(self, docs):
+        mock_cursor = MagicMock()
+        mock_cursor.sort.return_value = mock_cursor
+        mock_cursor.limit.return_value = AsyncIter(docs)
+
+        mock_collection = MagicMock()
+        mock_collection.find.return_value = mock_cursor
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+        return mock_db, mock_collection, mock_cursor
+
+    @pytest.mark.asyncio
+    async def test_get_changes_after_watermark_includes_tombstones(self):
+        repo = MongoExpenseRepository()
+        group_id = "507f1f77bcf86cd799439012"
+        after_id = str(ObjectId())
+        after_updated_at = datetime(2026, 2, 10, 12, 0, tzinfo=timezone.utc)
+        deleted = make_expense_doc()
+        deleted["is_deleted"] = True
+        mock_db, mock_collection, mock_cursor = self._mock_db(
+            [make_expense_doc(), deleted]
+        )
+
+        with patch(
+            "app.infrastructure.repositories.expense_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            result = await repo.get_changes(
+                group_id, after_updated_at, after_id, limit=50
+            )
+
+        assert [expense.is_deleted for expense in result] == [False, True]
+        query = mock_collection.find.call_args[0][0]
+        assert "is_deleted" not in query
+        assert query["group_id"] == group_id
+        assert query["$or"] == [
+            {"updated_at": {"$gt": after_updated_at}},
+            {"updated_at": after_updated_at, "_id": {"$gt": ObjectId(after_id)}},
+        ]
+        mock_cursor.sort.assert_called_once_with([("updated_at", 1), ("_id", 1)])
+        mock_cursor.limit.assert_called_once_with(50)
+
+    @pytest.mark.asyncio
+    async def test_get_changes_without_watermark_returns_active_expenses(self):
+        repo = MongoExpenseRepository()
+        mock_db, mock_collection, _ = self._mock_db([make_expense_doc()])
+
+        with patch(
+            "app.infrastructure.repositories.expense_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            result = await repo.get_changes("507f1f77bcf86cd799439012")
+
+        assert len(result) == 1
+        mock_collection.find.assert_called_once_with(
+            {"group_id": "507f1f77bcf86cd799439012", "is_deleted": False}
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_changes_raises_on_exception(self):
+        repo = MongoExpenseRepository()
+
+        mock_collection = MagicMock()
+        mock_collection.find.side_effect = Exception("DB error")
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.expense_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            with pytest.raises(Exception):
+                await repo.get_changes("507f1f77bcf86cd799439012")
+
+
+class TestMongoExpenseRepositoryCreateMany:
+    """Test create_many method."""
+
+    @pytest.mark.asyncio
+    async def test_create_many_inserts_unordered_and_sets_ids(self):
+        repo = MongoExpenseRepository()
+        entities = [make_expense_entity(), make_expense_entity()]
+
+        mock_collection = AsyncMock()
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.expense_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            errors = await repo.create_many(entities)
+
+        assert errors == {}
+        docs = mock_collection.insert_many.call_args[0][0]
+        assert mock_collection.insert_many.call_args.kwargs["ordered"] is False
+        assert [entity.id for entity in entities] == [str(doc["_id"]) for doc in docs]
+
+    @pytest.mark.asyncio
+    async def test_create_many_reports_failed_items(self):
+        repo = MongoExpenseRepository()
+        entities = [make_expense_entity(), make_expense_entity(), make_expense_entity()]
+
+        mock_collection = AsyncMock()
+        mock_collection.insert_many.side_effect = BulkWriteError(
+            {"writeErrors": [{"index": 1, "code": 11000, "errmsg": "duplicate key"}]}
+        )
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.expense_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            errors = await repo.create_many(entities)
+
+        assert errors == {1: "duplicate key"}
+        assert entities[0].id is not None
+        assert entities[1].id is None
+        assert entities[2].id is not None
+
+    @pytest.mark.asyncio
+    async def test_create_many_empty_list_skips_insert(self):
+        repo = MongoExpenseRepository()
+        mock_collection = AsyncMock()
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.expense_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            errors = await repo.create_many([])
+
+        assert errors == {}
+        mock_collection.insert_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_many_raises_on_exception(self):
+        repo = MongoExpenseRepository()
+        mock_collection = AsyncMock()
+        mock_collection.insert_many.side_effect = Exception("DB error")
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.expense_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            with pytest.raises(Exception):
+                await repo.create_many([make_expense_entity()])
+
+
 class TestMongoExpenseRepositoryUpdate:
     """Test update method."""
 
@@ -350,12 +653,8 @@ class TestMongoExpenseRepositoryUpdate:
         entity.id = expense_id
         doc = make_expense_doc(expense_id)
 
-        update_result = MagicMock()
-        update_result.matched_count = 1
-
         mock_collection = AsyncMock()
-        mock_collection.update_one = AsyncMock(return_value=update_result)
-        mock_collection.find_one = AsyncMock(return_value=doc)
+        mock_collection.find_one_and_update = AsyncMock(return_value=doc)
 
         mock_db = MagicMock()
         mock_db.__getitem__.return_value = mock_collection
@@ -367,6 +666,11 @@ class TestMongoExpenseRepositoryUpdate:
             result = await repo.update(expense_id, entity)
 
         assert result is not None
+        assert result.id == expense_id
+        mock_collection.find_one.assert_not_called()
+        call_args = mock_collection.find_one_and_update.call_args
+        assert call_args[0][0] == {"_id": ObjectId(expense_id), "is_deleted": False}
+        assert call_args[1]["return_document"] == ReturnDocument.AFTER
 
     @pytest.mark.asyncio
     async def test_update_not_found(self):
@@ -374,11 +678,8 @@ class TestMongoExpenseRepositoryUpdate:
         expense_id = str(ObjectId())
         entity = make_expense_entity()
 
-        update_result = MagicMock()
-        update_result.matched_count = 0
-
         mock_collection = AsyncMock()
-        mock_collection.update_one = AsyncMock(return_value=update_result)
+        mock_collection.find_one_and_update = AsyncMock(return_value=None)
 
         mock_db = MagicMock()
         mock_db.__getitem__.return_value = mock_collection
@@ -398,7 +699,9 @@ class TestMongoExpenseRepositoryUpdate:
         entity = make_expense_entity()
 
         mock_collection = AsyncMock()
-        mock_collection.update_one = AsyncMock(side_effect=Exception("DB error"))
+        mock_collection.find_one_and_update = AsyncMock(
+            side_effect=Exception("DB error")
+        )
 
         mock_db = MagicMock()
         mock_db.__getitem__.return_value = mock_collection
@@ -411,19 +714,137 @@ class TestMongoExpenseRepositoryUpdate:
                 await repo.update(expense_id, entity)
 
 
+class TestMongoExpenseRepositoryUpdateFields:
+    """Test update_fields method."""
+
+    @pytest.mark.asyncio
+    async def test_update_fields_sets_only_given_fields(self):
+        repo = MongoExpenseRepository()
+        expense_id = str(ObjectId())
+        doc = make_expense_doc(expense_id)
+
+        mock_collection = AsyncMock()
+        mock_collection.find_one_and_update = AsyncMock(return_value=doc)
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.expense_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            result = await repo.update_fields(expense_id, {"note": "taxi"})
+
+        assert result.id == expense_id
+        call_args = mock_collection.find_one_and_update.call_args
+        assert call_args[0][0] == {"_id": ObjectId(expense_id), "is_deleted": False}
+        update_set = call_args[0][1]["$set"]
+        assert set(update_set) == {"note", "updated_at"}
+        assert update_set["note"] == "taxi"
+        assert call_args[1]["return_document"] == ReturnDocument.AFTER
+
+    @pytest.mark.asyncio
+    async def test_update_fields_not_found(self):
+        repo = MongoExpenseRepository()
+
+        mock_collection = AsyncMock()
+        mock_collection.find_one_and_update = AsyncMock(return_value=None)
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.expense_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            result = await repo.update_fields(str(ObjectId()), {"note": "taxi"})
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_update_fields_raises_on_exception(self):
+        repo = MongoExpenseRepository()
+
+        mock_collection = AsyncMock()
+        mock_collection.find_one_and_update = AsyncMock(
+            side_effect=Exception("DB error")
+        )
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.expense_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            with pytest.raises(Exception):
+                await repo.update_fields(str(ObjectId()), {"note": "taxi"})
+
+
+class TestMongoExpenseRepositoryUpdateFieldsWithPrevious:
+    """Test update_fields_with_previous method."""
+
+    @pytest.mark.asyncio
+    async def test_returns_previous_and_updated_from_one_write(self):
+        repo = MongoExpenseRepository()
+        expense_id = str(ObjectId())
+        doc = make_expense_doc(expense_id)
+        previous_amount = doc["amount_cents"]
+
+        mock_collection = AsyncMock()
+        mock_collection.find_one_and_update = AsyncMock(return_value=doc)
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.expense_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            previous, updated = await repo.update_fields_with_previous(
+                expense_id, {"amount_cents": previous_amount + 1}
+            )
+
+        assert previous.amount_cents == previous_amount
+        assert updated.amount_cents == previous_amount + 1
+        assert previous.id == updated.id == expense_id
+        call_args = mock_collection.find_one_and_update.call_args
+        assert call_args[1]["return_document"] == ReturnDocument.BEFORE
+        mock_collection.find_one.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_not_found(self):
+        repo = MongoExpenseRepository()
+
+        mock_collection = AsyncMock()
+        mock_collection.find_one_and_update = AsyncMock(return_value=None)
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.expense_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            result = await repo.update_fields_with_previous(
+                str(ObjectId()), {"amount_cents": 100}
+            )
+
+        assert result is None
+
+
 class TestMongoExpenseRepositoryDelete:
     """Test delete (soft delete) method."""
 
     @pytest.mark.asyncio
     async def test_delete_success(self):
-        repo = MongoExpenseRepository()
+        summary_repo = AsyncMock(spec=IGroupSummaryRepository)
+        repo = MongoExpenseRepository(summary_repository=summary_repo)
         expense_id = str(ObjectId())
-
-        update_result = MagicMock()
-        update_result.matched_count = 1
+        doc = make_expense_doc(expense_id)
 
         mock_collection = AsyncMock()
-        mock_collection.update_one = AsyncMock(return_value=update_result)
+        mock_collection.find_one_and_update = AsyncMock(return_value=doc)
 
         mock_db = MagicMock()
         mock_db.__getitem__.return_value = mock_collection
@@ -435,17 +856,20 @@ class TestMongoExpenseRepositoryDelete:
             result = await repo.delete(expense_id)
 
         assert result is True
+        summary_repo.apply_change.assert_awaited_once()
+        group_id = summary_repo.apply_change.call_args[0][0]
+        changed = summary_repo.apply_change.call_args.kwargs["removed"]
+        assert group_id == changed.group_id
+        assert changed.id == expense_id
 
     @pytest.mark.asyncio
     async def test_delete_not_found(self):
-        repo = MongoExpenseRepository()
+        summary_repo = AsyncMock(spec=IGroupSummaryRepository)
+        repo = MongoExpenseRepository(summary_repository=summary_repo)
         expense_id = str(ObjectId())
 
-        update_result = MagicMock()
-        update_result.matched_count = 0
-
         mock_collection = AsyncMock()
-        mock_collection.update_one = AsyncMock(return_value=update_result)
+        mock_collection.find_one_and_update = AsyncMock(return_value=None)
 
         mock_db = MagicMock()
         mock_db.__getitem__.return_value = mock_collection
@@ -457,6 +881,7 @@ class TestMongoExpenseRepositoryDelete:
             result = await repo.delete(expense_id)
 
         assert result is False
+        summary_repo.apply_change.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_delete_raises_on_exception(self):
@@ -464,7 +889,7 @@ class TestMongoExpenseRepositoryDelete:
         expense_id = str(ObjectId())
 
         mock_collection = AsyncMock()
-        mock_collection.update_one = AsyncMock(side_effect=Exception("DB error"))
+        mock_collection.find_one_and_update = AsyncMock(side_effect=Exception("DB error"))
 
         mock_db = MagicMock()
         mock_db.__getitem__.return_value = mock_collection
@@ -486,7 +911,7 @@ class TestMongoExpenseRepositoryExists:
         expense_id = str(ObjectId())
 
         mock_collection = AsyncMock()
-        mock_collection.count_documents = AsyncMock(return_value=1)
+        mock_collection.find_one = AsyncMock(return_value={"_id": ObjectId(expense_id)})
 
         mock_db = MagicMock()
         mock_db.__getitem__.return_value = mock_collection
@@ -498,6 +923,9 @@ class TestMongoExpenseRepositoryExists:
             result = await repo.exists(expense_id)
 
         assert result is True
+        mock_collection.find_one.assert_called_once_with(
+            {"_id": ObjectId(expense_id), "is_deleted": False}, {"_id": 1}
+        )
 
     @pytest.mark.asyncio
     async def test_exists_false(self):
@@ -505,7 +933,7 @@ class TestMongoExpenseRepositoryExists:
         expense_id = str(ObjectId())
 
         mock_collection = AsyncMock()
-        mock_collection.count_documents = AsyncMock(return_value=0)
+        mock_collection.find_one = AsyncMock(return_value=None)
 
         mock_db = MagicMock()
         mock_db.__getitem__.return_value = mock_collection
@@ -524,7 +952,7 @@ class TestMongoExpenseRepositoryExists:
         expense_id = str(ObjectId())
 
         mock_collection = AsyncMock()
-        mock_collection.count_documents = AsyncMock(side_effect=Exception("DB error"))
+        mock_collection.find_one = AsyncMock(side_effect=Exception("DB error"))
 
         mock_db = MagicMock()
         mock_db.__getitem__.return_value = mock_collection
@@ -605,19 +1033,120 @@ class TestMongoExpenseRepositoryGetAmountsAndTypes:
                 await repo.get_amounts_and_types(group_id)
 
 
+class TestMongoExpenseRepositoryAggregateAmounts:
+    """Test aggregate_amounts method."""
+
+    def _patch_db(self, mock_collection):
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+        return patch(
+            "app.infrastructure.repositories.expense_repository.Database.get_db",
+            return_value=mock_db,
+        )
+
+    @pytest.mark.asyncio
+    async def test_aggregate_amounts_maps_group_rows(self):
+        repo = MongoExpenseRepository()
+        rows = [
+            {
+                "_id": "cash",
+                "total_cents": 3000,
+                "count": 2,
+                "average_cents": 1500.0,
+                "min_cents": 1000,
+                "max_cents": 2000,
+            }
+        ]
+        mock_collection = MagicMock()
+        mock_collection.aggregate.return_value = AsyncIter(rows)
+
+        with self._patch_db(mock_collection):
+            result = await repo.aggregate_amounts(
+                "507f1f77bcf86cd799439012", AnalyticsGroupBy.TYPE_EXPENSE
+            )
+
+        assert result == [
+            {
+                "key": "cash",
+                "total_cents": 3000,
+                "count": 2,
+                "average_cents": 1500.0,
+                "min_cents": 1000,
+                "max_cents": 2000,
+            }
+        ]
+        pipeline = mock_collection.aggregate.call_args[0][0]
+        assert pipeline[0] == {
+            "$match": {"group_id": "507f1f77bcf86cd799439012", "is_deleted": False}
+        }
+        assert pipeline[1]["$group"]["_id"] == "$type_expense"
+        assert pipeline[2] == {"$sort": {"_id": 1}}
+
+    @pytest.mark.asyncio
+    async def test_aggregate_amounts_by_month_with_date_range(self):
+        repo = MongoExpenseRepository()
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2026, 4, 1, tzinfo=timezone.utc)
+        mock_collection = MagicMock()
+        mock_collection.aggregate.return_value = AsyncIter([])
+
+        with self._patch_db(mock_collection):
+            result = await repo.aggregate_amounts(
+                "507f1f77bcf86cd799439012",
+                AnalyticsGroupBy.MONTH,
+                start_date=start,
+                end_date=end,
+            )
+
+        assert result == []
+        pipeline = mock_collection.aggregate.call_args[0][0]
+        assert pipeline[0]["$match"]["date"] == {"$gte": start, "$lt": end}
+        assert pipeline[1]["$group"]["_id"] == {
+            "$dateToString": {"format": "%Y-%m", "date": "$date"}
+        }
+
+    @pytest.mark.asyncio
+    async def test_aggregate_amounts_uses_iso_week_buckets(self):
+        repo = MongoExpenseRepository()
+        mock_collection = MagicMock()
+        mock_collection.aggregate.return_value = AsyncIter([])
+
+        with self._patch_db(mock_collection):
+            await repo.aggregate_amounts(
+                "507f1f77bcf86cd799439012",
+                AnalyticsGroupBy.WEEK,
+                start_date=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            )
+
+        pipeline = mock_collection.aggregate.call_args[0][0]
+        assert "$lt" not in pipeline[0]["$match"]["date"]
+        assert pipeline[1]["$group"]["_id"]["$dateToString"]["format"] == "%G-W%V"
+
+    @pytest.mark.asyncio
+    async def test_aggregate_amounts_raises_on_exception(self):
+        repo = MongoExpenseRepository()
+        mock_collection = MagicMock()
+        mock_collection.aggregate.side_effect = Exception("DB error")
+
+        with self._patch_db(mock_collection):
+            with pytest.raises(Exception):
+                await repo.aggregate_amounts(
+                    "507f1f77bcf86cd799439012", AnalyticsGroupBy.DAY
+                )
+
+
 class TestMongoExpenseRepositoryRestore:
     """Test restore method."""
 
     @pytest.mark.asyncio
     async def test_restore_success(self):
-        repo = MongoExpenseRepository()
+        summary_repo = AsyncMock(spec=IGroupSummaryRepository)
+        repo = MongoExpenseRepository(summary_repository=summary_repo)
         expense_id = str(ObjectId())
-
-        update_result = MagicMock()
-        update_result.matched_count = 1
+        doc = make_expense_doc(expense_id)
 
         mock_collection = AsyncMock()
-        mock_collection.update_one = AsyncMock(return_value=update_result)
+        mock_collection.find_one_and_update = AsyncMock(return_value=doc)
 
         mock_db = MagicMock()
         mock_db.__getitem__.return_value = mock_collection
@@ -629,17 +1158,20 @@ class TestMongoExpenseRepositoryRestore:
             result = await repo.restore(expense_id)
 
         assert result is True
+        summary_repo.apply_change.assert_awaited_once()
+        group_id = summary_repo.apply_change.call_args[0][0]
+        changed = summary_repo.apply_change.call_args.kwargs["added"]
+        assert group_id == changed.group_id
+        assert changed.id == expense_id
 
     @pytest.mark.asyncio
     async def test_restore_not_found(self):
-        repo = MongoExpenseRepository()
+        summary_repo = AsyncMock(spec=IGroupSummaryRepository)
+        repo = MongoExpenseRepository(summary_repository=summary_repo)
         expense_id = str(ObjectId())
 
-        update_result = MagicMock()
-        update_result.matched_count = 0
-
         mock_collection = AsyncMock()
-        mock_collection.update_one = AsyncMock(return_value=update_result)
+        mock_collection.find_one_and_update = AsyncMock(return_value=None)
 
         mock_db = MagicMock()
         mock_db.__getitem__.return_value = mock_collection
@@ -651,6 +1183,7 @@ class TestMongoExpenseRepositoryRestore:
             result = await repo.restore(expense_id)
 
         assert result is False
+        summary_repo.apply_change.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_restore_raises_on_exception(self):
@@ -658,7 +1191,7 @@ class TestMongoExpenseRepositoryRestore:
         expense_id = str(ObjectId())
 
         mock_collection = AsyncMock()
-        mock_collection.update_one = AsyncMock(side_effect=Exception("DB error"))
+        mock_collection.find_one_and_update = AsyncMock(side_effect=Exception("DB error"))
 
         mock_db = MagicMock()
         mock_db.__getitem__.return_value = mock_collection
@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from datetime import datetime, timezone
 from bson import ObjectId
+from pymongo import ReturnDocument
 from app.infrastructure.repositories.group_repository import MongoGroupRepository
 from app.domain.interfaces.group_repository_interface import IGroupRepository
 from app.domain.entities.group_entity import Group
@@ -179,6 +180,26 @@ class TestMongoGroupRepositoryGetById:
         # Assert
         assert result is None
 
+    async def test_concurrent_get_by_id_calls_share_one_query(self):
+        # Arrange
+        import asyncio
+
+        repo = MongoGroupRepository()
+        doc = make_group_doc()
+        mock_col = MagicMock()
+        mock_col.find_one = AsyncMock(return_value=doc)
+
+        with patch.object(repo, "_get_collection", return_value=mock_col):
+            # Act
+            results = await asyncio.gather(
+                *(repo.get_by_id(str(doc["_id"])) for _ in range(3))
+            )
+
+        # Assert
+        assert [group.id for group in results] == [str(doc["_id"])] * 3
+        assert results[0] is not results[1]
+        mock_col.find_one.assert_awaited_once()
+
     async def test_get_by_id_propagates_exception(self):
         # Arrange
         repo = MongoGroupRepository()
@@ -251,8 +272,8 @@ class TestMongoGroupRepositoryUpdate:
         entity = make_group_entity()
         doc = make_group_doc(entity.id)
         mock_col = MagicMock()
-        mock_col.update_one = AsyncMock(return_value=MagicMock(matched_count=1))
-        mock_col.find_one = AsyncMock(return_value=doc)
+        mock_col.find_one_and_update = AsyncMock(return_value=doc)
+        mock_col.find_one = AsyncMock()
 
         with patch.object(repo, "_get_collection", return_value=mock_col):
             # Act
@@ -260,14 +281,15 @@ class TestMongoGroupRepositoryUpdate:
 
         # Assert
         assert result is not None
-        mock_col.update_one.assert_called_once()
+        mock_col.find_one_and_update.assert_called_once()
+        mock_col.find_one.assert_not_called()
 
     async def test_update_not_found_returns_none(self):
         # Arrange
         repo = MongoGroupRepository()
         entity = make_group_entity()
         mock_col = MagicMock()
-        mock_col.update_one = AsyncMock(return_value=MagicMock(matched_count=0))
+        mock_col.find_one_and_update = AsyncMock(return_value=None)
 
         with patch.object(repo, "_get_collection", return_value=mock_col):
             # Act
@@ -281,7 +303,7 @@ class TestMongoGroupRepositoryUpdate:
         repo = MongoGroupRepository()
         entity = make_group_entity()
         mock_col = MagicMock()
-        mock_col.update_one = AsyncMock(side_effect=RuntimeError("DB error"))
+        mock_col.find_one_and_update = AsyncMock(side_effect=RuntimeError("DB error"))
 
         with patch.object(repo, "_get_collection", return_value=mock_col):
             # Act / Assert
@@ -289,6 +311,149 @@ class TestMongoGroupRepositoryUpdate:
                 await repo.update(entity.id, entity)
 
 
+class TestMongoGroupRepositoryUpdateFields:
+    async def test_update_fields_sets_only_given_fields(self):
+        # Arrange
+        repo = MongoGroupRepository()
+        group_id = str(ObjectId())
+        doc = make_group_doc(group_id)
+        mock_col = MagicMock()
+        mock_col.find_one_and_update = AsyncMock(return_value=doc)
+
+        with patch.object(repo, "_get_collection", return_value=mock_col):
+            # Act
+            result = await repo.update_fields(group_id, {"group_name": "Novo"})
+
+        # Assert
+        assert result.id == group_id
+        filter_doc, update_doc = mock_col.find_one_and_update.call_args[0]
+        assert filter_doc == {"_id": ObjectId(group_id), "is_deleted": False}
+        assert set(update_doc["$set"]) == {"group_name", "updated_at"}
+        assert (
+            mock_col.find_one_and_update.call_args[1]["return_document"]
+            == ReturnDocument.AFTER
+        )
+
+    async def test_update_fields_not_found_returns_none(self):
+        # Arrange
+        repo = MongoGroupRepository()
+        mock_col = MagicMock()
+        mock_col.find_one_and_update = AsyncMock(return_value=None)
+
+        with patch.object(repo, "_get_collection", return_value=mock_col):
+            # Act
+            result = await repo.update_fields(str(ObjectId()), {"group_name": "Novo"})
+
+        # Assert
+        assert result is None
+
+    async def test_update_fields_propagates_exception(self):
+        # Arrange
+        repo = MongoGroupRepository()
+        mock_col = MagicMock()
+        mock_col.find_one_and_update = AsyncMock(side_effect=RuntimeError("DB error"))
+
+        with patch.object(repo, "_get_collection", return_value=mock_col):
+            # Act / Assert
+            with pytest.raises(RuntimeError):
+                await repo.update_fields(str(ObjectId()), {"group_name": "Novo"})
+
+
+class TestMongoGroupRepositoryMembers:
+    async def test_add_member_uses_add_to_set_guarded_by_filter(self):
+        # Arrange
+        repo = MongoGroupRepository()
+        group_id = str(ObjectId())
+        mock_col = MagicMock()
+        mock_col.find_one_and_update = AsyncMock(return_value=make_group_doc(group_id))
+
+        with patch.object(repo, "_get_collection", return_value=mock_col):
+            # Act
+            result = await repo.add_member(group_id, "uid3")
+
+        # Assert
+        assert result.id == group_id
+        filter_doc, update_doc = mock_col.find_one_and_update.call_args[0]
+        assert filter_doc == {
+            "_id": ObjectId(group_id),
+            "is_deleted": False,
+            "user_ids": {"$ne": "uid3"},
+        }
+        assert update_doc["$addToSet"] == {"user_ids": "uid3"}
+        assert "updated_at" in update_doc["$set"]
+        assert (
+            mock_col.find_one_and_update.call_args[1]["return_document"]
+            == ReturnDocument.AFTER
+        )
+
+    async def test_add_member_returns_none_when_no_match(self):
+        # Arrange
+        repo = MongoGroupRepository()
+        mock_col = MagicMock()
+        mock_col.find_one_and_update = AsyncMock(return_value=None)
+
+        with patch.object(repo, "_get_collection", return_value=mock_col):
+            # Act
+            result = await repo.add_member(str(ObjectId()), "uid1")
+
+        # Assert
+        assert result is None
+
+    async def test_add_members_adds_each_in_one_update(self):
+        # Arrange
+        repo = MongoGroupRepository()
+        group_id = str(ObjectId())
+        mock_col = MagicMock()
+        mock_col.find_one_and_update = AsyncMock(return_value=make_group_doc(group_id))
+
+        with patch.object(repo, "_get_collection", return_value=mock_col):
+            # Act
+            result = await repo.add_members(group_id, ["uid3", "uid4"])
+
+        # Assert
+        assert result.id == group_id
+        mock_col.find_one_and_update.assert_called_once()
+        filter_doc, update_doc = mock_col.find_one_and_update.call_args[0]
+        assert filter_doc == {"_id": ObjectId(group_id), "is_deleted": False}
+        assert update_doc["$addToSet"] == {"user_ids": {"$each": ["uid3", "uid4"]}}
+
+    async def test_remove_member_uses_pull_guarded_by_filter(self):
+        # Arrange
+        repo = MongoGroupRepository()
+        group_id = str(ObjectId())
+        mock_col = MagicMock()
+        mock_col.find_one_and_update = AsyncMock(return_value=make_group_doc(group_id))
+
+        with patch.object(repo, "_get_collection", return_value=mock_col):
+            # Act
+            result = await repo.remove_member(group_id, "uid2")
+
+        # Assert
+        assert result.id == group_id
+        filter_doc, update_doc = mock_col.find_one_and_update.call_args[0]
+        assert filter_doc == {
+            "_id": ObjectId(group_id),
+            "is_deleted": False,
+            "user_ids": "uid2",
+        }
+        assert update_doc["$pull"] == {"user_ids": "uid2"}
+
+    async def test_member_updates_propagate_exception(self):
+        # Arrange
+        repo = MongoGroupRepository()
+        mock_col = MagicMock()
+        mock_col.find_one_and_update = AsyncMock(side_effect=RuntimeError("DB error"))
+
+        with patch.object(repo, "_get_collection", return_value=mock_col):
+            # Act / Assert
+            with pytest.raises(RuntimeError):
+                await repo.add_member(str(ObjectId()), "uid1")
+            with pytest.raises(RuntimeError):
+                await repo.add_members(str(ObjectId()), ["uid1"])
+            with pytest.raises(RuntimeError):
+                await repo.remove_member(str(ObjectId()), "uid1")
+
+
 class TestMongoGroupRepositoryDelete:
     async def test_delete_success_returns_true(self):
         # Arrange
@@ -328,12 +493,32 @@ class TestMongoGroupRepositoryDelete:
                 await repo.delete(str(ObjectId()))
 
 
+class TestMongoGroupRepositoryGetFields:
+    async def test_get_fields_returns_only_user_ids(self):
+        # Arrange
+        repo = MongoGroupRepository()
+        group_id = str(ObjectId())
+        mock_col = MagicMock()
+        mock_col.find_one = AsyncMock(return_value={"user_ids": ["u1", "u2"]})
+
+        with patch.object(repo, "_get_collection", return_value=mock_col):
+            # Act
+            result = await repo.get_fields(group_id, ["user_ids"])
+
+        # Assert
+        assert result == {"user_ids": ["u1", "u2"]}
+        mock_col.find_one.assert_called_once_with(
+            {"_id": ObjectId(group_id), "is_deleted": False},
+            {"user_ids": 1, "_id": 0},
+        )
+
+
 class TestMongoGroupRepositoryExists:
     async def test_exists_true(self):
         # Arrange
         repo = MongoGroupRepository()
         mock_col = MagicMock()
-        mock_col.count_documents = AsyncMock(return_value=1)
+        mock_col.find_one = AsyncMock(return_value={"_id": ObjectId()})
 
         with patch.object(repo, "_get_collection", return_value=mock_col):
             # Act
@@ -341,12 +526,13 @@ class TestMongoGroupRepositoryExists:
 
         # Assert
         assert result is True
+        assert mock_col.find_one.call_args[0][1] == {"_id": 1}
 
     async def test_exists_false(self):
         # Arrange
         repo = MongoGroupRepository()
         mock_col = MagicMock()
-        mock_col.count_documents = AsyncMock(return_value=0)
+        mock_col.find_one = AsyncMock(return_value=None)
 
         with patch.object(repo, "_get_collection", return_value=mock_col):
             # Act
@@ -359,7 +545,7 @@ class TestMongoGroupRepositoryExists:
         # Arrange
         repo = MongoGroupRepository()
         mock_col = MagicMock()
-        mock_col.count_documents = AsyncMock(side_effect=RuntimeError("DB error"))
+        mock_col.find_one = AsyncMock(side_effect=RuntimeError("DB error"))
 
         with patch.object(repo, "_get_collection", return_value=mock_col):
             # Act / Assert
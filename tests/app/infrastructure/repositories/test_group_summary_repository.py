@@ -0,0 +1,286 @@
+"""Tests for infrastructure/repositories/group_summary_repository.py"""
+
+import pytest
+from unittest.mock import MagicMock, AsyncMock, patch
+from datetime import datetime, timezone
+from app.infrastructure.repositories.group_summary_repository import (
+    MongoGroupSummaryRepository,
+)
+from app.domain.entities.expense_entity import Expense
+from app.domain.enums.expense_category_enum import ExpenseCategory
+from app.domain.enums.expense_type_enum import ExpenseType
+
+GROUP_ID = "507f1f77bcf86cd799439012"
+
+
+class AsyncIter:
+    """Helper to mock async iteration over aggregation cursors."""
+
+    def __init__(self, items):
+        self.items = items
+        self.index = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.index >= len(self.items):
+            raise StopAsyncIteration
+        item = self.items[self.index]
+        self.index += 1
+        return item
+
+
+def make_expense(**overrides):
+    data = {
+        "group_id": GROUP_ID,
+        "amount_cents": 5000,
+        "category": ExpenseCategory.SHOPPING,
+        "type_expense": ExpenseType.CASH,
+        "spent_by": "John Doe",
+        "date": datetime(2026, 2, 10, 12, 0, tzinfo=timezone.utc),
+    }
+    data.update(overrides)
+    return Expense(**data)
+
+
+def patch_db(collections):
+    mock_db = MagicMock()
+    mock_db.__getitem__.side_effect = lambda name: collections[name]
+    return patch(
+        "app.infrastructure.repositories.group_summary_repository.Database.get_db",
+        return_value=mock_db,
+    )
+
+
+class TestMongoGroupSummaryRepositoryApplyChange:
+    """Test apply_change method."""
+
+    @pytest.mark.asyncio
+    async def test_added_expense_increments_all_buckets(self):
+        repo = MongoGroupSummaryRepository()
+        summaries = AsyncMock()
+
+        with patch_db({"group_summaries": summaries}):
+            await repo.apply_change(GROUP_ID, added=make_expense())
+
+        query, update = summaries.update_one.call_args[0]
+        assert query == {"_id": GROUP_ID}
+        assert update["$inc"] == {
+            "total_cents": 5000,
+            "count": 1,
+            "by_category.shopping.total_cents": 5000,
+            "by_category.shopping.count": 1,
+            "by_type.cash.total_cents": 5000,
+            "by_type.cash.count": 1,
+            "by_month.2026-02.total_cents": 5000,
+            "by_month.2026-02.count": 1,
+        }
+        assert summaries.update_one.call_args.kwargs["upsert"] is True
+
+    @pytest.mark.asyncio
+    async def test_update_merges_old_and_new_deltas(self):
+        repo = MongoGroupSummaryRepository()
+        summaries = AsyncMock()
+        old = make_expense()
+        new = make_expense(amount_cents=7000, type_expense=ExpenseType.PIX_TRANSFER)
+
+        with patch_db({"group_summaries": summaries}):
+            await repo.apply_change(GROUP_ID, added=new, removed=old)
+
+        update = summaries.update_one.call_args[0][1]
+        assert update["$inc"] == {
+            "total_cents": 2000,
+            "by_category.shopping.total_cents": 2000,
+            "by_type.cash.total_cents": -5000,
+            "by_type.cash.count": -1,
+            "by_type.pix_transfer.total_cents": 7000,
+            "by_type.pix_transfer.count": 1,
+            "by_month.2026-02.total_cents": 2000,
+        }
+
+    @pytest.mark.asyncio
+    async def test_no_effective_change_skips_write(self):
+        repo = MongoGroupSummaryRepository()
+        summaries = AsyncMock()
+        expense = make_expense()
+
+        with patch_db({"group_summaries": summaries}):
+            await repo.apply_change(GROUP_ID, added=expense, removed=expense)
+
+        summaries.update_one.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_errors_are_logged_not_raised(self):
+        repo = MongoGroupSummaryRepository()
+        summaries = AsyncMock()
+        summaries.update_one.side_effect = Exception("DB error")
+
+        with patch_db({"group_summaries": summaries}):
+            await repo.apply_change(GROUP_ID, removed=make_expense())
+
+
+class TestMongoGroupSummaryRepositoryApplyAdditions:
+    """Test apply_additions method."""
+
+    @pytest.mark.asyncio
+    async def test_one_update_per_group_with_merged_deltas(self):
+        repo = MongoGroupSummaryRepository()
+        summaries = AsyncMock()
+        other_group = "507f1f77bcf86cd799439099"
+        expenses = [
+            make_expense(),
+            make_expense(amount_cents=2500),
+            make_expense(group_id=other_group, category=ExpenseCategory.ENTERTAINMENT),
+        ]
+
+        with patch_db({"group_summaries": summaries}):
+            await repo.apply_additions(expenses)
+
+        summaries.bulk_write.assert_called_once()
+        operations = summaries.bulk_write.call_args[0][0]
+        assert summaries.bulk_write.call_args.kwargs["ordered"] is False
+        assert [op._filter for op in operations] == [
+            {"_id": GROUP_ID},
+            {"_id": other_group},
+        ]
+        first = operations[0]._doc["$inc"]
+        assert first["total_cents"] == 7500
+        assert first["count"] == 2
+        assert first["by_category.shopping.count"] == 2
+        assert operations[1]._doc["$inc"]["by_category.entertainment.total_cents"] == 5000
+        assert all(op._upsert for op in operations)
+
+    @pytest.mark.asyncio
+    async def test_empty_list_skips_write(self):
+        repo = MongoGroupSummaryRepository()
+        summaries = AsyncMock()
+
+        with patch_db({"group_summaries": summaries}):
+            await repo.apply_additions([])
+
+        summaries.bulk_write.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_errors_are_logged_not_raised(self):
+        repo = MongoGroupSummaryRepository()
+        summaries = AsyncMock()
+        summaries.bulk_write.side_effect = Exception("DB error")
+
+        with patch_db({"group_summaries": summaries}):
+            await repo.apply_additions([make_expense()])
+
+
+class TestMongoGroupSummaryRepositoryGetByGroupId:
+    """Test get_by_group_id method."""
+
+    @pytest.mark.asyncio
+    async def test_get_by_group_id_found(self):
+        repo = MongoGroupSummaryRepository()
+        summaries = AsyncMock()
+        summaries.find_one.return_value = {
+            "_id": GROUP_ID,
+            "total_cents": 5000,
+            "count": 1,
+            "by_category": {"food": {"total_cents": 5000, "count": 1}},
+        }
+
+        with patch_db({"group_summaries": summaries}):
+            result = await repo.get_by_group_id(GROUP_ID)
+
+        assert result.group_id == GROUP_ID
+        assert result.by_category["food"].total_cents == 5000
+        summaries.find_one.assert_called_once_with({"_id": GROUP_ID})
+
+    @pytest.mark.asyncio
+    async def test_get_by_group_id_not_found(self):
+        repo = MongoGroupSummaryRepository()
+        summaries = AsyncMock()
+        summaries.find_one.return_value = None
+
+        with patch_db({"group_summaries": summaries}):
+            result = await repo.get_by_group_id(GROUP_ID)
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_get_by_group_id_raises_on_exception(self):
+        repo = MongoGroupSummaryRepository()
+        summaries = AsyncMock()
+        summaries.find_one.side_effect = Exception("DB error")
+
+        with patch_db({"group_summaries": summaries}):
+            with pytest.raises(Exception):
+                await repo.get_by_group_id(GROUP_ID)
+
+
+class TestMongoGroupSummaryRepositoryRebuild:
+    """Test rebuild method."""
+
+    def _row(self, group_id, category, type_expense, month, total_cents, count):
+        return {
+            "_id": {
+                "group_id": group_id,
+                "category": category,
+                "type_expense": type_expense,
+                "month": month,
+            },
+            "total_cents": total_cents,
+            "count": count,
+        }
+
+    @pytest.mark.asyncio
+    async def test_rebuild_all_replaces_summaries_and_drops_stale(self):
+        repo = MongoGroupSummaryRepository()
+        expenses = MagicMock()
+        expenses.aggregate.return_value = AsyncIter(
+            [
+                self._row("g1", "food", "cash", "2026-01", 1000, 1),
+                self._row("g1", "food", "credit_card", "2026-02", 3000, 2),
+                self._row("g2", "travel", "cash", "2026-02", 500, 1),
+            ]
+        )
+        summaries = AsyncMock()
+
+        with patch_db({"expenses": expenses, "group_summaries": summaries}):
+            result = await repo.rebuild()
+
+        assert result == 2
+        pipeline = expenses.aggregate.call_args[0][0]
+        assert pipeline[0] == {"$match": {"is_deleted": False}}
+        written = {
+            call.args[0]["_id"]: call.args[1]
+            for call in summaries.replace_one.call_args_list
+        }
+        assert written["g1"]["total_cents"] == 4000
+        assert written["g1"]["count"] == 3
+        assert written["g1"]["by_category"] == {"food": {"total_cents": 4000, "count": 3}}
+        assert written["g1"]["by_month"]["2026-02"] == {"total_cents": 3000, "count": 2}
+        assert written["g2"]["by_type"] == {"cash": {"total_cents": 500, "count": 1}}
+        summaries.delete_many.assert_called_once_with({"_id": {"$nin": ["g1", "g2"]}})
+
+    @pytest.mark.asyncio
+    async def test_rebuild_group_without_expenses_deletes_summary(self):
+        repo = MongoGroupSummaryRepository()
+        expenses = MagicMock()
+        expenses.aggregate.return_value = AsyncIter([])
+        summaries = AsyncMock()
+
+        with patch_db({"expenses": expenses, "group_summaries": summaries}):
+            result = await repo.rebuild(GROUP_ID)
+
+        assert result == 0
+        pipeline = expenses.aggregate.call_args[0][0]
+        assert pipeline[0] == {"$match": {"is_deleted": False, "group_id": GROUP_ID}}
+        summaries.replace_one.assert_not_called()
+        summaries.delete_one.assert_called_once_with({"_id": GROUP_ID})
+
+    @pytest.mark.asyncio
+    async def test_rebuild_raises_on_exception(self):
+        repo = MongoGroupSummaryRepository()
+        expenses = MagicMock()
+        expenses.aggregate.side_effect = Exception("DB error")
+
+        with patch_db({"expenses": expenses, "group_summaries": AsyncMock()}):
+            with pytest.raises(Exception):
+                await repo.rebuild()
@@ -0,0 +1,470 @@
+"""Tests for infrastructure/cache"""
+
+import asyncio
+import pytest
+from app.infrastructure.cache import cache_metrics, memory_cache
+from app.infrastructure.cache.cache_factory import build_cache
+from app.infrastructure.cache.memory_cache import InMemoryCache
+from app.infrastructure.cache.redis_cache import (
+    CacheBackendError,
+    RedisCache,
+    encode_command,
+    read_reply,
+)
+from app.infrastructure.metrics import MetricsRegistry
+from app.infrastructure.settings import Settings
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRedisServer:
+    """
+    Local server answering the few Redis commands the cache sends
+    (AUTH, SELECT, GET, SET ... PX, DEL) from a dict. Commands on the keys
+    of `slow_keys` are answered after 0.2 s.
+    """
+
+    def __init__(self, password=None):
+        self.password = password
+        self.data = {}
+        self.ttls_ms = {}
+        self.commands = []
+        self.reply_delay = 0.0
+        self.slow_keys = set()
+        self.connections = 0
+        self._server = None
+        self.port = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    @property
+    def url(self):
+        return f"redis://127.0.0.1:{self.port}/0"
+
+    async def _serve(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                command = await read_reply(reader)
+                delay = self.reply_delay
+                if len(command) > 1 and command[1].decode() in self.slow_keys:
+                    delay = max(delay, 0.2)
+                if delay:
+                    await asyncio.sleep(delay)
+                writer.write(self._reply(command))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _reply(self, command):
+        name, *args = [part.decode() for part in command]
+        self.commands.append([name, *args])
+        if name == "AUTH":
+            if args[-1] != self.password:
+                return b"-WRONGPASS invalid password\r\n"
+            return b"+OK\r\n"
+        if name == "SELECT":
+            return b"+OK\r\n"
+        if name == "GET":
+            value = self.data.get(args[0])
+            if value is None:
+                return b"$-1\r\n"
+            return b"$%d\r\n%s\r\n" % (len(value.encode()), value.encode())
+        if name == "SET":
+            self.data[args[0]] = args[1]
+            self.ttls_ms[args[0]] = int(args[3])
+            return b"+OK\r\n"
+        if name == "DEL":
+            removed = sum(self.data.pop(key, None) is not None for key in args)
+            return b":%d\r\n" % removed
+        return b"-ERR unknown command\r\n"
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Record into a fresh registry instead of the application one."""
+    registry = MetricsRegistry()
+    monkeypatch.setattr(
+        cache_metrics,
+        "CACHE_LOOKUPS",
+        registry.counter("cache_lookups_total", "", ("backend", "namespace", "result")),
+    )
+    monkeypatch.setattr(
+        memory_cache,
+        "CACHE_EVICTIONS",
+        registry.counter("cache_evictions_total", "", ("namespace",)),
+    )
+    return registry
+
+
+@pytest.fixture
+async def redis_server():
+    server = await FakeRedisServer().start()
+    yield server
+    await server.stop()
+
+
+class TestInMemoryCache:
+    """Test InMemoryCache"""
+
+    async def test_set_then_get_returns_value(self):
+        # Arrange
+        cache = InMemoryCache(default_ttl_seconds=60, max_entries=10)
+
+        # Act
+        await cache.set("users", "id:1", "alice")
+
+        # Assert
+        assert await cache.get("users", "id:1") == "alice"
+        assert await cache.get("users", "id:2") is None
+
+    async def test_namespaces_do_not_collide(self):
+        # Arrange
+        cache = InMemoryCache(default_ttl_seconds=60, max_entries=10)
+
+        # Act
+        await cache.set("users", "id:1", "alice")
+        await cache.set("groups", "id:1", "trip")
+
+        # Assert
+        assert await cache.get("users", "id:1") == "alice"
+        assert await cache.get("groups", "id:1") == "trip"
+
+    async def test_entry_expires_after_default_ttl(self):
+        # Arrange
+        clock = FakeClock()
+        cache = InMemoryCache(default_ttl_seconds=60, max_entries=10, clock=clock)
+        await cache.set("users", "id:1", "alice")
+
+        # Act
+        clock.now = 59.0
+        before_expiry = await cache.get("users", "id:1")
+        clock.now = 60.0
+        after_expiry = await cache.get("users", "id:1")
+
+        # Assert
+        assert before_expiry == "alice"
+        assert after_expiry is None
+        assert len(cache) == 0
+
+    async def test_per_key_ttl_overrides_default(self):
+        # Arrange
+        clock = FakeClock()
+        cache = InMemoryCache(default_ttl_seconds=60, max_entries=10, clock=clock)
+        await cache.set("users", "id:1", "alice", ttl_seconds=5)
+
+        # Act
+        clock.now = 5.0
+
+        # Assert
+        assert await cache.get("users", "id:1") is None
+
+    async def test_least_recently_used_entry_is_evicted(self, registry):
+        # Arrange
+        cache = InMemoryCache(default_ttl_seconds=60, max_entries=2)
+        await cache.set("users", "id:1", "alice")
+        await cache.set("users", "id:2", "bob")
+        await cache.get("users", "id:1")
+
+        # Act
+        await cache.set("groups", "id:3", "trip")
+
+        # Assert
+        assert await cache.get("users", "id:2") is None
+        assert await cache.get("users", "id:1") == "alice"
+        assert await cache.get("groups", "id:3") == "trip"
+        assert 'cache_evictions_total{namespace="users"} 1' in registry.render()
+
+    async def test_delete_drops_entries(self):
+        # Arrange
+        cache = InMemoryCache(default_ttl_seconds=60, max_entries=10)
+        await cache.set("users", "id:1", "alice")
+        await cache.set("users", "id:2", "bob")
+
+        # Act
+        await cache.delete("users", "id:1", "id:2", "id:3")
+
+        # Assert
+        assert len(cache) == 0
+
+    async def test_hits_and_misses_are_counted(self, registry):
+        # Arrange
+        cache = InMemoryCache(default_ttl_seconds=60, max_entries=10)
+        await cache.set("users", "id:1", "alice")
+
+        # Act
+        await cache.get("users", "id:1")
+        await cache.get("users", "id:1")
+        await cache.get("users", "id:2")
+        text = registry.render()
+
+        # Assert
+        assert (
+            'cache_lookups_total{backend="memory",namespace="users",result="hit"} 2'
+            in text
+        )
+        assert (
+            'cache_lookups_total{backend="memory",namespace="users",result="miss"} 1'
+            in text
+        )
+
+
+class TestRespProtocol:
+    """Test the RESP encoding and reply parsing."""
+
+    def test_encode_command(self):
+        # Act / Assert
+        assert encode_command("SET", "k", 5) == (
+            b"*3\r\n$3\r\nSET\r\n$1\r\nk\r\n$1\r\n5\r\n"
+        )
+
+    async def test_read_reply_types(self):
+        # Arrange
+        reader = asyncio.StreamReader()
+        reader.feed_data(
+            b"+OK\r\n:42\r\n$5\r\nhello\r\n$-1\r\n*2\r\n$1\r\na\r\n:1\r\n"
+        )
+
+        # Act / Assert
+        assert await read_reply(reader) == b"OK"
+        assert await read_reply(reader) == 42
+        assert await read_reply(reader) == b"hello"
+        assert await read_reply(reader) is None
+        assert await read_reply(reader) == [b"a", 1]
+
+    async def test_read_reply_raises_on_error(self):
+        # Arrange
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"-ERR wrong type\r\n")
+
+        # Act / Assert
+        with pytest.raises(CacheBackendError, match="ERR wrong type"):
+            await read_reply(reader)
+
+
+class TestRedisCache:
+    """Test RedisCache against a local fake server."""
+
+    async def test_set_then_get_returns_value(self, redis_server, registry):
+        # Arrange
+        cache = RedisCache(redis_server.url, "finito", default_ttl_seconds=60)
+
+        # Act
+        await cache.set("users", "id:1", "alice")
+        hit = await cache.get("users", "id:1")
+        miss = await cache.get("users", "id:2")
+        await cache.close()
+
+        # Assert
+        assert hit == "alice"
+        assert miss is None
+        assert redis_server.data == {"finito:users:id:1": "alice"}
+        assert (
+            'cache_lookups_total{backend="redis",namespace="users",result="hit"} 1'
+            in registry.render()
+        )
+
+    async def test_ttl_is_sent_in_milliseconds(self, redis_server):
+        # Arrange
+        cache = RedisCache(redis_server.url, "finito", default_ttl_seconds=60)
+
+        # Act
+        await cache.set("users", "id:1", "alice")
+        await cache.set("users", "id:2", "bob", ttl_seconds=1.5)
+        await cache.close()
+
+        # Assert
+        assert redis_server.ttls_ms == {
+            "finito:users:id:1": 60_000,
+            "finito:users:id:2": 1_500,
+        }
+
+    async def test_replicas_share_entries_and_invalidations(self, redis_server):
+        # Arrange
+        replica_a = RedisCache(redis_server.url, "finito", default_ttl_seconds=60)
+        replica_b = RedisCache(redis_server.url, "finito", default_ttl_seconds=60)
+
+        # Act
+        await replica_a.set("groups", "id:1", "trip")
+        shared = await replica_b.get("groups", "id:1")
+        await replica_b.delete("groups", "id:1")
+        after_delete = await replica_a.get("groups", "id:1")
+        await replica_a.close()
+        await replica_b.close()
+
+        # Assert
+        assert shared == "trip"
+        assert after_delete is None
+
+    async def test_authenticates_and_selects_database_from_url(self):
+        # Arrange
+        server = await FakeRedisServer(password="s3cret").start()
+        cache = RedisCache(
+            f"redis://:s3cret@127.0.0.1:{server.port}/2", "finito", 60
+        )
+
+        try:
+            # Act
+            await cache.set("users", "id:1", "alice")
+            await cache.close()
+        finally:
+            await server.stop()
+
+        # Assert
+        assert server.commands[0] == ["AUTH", "s3cret"]
+        assert server.commands[1] == ["SELECT", "2"]
+
+    async def test_cancelled_command_does_not_leak_its_reply(self, redis_server):
+        # Arrange
+        cache = RedisCache(redis_server.url, "finito", default_ttl_seconds=60)
+        await cache.set("users", "id:A", "alice")
+        await cache.set("users", "id:B", "bob")
+        redis_server.reply_delay = 0.1
+        pending = asyncio.create_task(cache.get("users", "id:A"))
+        await asyncio.sleep(0.02)
+
+        # Act
+        pending.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await pending
+        redis_server.reply_delay = 0.0
+        value = await cache.get("users", "id:B")
+        await cache.close()
+
+        # Assert
+        assert value == "bob"
+
+    async def test_slow_reply_does_not_block_other_commands(self, redis_server):
+        # Arrange
+        cache = RedisCache(redis_server.url, "finito", default_ttl_seconds=60)
+        await cache.set("users", "id:B", "bob")
+        redis_server.slow_keys.add("finito:users:id:A")
+        slow = asyncio.create_task(cache.get("users", "id:A"))
+        await asyncio.sleep(0.02)
+
+        # Act
+        started = asyncio.get_running_loop().time()
+        value = await cache.get("users", "id:B")
+        elapsed = asyncio.get_running_loop().time() - started
+        await slow
+        await cache.close()
+
+        # Assert
+        assert value == "bob"
+        assert elapsed < 0.1
+        assert redis_server.connections == 2
+
+    async def test_connections_are_reused(self, redis_server):
+        # Arrange
+        cache = RedisCache(redis_server.url, "finito", default_ttl_seconds=60)
+
+        # Act
+        for index in range(5):
+            await cache.set("users", f"id:{index}", "alice")
+        await cache.close()
+
+        # Assert
+        assert redis_server.connections == 1
+
+    async def test_timeout_covers_waiting_for_a_connection(self, redis_server):
+        # Arrange
+        cache = RedisCache(
+            redis_server.url,
+            "finito",
+            default_ttl_seconds=60,
+            timeout_seconds=0.05,
+            max_connections=1,
+        )
+        await cache.execute("GET", "finito:users:id:A")
+        # Another request holds the only connection
+        await cache._slots.acquire()
+
+        # Act / Assert
+        started = asyncio.get_running_loop().time()
+        with pytest.raises(CacheBackendError, match="unavailable"):
+            await cache.execute("GET", "finito:users:id:B")
+        assert asyncio.get_running_loop().time() - started < 0.15
+        cache._slots.release()
+        await cache.close()
+
+    async def test_unreachable_server_degrades_to_misses(self, redis_server):
+        # Arrange
+        url = redis_server.url
+        await redis_server.stop()
+        cache = RedisCache(url, "finito", default_ttl_seconds=60, timeout_seconds=0.2)
+
+        # Act / Assert — nothing raises
+        await cache.set("users", "id:1", "alice")
+        assert await cache.get("users", "id:1") is None
+        await cache.delete("users", "id:1")
+
+    async def test_execute_raises_on_unreachable_server(self, redis_server):
+        # Arrange
+        url = redis_server.url
+        await redis_server.stop()
+        cache = RedisCache(url, "finito", default_ttl_seconds=60, timeout_seconds=0.2)
+
+        # Act / Assert
+        with pytest.raises(CacheBackendError, match="unavailable"):
+            await cache.execute("GET", "key")
+
+
+class TestBuildCache:
+    """Test the cache built from the settings."""
+
+    def test_caching_disabled_by_default(self):
+        # Act / Assert
+        assert build_cache(Settings()) is None
+
+    def test_memory_backend_for_a_single_worker(self):
+        # Act / Assert
+        cache = build_cache(Settings(cache_backend="memory", web_concurrency=1))
+        assert isinstance(cache, InMemoryCache)
+
+    def test_memory_backend_refused_with_several_workers(self):
+        # Act / Assert
+        with pytest.raises(ValueError, match="per process"):
+            build_cache(Settings(cache_backend="memory", web_concurrency=4))
+
+    def test_memory_backend_with_several_workers_when_accepted(self):
+        # Act
+        cache = build_cache(
+            Settings(
+                cache_backend="memory",
+                web_concurrency=4,
+                cache_memory_multi_worker=True,
+            )
+        )
+
+        # Assert
+        assert isinstance(cache, InMemoryCache)
+
+    def test_redis_backend(self):
+        # Act / Assert
+        assert isinstance(build_cache(Settings(cache_backend="redis")), RedisCache)
+
+    def test_none_disables_caching(self):
+        # Act / Assert
+        assert build_cache(Settings(cache_backend="none")) is None
+
+    def test_unknown_backend_raises(self):
+        # Act / Assert
+        with pytest.raises(ValueError, match="Unknown cache backend"):
+            build_cache(Settings(cache_backend="memcached"))
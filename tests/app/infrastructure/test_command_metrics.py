@@ -0,0 +1,153 @@
+"""Tests for infrastructure/database/command_metrics.py"""
+
+import pytest
+from unittest.mock import MagicMock
+from app.infrastructure.database import command_metrics
+from app.infrastructure.database.command_metrics import CommandMetricsListener
+from app.infrastructure.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Record into a fresh registry instead of the application one."""
+    registry = MetricsRegistry()
+    labels = ("collection", "command")
+    monkeypatch.setattr(
+        command_metrics,
+        "COMMAND_DURATION",
+        registry.histogram("mongodb_command_duration_seconds", "", labels),
+    )
+    monkeypatch.setattr(
+        command_metrics,
+        "COMMAND_DOCUMENTS",
+        registry.counter("mongodb_command_documents_total", "", labels),
+    )
+    monkeypatch.setattr(
+        command_metrics,
+        "COMMAND_FAILURES",
+        registry.counter("mongodb_command_failures_total", "", labels),
+    )
+    return registry
+
+
+def _started(command_name, command, request_id=1):
+    return MagicMock(
+        command_name=command_name,
+        command=command,
+        connection_id=("localhost", 27017),
+        request_id=request_id,
+    )
+
+
+def _finished(command_name, reply=None, request_id=1, duration_micros=2500):
+    return MagicMock(
+        command_name=command_name,
+        reply=reply or {},
+        connection_id=("localhost", 27017),
+        request_id=request_id,
+        duration_micros=duration_micros,
+    )
+
+
+class TestCommandMetricsListener:
+    """Test MongoDB commands are recorded per collection and command."""
+
+    def test_find_records_latency_and_returned_documents(self, registry):
+        # Arrange
+        listener = CommandMetricsListener()
+
+        # Act
+        listener.started(_started("find", {"find": "expenses", "filter": {}}))
+        listener.succeeded(
+            _finished("find", {"cursor": {"firstBatch": [{}, {}, {}], "id": 0}})
+        )
+        text = registry.render()
+
+        # Assert
+        assert (
+            'mongodb_command_duration_seconds_count{collection="expenses",command="find"} 1'
+            in text
+        )
+        assert (
+            'mongodb_command_duration_seconds_sum{collection="expenses",command="find"} 0.0025'
+            in text
+        )
+        assert (
+            'mongodb_command_documents_total{collection="expenses",command="find"} 3'
+            in text
+        )
+
+    def test_get_more_uses_collection_field(self, registry):
+        # Arrange
+        listener = CommandMetricsListener()
+
+        # Act
+        listener.started(
+            _started("getMore", {"getMore": 123, "collection": "expenses"})
+        )
+        listener.succeeded(_finished("getMore", {"cursor": {"nextBatch": [{}, {}]}}))
+
+        # Assert
+        assert (
+            'mongodb_command_documents_total{collection="expenses",command="getMore"} 2'
+            in registry.render()
+        )
+
+    def test_writes_record_affected_documents(self, registry):
+        # Arrange
+        listener = CommandMetricsListener()
+
+        # Act
+        listener.started(_started("insert", {"insert": "expenses"}))
+        listener.succeeded(_finished("insert", {"n": 5, "ok": 1}))
+
+        # Assert
+        assert (
+            'mongodb_command_documents_total{collection="expenses",command="insert"} 5'
+            in registry.render()
+        )
+
+    def test_find_and_modify_counts_returned_document(self, registry):
+        # Arrange
+        listener = CommandMetricsListener()
+
+        # Act
+        listener.started(_started("findAndModify", {"findAndModify": "groups"}))
+        listener.succeeded(_finished("findAndModify", {"value": {"_id": 1}}))
+
+        # Assert
+        assert (
+            'mongodb_command_documents_total{collection="groups",command="findAndModify"} 1'
+            in registry.render()
+        )
+
+    def test_failed_command_is_counted(self, registry):
+        # Arrange
+        listener = CommandMetricsListener()
+
+        # Act
+        listener.started(_started("update", {"update": "users"}))
+        listener.failed(_finished("update"))
+        text = registry.render()
+
+        # Assert
+        assert (
+            'mongodb_command_failures_total{collection="users",command="update"} 1'
+            in text
+        )
+        assert (
+            'mongodb_command_duration_seconds_count{collection="users",command="update"} 1'
+            in text
+        )
+
+    def test_commands_without_collection_are_ignored(self, registry):
+        # Arrange
+        listener = CommandMetricsListener()
+
+        # Act
+        listener.started(_started("ping", {"ping": 1}))
+        listener.succeeded(_finished("ping", {"ok": 1}))
+
+        # Assert
+        assert "ping" not in registry.render()
+        assert listener._pending == {}
@@ -0,0 +1,203 @@
+"""Tests for infrastructure/dependencies/container.py"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from app.infrastructure.dependencies.container import (
+    AppContainer,
+    build_email_transport,
+    get_container,
+    reset_container,
+)
+from app.infrastructure.dependencies.expense_dependencies import ExpenseDependencies
+from app.infrastructure.dependencies.group_dependencies import GroupDependencies
+from app.infrastructure.dependencies.user_dependencies import UserDependencies
+from app.infrastructure.dependencies.email_verification_dependencies import (
+    EmailVerificationDependencies,
+)
+from app.infrastructure.dependencies.auth_controller_dependencies import (
+    AuthDependencies,
+)
+from app.domain.interfaces.user_repository_interface import IUserRepository
+from app.controllers.expense_controller import ExpenseController
+
+
+class TestAppContainer:
+    """Test AppContainer and its singleton accessor"""
+
+    def test_get_container_returns_singleton(self):
+        # Arrange
+        reset_container()
+
+        # Act
+        first = get_container()
+
+        # Assert
+        assert get_container() is first
+        reset_container()
+        assert get_container() is not first
+
+    def test_controllers_share_repositories(self):
+        # Arrange / Act
+        container = AppContainer()
+
+        # Assert
+        assert container.expense_controller.repository is container.expense_repository
+        assert container.expense_controller.user_repository is container.user_repository
+        assert container.group_controller.user_repository is container.user_repository
+        assert container.auth_controller.repository is container.user_repository
+
+    def test_user_and_group_reads_go_through_the_cache(self):
+        # Arrange
+        from app.infrastructure.cache.memory_cache import InMemoryCache
+        from app.infrastructure.repositories.cached_repositories import (
+            CachedGroupRepository,
+            CachedUserRepository,
+        )
+
+        # Act
+        with patch(
+            "app.infrastructure.dependencies.container.get_cache",
+            return_value=InMemoryCache(default_ttl_seconds=60, max_entries=10),
+        ):
+            container = AppContainer()
+
+        # Assert
+        assert isinstance(container.user_repository, CachedUserRepository)
+        assert isinstance(container.group_repository, CachedGroupRepository)
+
+    def test_repositories_are_not_wrapped_when_caching_is_disabled(self):
+        # Arrange
+        from app.infrastructure.repositories.user_repository import (
+            MongoUserRepository,
+        )
+
+        # Act
+        with patch(
+            "app.infrastructure.dependencies.container.get_cache", return_value=None
+        ):
+            container = AppContainer()
+
+        # Assert
+        assert isinstance(container.user_repository, MongoUserRepository)
+
+    def test_email_service_queues_into_the_dispatched_outbox(self):
+        # Arrange / Act
+        container = AppContainer()
+
+        # Assert
+        assert container.email_service.outbox_repository is container.outbox_repository
+        assert container.email_dispatcher.repository is container.outbox_repository
+        assert container.email_service.notify == container.email_dispatcher.wake
+        assert container.email_dispatcher.running is False
+
+    def test_build_email_transport_follows_settings(self):
+        # Arrange
+        from app.infrastructure.settings import Settings
+        from app.services.fake_email_transport import FakeEmailTransport
+        from app.services.resend_email_transport import ResendEmailTransport
+
+        # Act / Assert
+        assert isinstance(
+            build_email_transport(Settings(email_transport="fake")), FakeEmailTransport
+        )
+        assert isinstance(
+            build_email_transport(Settings(email_transport="resend")),
+            ResendEmailTransport,
+        )
+        with pytest.raises(ValueError, match="Unknown email transport"):
+            build_email_transport(Settings(email_transport="smtp"))
+
+    def test_owns_only_its_own_instances(self):
+        # Arrange
+        container = AppContainer()
+
+        # Act / Assert
+        assert container.owns(container.user_repository, container.membership_cache)
+        assert not container.owns(container.user_repository, MagicMock())
+        assert container.owns()
+
+    def test_email_api_key_is_set_once_per_container(self):
+        # Arrange
+        with patch("app.services.resend_email_transport.resend") as mock_resend:
+            mock_resend.api_key = None
+            container = AppContainer()
+            mock_resend.api_key = "changed"
+
+            # Act
+            for _ in range(3):
+                UserDependencies.get_controller(
+                    repository=container.user_repository,
+                    verification_repository=container.verification_repository,
+                    email_service=container.email_service,
+                )
+
+        # Assert
+        assert mock_resend.api_key == "changed"
+
+
+class TestProvidersUseSharedInstances:
+    """Test the dependency providers hand out shared instances"""
+
+    def test_expense_providers_return_shared_controller(self):
+        # Arrange
+        container = get_container()
+
+        # Act
+        controller = ExpenseDependencies.get_controller(
+            repository=ExpenseDependencies.get_repository(
+                ExpenseDependencies.get_summary_repository()
+            ),
+            group_repository=ExpenseDependencies.get_group_repository(),
+            user_repository=ExpenseDependencies.get_user_repository(),
+            membership_cache=ExpenseDependencies.get_membership_cache(),
+            summary_repository=ExpenseDependencies.get_summary_repository(),
+        )
+
+        # Assert
+        assert controller is container.expense_controller
+
+    def test_overridden_dependency_gets_fresh_controller(self):
+        # Arrange
+        container = get_container()
+        mock_user_repo = MagicMock(spec=IUserRepository)
+
+        # Act
+        controller = ExpenseDependencies.get_controller(
+            repository=container.expense_repository,
+            group_repository=container.group_repository,
+            user_repository=mock_user_repo,
+            membership_cache=container.membership_cache,
+            summary_repository=container.summary_repository,
+        )
+
+        # Assert
+        assert isinstance(controller, ExpenseController)
+        assert controller is not container.expense_controller
+        assert controller.user_repository is mock_user_repo
+
+    def test_other_providers_return_shared_controllers(self):
+        # Arrange
+        container = get_container()
+
+        # Act / Assert
+        assert (
+            GroupDependencies.get_controller(
+                GroupDependencies.get_group_repository(),
+                GroupDependencies.get_user_repository(),
+                GroupDependencies.get_membership_cache(),
+            )
+            is container.group_controller
+        )
+        assert (
+            EmailVerificationDependencies.get_controller(
+                EmailVerificationDependencies.get_user_repository(),
+                EmailVerificationDependencies.get_verification_repository(),
+                EmailVerificationDependencies.get_email_service(),
+            )
+            is container.email_verification_controller
+        )
+        assert (
+            AuthDependencies.get_controller(AuthDependencies.get_repository())
+            is container.auth_controller
+        )
@@ -126,6 +126,9 @@ class TestDatabaseConnect:
             with patch(
                 "app.infrastructure.database.database.AsyncIOMotorClient",
                 return_value=mock_client,
+            ), patch(
+                "app.infrastructure.database.database.ensure_indexes",
+                new=AsyncMock(),
             ):
                 # Act
                 await Database.connect()
@@ -136,6 +139,163 @@ class TestDatabaseConnect:
             Database._client = original_client
             Database._db = original_db
 
+    async def test_connect_registers_metrics_listeners(self):
+        # Arrange
+        original_client = Database._client
+        original_db = Database._db
+
+        from unittest.mock import MagicMock, AsyncMock, patch
+        from app.infrastructure.database.command_metrics import (
+            CommandMetricsListener,
+        )
+        from app.infrastructure.database.pool_metrics import PoolMetricsListener
+
+        mock_client = MagicMock()
+        mock_client.admin.command = AsyncMock(return_value=True)
+
+        try:
+            with patch(
+                "app.infrastructure.database.database.AsyncIOMotorClient",
+                return_value=mock_client,
+            ) as mock_client_class, patch(
+                "app.infrastructure.database.database.ensure_indexes",
+                new=AsyncMock(),
+            ):
+                # Act
+                await Database.connect()
+
+                # Assert
+                command_listener, pool_listener = mock_client_class.call_args.kwargs[
+                    "event_listeners"
+                ]
+                assert isinstance(command_listener, CommandMetricsListener)
+                assert isinstance(pool_listener, PoolMetricsListener)
+        finally:
+            Database._client = original_client
+            Database._db = original_db
+
+    async def test_connect_applies_declared_indexes(self):
+        # Arrange
+        original_client = Database._client
+        original_db = Database._db
+
+        from unittest.mock import MagicMock, AsyncMock, patch
+
+        mock_client = MagicMock()
+        mock_client.admin.command = AsyncMock(return_value=True)
+        mock_db = MagicMock()
+        mock_client.__getitem__ = MagicMock(return_value=mock_db)
+
+        try:
+            with patch(
+                "app.infrastructure.database.database.AsyncIOMotorClient",
+                return_value=mock_client,
+            ), patch(
+                "app.infrastructure.database.database.ensure_indexes",
+                new=AsyncMock(),
+            ) as mock_ensure:
+                # Act
+                await Database.connect()
+
+                # Assert
+                mock_ensure.assert_awaited_once_with(mock_db)
+        finally:
+            Database._client = original_client
+            Database._db = original_db
+
+    async def test_connect_skips_indexes_when_disabled(self):
+        # Arrange
+        original_client = Database._client
+        original_db = Database._db
+
+        from unittest.mock import MagicMock, AsyncMock, patch
+
+        mock_client = MagicMock()
+        mock_client.admin.command = AsyncMock(return_value=True)
+
+        try:
+            with patch(
+                "app.infrastructure.database.database.AsyncIOMotorClient",
+                return_value=mock_client,
+            ), patch(
+                "app.infrastructure.database.database.ensure_indexes",
+                new=AsyncMock(),
+            ) as mock_ensure:
+                # Act
+                await Database.connect(apply_indexes=False)
+
+                # Assert
+                mock_ensure.assert_not_awaited()
+        finally:
+            Database._client = original_client
+            Database._db = original_db
+
+    async def test_connect_verifies_unique_indexes_when_not_ensuring(self):
+        # Arrange
+        original_client = Database._client
+        original_db = Database._db
+
+        from unittest.mock import MagicMock, AsyncMock, patch
+        from app.infrastructure.settings import Settings
+
+        mock_client = MagicMock()
+        mock_client.admin.command = AsyncMock(return_value=True)
+        mock_db = MagicMock()
+        mock_client.__getitem__ = MagicMock(return_value=mock_db)
+
+        try:
+            with patch(
+                "app.infrastructure.database.database.AsyncIOMotorClient",
+                return_value=mock_client,
+            ), patch(
+                "app.infrastructure.database.database.get_settings",
+                return_value=Settings(mongodb_ensure_indexes=False),
+            ), patch(
+                "app.infrastructure.database.database.ensure_indexes",
+                new=AsyncMock(),
+            ) as mock_ensure, patch(
+                "app.infrastructure.database.database.verify_unique_indexes",
+                new=AsyncMock(side_effect=RuntimeError("missing")),
+            ) as mock_verify:
+                # Act / Assert
+                with pytest.raises(RuntimeError, match="missing"):
+                    await Database.connect()
+
+                mock_ensure.assert_not_awaited()
+                mock_verify.assert_awaited_once_with(mock_db)
+        finally:
+            Database._client = original_client
+            Database._db = original_db
+
+    async def test_connect_prewarms_min_pool_size_connections(self):
+        # Arrange
+        original_client = Database._client
+        original_db = Database._db
+
+        from unittest.mock import MagicMock, AsyncMock, patch
+        from app.infrastructure.settings import Settings
+
+        mock_client = MagicMock()
+        mock_client.admin.command = AsyncMock(return_value=True)
+
+        try:
+            with patch(
+                "app.infrastructure.database.database.AsyncIOMotorClient",
+                return_value=mock_client,
+            ), patch(
+                "app.infrastructure.database.database.get_settings",
+                return_value=Settings(mongodb_min_pool_size=5),
+            ):
+                # Act
+                await Database.connect(apply_indexes=False)
+
+                # Assert
+                # One connectivity ping plus one per pre-warmed connection
+                assert mock_client.admin.command.await_count == 6
+        finally:
+            Database._client = original_client
+            Database._db = original_db
+
     async def test_connect_raises_when_ping_fails(self):
         # Arrange
         original_client = Database._client
@@ -189,3 +349,48 @@ class TestDatabaseConnect:
             await Database.disconnect()
         finally:
             Database._client = original_client
+
+
+class TestClientOptions:
+    """Test the Motor client options built from the settings."""
+
+    def test_pool_settings_are_passed_to_the_driver(self):
+        # Arrange
+        from app.infrastructure.database.database import client_options
+        from app.infrastructure.settings import Settings
+
+        settings = Settings(
+            mongodb_max_pool_size=50,
+            mongodb_min_pool_size=10,
+            mongodb_max_idle_time_ms=60_000,
+            mongodb_wait_queue_timeout_ms=2_000,
+            mongodb_server_selection_timeout_ms=5_000,
+            mongodb_compressors="zstd,zlib",
+            mongodb_app_name="finito-api",
+        )
+
+        # Act
+        options = client_options(settings)
+
+        # Assert
+        assert options["maxPoolSize"] == 50
+        assert options["minPoolSize"] == 10
+        assert options["maxIdleTimeMS"] == 60_000
+        assert options["waitQueueTimeoutMS"] == 2_000
+        assert options["serverSelectionTimeoutMS"] == 5_000
+        assert options["compressors"] == "zstd,zlib"
+        assert options["appname"] == "finito-api"
+
+    def test_unset_options_keep_driver_defaults(self):
+        # Arrange
+        from app.infrastructure.database.database import client_options
+        from app.infrastructure.settings import Settings
+
+        # Act
+        options = client_options(Settings())
+
+        # Assert
+        assert "maxIdleTimeMS" not in options
+        assert "waitQueueTimeoutMS" not in options
+        assert "compressors" not in options
+        assert options["appname"] == Settings().app_name
@@ -0,0 +1,145 @@
+"""Tests for infrastructure/dataloader.py"""
+
+import asyncio
+import pytest
+from app.infrastructure import dataloader
+from app.infrastructure.dataloader import DataLoader
+from app.infrastructure.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Record into a fresh registry instead of the application one."""
+    registry = MetricsRegistry()
+    monkeypatch.setattr(
+        dataloader, "LOADS", registry.counter("loads_total", "", ("loader",))
+    )
+    monkeypatch.setattr(
+        dataloader, "COALESCED", registry.counter("coalesced_total", "", ("loader",))
+    )
+    monkeypatch.setattr(
+        dataloader,
+        "BATCH_SIZE",
+        registry.histogram("batch_size", "", ("loader",), buckets=(1, 2, 5)),
+    )
+    return registry
+
+
+class RecordingBatch:
+    """Batch function returning key * 10 and recording the batches it got."""
+
+    def __init__(self, delay=0.0, error=None):
+        self.batches = []
+        self.delay = delay
+        self.error = error
+
+    async def __call__(self, keys):
+        self.batches.append(sorted(keys))
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return {key: key * 10 for key in keys if key != 0}
+
+
+class TestDataLoader:
+    """Test DataLoader"""
+
+    async def test_concurrent_loads_of_one_key_share_a_query(self, registry):
+        # Arrange
+        batch = RecordingBatch()
+        loader = DataLoader(batch, "test")
+
+        # Act
+        results = await asyncio.gather(*(loader.load(1) for _ in range(5)))
+
+        # Assert
+        assert results == [10] * 5
+        assert batch.batches == [[1]]
+        text = registry.render()
+        assert 'loads_total{loader="test"} 5' in text
+        assert 'coalesced_total{loader="test"} 4' in text
+
+    async def test_distinct_keys_in_one_tick_are_batched(self, registry):
+        # Arrange
+        batch = RecordingBatch()
+        loader = DataLoader(batch, "test")
+
+        # Act
+        results = await asyncio.gather(loader.load(1), loader.load(2), loader.load(3))
+
+        # Assert
+        assert results == [10, 20, 30]
+        assert batch.batches == [[1, 2, 3]]
+        assert 'batch_size_count{loader="test"} 1' in registry.render()
+
+    async def test_missing_keys_load_as_none(self, registry):
+        # Arrange
+        loader = DataLoader(RecordingBatch(), "test")
+
+        # Act / Assert
+        assert await loader.load(0) is None
+
+    async def test_loads_join_a_batch_already_in_flight(self, registry):
+        # Arrange
+        batch = RecordingBatch(delay=0.01)
+        loader = DataLoader(batch, "test")
+        first = asyncio.ensure_future(loader.load(1))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        # Act
+        second = await loader.load(1)
+
+        # Assert
+        assert await first == second == 10
+        assert batch.batches == [[1]]
+
+    async def test_results_are_not_kept_after_the_batch(self, registry):
+        # Arrange
+        batch = RecordingBatch()
+        loader = DataLoader(batch, "test")
+
+        # Act
+        await loader.load(1)
+        await loader.load(1)
+
+        # Assert
+        assert batch.batches == [[1], [1]]
+
+    async def test_batches_are_split_at_max_batch_size(self, registry):
+        # Arrange
+        batch = RecordingBatch()
+        loader = DataLoader(batch, "test", max_batch_size=2)
+
+        # Act
+        results = await asyncio.gather(*(loader.load(key) for key in (1, 2, 3)))
+
+        # Assert
+        assert results == [10, 20, 30]
+        assert batch.batches == [[1, 2], [3]]
+
+    async def test_batch_error_reaches_every_caller(self, registry):
+        # Arrange
+        loader = DataLoader(RecordingBatch(error=RuntimeError("DB error")), "test")
+
+        # Act
+        results = await asyncio.gather(
+            loader.load(1), loader.load(2), return_exceptions=True
+        )
+
+        # Assert
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def test_cancelled_caller_does_not_cancel_the_others(self, registry):
+        # Arrange
+        loader = DataLoader(RecordingBatch(delay=0.01), "test")
+        cancelled = asyncio.ensure_future(loader.load(1))
+        survivor = asyncio.ensure_future(loader.load(1))
+        await asyncio.sleep(0)
+
+        # Act
+        cancelled.cancel()
+
+        # Assert
+        assert await survivor == 10
+        assert cancelled.cancelled()
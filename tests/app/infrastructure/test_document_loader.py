@@ -0,0 +1,91 @@
+"""Tests for infrastructure/database/document_loader.py"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from bson import ObjectId
+from app.infrastructure.database.document_loader import document_loader
+
+
+class AsyncIter:
+    """Helper to create async iterables for mocking MongoDB cursors."""
+
+    def __init__(self, items):
+        self.items = list(items)
+        self.index = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.index >= len(self.items):
+            raise StopAsyncIteration
+        item = self.items[self.index]
+        self.index += 1
+        return item
+
+
+class TestDocumentLoader:
+    """Test document_loader"""
+
+    async def test_single_key_uses_find_one(self):
+        # Arrange
+        oid = ObjectId()
+        collection = MagicMock()
+        collection.find_one = AsyncMock(return_value={"_id": oid, "name": "Trip"})
+        loader = document_loader(
+            lambda: collection, "_id", {"is_deleted": False}, "test"
+        )
+
+        # Act
+        doc = await loader.load(oid)
+
+        # Assert
+        assert doc["name"] == "Trip"
+        collection.find_one.assert_awaited_once_with(
+            {"_id": oid, "is_deleted": False}
+        )
+        collection.find.assert_not_called()
+
+    async def test_concurrent_keys_use_one_in_query(self):
+        # Arrange
+        first, second, missing = ObjectId(), ObjectId(), ObjectId()
+        collection = MagicMock()
+        collection.find.return_value = AsyncIter(
+            [{"_id": second, "name": "B"}, {"_id": first, "name": "A"}]
+        )
+        loader = document_loader(
+            lambda: collection, "_id", {"is_deleted": False}, "test"
+        )
+
+        # Act
+        docs = await asyncio.gather(
+            loader.load(first), loader.load(second), loader.load(missing)
+        )
+
+        # Assert
+        assert [doc and doc["name"] for doc in docs] == ["A", "B", None]
+        collection.find.assert_called_once_with(
+            {"_id": {"$in": [first, second, missing]}, "is_deleted": False}
+        )
+
+    async def test_first_document_wins_for_duplicate_values(self):
+        # Arrange
+        collection = MagicMock()
+        collection.find.return_value = AsyncIter(
+            [
+                {"email": "a@example.com", "name": "first"},
+                {"email": "a@example.com", "name": "second"},
+            ]
+        )
+        loader = document_loader(
+            lambda: collection, "email", {"is_active": True}, "test"
+        )
+
+        # Act
+        docs = await asyncio.gather(
+            loader.load("a@example.com"), loader.load("b@example.com")
+        )
+
+        # Assert
+        assert docs[0]["name"] == "first"
+        assert docs[1] is None
@@ -0,0 +1,244 @@
+"""Tests for infrastructure/database/indexes.py"""
+
+import pytest
+from unittest.mock import MagicMock, AsyncMock, patch
+from pymongo import IndexModel
+from app.infrastructure.database.indexes import (
+    MissingUniqueIndexError,
+    get_index_registry,
+    ensure_indexes,
+    diff_indexes,
+    verify_unique_indexes,
+)
+
+
+def make_mock_db(collections):
+    mock_db = MagicMock()
+    mock_db.__getitem__.side_effect = lambda name: collections[name]
+    return mock_db
+
+
+def make_index_collections():
+    """Collections of the registry with indexes built and nothing to prepare."""
+    collections = {name: MagicMock() for name in get_index_registry()}
+    for collection in collections.values():
+        collection.create_indexes = AsyncMock(return_value=["idx"])
+        collection.index_information = AsyncMock(
+            return_value={"user_id_active_unique": {}}
+        )
+    return collections
+
+
+class TestIndexRegistry:
+    """Test get_index_registry."""
+
+    def test_registry_covers_all_repository_collections(self):
+        registry = get_index_registry()
+        assert set(registry) == {
+            "expenses",
+            "users",
+            "groups",
+            "email_verification_tokens",
+            "email_outbox",
+            "email_verification_resends",
+        }
+
+    def test_registry_values_are_index_models(self):
+        for indexes in get_index_registry().values():
+            assert indexes
+            assert all(isinstance(index, IndexModel) for index in indexes)
+
+    def test_expense_index_is_partial_on_active_rows(self):
+        document = get_index_registry()["expenses"][0].document
+        assert list(document["key"]) == ["group_id", "date", "_id"]
+        assert document["partialFilterExpression"] == {"is_deleted": False}
+
+    def test_expense_changes_index_covers_tombstones(self):
+        indexes = {
+            index.document["name"]: index.document
+            for index in get_index_registry()["expenses"]
+        }
+        document = indexes["group_id_updated_at"]
+        assert list(document["key"]) == ["group_id", "updated_at", "_id"]
+        assert "partialFilterExpression" not in document
+
+
+class TestEnsureIndexes:
+    """Test ensure_indexes."""
+
+    @pytest.mark.asyncio
+    async def test_creates_declared_indexes_per_collection(self):
+        # Arrange
+        registry = get_index_registry()
+        collections = make_index_collections()
+
+        # Act
+        await ensure_indexes(make_mock_db(collections))
+
+        # Assert
+        for name, collection in collections.items():
+            collection.create_indexes.assert_awaited_once_with(registry[name])
+
+    @pytest.mark.asyncio
+    async def test_failure_on_one_collection_does_not_stop_others(self):
+        # Arrange
+        collections = make_index_collections()
+        collections["groups"].create_indexes.side_effect = Exception("conflict")
+
+        # Act
+        await ensure_indexes(make_mock_db(collections))
+
+        # Assert
+        collections["users"].create_indexes.assert_awaited_once()
+        collections["expenses"].create_indexes.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failure_on_unique_indexes_stops_startup(self):
+        # Arrange
+        collections = make_index_collections()
+        collections["users"].create_indexes.side_effect = Exception(
+            "E11000 duplicate key error"
+        )
+
+        # Act / Assert
+        with pytest.raises(MissingUniqueIndexError, match="users.email_unique"):
+            await ensure_indexes(make_mock_db(collections))
+        collections["groups"].create_indexes.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_prepares_collections_before_building_indexes(self):
+        # Arrange
+        calls = []
+        collections = make_index_collections()
+        tokens = collections["email_verification_tokens"]
+        tokens.index_information.side_effect = lambda: calls.append("prepare") or {}
+        tokens.create_indexes.side_effect = lambda indexes: calls.append("build") or []
+
+        # Act
+        with patch(
+            "app.infrastructure.repositories.email_verification_repository."
+            "MongoEmailVerificationRepository.retire_duplicate_active_tokens",
+            new=AsyncMock(return_value=2),
+        ) as retire:
+            await ensure_indexes(make_mock_db(collections))
+
+        # Assert
+        retire.assert_awaited_once_with(tokens)
+        assert calls == ["prepare", "build"]
+
+
+class TestVerifyUniqueIndexes:
+    """Test verify_unique_indexes."""
+
+    @pytest.mark.asyncio
+    async def test_raises_when_a_unique_index_is_missing(self):
+        # Arrange
+        registry = {
+            "users": [
+                IndexModel([("email", 1)], name="email"),
+                IndexModel([("email", 1)], name="email_unique", unique=True),
+            ]
+        }
+        collection = MagicMock()
+        collection.index_information = AsyncMock(
+            return_value={
+                "_id_": {"key": [("_id", 1)]},
+                "email": {"key": [("email", 1)]},
+            }
+        )
+
+        # Act / Assert
+        with patch(
+            "app.infrastructure.database.indexes.get_index_registry",
+            return_value=registry,
+        ):
+            with pytest.raises(MissingUniqueIndexError, match="users.email_unique"):
+                await verify_unique_indexes(make_mock_db({"users": collection}))
+
+    @pytest.mark.asyncio
+    async def test_other_missing_indexes_are_tolerated(self):
+        # Arrange
+        registry = {
+            "users": [
+                IndexModel([("email", 1)], name="email"),
+                IndexModel([("email", 1)], name="email_unique", unique=True),
+            ]
+        }
+        collection = MagicMock()
+        collection.index_information = AsyncMock(
+            return_value={
+                "_id_": {"key": [("_id", 1)]},
+                "email_unique": {"key": [("email", 1)], "unique": True},
+            }
+        )
+
+        # Act / Assert — nothing raises
+        with patch(
+            "app.infrastructure.database.indexes.get_index_registry",
+            return_value=registry,
+        ):
+            await verify_unique_indexes(make_mock_db({"users": collection}))
+
+
+class TestDiffIndexes:
+    """Test diff_indexes."""
+
+    @pytest.mark.asyncio
+    async def test_reports_missing_changed_and_extra(self):
+        # Arrange
+        registry = {
+            "expenses": [
+                IndexModel([("a", 1)], name="a_1"),
+                IndexModel(
+                    [("b", 1)], name="b_1", partialFilterExpression={"x": True}
+                ),
+                IndexModel([("c", 1)], name="c_1"),
+            ]
+        }
+        collection = MagicMock()
+        collection.index_information = AsyncMock(
+            return_value={
+                "_id_": {"key": [("_id", 1)]},
+                "a_1": {"key": [("a", 1)]},
+                "b_1": {"key": [("b", 1)]},
+                "legacy": {"key": [("z", 1)]},
+            }
+        )
+
+        # Act
+        with patch(
+            "app.infrastructure.database.indexes.get_index_registry",
+            return_value=registry,
+        ):
+            result = await diff_indexes(make_mock_db({"expenses": collection}))
+
+        # Assert
+        assert result["expenses"] == {
+            "missing": ["c_1"],
+            "changed": ["b_1"],
+            "extra": ["legacy"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_up_to_date_collection_has_empty_diff(self):
+        # Arrange
+        registry = {
+            "users": [IndexModel([("email", 1)], name="email", unique=True)]
+        }
+        collection = MagicMock()
+        collection.index_information = AsyncMock(
+            return_value={
+                "_id_": {"key": [("_id", 1)]},
+                "email": {"key": [("email", 1)], "unique": True},
+            }
+        )
+
+        # Act
+        with patch(
+            "app.infrastructure.database.indexes.get_index_registry",
+            return_value=registry,
+        ):
+            result = await diff_indexes(make_mock_db({"users": collection}))
+
+        # Assert
+        assert result["users"] == {"missing": [], "changed": [], "extra": []}
@@ -1,8 +1,20 @@
 """Tests for infrastructure/logger.py"""
 
 import pytest
+import json
 import logging
-from app.infrastructure.logger import get_logger
+import queue
+import sys
+from unittest.mock import patch
+from app.infrastructure.logger import (
+    JsonFormatter,
+    RateLimitFilter,
+    TextFormatter,
+    _DeferredQueueHandler,
+    get_logger,
+    shutdown_logging,
+)
+from app.infrastructure.settings import Settings
 
 
 class TestLoggerSetup:
@@ -102,3 +114,203 @@ class TestLoggerHandlerSetup:
 
         # Assert
         assert log1 is log2
+
+
+def _record(msg="Retrieved %s expenses", args=(3,), level=logging.INFO):
+    return logging.LogRecord("test", level, __file__, 1, msg, args, None)
+
+
+class TestRateLimitFilter:
+    """Test the per-template rate limit of noisy log lines."""
+
+    def test_drops_records_over_the_limit_within_a_second(self):
+        """Test only max_per_second records of one template pass per window."""
+        # Arrange
+        rate_filter = RateLimitFilter(max_per_second=2)
+
+        # Act
+        passed = [rate_filter.filter(_record(args=(i,))) for i in range(5)]
+
+        # Assert
+        assert passed == [True, True, False, False, False]
+
+    def test_templates_are_limited_independently(self):
+        """Test a noisy template does not suppress a different message."""
+        # Arrange
+        rate_filter = RateLimitFilter(max_per_second=1)
+        rate_filter.filter(_record())
+
+        # Act
+        result = rate_filter.filter(_record(msg="Created expense with ID: %s"))
+
+        # Assert
+        assert result is True
+        assert rate_filter.filter(_record()) is False
+
+    def test_warnings_are_never_dropped(self):
+        """Test records at WARNING and above always pass."""
+        # Arrange
+        rate_filter = RateLimitFilter(max_per_second=1)
+
+        # Act
+        passed = [
+            rate_filter.filter(_record(level=logging.ERROR)) for _ in range(3)
+        ]
+
+        # Assert
+        assert passed == [True, True, True]
+
+    def test_next_window_reports_suppressed_count(self):
+        """Test the first record of a new window carries the dropped count."""
+        # Arrange
+        rate_filter = RateLimitFilter(max_per_second=1)
+        with patch("app.infrastructure.logger.time.monotonic", return_value=100.0):
+            rate_filter.filter(_record())
+            rate_filter.filter(_record())
+            rate_filter.filter(_record())
+        record = _record()
+
+        # Act
+        with patch("app.infrastructure.logger.time.monotonic", return_value=101.0):
+            result = rate_filter.filter(record)
+
+        # Assert
+        assert result is True
+        assert record.suppressed == 2
+
+
+class TestFormatters:
+    """Test the text and JSON output formats."""
+
+    def test_text_formatter_formats_lazy_arguments(self):
+        """Test %-style arguments are applied when the record is formatted."""
+        # Act
+        line = TextFormatter().format(_record())
+
+        # Assert
+        assert line.startswith("[INFO]: Retrieved 3 expenses - ")
+
+    def test_text_formatter_notes_suppressed_records(self):
+        """Test the suppressed count is appended to the line."""
+        # Arrange
+        record = _record()
+        record.suppressed = 7
+
+        # Act
+        line = TextFormatter().format(record)
+
+        # Assert
+        assert line.endswith("(7 similar suppressed)")
+
+    def test_json_formatter_outputs_structured_record(self):
+        """Test one JSON object with level, logger and message is produced."""
+        # Arrange
+        record = _record()
+        record.suppressed = 4
+
+        # Act
+        payload = json.loads(JsonFormatter().format(record))
+
+        # Assert
+        assert payload["level"] == "INFO"
+        assert payload["logger"] == "test"
+        assert payload["message"] == "Retrieved 3 expenses"
+        assert payload["suppressed"] == 4
+        assert "timestamp" in payload
+
+    def test_json_formatter_includes_exception(self):
+        """Test exception tracebacks are kept in the JSON payload."""
+        # Arrange
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord(
+                "test", logging.ERROR, __file__, 1, "failed", (), sys.exc_info()
+            )
+
+        # Act
+        payload = json.loads(JsonFormatter().format(record))
+
+        # Assert
+        assert "ValueError: boom" in payload["exception"]
+
+
+class TestLoggingQueue:
+    """Test records are written by the background listener."""
+
+    def test_records_are_written_by_listener_thread(self, capsys):
+        """Test a record reaches stdout once the listener is flushed."""
+        # Arrange
+        log = logging.getLogger("test_logger_queue_output_q1")
+        log.propagate = False
+        get_logger(log.name)
+        shutdown_logging()
+
+        # Act
+        log.info("Queued %s message", "lazy")
+        shutdown_logging()
+
+        # Assert
+        assert "[INFO]: Queued lazy message" in capsys.readouterr().out
+
+    def test_handler_does_not_format_on_calling_thread(self):
+        """Test the queued record keeps its template and arguments."""
+        # Arrange
+        handler = _DeferredQueueHandler(queue.SimpleQueue())
+        record = _record()
+
+        # Act
+        prepared = handler.prepare(record)
+
+        # Assert
+        assert prepared.msg == "Retrieved %s expenses"
+        assert prepared.args == (3,)
+
+    def test_logging_after_shutdown_restarts_listener(self, capsys):
+        """Test records logged after shutdown_logging are still written."""
+        # Arrange
+        log = logging.getLogger("test_logger_queue_restart_q2")
+        log.propagate = False
+        get_logger(log.name)
+        shutdown_logging()
+
+        # Act
+        log.warning("After shutdown")
+        shutdown_logging()
+
+        # Assert
+        assert "After shutdown" in capsys.readouterr().out
+
+
+class TestLoggerSettings:
+    """Test the logger honours the logging settings."""
+
+    def test_level_and_rate_limit_come_from_settings(self):
+        """Test log_level and per-logger rate limits are applied."""
+        # Arrange
+        name = "test_logger_settings_s1"
+        logging.getLogger(name).propagate = False
+        settings = Settings(log_level="warning", log_rate_limits={name: 5})
+
+        # Act
+        with patch("app.infrastructure.logger.get_settings", return_value=settings):
+            log = get_logger(name)
+
+        # Assert
+        assert log.level == logging.WARNING
+        [rate_filter] = log.filters
+        assert rate_filter.max_per_second == 5
+
+    def test_rate_limit_can_be_disabled(self):
+        """Test a limit of 0 adds no filter."""
+        # Arrange
+        name = "test_logger_settings_s2"
+        logging.getLogger(name).propagate = False
+        settings = Settings(log_rate_limit_per_second=0)
+
+        # Act
+        with patch("app.infrastructure.logger.get_settings", return_value=settings):
+            log = get_logger(name)
+
+        # Assert
+        assert log.filters == []
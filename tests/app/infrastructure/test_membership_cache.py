@@ -0,0 +1,140 @@
+"""Tests for infrastructure/membership_cache.py"""
+
+from app.infrastructure.membership_cache import (
+    InMemoryMembershipCache,
+    get_membership_cache,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestInMemoryMembershipCache:
+    """Test InMemoryMembershipCache"""
+
+    def test_get_unknown_group_returns_none(self):
+        # Arrange
+        cache = InMemoryMembershipCache(ttl_seconds=60, max_entries=10)
+
+        # Act / Assert
+        assert cache.get("group-1") is None
+
+    def test_set_then_get_returns_members(self):
+        # Arrange
+        cache = InMemoryMembershipCache(ttl_seconds=60, max_entries=10)
+
+        # Act
+        cache.set("group-1", ["user-1", "user-2"])
+
+        # Assert
+        assert cache.get("group-1") == frozenset({"user-1", "user-2"})
+
+    def test_entry_expires_after_ttl(self):
+        # Arrange
+        clock = FakeClock()
+        cache = InMemoryMembershipCache(ttl_seconds=60, max_entries=10, clock=clock)
+        cache.set("group-1", ["user-1"])
+
+        # Act
+        clock.now = 59.0
+        before_expiry = cache.get("group-1")
+        clock.now = 60.0
+        after_expiry = cache.get("group-1")
+
+        # Assert
+        assert before_expiry == frozenset({"user-1"})
+        assert after_expiry is None
+
+    def test_invalidate_drops_entry(self):
+        # Arrange
+        cache = InMemoryMembershipCache(ttl_seconds=60, max_entries=10)
+        cache.set("group-1", ["user-1"])
+
+        # Act
+        cache.invalidate("group-1")
+        cache.invalidate("unknown-group")
+
+        # Assert
+        assert cache.get("group-1") is None
+
+    def test_evicts_least_recently_used_group(self):
+        # Arrange
+        cache = InMemoryMembershipCache(ttl_seconds=60, max_entries=2)
+        cache.set("group-1", ["user-1"])
+        cache.set("group-2", ["user-2"])
+        cache.get("group-1")
+
+        # Act
+        cache.set("group-3", ["user-3"])
+
+        # Assert
+        assert cache.get("group-1") is not None
+        assert cache.get("group-2") is None
+        assert cache.get("group-3") is not None
+
+
+    def test_unknown_user_is_not_active(self):
+        # Arrange
+        cache = InMemoryMembershipCache(ttl_seconds=60, max_entries=10)
+
+        # Act / Assert
+        assert cache.is_active("user-1") is False
+
+    def test_active_user_expires_after_ttl(self):
+        # Arrange
+        clock = FakeClock()
+        cache = InMemoryMembershipCache(ttl_seconds=60, max_entries=10, clock=clock)
+        cache.set_active("user-1")
+
+        # Act
+        clock.now = 59.0
+        before_expiry = cache.is_active("user-1")
+        clock.now = 60.0
+        after_expiry = cache.is_active("user-1")
+
+        # Assert
+        assert before_expiry is True
+        assert after_expiry is False
+
+    def test_invalidate_user_drops_only_that_user(self):
+        # Arrange
+        cache = InMemoryMembershipCache(ttl_seconds=60, max_entries=10)
+        cache.set_active("user-1")
+        cache.set_active("user-2")
+        cache.set("group-1", ["user-1"])
+
+        # Act
+        cache.invalidate_user("user-1")
+
+        # Assert
+        assert cache.is_active("user-1") is False
+        assert cache.is_active("user-2") is True
+        assert cache.get("group-1") == frozenset({"user-1"})
+
+    def test_users_and_groups_are_bounded_separately(self):
+        # Arrange
+        cache = InMemoryMembershipCache(ttl_seconds=60, max_entries=1)
+        cache.set("group-1", ["user-1"])
+
+        # Act
+        cache.set_active("user-1")
+
+        # Assert
+        assert cache.get("group-1") is not None
+        assert cache.is_active("user-1") is True
+
+
+class TestGetMembershipCache:
+    """Test get_membership_cache singleton"""
+
+    def test_returns_same_instance(self):
+        # Act / Assert
+        assert get_membership_cache() is get_membership_cache()
+        assert isinstance(get_membership_cache(), InMemoryMembershipCache)
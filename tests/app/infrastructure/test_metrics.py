@@ -0,0 +1,136 @@
+"""Tests for infrastructure/metrics.py"""
+
+import threading
+import pytest
+from app.infrastructure.metrics import MetricsRegistry, get_metrics_registry
+
+
+class TestCounterAndGauge:
+    """Test counters and gauges are summed per label set."""
+
+    def test_counter_renders_total_per_labels(self):
+        # Arrange
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "Requests.", ("route",))
+
+        # Act
+        counter.inc("/a")
+        counter.inc("/a", amount=2)
+        counter.inc("/b")
+        text = registry.render()
+
+        # Assert
+        assert "# HELP requests_total Requests." in text
+        assert "# TYPE requests_total counter" in text
+        assert 'requests_total{route="/a"} 3' in text
+        assert 'requests_total{route="/b"} 1' in text
+
+    def test_gauge_goes_up_and_down(self):
+        # Arrange
+        registry = MetricsRegistry()
+        gauge = registry.gauge("in_flight", "In flight.", ("route",))
+
+        # Act
+        gauge.inc("/a")
+        gauge.inc("/a")
+        gauge.dec("/a")
+        text = registry.render()
+
+        # Assert
+        assert 'in_flight{route="/a"} 1' in text
+
+    def test_label_values_are_escaped(self):
+        # Arrange
+        registry = MetricsRegistry()
+        counter = registry.counter("c", "C.", ("value",))
+
+        # Act
+        counter.inc('a"b\\c')
+
+        # Assert
+        assert 'c{value="a\\"b\\\\c"} 1' in registry.render()
+
+    def test_declared_metric_without_samples_renders_header(self):
+        # Arrange
+        registry = MetricsRegistry()
+        registry.counter("unused_total", "Unused.")
+
+        # Act
+        text = registry.render()
+
+        # Assert
+        assert text == "# HELP unused_total Unused.\n# TYPE unused_total counter\n"
+
+
+class TestHistogram:
+    """Test histogram buckets, sum and count."""
+
+    def test_observations_fill_cumulative_buckets(self):
+        # Arrange
+        registry = MetricsRegistry()
+        histogram = registry.histogram(
+            "latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0)
+        )
+
+        # Act
+        histogram.observe(0.05, "/a")
+        histogram.observe(0.1, "/a")
+        histogram.observe(0.5, "/a")
+        histogram.observe(3.0, "/a")
+        text = registry.render()
+
+        # Assert
+        assert 'latency_seconds_bucket{route="/a",le="0.1"} 2' in text
+        assert 'latency_seconds_bucket{route="/a",le="1"} 3' in text
+        assert 'latency_seconds_bucket{route="/a",le="+Inf"} 4' in text
+        assert 'latency_seconds_sum{route="/a"} 3.65' in text
+        assert 'latency_seconds_count{route="/a"} 4' in text
+
+
+class TestRegistry:
+    """Test registration and per-thread shards."""
+
+    def test_registering_same_metric_twice_returns_existing(self):
+        # Arrange
+        registry = MetricsRegistry()
+        first = registry.counter("c_total", "C.")
+
+        # Act
+        second = registry.counter("c_total", "C.")
+
+        # Assert
+        assert second is first
+
+    def test_registering_name_with_other_type_raises(self):
+        # Arrange
+        registry = MetricsRegistry()
+        registry.counter("m", "M.")
+
+        # Act / Assert
+        with pytest.raises(ValueError):
+            registry.gauge("m", "M.")
+
+    def test_values_from_several_threads_are_summed(self):
+        # Arrange
+        registry = MetricsRegistry()
+        counter = registry.counter("work_total", "Work.")
+
+        def record():
+            for _ in range(1000):
+                counter.inc()
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert len(registry._shards) == 4
+        assert "work_total 4000" in registry.render()
+
+    def test_get_metrics_registry_returns_singleton(self):
+        # Act / Assert
+        assert get_metrics_registry() is get_metrics_registry()
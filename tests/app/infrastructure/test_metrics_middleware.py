@@ -0,0 +1,134 @@
+"""Tests for infrastructure/metrics_middleware.py"""
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from app.infrastructure.metrics import MetricsRegistry
+from app.infrastructure.metrics_middleware import MetricsMiddleware, track_route
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Record into a fresh registry instead of the application one."""
+    from app.infrastructure import metrics_middleware
+
+    registry = MetricsRegistry()
+    labels = ("method", "route")
+    monkeypatch.setattr(
+        metrics_middleware,
+        "REQUESTS",
+        registry.counter("http_requests_total", "", labels + ("status",)),
+    )
+    monkeypatch.setattr(
+        metrics_middleware,
+        "REQUEST_DURATION",
+        registry.histogram("http_request_duration_seconds", "", labels),
+    )
+    monkeypatch.setattr(
+        metrics_middleware,
+        "REQUESTS_IN_FLIGHT",
+        registry.gauge("http_requests_in_flight", "", labels),
+    )
+    return registry
+
+
+@pytest.fixture
+def client():
+    app = FastAPI(dependencies=[Depends(track_route)])
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str):
+        return {"id": item_id}
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    @app.get("/in-flight")
+    async def in_flight():
+        from app.infrastructure import metrics_middleware
+
+        return {"metrics": metrics_middleware.REQUESTS_IN_FLIGHT._registry.render()}
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+class TestMetricsMiddleware:
+    """Test requests are recorded by route template."""
+
+    def test_requests_are_labelled_by_route_template(self, client, registry):
+        # Act
+        client.get("/items/1")
+        client.get("/items/2")
+        text = registry.render()
+
+        # Assert
+        assert (
+            'http_requests_total{method="GET",route="/items/{item_id}",status="200"} 2'
+            in text
+        )
+        assert (
+            'http_request_duration_seconds_count{method="GET",route="/items/{item_id}"} 2'
+            in text
+        )
+        assert (
+            'http_requests_in_flight{method="GET",route="/items/{item_id}"} 0' in text
+        )
+
+    def test_unmatched_paths_share_one_label(self, client, registry):
+        # Act
+        client.get("/missing/1")
+        client.get("/missing/2")
+
+        # Assert
+        assert (
+            'http_requests_total{method="GET",route="unmatched",status="404"} 2'
+            in registry.render()
+        )
+
+    def test_wrong_method_is_unmatched(self, client, registry):
+        # Act
+        client.post("/items/1")
+
+        # Assert
+        assert (
+            'http_requests_total{method="POST",route="unmatched",status="405"} 1'
+            in registry.render()
+        )
+
+    def test_request_is_in_flight_while_handler_runs(self, client, registry):
+        # Act
+        during = client.get("/in-flight").json()["metrics"]
+        after = registry.render()
+
+        # Assert
+        assert 'http_requests_in_flight{method="GET",route="/in-flight"} 1' in during
+        assert 'http_requests_in_flight{method="GET",route="/in-flight"} 0' in after
+
+    def test_track_route_without_middleware_only_counts_in_flight(self, registry):
+        # Arrange
+        app = FastAPI(dependencies=[Depends(track_route)])
+
+        @app.get("/plain")
+        async def plain():
+            return {}
+
+        # Act
+        response = TestClient(app).get("/plain")
+
+        # Assert
+        assert response.status_code == 200
+        assert 'http_requests_in_flight{method="GET",route="/plain"} 0' in (
+            registry.render()
+        )
+
+    def test_unhandled_error_is_counted_as_500(self, client, registry):
+        # Act
+        client.get("/boom")
+
+        # Assert
+        assert (
+            'http_requests_total{method="GET",route="/boom",status="500"} 1'
+            in registry.render()
+        )
@@ -0,0 +1,119 @@
+"""Tests for infrastructure/password_hasher.py"""
+
+import asyncio
+import threading
+import pytest
+from unittest.mock import patch, MagicMock
+
+from app.infrastructure.password_hasher import (
+    PasswordHasher,
+    PasswordHasherBusyError,
+    get_password_hasher,
+    shutdown_password_hasher,
+)
+
+
+@pytest.fixture
+def hasher():
+    """Provide a small hasher and shut it down afterwards."""
+    instance = PasswordHasher(max_workers=1, max_queue=1)
+    yield instance
+    instance.shutdown()
+
+
+class TestPasswordHasherRun:
+    """Test PasswordHasher.run"""
+
+    @pytest.mark.asyncio
+    async def test_run_returns_function_result(self, hasher):
+        """Test that run returns the value computed on the pool."""
+        # Act
+        result = await hasher.run(lambda a, b: a + b, 2, 3)
+
+        # Assert
+        assert result == 5
+        assert hasher.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_run_executes_off_event_loop_thread(self, hasher):
+        """Test that the function runs on a worker thread."""
+        # Act
+        thread_name = await hasher.run(lambda: threading.current_thread().name)
+
+        # Assert
+        assert thread_name.startswith("password-hasher")
+
+    @pytest.mark.asyncio
+    async def test_run_propagates_exceptions(self, hasher):
+        """Test that exceptions raised on the pool reach the caller."""
+
+        # Arrange
+        def boom():
+            raise RuntimeError("bcrypt error")
+
+        # Act & Assert
+        with pytest.raises(RuntimeError, match="bcrypt error"):
+            await hasher.run(boom)
+        assert hasher.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_run_raises_busy_when_saturated(self, hasher):
+        """Test that calls beyond workers + queue fail fast."""
+        # Arrange
+        release = threading.Event()
+        blocked = [
+            asyncio.create_task(hasher.run(release.wait)),
+            asyncio.create_task(hasher.run(release.wait)),
+        ]
+        await asyncio.sleep(0)
+
+        # Act & Assert
+        assert hasher.in_flight == 2
+        with pytest.raises(PasswordHasherBusyError):
+            await hasher.run(lambda: None)
+
+        release.set()
+        await asyncio.gather(*blocked)
+        assert hasher.in_flight == 0
+
+
+class TestPasswordHasherSingleton:
+    """Test get_password_hasher / shutdown_password_hasher"""
+
+    def test_get_password_hasher_uses_settings(self):
+        """Test that the singleton is sized from settings."""
+        # Arrange
+        shutdown_password_hasher()
+        settings = MagicMock(password_hash_workers=2, password_hash_queue_size=3)
+
+        # Act
+        with patch(
+            "app.infrastructure.password_hasher.get_settings", return_value=settings
+        ):
+            instance = get_password_hasher()
+
+        # Assert
+        assert instance is get_password_hasher()
+        assert instance._capacity == 5
+        shutdown_password_hasher()
+
+    def test_shutdown_password_hasher_resets_singleton(self):
+        """Test that shutdown drops the cached instance."""
+        # Arrange
+        first = get_password_hasher()
+
+        # Act
+        shutdown_password_hasher()
+
+        # Assert
+        assert get_password_hasher() is not first
+        shutdown_password_hasher()
+
+    def test_shutdown_password_hasher_without_instance(self):
+        """Test that shutdown is a no-op when the hasher was never created."""
+        # Arrange
+        shutdown_password_hasher()
+
+        # Act & Assert
+        shutdown_password_hasher()
+        assert get_password_hasher.cache_info().currsize == 0
@@ -0,0 +1,100 @@
+"""Tests for infrastructure/database/pool_metrics.py"""
+
+import pytest
+from unittest.mock import MagicMock
+from app.infrastructure.database import pool_metrics
+from app.infrastructure.database.pool_metrics import PoolMetricsListener
+from app.infrastructure.metrics import MetricsRegistry
+
+ADDRESS = ("localhost", 27017)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Record into a fresh registry instead of the application one."""
+    registry = MetricsRegistry()
+    for attribute, factory, name, labels in (
+        ("CHECKOUT_WAIT", registry.histogram, "checkout_wait_seconds", ("address",)),
+        (
+            "CHECKOUT_FAILURES",
+            registry.counter,
+            "checkout_failures_total",
+            ("address", "reason"),
+        ),
+        ("CONNECTIONS", registry.gauge, "connections", ("address",)),
+        ("CONNECTIONS_IN_USE", registry.gauge, "connections_in_use", ("address",)),
+        ("POOL_CLEARED", registry.counter, "pool_cleared_total", ("address",)),
+    ):
+        monkeypatch.setattr(pool_metrics, attribute, factory(name, "", labels))
+    return registry
+
+
+def _event(**attributes):
+    return MagicMock(address=ADDRESS, **attributes)
+
+
+class TestPoolMetricsListener:
+    """Test pool events are published as metrics."""
+
+    def test_connections_are_counted_while_open(self, registry):
+        # Arrange
+        listener = PoolMetricsListener()
+
+        # Act
+        listener.connection_created(_event())
+        listener.connection_created(_event())
+        listener.connection_closed(_event())
+
+        # Assert
+        assert 'connections{address="localhost:27017"} 1' in registry.render()
+
+    def test_checkout_records_wait_and_in_use(self, registry):
+        # Arrange
+        listener = PoolMetricsListener()
+
+        # Act
+        listener.connection_checked_out(_event(duration=0.002))
+        listener.connection_checked_out(_event(duration=0.004))
+        listener.connection_checked_in(_event())
+        text = registry.render()
+
+        # Assert
+        assert 'connections_in_use{address="localhost:27017"} 1' in text
+        assert 'checkout_wait_seconds_count{address="localhost:27017"} 2' in text
+        assert 'checkout_wait_seconds_sum{address="localhost:27017"} 0.006' in text
+
+    def test_failed_checkout_is_counted_by_reason(self, registry):
+        # Arrange
+        listener = PoolMetricsListener()
+
+        # Act
+        listener.connection_check_out_failed(_event(duration=2.0, reason="timeout"))
+        text = registry.render()
+
+        # Assert
+        assert (
+            'checkout_failures_total{address="localhost:27017",reason="timeout"} 1'
+            in text
+        )
+        assert 'checkout_wait_seconds_count{address="localhost:27017"} 1' in text
+
+    def test_pool_cleared_is_counted(self, registry):
+        # Arrange
+        listener = PoolMetricsListener()
+
+        # Act
+        listener.pool_cleared(_event())
+
+        # Assert
+        assert 'pool_cleared_total{address="localhost:27017"} 1' in registry.render()
+
+    def test_untracked_events_are_ignored(self, registry):
+        # Arrange
+        listener = PoolMetricsListener()
+
+        # Act / Assert (the driver's base class raises NotImplementedError)
+        listener.pool_created(_event())
+        listener.pool_ready(_event())
+        listener.pool_closed(_event())
+        listener.connection_ready(_event())
+        listener.connection_check_out_started(_event())
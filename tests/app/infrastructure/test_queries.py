@@ -0,0 +1,95 @@
+"""Tests for infrastructure/database/queries.py"""
+
+from unittest.mock import AsyncMock, MagicMock
+from bson import ObjectId
+from app.infrastructure.database.queries import document_exists, find_fields
+
+
+class TestDocumentExists:
+    """Test document_exists"""
+
+    async def test_fetches_only_the_key(self):
+        # Arrange
+        collection = MagicMock()
+        collection.find_one = AsyncMock(return_value={"_id": ObjectId()})
+
+        # Act
+        found = await document_exists(collection, {"name": "Trip"})
+
+        # Assert
+        assert found is True
+        collection.find_one.assert_called_once_with({"name": "Trip"}, {"_id": 1})
+
+    async def test_no_match(self):
+        # Arrange
+        collection = MagicMock()
+        collection.find_one = AsyncMock(return_value=None)
+
+        # Act / Assert
+        assert await document_exists(collection, {"name": "Trip"}) is False
+
+    async def test_custom_projection_for_covered_queries(self):
+        # Arrange
+        collection = MagicMock()
+        collection.find_one = AsyncMock(return_value={"email": "a@b.com"})
+
+        # Act
+        await document_exists(
+            collection, {"email": "a@b.com"}, {"_id": 0, "email": 1}
+        )
+
+        # Assert
+        collection.find_one.assert_called_once_with(
+            {"email": "a@b.com"}, {"_id": 0, "email": 1}
+        )
+
+
+class TestFindFields:
+    """Test find_fields"""
+
+    async def test_excludes_the_key_unless_asked(self):
+        # Arrange
+        collection = MagicMock()
+        collection.find_one = AsyncMock(return_value={"user_ids": ["u1"]})
+
+        # Act
+        fields = await find_fields(collection, {"name": "Trip"}, ["user_ids"])
+
+        # Assert
+        assert fields == {"user_ids": ["u1"]}
+        collection.find_one.assert_called_once_with(
+            {"name": "Trip"}, {"user_ids": 1, "_id": 0}
+        )
+
+    async def test_id_is_returned_as_a_string(self):
+        # Arrange
+        oid = ObjectId()
+        collection = MagicMock()
+        collection.find_one = AsyncMock(return_value={"_id": oid})
+
+        # Act
+        fields = await find_fields(collection, {"_id": oid}, ["id"])
+
+        # Assert
+        assert fields == {"id": str(oid)}
+        collection.find_one.assert_called_once_with({"_id": oid}, {"_id": 1})
+
+    async def test_no_fields_never_fetches_the_whole_document(self):
+        # Arrange
+        collection = MagicMock()
+        collection.find_one = AsyncMock(return_value={"_id": ObjectId()})
+
+        # Act
+        fields = await find_fields(collection, {"name": "Trip"}, [])
+
+        # Assert
+        assert fields == {}
+        assert collection.find_one.call_args[0][1] == {"_id": 1}
+
+    async def test_no_match(self):
+        # Arrange
+        collection = MagicMock()
+        collection.find_one = AsyncMock(return_value=None)
+
+        # Act / Assert
+        assert await find_fields(collection, {"name": "Trip"}, ["user_ids"]) is None
@@ -0,0 +1,54 @@
+"""Tests for infrastructure/database/rebuild_group_summaries.py"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.infrastructure.database import rebuild_group_summaries
+
+
+class TestRebuildGroupSummariesCli:
+    """Test the rebuild command."""
+
+    @pytest.mark.asyncio
+    async def test_run_cli_rebuilds_and_disconnects(self):
+        with patch(
+            "app.infrastructure.database.database.Database.connect", new=AsyncMock()
+        ) as connect, patch(
+            "app.infrastructure.database.database.Database.disconnect", new=AsyncMock()
+        ) as disconnect, patch(
+            "app.infrastructure.repositories.group_summary_repository.MongoGroupSummaryRepository.rebuild",
+            new=AsyncMock(return_value=3),
+        ) as rebuild:
+            result = await rebuild_group_summaries._run_cli("group-1")
+
+        assert result == 0
+        connect.assert_awaited_once_with(apply_indexes=False)
+        rebuild.assert_awaited_once_with("group-1")
+        disconnect.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_run_cli_disconnects_on_failure(self):
+        with patch(
+            "app.infrastructure.database.database.Database.connect", new=AsyncMock()
+        ), patch(
+            "app.infrastructure.database.database.Database.disconnect", new=AsyncMock()
+        ) as disconnect, patch(
+            "app.infrastructure.repositories.group_summary_repository.MongoGroupSummaryRepository.rebuild",
+            new=AsyncMock(side_effect=Exception("DB error")),
+        ):
+            with pytest.raises(Exception, match="DB error"):
+                await rebuild_group_summaries._run_cli(None)
+
+        disconnect.assert_awaited_once()
+
+    def test_main_parses_group_id(self):
+        with patch(
+            "sys.argv", ["rebuild_group_summaries", "--group-id", "group-1"]
+        ), patch.object(
+            rebuild_group_summaries, "_run_cli", new=AsyncMock(return_value=0)
+        ) as run_cli:
+            with pytest.raises(SystemExit) as exc_info:
+                rebuild_group_summaries.main()
+
+        assert exc_info.value.code == 0
+        run_cli.assert_awaited_once_with("group-1")
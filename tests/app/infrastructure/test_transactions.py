@@ -0,0 +1,126 @@
+"""Tests for infrastructure/database/transactions.py"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.infrastructure.database.transactions import MongoTransactionManager
+
+
+class FakeTransaction:
+    def __init__(self, session):
+        self.session = session
+
+    async def __aenter__(self):
+        self.session.events.append("start")
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.session.events.append("abort" if exc_type else "commit")
+
+
+class FakeSession:
+    def __init__(self):
+        self.events = []
+
+    def start_transaction(self):
+        return FakeTransaction(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.events.append("end")
+
+
+def make_client(hello):
+    client = MagicMock()
+    client.admin.command = AsyncMock(return_value=hello)
+    client.start_session = AsyncMock(return_value=FakeSession())
+    return client
+
+
+def patch_client(client):
+    return patch(
+        "app.infrastructure.database.transactions.Database.get_client",
+        return_value=client,
+    )
+
+
+class TestMongoTransactionManager:
+    """Test transactions are used only where the deployment supports them"""
+
+    @pytest.mark.parametrize(
+        "hello, supported",
+        [
+            ({"isWritablePrimary": True, "setName": "rs0"}, True),
+            ({"isWritablePrimary": True, "msg": "isdbgrid"}, True),
+            ({"isWritablePrimary": True}, False),
+        ],
+    )
+    async def test_detects_transaction_support(self, hello, supported):
+        # Arrange
+        manager = MongoTransactionManager()
+
+        # Act
+        with patch_client(make_client(hello)):
+            result = await manager.supports_transactions()
+
+        # Assert
+        assert result is supported
+
+    async def test_detection_runs_once_per_client(self):
+        # Arrange
+        manager = MongoTransactionManager()
+        client = make_client({"setName": "rs0"})
+        other_client = make_client({})
+
+        # Act
+        with patch_client(client):
+            await manager.supports_transactions()
+            await manager.supports_transactions()
+        with patch_client(other_client):
+            reconnected = await manager.supports_transactions()
+
+        # Assert
+        client.admin.command.assert_awaited_once_with("hello")
+        assert reconnected is False
+
+    async def test_standalone_server_yields_no_session(self):
+        # Arrange
+        manager = MongoTransactionManager()
+        client = make_client({})
+
+        # Act
+        with patch_client(client):
+            async with manager.transaction() as session:
+                pass
+
+        # Assert
+        assert session is None
+        client.start_session.assert_not_awaited()
+
+    async def test_replica_set_commits_transaction(self):
+        # Arrange
+        manager = MongoTransactionManager()
+        client = make_client({"setName": "rs0"})
+
+        # Act
+        with patch_client(client):
+            async with manager.transaction() as session:
+                session.events.append("write")
+
+        # Assert
+        assert session.events == ["start", "write", "commit", "end"]
+
+    async def test_replica_set_aborts_transaction_on_error(self):
+        # Arrange
+        manager = MongoTransactionManager()
+        client = make_client({"setName": "rs0"})
+
+        # Act
+        with patch_client(client):
+            with pytest.raises(ValueError):
+                async with manager.transaction() as session:
+                    raise ValueError("rejected")
+
+        # Assert
+        assert session.events == ["start", "abort", "end"]
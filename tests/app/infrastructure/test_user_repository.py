@@ -4,7 +4,11 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import date, datetime, timezone
 from bson import ObjectId
-from app.infrastructure.repositories.user_repository import MongoUserRepository
+from pymongo.errors import DuplicateKeyError
+from app.infrastructure.repositories.user_repository import (
+    EMAIL_COLLATION,
+    MongoUserRepository,
+)
 from app.domain.entities.user_entity import User
 
 
@@ -62,6 +66,16 @@ class TestMongoUserRepository:
         repo = MongoUserRepository()
         assert repo is not None
 
+    def test_email_index_is_unique_and_case_insensitive(self):
+        index = next(
+            i.document
+            for i in MongoUserRepository.indexes
+            if i.document["name"] == "email_unique"
+        )
+        assert index["key"] == {"email": 1}
+        assert index["unique"] is True
+        assert index["collation"] == EMAIL_COLLATION.document
+
 
 class TestMongoUserRepositoryHelpers:
     """Test internal helper methods."""
@@ -86,6 +100,19 @@ class TestMongoUserRepositoryHelpers:
         result = repo._document_to_entity(None)
         assert result is None
 
+    def test_document_to_entity_does_not_revalidate_stored_data(self):
+        repo = MongoUserRepository()
+        doc = make_user_doc()
+        doc["email"] = "legacy-address"
+        doc.pop("is_email_verified", None)
+
+        entity = repo._document_to_entity(doc)
+
+        # User(**doc) would reject the email; the trusted read keeps it
+        assert entity.email == "legacy-address"
+        assert entity.is_email_verified is False
+        assert entity.model_dump()["id"] == entity.id
+
     def test_entity_to_document_with_date_birth(self):
         repo = MongoUserRepository()
         entity = make_user_entity()
@@ -139,10 +166,15 @@ class TestMongoUserRepositoryCreate:
     async def test_create_raises_on_duplicate_email(self):
         repo = MongoUserRepository()
         entity = make_user_entity()
-        existing_doc = make_user_doc()
 
         mock_collection = AsyncMock()
-        mock_collection.find_one = AsyncMock(return_value=existing_doc)
+        mock_collection.insert_one = AsyncMock(
+            side_effect=DuplicateKeyError(
+                "E11000 duplicate key error",
+                11000,
+                {"keyPattern": {"email": 1}},
+            )
+        )
 
         mock_db = MagicMock()
         mock_db.__getitem__.return_value = mock_collection
@@ -154,6 +186,8 @@ class TestMongoUserRepositoryCreate:
             with pytest.raises(ValueError, match="already registered"):
                 await repo.create(entity)
 
+        mock_collection.find_one.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_create_raises_on_exception(self):
         repo = MongoUserRepository()
@@ -328,6 +362,67 @@ class TestMongoUserRepositoryGetAll:
                 await repo.get_all()
 
 
+class TestMongoUserRepositoryGetManyByIds:
+    """Test get_many_by_ids method."""
+
+    @pytest.mark.asyncio
+    async def test_get_many_by_ids_single_in_query_with_name_projection(self):
+        repo = MongoUserRepository()
+        id_1, id_2 = ObjectId(), ObjectId()
+        docs = [{"_id": id_1, "name": "Ana"}, {"_id": id_2, "name": "Bruno"}]
+
+        mock_collection = MagicMock()
+        mock_collection.find.return_value = AsyncIter(docs)
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.user_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            result = await repo.get_many_by_ids([str(id_1), str(id_2), str(id_1)])
+
+        assert result == {str(id_1): "Ana", str(id_2): "Bruno"}
+        mock_collection.find.assert_called_once()
+        query, projection = mock_collection.find.call_args[0]
+        assert set(query["_id"]["$in"]) == {id_1, id_2}
+        assert query["is_active"] is True
+        assert projection == {"name": 1}
+
+    @pytest.mark.asyncio
+    async def test_get_many_by_ids_ignores_invalid_ids_without_query(self):
+        repo = MongoUserRepository()
+
+        mock_db = MagicMock()
+
+        with patch(
+            "app.infrastructure.repositories.user_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            result = await repo.get_many_by_ids(["not-an-object-id"])
+
+        assert result == {}
+        mock_db.__getitem__.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_many_by_ids_raises_on_exception(self):
+        repo = MongoUserRepository()
+
+        mock_collection = MagicMock()
+        mock_collection.find.side_effect = Exception("DB error")
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.user_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            with pytest.raises(Exception):
+                await repo.get_many_by_ids([str(ObjectId())])
+
+
 class TestMongoUserRepositoryGetByEmail:
     """Test get_by_email method."""
 
@@ -389,6 +484,45 @@ class TestMongoUserRepositoryGetByEmail:
                 await repo.get_by_email("test@example.com")
 
 
+    @pytest.mark.asyncio
+    async def test_concurrent_get_by_email_calls_share_one_query(self):
+        import asyncio
+
+        repo = MongoUserRepository()
+        john = make_user_doc()
+        mary = make_user_doc()
+        mary["email"] = "mary@example.com"
+
+        mock_collection = MagicMock()
+        mock_collection.find.return_value = AsyncIter([john, mary])
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.user_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            results = await asyncio.gather(
+                repo.get_by_email("john@example.com"),
+                repo.get_by_email("john@example.com"),
+                repo.get_by_email("mary@example.com"),
+            )
+
+        assert [user.email for user in results] == [
+            "john@example.com",
+            "john@example.com",
+            "mary@example.com",
+        ]
+        assert results[0] is not results[1]
+        mock_collection.find.assert_called_once_with(
+            {
+                "email": {"$in": ["john@example.com", "mary@example.com"]},
+                "is_active": True,
+            }
+        )
+
+
 class TestMongoUserRepositoryEmailExists:
     """Test email_exists method."""
 
@@ -411,6 +545,9 @@ class TestMongoUserRepositoryEmailExists:
             result = await repo.email_exists(email)
 
         assert result is True
+        mock_collection.find_one.assert_called_once_with(
+            {"email": email}, {"_id": 0, "email": 1}
+        )
 
     @pytest.mark.asyncio
     async def test_email_exists_false(self):
@@ -459,12 +596,8 @@ class TestMongoUserRepositoryUpdate:
         entity.id = user_id
         doc = make_user_doc(user_id)
 
-        update_result = MagicMock()
-        update_result.matched_count = 1
-
         mock_collection = AsyncMock()
-        mock_collection.update_one = AsyncMock(return_value=update_result)
-        mock_collection.find_one = AsyncMock(return_value=doc)
+        mock_collection.find_one_and_update = AsyncMock(return_value=doc)
 
         mock_db = MagicMock()
         mock_db.__getitem__.return_value = mock_collection
@@ -476,6 +609,10 @@ class TestMongoUserRepositoryUpdate:
             result = await repo.update(user_id, entity)
 
         assert result is not None
+        mock_collection.find_one.assert_not_called()
+        filter_doc, update_doc = mock_collection.find_one_and_update.call_args[0]
+        assert filter_doc == {"_id": ObjectId(user_id)}
+        assert isinstance(update_doc["$set"]["date_birth"], datetime)
 
     @pytest.mark.asyncio
     async def test_update_not_found(self):
@@ -483,11 +620,8 @@ class TestMongoUserRepositoryUpdate:
         user_id = str(ObjectId())
         entity = make_user_entity()
 
-        update_result = MagicMock()
-        update_result.matched_count = 0
-
         mock_collection = AsyncMock()
-        mock_collection.update_one = AsyncMock(return_value=update_result)
+        mock_collection.find_one_and_update = AsyncMock(return_value=None)
 
         mock_db = MagicMock()
         mock_db.__getitem__.return_value = mock_collection
@@ -507,7 +641,9 @@ class TestMongoUserRepositoryUpdate:
         entity = make_user_entity()
 
         mock_collection = AsyncMock()
-        mock_collection.update_one = AsyncMock(side_effect=Exception("DB error"))
+        mock_collection.find_one_and_update = AsyncMock(
+            side_effect=Exception("DB error")
+        )
 
         mock_db = MagicMock()
         mock_db.__getitem__.return_value = mock_collection
@@ -520,6 +656,218 @@ class TestMongoUserRepositoryUpdate:
                 await repo.update(user_id, entity)
 
 
+class TestMongoUserRepositoryUpdateFields:
+    """Test update_fields method."""
+
+    @pytest.mark.asyncio
+    async def test_update_fields_sets_only_given_fields(self):
+        repo = MongoUserRepository()
+        user_id = str(ObjectId())
+        doc = make_user_doc(user_id)
+
+        mock_collection = AsyncMock()
+        mock_collection.find_one_and_update = AsyncMock(return_value=doc)
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.user_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            result = await repo.update_fields(
+                user_id, {"name": "New Name", "date_birth": date(1991, 2, 3)}
+            )
+
+        assert result.id == user_id
+        filter_doc, update_doc = mock_collection.find_one_and_update.call_args[0]
+        assert filter_doc == {"_id": ObjectId(user_id), "is_active": True}
+        assert set(update_doc["$set"]) == {"name", "date_birth", "updated_at"}
+        assert update_doc["$set"]["date_birth"] == datetime(1991, 2, 3)
+
+    @pytest.mark.asyncio
+    async def test_update_fields_not_found(self):
+        repo = MongoUserRepository()
+
+        mock_collection = AsyncMock()
+        mock_collection.find_one_and_update = AsyncMock(return_value=None)
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.user_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            result = await repo.update_fields(str(ObjectId()), {"name": "New Name"})
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_update_fields_raises_on_exception(self):
+        repo = MongoUserRepository()
+
+        mock_collection = AsyncMock()
+        mock_collection.find_one_and_update = AsyncMock(
+            side_effect=Exception("DB error")
+        )
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.user_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            with pytest.raises(Exception):
+                await repo.update_fields(str(ObjectId()), {"name": "New Name"})
+
+    @pytest.mark.asyncio
+    async def test_update_fields_raises_on_duplicate_email(self):
+        repo = MongoUserRepository()
+
+        mock_collection = AsyncMock()
+        mock_collection.find_one_and_update = AsyncMock(
+            side_effect=DuplicateKeyError(
+                "E11000 duplicate key error",
+                11000,
+                {"keyPattern": {"email": 1}},
+            )
+        )
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.user_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            with pytest.raises(ValueError, match="already registered"):
+                await repo.update_fields(
+                    str(ObjectId()), {"email": "taken@example.com"}
+                )
+
+
+class TestMongoUserRepositoryGetFields:
+    """Test get_fields method."""
+
+    @pytest.mark.asyncio
+    async def test_get_fields_projects_only_given_fields(self):
+        repo = MongoUserRepository()
+        user_id = str(ObjectId())
+
+        mock_collection = AsyncMock()
+        mock_collection.find_one = AsyncMock(
+            return_value={"_id": ObjectId(user_id), "name": "John Silva"}
+        )
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.user_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            result = await repo.get_fields(user_id, ["id", "name"])
+
+        assert result == {"id": user_id, "name": "John Silva"}
+        mock_collection.find_one.assert_called_once_with(
+            {"_id": ObjectId(user_id), "is_active": True},
+            {"name": 1, "_id": 1},
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_fields_not_found(self):
+        repo = MongoUserRepository()
+
+        mock_collection = AsyncMock()
+        mock_collection.find_one = AsyncMock(return_value=None)
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.user_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            result = await repo.get_fields(str(ObjectId()), ["name"])
+
+        assert result is None
+
+
+class TestMongoUserRepositoryMarkEmailVerified:
+    """Test mark_email_verified method."""
+
+    @pytest.mark.asyncio
+    async def test_sets_only_verification_flags_on_any_user(self):
+        repo = MongoUserRepository()
+        user_id = str(ObjectId())
+        doc = make_user_doc(user_id)
+        session = MagicMock()
+
+        mock_collection = AsyncMock()
+        mock_collection.find_one_and_update = AsyncMock(return_value=doc)
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.user_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            result = await repo.mark_email_verified(user_id, session=session)
+
+        assert result.id == user_id
+        filter_doc, update_doc = mock_collection.find_one_and_update.call_args[0]
+        kwargs = mock_collection.find_one_and_update.call_args[1]
+        assert filter_doc == {"_id": ObjectId(user_id)}
+        assert set(update_doc["$set"]) == {
+            "is_email_verified",
+            "is_active",
+            "updated_at",
+        }
+        assert update_doc["$set"]["is_email_verified"] is True
+        assert update_doc["$set"]["is_active"] is True
+        assert kwargs["session"] is session
+
+    @pytest.mark.asyncio
+    async def test_returns_none_when_user_missing(self):
+        repo = MongoUserRepository()
+
+        mock_collection = AsyncMock()
+        mock_collection.find_one_and_update = AsyncMock(return_value=None)
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.user_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            result = await repo.mark_email_verified(str(ObjectId()))
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_raises_on_exception(self):
+        repo = MongoUserRepository()
+
+        mock_collection = AsyncMock()
+        mock_collection.find_one_and_update = AsyncMock(
+            side_effect=Exception("DB error")
+        )
+
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = mock_collection
+
+        with patch(
+            "app.infrastructure.repositories.user_repository.Database.get_db",
+            return_value=mock_db,
+        ):
+            with pytest.raises(Exception):
+                await repo.mark_email_verified(str(ObjectId()))
+
+
 class TestMongoUserRepositoryDelete:
     """Test delete (soft delete) method."""
 
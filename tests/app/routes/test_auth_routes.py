@@ -132,6 +132,18 @@ class TestAuthRoutesWithMockedController:
         response = client.post("/api/v1/auth/login", json=login_data)
         assert response.status_code == 400
 
+    def test_login_hasher_busy_returns_503(self, auth_client):
+        """Test that a saturated password hasher returns 503 with Retry-After."""
+        from app.infrastructure.password_hasher import PasswordHasherBusyError
+
+        client, mock_controller = auth_client
+        mock_controller.login.side_effect = PasswordHasherBusyError("busy")
+
+        login_data = {"email": "test@example.com", "password": "password123"}
+        response = client.post("/api/v1/auth/login", json=login_data)
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
     def test_refresh_success_with_mocked_controller(self, auth_client):
         """Test successful token refresh with mocked controller."""
         client, mock_controller = auth_client
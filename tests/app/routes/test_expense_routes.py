@@ -58,6 +58,7 @@ def expense_client(mock_app_dependencies, mock_expense_repository):
         date_birth=date(1990, 1, 1),
     )
     mock_user_repo.get_by_email.return_value = test_user
+    mock_user_repo.get_fields.return_value = {"is_active": True}
 
     test_group = Group(
         id="507f1f77bcf86cd799439012",
@@ -68,6 +69,7 @@ def expense_client(mock_app_dependencies, mock_expense_repository):
         updated_at=datetime.now(timezone.utc),
     )
     mock_group_repo.get_by_id.return_value = test_group
+    mock_group_repo.get_fields.return_value = {"user_ids": test_group.user_ids}
 
     mock_app_dependencies.dependency_overrides[ExpenseDependencies.get_repository] = (
         lambda: mock_expense_repository
@@ -147,6 +149,78 @@ class TestExpenseRouteCreateExpense:
         assert response.status_code in [400, 422, 500]
 
 
+class TestExpenseRouteCreateExpensesBulk:
+    """Test POST /expenses/bulk endpoint."""
+
+    def _item(self, group_id="507f1f77bcf86cd799439012"):
+        return {
+            "group_id": group_id,
+            "amount_cents": 5000,
+            "category": "entertainment",
+            "type_expense": "credit_card",
+            "spent_by": "John Doe",
+        }
+
+    def test_create_expenses_bulk_success(self, expense_client):
+        client, mock_repo = expense_client
+        mock_repo.create_many.return_value = {1: "duplicate key"}
+
+        response = client.post(
+            "/api/v1/expenses/bulk", json={"items": [self._item(), self._item()]}
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["created"] == 1
+        assert body["failed"] == 1
+        assert body["results"][1] == {"index": 1, "id": None, "error": "duplicate key"}
+        mock_repo.create_many.assert_called_once()
+
+    def test_create_expenses_bulk_malformed_group_fails_only_its_items(
+        self, expense_client
+    ):
+        client, mock_repo = expense_client
+        mock_repo.create_many.return_value = {}
+
+        response = client.post(
+            "/api/v1/expenses/bulk",
+            json={"items": [self._item(), self._item("not-an-id"), self._item()]},
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["created"] == 2
+        assert body["failed"] == 1
+        assert body["results"][1] == {
+            "index": 1,
+            "id": None,
+            "error": "Invalid group ID",
+        }
+        assert len(mock_repo.create_many.call_args[0][0]) == 2
+
+    def test_create_expenses_bulk_empty_returns_422(self, expense_client):
+        client, _ = expense_client
+        response = client.post("/api/v1/expenses/bulk", json={"items": []})
+        assert response.status_code == 422
+
+    def test_create_expenses_bulk_too_many_returns_422(self, expense_client):
+        from app.models.expense_schema import MAX_BULK_EXPENSES
+
+        client, _ = expense_client
+        response = client.post(
+            "/api/v1/expenses/bulk",
+            json={"items": [self._item()] * (MAX_BULK_EXPENSES + 1)},
+        )
+        assert response.status_code == 422
+
+    def test_create_expenses_bulk_server_error(self, expense_client):
+        client, mock_repo = expense_client
+        mock_repo.create_many.side_effect = Exception("Unexpected error")
+
+        response = client.post("/api/v1/expenses/bulk", json={"items": [self._item()]})
+        assert response.status_code == 400
+
+
 class TestExpenseRouteListExpenses:
     """Test GET /expenses/{group_id} endpoint."""
 
@@ -181,6 +255,220 @@ class TestExpenseRouteListExpenses:
         response = client.get("/api/v1/expenses/507f1f77bcf86cd799439012")
         assert response.status_code == 500
 
+    def test_list_expenses_full_page_sets_next_cursor_header(self, expense_client):
+        client, mock_repo = expense_client
+        mock_repo.get_all.return_value = [make_expense_response_obj()]
+
+        response = client.get("/api/v1/expenses/507f1f77bcf86cd799439012?limit=1")
+        assert response.status_code == 200
+        assert response.headers.get("X-Next-Cursor")
+
+    def test_list_expenses_with_cursor_uses_keyset(self, expense_client):
+        client, mock_repo = expense_client
+        mock_repo.get_all.return_value = [make_expense_response_obj()]
+        first = client.get("/api/v1/expenses/507f1f77bcf86cd799439012?limit=1")
+        mock_repo.get_all_after.return_value = []
+
+        response = client.get(
+            "/api/v1/expenses/507f1f77bcf86cd799439012",
+            params={"limit": 1, "cursor": first.headers["X-Next-Cursor"]},
+        )
+        assert response.status_code == 200
+        assert response.json() == []
+        assert "X-Next-Cursor" not in response.headers
+        mock_repo.get_all_after.assert_called_once()
+
+    def test_list_expenses_invalid_cursor_returns_422(self, expense_client):
+        client, _ = expense_client
+
+        response = client.get("/api/v1/expenses/507f1f77bcf86cd799439012?cursor=bad")
+        assert response.status_code == 422
+
+    def test_list_expenses_cursor_with_tampered_id_returns_422(self, expense_client):
+        from app.use_cases.expense.cursor_utils import encode_cursor
+
+        client, mock_repo = expense_client
+        cursor = encode_cursor(datetime(2026, 2, 10, 12, 0), "zzz")
+
+        response = client.get(
+            "/api/v1/expenses/507f1f77bcf86cd799439012", params={"cursor": cursor}
+        )
+        assert response.status_code == 422
+        mock_repo.get_all_after.assert_not_called()
+
+
+class TestExpenseRouteListExpenseChanges:
+    """Test GET /expenses/{group_id}/changes endpoint."""
+
+    def test_list_changes_first_sync(self, expense_client):
+        client, mock_repo = expense_client
+        mock_repo.get_changes.return_value = [make_expense_response_obj()]
+
+        response = client.get("/api/v1/expenses/507f1f77bcf86cd799439012/changes")
+        assert response.status_code == 200
+        body = response.json()
+        assert len(body["items"]) == 1
+        assert body["since"]
+        assert body["has_more"] is False
+
+    def test_list_changes_resumes_with_returned_watermark(self, expense_client):
+        client, mock_repo = expense_client
+        mock_repo.get_changes.return_value = [make_expense_response_obj()]
+        first = client.get("/api/v1/expenses/507f1f77bcf86cd799439012/changes")
+        tombstone = make_expense_response_obj()
+        tombstone.is_deleted = True
+        mock_repo.get_changes.return_value = [tombstone]
+
+        response = client.get(
+            "/api/v1/expenses/507f1f77bcf86cd799439012/changes",
+            params={"since": first.json()["since"]},
+        )
+        assert response.status_code == 200
+        assert response.json()["items"][0]["is_deleted"] is True
+        _, after_updated_at, after_id = mock_repo.get_changes.call_args.args
+        assert after_updated_at is not None
+        assert after_id is not None
+
+    def test_list_changes_invalid_watermark_returns_422(self, expense_client):
+        client, _ = expense_client
+
+        response = client.get(
+            "/api/v1/expenses/507f1f77bcf86cd799439012/changes?since=bad"
+        )
+        assert response.status_code == 422
+
+    def test_list_changes_watermark_with_tampered_id_returns_422(
+        self, expense_client
+    ):
+        from app.use_cases.expense.cursor_utils import encode_cursor
+
+        client, mock_repo = expense_client
+        since = encode_cursor(datetime(2026, 1, 1, tzinfo=timezone.utc), "zzz")
+
+        response = client.get(
+            "/api/v1/expenses/507f1f77bcf86cd799439012/changes",
+            params={"since": since},
+        )
+        assert response.status_code == 422
+        mock_repo.get_changes.assert_not_called()
+
+    def test_list_changes_invalid_limit_returns_422(self, expense_client):
+        client, _ = expense_client
+
+        response = client.get(
+            "/api/v1/expenses/507f1f77bcf86cd799439012/changes?limit=0"
+        )
+        assert response.status_code == 422
+
+    def test_list_changes_server_error(self, expense_client):
+        client, mock_repo = expense_client
+        mock_repo.get_changes.side_effect = Exception("DB error")
+
+        response = client.get("/api/v1/expenses/507f1f77bcf86cd799439012/changes")
+        assert response.status_code == 500
+
+
+def make_expense_documents(count):
+    """Build an async generator factory of raw expense documents."""
+
+    async def stream(*args, **kwargs):
+        for index in range(count):
+            yield {
+                "id": str(ObjectId()),
+                "group_id": "507f1f77bcf86cd799439012",
+                "amount_cents": 1000 + index,
+                "category": "food",
+                "type_expense": "expense",
+                "spent_by": "test@example.com",
+                "date": datetime(2024, 1, 15),
+                "note": f"Expense {index}",
+                "created_at": datetime(2024, 1, 15),
+                "updated_at": datetime(2024, 1, 15),
+            }
+
+    return stream
+
+
+class TestExpenseRouteExportExpenses:
+    """Test GET /expenses/{group_id}/export endpoint."""
+
+    def test_export_ndjson_by_default(self, expense_client):
+        import json
+
+        client, mock_repo = expense_client
+        mock_repo.stream_documents.side_effect = make_expense_documents(3)
+
+        response = client.get("/api/v1/expenses/507f1f77bcf86cd799439012/export")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert 'filename="expenses-507f1f77bcf86cd799439012.ndjson"' in (
+            response.headers["content-disposition"]
+        )
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["amount_cents"] for line in lines] == [1000, 1001, 1002]
+        assert lines[0]["date"] == "2024-01-15T00:00:00+00:00"
+
+    def test_export_csv(self, expense_client):
+        client, mock_repo = expense_client
+        mock_repo.stream_documents.side_effect = make_expense_documents(2)
+
+        response = client.get(
+            "/api/v1/expenses/507f1f77bcf86cd799439012/export?format=csv"
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = response.text.splitlines()
+        assert rows[0].startswith("id,group_id,amount_cents")
+        assert len(rows) == 3
+
+    def test_export_passes_date_range(self, expense_client):
+        client, mock_repo = expense_client
+        mock_repo.stream_documents.side_effect = make_expense_documents(0)
+
+        response = client.get(
+            "/api/v1/expenses/507f1f77bcf86cd799439012/export",
+            params={"start_date": "2024-01-01T00:00:00", "end_date": "2024-02-01T00:00:00"},
+        )
+
+        assert response.status_code == 200
+        kwargs = mock_repo.stream_documents.call_args.kwargs
+        assert kwargs["start_date"] == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert kwargs["end_date"] == datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+    def test_export_mixed_offsets_in_range(self, expense_client):
+        client, mock_repo = expense_client
+        mock_repo.stream_documents.side_effect = make_expense_documents(0)
+
+        response = client.get(
+            "/api/v1/expenses/507f1f77bcf86cd799439012/export",
+            params={"start_date": "2024-01-01T00:00:00Z", "end_date": "2024-02-01T00:00:00"},
+        )
+
+        assert response.status_code == 200
+        kwargs = mock_repo.stream_documents.call_args.kwargs
+        assert kwargs["end_date"] == datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+    def test_export_invalid_format_returns_422(self, expense_client):
+        client, _ = expense_client
+
+        response = client.get(
+            "/api/v1/expenses/507f1f77bcf86cd799439012/export?format=xml"
+        )
+        assert response.status_code == 422
+
+    def test_export_invalid_date_range_returns_422(self, expense_client):
+        client, mock_repo = expense_client
+
+        response = client.get(
+            "/api/v1/expenses/507f1f77bcf86cd799439012/export",
+            params={"start_date": "2024-02-01T00:00:00", "end_date": "2024-01-01T00:00:00"},
+        )
+
+        assert response.status_code == 422
+        mock_repo.stream_documents.assert_not_called()
+
 
 class TestExpenseRouteGetExpenseDetails:
     """Test GET /expenses/{expense_id}/details endpoint."""
@@ -308,3 +596,114 @@ class TestExpenseRouteAnalytics:
 
         response = client.get("/api/v1/expenses/507f1f77bcf86cd799439012/analytics")
         assert response.status_code == 500
+
+
+class TestExpenseRouteAnalyticsSummary:
+    """Test GET /expenses/{group_id}/analytics/summary endpoint."""
+
+    def test_get_analytics_summary_success(self, expense_client):
+        client, mock_repo = expense_client
+        mock_repo.aggregate_amounts.return_value = [
+            {
+                "key": "food",
+                "total_cents": 3000,
+                "count": 2,
+                "average_cents": 1500.0,
+                "min_cents": 1000,
+                "max_cents": 2000,
+            },
+        ]
+
+        response = client.get(
+            "/api/v1/expenses/507f1f77bcf86cd799439012/analytics/summary",
+            params={"group_by": "category", "start_date": "2026-01-01T00:00:00Z"},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["group_by"] == "category"
+        assert data["total_cents"] == 3000
+        assert data["count"] == 2
+        assert data["buckets"][0]["key"] == "food"
+
+    def test_get_analytics_summary_invalid_group_by_returns_422(self, expense_client):
+        client, _ = expense_client
+
+        response = client.get(
+            "/api/v1/expenses/507f1f77bcf86cd799439012/analytics/summary",
+            params={"group_by": "amount"},
+        )
+        assert response.status_code == 422
+
+    def test_get_analytics_summary_inverted_range_returns_422(self, expense_client):
+        client, _ = expense_client
+
+        response = client.get(
+            "/api/v1/expenses/507f1f77bcf86cd799439012/analytics/summary",
+            params={
+                "start_date": "2026-02-01T00:00:00Z",
+                "end_date": "2026-01-01T00:00:00Z",
+            },
+        )
+        assert response.status_code == 422
+
+    def test_get_analytics_summary_mixed_offsets_in_range(self, expense_client):
+        client, mock_repo = expense_client
+        mock_repo.aggregate_amounts.return_value = []
+
+        response = client.get(
+            "/api/v1/expenses/507f1f77bcf86cd799439012/analytics/summary",
+            params={
+                "start_date": "2026-01-01T00:00:00Z",
+                "end_date": "2026-02-01T00:00:00",
+            },
+        )
+        assert response.status_code == 200
+        kwargs = mock_repo.aggregate_amounts.call_args.kwargs
+        assert kwargs["end_date"] == datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+    def test_get_analytics_summary_server_error(self, expense_client):
+        client, mock_repo = expense_client
+        mock_repo.aggregate_amounts.side_effect = Exception("DB error")
+
+        response = client.get(
+            "/api/v1/expenses/507f1f77bcf86cd799439012/analytics/summary"
+        )
+        assert response.status_code == 500
+
+
+class TestExpenseRouteTotals:
+    """Test GET /expenses/{group_id}/totals endpoint."""
+
+    def test_get_totals_success(self, expense_client, mock_group_summary_repository):
+        from app.domain.entities.group_summary_entity import GroupSummary, SummaryTotals
+
+        client, _ = expense_client
+        mock_group_summary_repository.get_by_group_id.return_value = GroupSummary(
+            group_id="507f1f77bcf86cd799439012",
+            total_cents=5000,
+            count=1,
+            by_type={"cash": SummaryTotals(total_cents=5000, count=1)},
+        )
+
+        response = client.get("/api/v1/expenses/507f1f77bcf86cd799439012/totals")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_cents"] == 5000
+        assert data["by_type"] == {"cash": {"total_cents": 5000, "count": 1}}
+
+    def test_get_totals_without_summary_returns_zeros(
+        self, expense_client, mock_group_summary_repository
+    ):
+        client, _ = expense_client
+        mock_group_summary_repository.get_by_group_id.return_value = None
+
+        response = client.get("/api/v1/expenses/507f1f77bcf86cd799439012/totals")
+        assert response.status_code == 200
+        assert response.json()["count"] == 0
+
+    def test_get_totals_server_error(self, expense_client, mock_group_summary_repository):
+        client, _ = expense_client
+        mock_group_summary_repository.get_by_group_id.side_effect = Exception("DB error")
+
+        response = client.get("/api/v1/expenses/507f1f77bcf86cd799439012/totals")
+        assert response.status_code == 500
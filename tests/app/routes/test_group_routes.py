@@ -88,7 +88,7 @@ class TestCreateGroupRoute:
         user_id = str(ObjectId())
         creator = make_test_user(user_id)
         mock_user_repo.get_by_email.return_value = creator
-        mock_user_repo.get_by_id.return_value = None
+        mock_user_repo.get_many_by_ids.return_value = {}
 
         group_entity = Group(
             id=str(ObjectId()),
@@ -159,7 +159,7 @@ class TestCreateGroupRoute:
 #             for i in range(3)
 #         ]
 #         mock_repo.get_all.return_value = groups
-#         mock_user_repo.get_by_id.return_value = None
+#         mock_user_repo.get_many_by_ids.return_value = {}
 
 #         # Act
 #         response = client.get("/api/v1/groups")
@@ -202,7 +202,7 @@ class TestGetGroupByIdRoute:
 
         auth_user = make_test_user(user_id)
         mock_user_repo.get_by_email.return_value = auth_user
-        mock_user_repo.get_by_id.return_value = None
+        mock_user_repo.get_many_by_ids.return_value = {}
 
         group = Group(
             id=group_id,
@@ -243,7 +243,7 @@ class TestUpdateGroupRoute:
 
         auth_user = make_test_user(user_id)
         mock_user_repo.get_by_email.return_value = auth_user
-        mock_user_repo.get_by_id.return_value = None
+        mock_user_repo.get_many_by_ids.return_value = {}
 
         group = Group(
             id=group_id,
@@ -254,7 +254,7 @@ class TestUpdateGroupRoute:
             updated_at=datetime.now(timezone.utc),
         )
         mock_repo.get_by_id.return_value = group
-        mock_repo.update.return_value = group
+        mock_repo.update_fields.return_value = group
 
         # Act
         response = client.patch(f"/api/v1/groups/{group_id}", json={"group_name": "Nome Atualizado"})
@@ -326,7 +326,7 @@ class TestAddUserToGroupRoute:
 
         auth_user = make_test_user(existing_user_id)
         mock_user_repo.get_by_email.return_value = auth_user
-        mock_user_repo.get_by_id.return_value = None
+        mock_user_repo.get_many_by_ids.return_value = {}
 
         group_before = Group(
             id=group_id,
@@ -345,7 +345,7 @@ class TestAddUserToGroupRoute:
             updated_at=datetime.now(timezone.utc),
         )
         mock_repo.get_by_id.return_value = group_before
-        mock_repo.update.return_value = group_after
+        mock_repo.add_member.return_value = group_after
 
         # Act
         response = client.post(
@@ -389,6 +389,8 @@ class TestAddUserToGroupRoute:
             updated_at=datetime.now(timezone.utc),
         )
         mock_repo.get_by_id.return_value = group
+        mock_repo.add_member.return_value = None
+        mock_repo.exists.return_value = True
 
         # Act
         response = client.post(
@@ -399,6 +401,69 @@ class TestAddUserToGroupRoute:
         assert response.status_code == 422
 
 
+class TestAddUsersToGroupRoute:
+    def test_add_users_success(self, group_client):
+        # Arrange
+        client, mock_repo, mock_user_repo = group_client
+
+        group_id = str(ObjectId())
+        auth_user_id = str(ObjectId())
+        new_user_ids = [str(ObjectId()), str(ObjectId())]
+
+        mock_user_repo.get_by_email.return_value = make_test_user(auth_user_id)
+        mock_user_repo.get_many_by_ids.return_value = {}
+
+        group_before = Group(
+            id=group_id,
+            group_name="Turma",
+            creator_id=auth_user_id,
+            user_ids=[auth_user_id],
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+        )
+        group_after = group_before.model_copy(
+            update={"user_ids": [auth_user_id] + new_user_ids}
+        )
+        mock_repo.get_by_id.return_value = group_before
+        mock_repo.add_members.return_value = group_after
+
+        # Act
+        response = client.post(
+            f"/api/v1/groups/{group_id}/users/bulk", json={"user_ids": new_user_ids}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["message"] == "Users added to group successfully"
+        mock_repo.add_members.assert_called_once_with(group_id, new_user_ids)
+
+    def test_add_users_group_not_found_returns_404(self, group_client):
+        # Arrange
+        client, mock_repo, _ = group_client
+        mock_repo.get_by_id.return_value = None
+
+        # Act
+        response = client.post(
+            f"/api/v1/groups/{str(ObjectId())}/users/bulk",
+            json={"user_ids": [str(ObjectId())]},
+        )
+
+        # Assert
+        assert response.status_code == 404
+
+    def test_add_users_empty_list_returns_422(self, group_client):
+        # Arrange
+        client, _, _ = group_client
+
+        # Act
+        response = client.post(
+            f"/api/v1/groups/{str(ObjectId())}/users/bulk", json={"user_ids": []}
+        )
+
+        # Assert
+        assert response.status_code == 422
+
+
 class TestRemoveUserFromGroupRoute:
     def test_remove_user_success(self, group_client):
         # Arrange
@@ -410,7 +475,7 @@ class TestRemoveUserFromGroupRoute:
 
         auth_user = make_test_user(auth_user_id)
         mock_user_repo.get_by_email.return_value = auth_user
-        mock_user_repo.get_by_id.return_value = None
+        mock_user_repo.get_many_by_ids.return_value = {}
 
         group_before = Group(
             id=group_id,
@@ -429,7 +494,7 @@ class TestRemoveUserFromGroupRoute:
             updated_at=datetime.now(timezone.utc),
         )
         mock_repo.get_by_id.return_value = group_before
-        mock_repo.update.return_value = group_after
+        mock_repo.remove_member.return_value = group_after
 
         # Act
         response = client.delete(f"/api/v1/groups/{group_id}/users/{user_to_remove_id}")
@@ -470,6 +535,8 @@ class TestRemoveUserFromGroupRoute:
             updated_at=datetime.now(timezone.utc),
         )
         mock_repo.get_by_id.return_value = group
+        mock_repo.remove_member.return_value = None
+        mock_repo.exists.return_value = True
 
         # Act
         response = client.delete(f"/api/v1/groups/{group_id}/users/{user_to_remove_id}")
@@ -166,9 +166,7 @@ class TestUserPrivateUpdateUser:
         user_id = str(ObjectId())
         entity = make_user_entity(user_id)
         make_user_response_obj(user_id)
-        mock_repo.get_by_id.return_value = entity
-        mock_repo.email_exists.return_value = False
-        mock_repo.update.return_value = entity
+        mock_repo.update_fields.return_value = entity
 
         update_data = {"name": "Updated Name"}
         response = client.put(f"/api/v1/users/{user_id}", json=update_data)
@@ -176,8 +174,7 @@ class TestUserPrivateUpdateUser:
 
     def test_update_user_not_found(self, user_private_client):
         client, mock_repo = user_private_client
-        mock_repo.get_by_id.return_value = None
-        mock_repo.update.return_value = None
+        mock_repo.update_fields.return_value = None
 
         update_data = {"name": "Updated Name"}
         response = client.put(f"/api/v1/users/{str(ObjectId())}", json=update_data)
@@ -230,7 +227,7 @@ class TestUserPrivateUpdateUser:
 
     def test_update_user_server_error(self, user_private_client):
         client, mock_repo = user_private_client
-        mock_repo.get_by_id.side_effect = Exception("DB error")
+        mock_repo.update_fields.side_effect = Exception("DB error")
 
         update_data = {"name": "Updated Name"}
         response = client.put(f"/api/v1/users/{str(ObjectId())}", json=update_data)
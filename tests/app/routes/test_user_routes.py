@@ -2,11 +2,13 @@
 
 import pytest
 from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, patch
 from bson import ObjectId
 from fastapi.testclient import TestClient
 
 from app.api import app
 from app.models.user_schema import UserResponse
+from app.infrastructure.password_hasher import PasswordHasherBusyError
 
 
 def make_user_response_obj():
@@ -101,6 +103,30 @@ class TestUserRegisterRoute:
         # Assert
         assert response.status_code == 400
 
+    def test_register_user_hasher_busy_returns_503(self, public_client):
+        client, mock_repo = public_client
+        # Arrange
+        mock_repo.get_by_email.return_value = None
+        user_data = {
+            "name": "Test User",
+            "email": "test@example.com",
+            "password": "password123!@#",
+            "date_birth": "1990-05-15",
+        }
+
+        # Act
+        with patch(
+            "app.use_cases.user.create_user.hash_password_async",
+            new_callable=AsyncMock,
+            side_effect=PasswordHasherBusyError("busy"),
+        ):
+            response = client.post("/api/v1/users/register", json=user_data)
+
+        # Assert
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+        mock_repo.create.assert_not_called()
+
 
 class TestUserRoutes:
     """Test cases for user API routes — validation."""
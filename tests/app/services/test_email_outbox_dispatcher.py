@@ -0,0 +1,365 @@
+"""Tests for services/email_outbox_dispatcher.py"""
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from bson import ObjectId
+
+from app.domain.entities.outbox_email_entity import OutboxEmail
+from app.domain.interfaces.email_outbox_repository_interface import (
+    IEmailOutboxRepository,
+)
+from app.infrastructure.metrics import MetricsRegistry
+from app.services import email_outbox_dispatcher
+from app.services.email_outbox_dispatcher import EmailOutboxDispatcher
+from app.services.fake_email_transport import FakeEmailTransport
+
+
+class InMemoryOutbox(IEmailOutboxRepository):
+    """Outbox repository with the semantics of the Mongo one, kept in memory."""
+
+    def __init__(self):
+        self.emails: Dict[str, OutboxEmail] = {}
+        self.dead: List[OutboxEmail] = []
+
+    async def enqueue(self, email: OutboxEmail) -> OutboxEmail:
+        email.id = str(ObjectId())
+        self.emails[email.id] = email
+        return email
+
+    async def claim_next(
+        self, now: datetime, lease_seconds: float
+    ) -> Optional[OutboxEmail]:
+        due = [
+            email
+            for email in self.emails.values()
+            if email.status == "pending" and email.next_attempt_at <= now
+        ]
+        if not due:
+            return None
+        email = min(due, key=lambda e: e.next_attempt_at)
+        email.next_attempt_at = now + timedelta(seconds=lease_seconds)
+        email.attempts += 1
+        return email.model_copy()
+
+    async def mark_sent(self, id: str) -> None:
+        del self.emails[id]
+
+    async def schedule_retry(
+        self, id: str, next_attempt_at: datetime, error: str
+    ) -> None:
+        self.emails[id].next_attempt_at = next_attempt_at
+        self.emails[id].last_error = error
+
+    async def dead_letter(self, id: str, error: str) -> None:
+        email = self.emails[id]
+        email.status = "dead"
+        email.html = ""
+        email.last_error = error
+        self.dead.append(email)
+
+
+class Clock:
+    def __init__(self):
+        self.now = datetime(2026, 4, 23, 12, 0, tzinfo=timezone.utc)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
+def make_email(clock: Clock, expires_in_minutes: int = 15) -> OutboxEmail:
+    return OutboxEmail(
+        to_email="user@example.com",
+        subject="Subject",
+        html="<p>123456</p>",
+        next_attempt_at=clock(),
+        expires_at=clock() + timedelta(minutes=expires_in_minutes),
+    )
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Record into a fresh registry instead of the application one."""
+    registry = MetricsRegistry()
+    monkeypatch.setattr(
+        email_outbox_dispatcher, "EMAILS_SENT", registry.counter("sent_total", "")
+    )
+    monkeypatch.setattr(
+        email_outbox_dispatcher,
+        "EMAILS_RETRIED",
+        registry.counter("retries_total", ""),
+    )
+    monkeypatch.setattr(
+        email_outbox_dispatcher,
+        "EMAILS_DEAD",
+        registry.counter("dead_letters_total", "", ("reason",)),
+    )
+    monkeypatch.setattr(
+        email_outbox_dispatcher,
+        "SEND_DURATION",
+        registry.histogram("send_seconds", "", buckets=(1.0,)),
+    )
+    return registry
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def outbox():
+    return InMemoryOutbox()
+
+
+@pytest.fixture
+def transport():
+    return FakeEmailTransport()
+
+
+@pytest.fixture
+def dispatcher(outbox, transport, clock, registry):
+    return EmailOutboxDispatcher(
+        outbox,
+        transport,
+        workers=2,
+        max_attempts=3,
+        backoff_base_seconds=2.0,
+        backoff_max_seconds=5.0,
+        poll_interval_seconds=0.01,
+        lease_seconds=60.0,
+        clock=clock,
+    )
+
+
+class TestEmailOutboxDispatcherRunOnce:
+    """Test a single claim and delivery"""
+
+    async def test_returns_false_when_outbox_is_empty(self, dispatcher):
+        # Act
+        delivered = await dispatcher.run_once()
+
+        # Assert
+        assert delivered is False
+
+    async def test_delivers_and_removes_email(
+        self, dispatcher, outbox, transport, clock, registry
+    ):
+        # Arrange
+        email = await outbox.enqueue(make_email(clock))
+
+        # Act
+        delivered = await dispatcher.run_once()
+
+        # Assert
+        assert delivered is True
+        assert [sent.id for sent in transport.sent] == [email.id]
+        assert outbox.emails == {}
+        assert "sent_total 1" in registry.render()
+        assert "send_seconds_count 1" in registry.render()
+
+    async def test_failed_send_is_retried_with_backoff(
+        self, dispatcher, outbox, transport, clock, registry
+    ):
+        # Arrange
+        email = await outbox.enqueue(make_email(clock))
+        transport.fail_next(1)
+
+        # Act
+        await dispatcher.run_once()
+
+        # Assert
+        stored = outbox.emails[email.id]
+        delay = (stored.next_attempt_at - clock()).total_seconds()
+        assert 1.0 <= delay <= 2.0
+        assert stored.attempts == 1
+        assert stored.last_error == "ConnectionError: Fake transport failure"
+        assert await dispatcher.run_once() is False
+        assert "retries_total 1" in registry.render()
+
+    async def test_email_is_delivered_once_retry_is_due(
+        self, dispatcher, outbox, transport, clock
+    ):
+        # Arrange
+        await outbox.enqueue(make_email(clock))
+        transport.fail_next(1)
+        await dispatcher.run_once()
+
+        # Act
+        clock.advance(2)
+        delivered = await dispatcher.run_once()
+
+        # Assert
+        assert delivered is True
+        assert len(transport.sent) == 1
+        assert transport.attempts == 2
+
+    async def test_dead_letters_after_max_attempts(
+        self, dispatcher, outbox, transport, clock, registry
+    ):
+        # Arrange
+        email = await outbox.enqueue(make_email(clock))
+        transport.fail_next(10)
+
+        # Act
+        for _ in range(3):
+            await dispatcher.run_once()
+            clock.advance(5)
+
+        # Assert
+        assert outbox.dead == [outbox.emails[email.id]]
+        assert outbox.emails[email.id].html == ""
+        assert "Gave up after 3 attempts" in outbox.emails[email.id].last_error
+        assert transport.attempts == 3
+        assert await dispatcher.run_once() is False
+        assert 'dead_letters_total{reason="attempts_exhausted"} 1' in registry.render()
+
+    async def test_expired_email_is_dead_lettered_without_sending(
+        self, dispatcher, outbox, transport, clock, registry
+    ):
+        # Arrange
+        await outbox.enqueue(make_email(clock, expires_in_minutes=1))
+        clock.advance(61)
+
+        # Act
+        delivered = await dispatcher.run_once()
+
+        # Assert
+        assert delivered is True
+        assert transport.attempts == 0
+        assert len(outbox.dead) == 1
+        assert 'dead_letters_total{reason="expired"} 1' in registry.render()
+
+    async def test_naive_expiry_from_mongo_is_treated_as_utc(
+        self, dispatcher, outbox, transport, clock
+    ):
+        # Arrange
+        email = make_email(clock)
+        email.expires_at = (clock() + timedelta(minutes=15)).replace(tzinfo=None)
+        await outbox.enqueue(email)
+
+        # Act
+        await dispatcher.run_once()
+
+        # Assert
+        assert len(transport.sent) == 1
+
+
+class TestEmailOutboxDispatcherBackoff:
+    """Test the retry delays"""
+
+    def test_backoff_doubles_up_to_the_maximum(self, dispatcher, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(email_outbox_dispatcher.random, "random", lambda: 1.0)
+
+        # Act
+        delays = [dispatcher.backoff_seconds(attempts) for attempts in (1, 2, 3, 4)]
+
+        # Assert
+        assert delays == [2.0, 4.0, 5.0, 5.0]
+
+    def test_backoff_jitter_keeps_at_least_half_the_delay(
+        self, dispatcher, monkeypatch
+    ):
+        # Arrange
+        monkeypatch.setattr(email_outbox_dispatcher.random, "random", lambda: 0.0)
+
+        # Act / Assert
+        assert dispatcher.backoff_seconds(2) == 2.0
+
+
+class TestEmailOutboxDispatcherWorkers:
+    """Test the worker pool lifecycle"""
+
+    async def test_workers_drain_the_outbox(self, dispatcher, outbox, transport, clock):
+        # Arrange
+        for _ in range(5):
+            await outbox.enqueue(make_email(clock))
+
+        # Act
+        dispatcher.start()
+        try:
+            for _ in range(100):
+                if not outbox.emails:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await dispatcher.stop()
+
+        # Assert
+        assert outbox.emails == {}
+        assert len(transport.sent) == 5
+
+    async def test_wake_delivers_without_waiting_for_the_poll(
+        self, dispatcher, outbox, transport, clock
+    ):
+        # Arrange
+        dispatcher.poll_interval_seconds = 60
+        dispatcher.start()
+        await asyncio.sleep(0.01)
+
+        # Act
+        try:
+            await outbox.enqueue(make_email(clock))
+            dispatcher.wake()
+            for _ in range(100):
+                if transport.sent:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await dispatcher.stop()
+
+        # Assert
+        assert len(transport.sent) == 1
+
+    async def test_worker_survives_repository_errors(
+        self, dispatcher, outbox, transport, clock, monkeypatch
+    ):
+        # Arrange
+        claim_next = outbox.claim_next
+        calls = []
+
+        async def flaky_claim_next(now, lease_seconds):
+            calls.append(now)
+            if len(calls) == 1:
+                raise ConnectionError("db down")
+            return await claim_next(now, lease_seconds)
+
+        monkeypatch.setattr(outbox, "claim_next", flaky_claim_next)
+        await outbox.enqueue(make_email(clock))
+
+        # Act
+        dispatcher.start()
+        try:
+            for _ in range(100):
+                if transport.sent:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await dispatcher.stop()
+
+        # Assert
+        assert len(transport.sent) == 1
+
+    async def test_start_and_stop_are_idempotent(self, dispatcher):
+        # Act
+        dispatcher.start()
+        tasks = list(dispatcher._tasks)
+        dispatcher.start()
+        restarted_tasks = list(dispatcher._tasks)
+        await dispatcher.stop()
+        await dispatcher.stop()
+
+        # Assert
+        assert len(tasks) == 2
+        assert restarted_tasks == tasks
+        assert all(task.done() for task in tasks)
+        assert dispatcher.running is False
+
+    def test_wake_before_start_is_a_no_op(self, dispatcher):
+        # Act / Assert
+        dispatcher.wake()
@@ -0,0 +1,76 @@
+"""Tests for services/outbox_email_service.py"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+from app.domain.entities.outbox_email_entity import OutboxEmail
+from app.domain.interfaces.email_outbox_repository_interface import (
+    IEmailOutboxRepository,
+)
+from app.domain.interfaces.email_service_interface import IEmailService
+from app.services.outbox_email_service import (
+    VERIFICATION_EMAIL_TTL_MINUTES,
+    VERIFICATION_SUBJECT,
+    OutboxEmailService,
+)
+
+
+@pytest.fixture
+def outbox_repository():
+    repository = AsyncMock(spec=IEmailOutboxRepository)
+    repository.enqueue.side_effect = lambda email: email
+    return repository
+
+
+class TestOutboxEmailService:
+    """Test verification emails are queued rather than sent"""
+
+    def test_is_an_email_service(self, outbox_repository):
+        # Act / Assert
+        assert isinstance(OutboxEmailService(outbox_repository), IEmailService)
+
+    async def test_enqueues_verification_email(self, outbox_repository):
+        # Arrange
+        service = OutboxEmailService(outbox_repository)
+        before = datetime.now(timezone.utc)
+
+        # Act
+        await service.send_verification_email("user@example.com", "382910")
+
+        # Assert
+        email = outbox_repository.enqueue.await_args.args[0]
+        assert isinstance(email, OutboxEmail)
+        assert email.to_email == "user@example.com"
+        assert email.subject == VERIFICATION_SUBJECT
+        assert "382910" in email.html
+        assert email.status == "pending"
+        assert before <= email.next_attempt_at <= datetime.now(timezone.utc)
+        assert email.expires_at - email.next_attempt_at == timedelta(
+            minutes=VERIFICATION_EMAIL_TTL_MINUTES
+        )
+
+    async def test_notifies_workers_after_enqueue(self, outbox_repository):
+        # Arrange
+        notify = MagicMock()
+        outbox_repository.enqueue.side_effect = lambda email: notify.assert_not_called()
+        service = OutboxEmailService(outbox_repository, notify=notify)
+
+        # Act
+        await service.send_verification_email("user@example.com", "382910")
+
+        # Assert
+        notify.assert_called_once_with()
+
+    async def test_enqueue_failure_propagates_without_notifying(
+        self, outbox_repository
+    ):
+        # Arrange
+        notify = MagicMock()
+        outbox_repository.enqueue.side_effect = Exception("write failed")
+        service = OutboxEmailService(outbox_repository, notify=notify)
+
+        # Act / Assert
+        with pytest.raises(Exception, match="write failed"):
+            await service.send_verification_email("user@example.com", "382910")
+        notify.assert_not_called()
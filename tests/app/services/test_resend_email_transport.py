@@ -0,0 +1,54 @@
+"""Tests for services/resend_email_transport.py"""
+
+import pytest
+from unittest.mock import patch
+
+from app.domain.entities.outbox_email_entity import OutboxEmail
+from app.services.resend_email_transport import ResendEmailTransport
+
+
+def make_email():
+    return OutboxEmail(
+        id="507f1f77bcf86cd799439011",
+        to_email="user@example.com",
+        subject="Subject",
+        html="<p>382910</p>",
+    )
+
+
+class TestResendEmailTransport:
+    """Test outbox emails are handed to the Resend SDK"""
+
+    def test_sets_api_key_on_init(self):
+        # Arrange
+        with patch("app.services.resend_email_transport.resend") as mock_resend:
+            # Act
+            transport = ResendEmailTransport()
+
+        # Assert
+        assert mock_resend.api_key == transport.settings.resend_api_key
+
+    def test_send_passes_email_fields(self):
+        # Arrange
+        with patch("app.services.resend_email_transport.resend") as mock_resend:
+            transport = ResendEmailTransport()
+
+            # Act
+            transport.send(make_email())
+
+        # Assert
+        params = mock_resend.Emails.send.call_args.args[0]
+        assert params["from"] == transport.settings.resend_from_email
+        assert params["to"] == ["user@example.com"]
+        assert params["subject"] == "Subject"
+        assert params["html"] == "<p>382910</p>"
+
+    def test_send_propagates_api_errors(self):
+        # Arrange
+        with patch("app.services.resend_email_transport.resend") as mock_resend:
+            mock_resend.Emails.send.side_effect = Exception("rate limited")
+            transport = ResendEmailTransport()
+
+            # Act / Assert
+            with pytest.raises(Exception, match="rate limited"):
+                transport.send(make_email())
@@ -0,0 +1,95 @@
+"""Tests for services/verification_token_compactor.py"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+from app.domain.interfaces.email_verification_repository_interface import (
+    IEmailVerificationRepository,
+)
+from app.infrastructure.metrics import MetricsRegistry
+from app.services import verification_token_compactor
+from app.services.verification_token_compactor import VerificationTokenCompactor
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Record into a fresh registry instead of the application one."""
+    registry = MetricsRegistry()
+    monkeypatch.setattr(
+        verification_token_compactor,
+        "TOKENS_COMPACTED",
+        registry.counter("compacted_total", ""),
+    )
+    return registry
+
+
+@pytest.fixture
+def repository():
+    return AsyncMock(spec=IEmailVerificationRepository)
+
+
+class TestVerificationTokenCompactor:
+    """Test used tokens are deleted in batches"""
+
+    async def test_run_once_deletes_until_a_batch_is_short(self, repository, registry):
+        # Arrange
+        repository.delete_used.side_effect = [10, 10, 3]
+        compactor = VerificationTokenCompactor(repository, batch_size=10)
+
+        # Act
+        deleted = await compactor.run_once()
+
+        # Assert
+        assert deleted == 23
+        assert repository.delete_used.await_count == 3
+        repository.delete_used.assert_awaited_with(10)
+        assert "compacted_total 23" in registry.render()
+
+    async def test_run_once_with_nothing_to_delete(self, repository, registry):
+        # Arrange
+        repository.delete_used.return_value = 0
+        compactor = VerificationTokenCompactor(repository)
+
+        # Act / Assert
+        assert await compactor.run_once() == 0
+        repository.delete_used.assert_awaited_once_with(1000)
+
+    async def test_task_runs_periodically_and_survives_errors(
+        self, repository, registry
+    ):
+        # Arrange
+        repository.delete_used.side_effect = [RuntimeError("db down"), 0, 0, 0]
+        compactor = VerificationTokenCompactor(repository, interval_seconds=0.01)
+
+        # Act
+        compactor.start()
+        try:
+            for _ in range(100):
+                if repository.delete_used.await_count >= 3:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await compactor.stop()
+
+        # Assert
+        assert repository.delete_used.await_count >= 3
+        assert compactor.running is False
+
+    async def test_start_and_stop_are_idempotent(self, repository, registry):
+        # Arrange
+        repository.delete_used.return_value = 0
+        compactor = VerificationTokenCompactor(repository, interval_seconds=60)
+
+        # Act
+        compactor.start()
+        task = compactor._task
+        compactor.start()
+        same_task = compactor._task is task
+        await compactor.stop()
+        await compactor.stop()
+
+        # Assert
+        assert same_task
+        assert task.done()
+        assert compactor.running is False
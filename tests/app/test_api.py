@@ -78,6 +78,59 @@ class TestAppLifespan:
             mock_connect.assert_awaited_once()
             mock_disconnect.assert_awaited_once()
 
+    async def test_lifespan_builds_and_resets_container(self):
+        """Test the dependency container is built at startup and dropped at shutdown."""
+        # Arrange
+        from app.api import lifespan
+        from app.infrastructure.dependencies.container import get_container
+
+        with patch("app.api.Database.connect", new_callable=AsyncMock), patch(
+            "app.api.Database.disconnect", new_callable=AsyncMock
+        ):
+            # Act
+            async with lifespan(app):
+                startup_container = get_container()
+                assert get_container.cache_info().currsize == 1
+
+            # Assert
+            assert get_container.cache_info().currsize == 0
+            assert get_container() is not startup_container
+
+    async def test_lifespan_runs_background_tasks_while_serving(self):
+        """Test the email workers and token compactor run while serving."""
+        # Arrange
+        from app.api import lifespan
+        from app.infrastructure.dependencies.container import get_container
+
+        with patch("app.api.Database.connect", new_callable=AsyncMock), patch(
+            "app.api.Database.disconnect", new_callable=AsyncMock
+        ):
+            # Act
+            async with lifespan(app):
+                dispatcher = get_container().email_dispatcher
+                compactor = get_container().token_compactor
+                assert dispatcher.running is True
+                assert compactor.running is True
+
+            # Assert
+            assert dispatcher.running is False
+            assert compactor.running is False
+
+    async def test_lifespan_flushes_logs_on_shutdown(self):
+        """Test the logging listener is stopped once the app has shut down."""
+        # Arrange
+        from app.api import lifespan
+
+        with patch("app.api.Database.connect", new_callable=AsyncMock), patch(
+            "app.api.Database.disconnect", new_callable=AsyncMock
+        ), patch("app.api.shutdown_logging") as mock_shutdown_logging:
+            # Act
+            async with lifespan(app):
+                mock_shutdown_logging.assert_not_called()
+
+            # Assert
+            mock_shutdown_logging.assert_called_once()
+
 
 class TestRootEndpoint:
     """Test the root GET / endpoint."""
@@ -103,3 +156,32 @@ class TestRootEndpoint:
         data = response.json()
         assert "message" in data
         assert data["status"] == "running"
+
+
+class TestMetricsEndpoint:
+    """Test the GET /metrics endpoint."""
+
+    def test_metrics_endpoint_exposes_request_metrics(self):
+        # Arrange
+        from fastapi.testclient import TestClient
+
+        with patch(
+            "app.infrastructure.database.database.Database.connect",
+            new_callable=AsyncMock,
+        ), patch(
+            "app.infrastructure.database.database.Database.disconnect",
+            new_callable=AsyncMock,
+        ):
+            client = TestClient(app, raise_server_exceptions=False)
+            client.get("/")
+
+            # Act
+            response = client.get("/metrics")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert (
+            'http_requests_total{method="GET",route="/",status="200"}' in response.text
+        )
+        assert "# TYPE mongodb_command_duration_seconds histogram" in response.text
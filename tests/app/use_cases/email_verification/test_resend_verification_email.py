@@ -32,16 +32,11 @@ class TestResendVerificationEmailUseCase:
         mock_verification_repository,
         mock_email_service,
         sample_unverified_user_entity,
-        sample_verification_token_entity,
     ):
         # Arrange
-        sample_verification_token_entity.resend_count = 1
         mock_user_repository.get_by_id_unverified.return_value = (
             sample_unverified_user_entity
         )
-        mock_verification_repository.get_latest_by_user_id.return_value = (
-            sample_verification_token_entity
-        )
 
         input_data = ResendVerificationEmailInput(
             user_id=sample_unverified_user_entity.id
@@ -73,7 +68,6 @@ class TestResendVerificationEmailUseCase:
         mock_user_repository.get_by_id_unverified.return_value = (
             sample_unverified_user_entity
         )
-        mock_verification_repository.get_latest_by_user_id.return_value = None
 
         input_data = ResendVerificationEmailInput(
             user_id=sample_unverified_user_entity.id
@@ -113,7 +107,7 @@ class TestResendVerificationEmailUseCase:
         with pytest.raises(ValueError, match="User not found"):
             await use_case.execute(ResendVerificationEmailInput(user_id="nonexistent"))
 
-        mock_verification_repository.get_latest_by_user_id.assert_not_called()
+        mock_verification_repository.issue_token.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_raises_when_email_already_verified(
@@ -138,7 +132,7 @@ class TestResendVerificationEmailUseCase:
                 ResendVerificationEmailInput(user_id=sample_unverified_user_entity.id)
             )
 
-        mock_verification_repository.get_latest_by_user_id.assert_not_called()
+        mock_verification_repository.issue_token.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_raises_when_resend_limit_reached(
@@ -147,16 +141,12 @@ class TestResendVerificationEmailUseCase:
         mock_verification_repository,
         mock_email_service,
         sample_unverified_user_entity,
-        sample_verification_token_entity,
     ):
-        # Arrange — resend_count at limit
-        sample_verification_token_entity.resend_count = 3
+        # Arrange — the repository refuses to issue past the resend limit
         mock_user_repository.get_by_id_unverified.return_value = (
             sample_unverified_user_entity
         )
-        mock_verification_repository.get_latest_by_user_id.return_value = (
-            sample_verification_token_entity
-        )
+        mock_verification_repository.issue_token.return_value = None
         use_case = self._make_use_case(
             mock_user_repository, mock_verification_repository, mock_email_service
         )
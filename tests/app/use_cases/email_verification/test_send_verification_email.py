@@ -2,14 +2,13 @@
 
 import hashlib
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 from datetime import datetime, timezone, timedelta
 
 from app.use_cases.email_verification.send_verification_email import (
     SendVerificationEmailUseCase,
 )
 from app.domain.dtos.email_verification_dtos import SendVerificationEmailInput
-from app.domain.entities.email_verification_token_entity import EmailVerificationToken
 
 
 class TestSendVerificationEmailUseCase:
@@ -26,15 +25,16 @@ class TestSendVerificationEmailUseCase:
     # ------------------------------------------------------------------
 
     @pytest.mark.asyncio
-    async def test_send_success_first_time(
+    async def test_send_success_issues_token_in_one_call(
         self,
         mock_verification_repository,
         mock_email_service,
+        sample_verification_token_entity,
     ):
         # Arrange
-        mock_verification_repository.get_latest_by_user_id.return_value = None
-        mock_verification_repository.invalidate_all_by_user_id.return_value = None
-        mock_verification_repository.create.return_value = MagicMock()
+        mock_verification_repository.issue_token.return_value = (
+            sample_verification_token_entity
+        )
         mock_email_service.send_verification_email.return_value = None
 
         input_data = SendVerificationEmailInput(
@@ -53,63 +53,26 @@ class TestSendVerificationEmailUseCase:
 
         # Assert
         assert result == "jwt-token"
-        mock_verification_repository.invalidate_all_by_user_id.assert_called_once_with(
-            "user-123"
+        mock_verification_repository.issue_token.assert_awaited_once()
+        user_id, _, _, max_resends = (
+            mock_verification_repository.issue_token.await_args.args
         )
-        mock_verification_repository.create.assert_called_once()
+        assert user_id == "user-123"
+        assert max_resends == 3
+        mock_verification_repository.create.assert_not_called()
         mock_email_service.send_verification_email.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_send_success_with_previous_token(
+    async def test_code_is_hashed_before_storing(
         self,
         mock_verification_repository,
         mock_email_service,
         sample_verification_token_entity,
     ):
-        # Arrange — previous token exists with resend_count = 1 (below limit)
-        sample_verification_token_entity.resend_count = 1
-        mock_verification_repository.get_latest_by_user_id.return_value = (
+        # Arrange
+        mock_verification_repository.issue_token.return_value = (
             sample_verification_token_entity
         )
-        mock_verification_repository.invalidate_all_by_user_id.return_value = None
-        mock_verification_repository.create.return_value = MagicMock()
-        mock_email_service.send_verification_email.return_value = None
-
-        input_data = SendVerificationEmailInput(
-            user_id="user-123", email="user@example.com"
-        )
-        use_case = self._make_use_case(
-            mock_verification_repository, mock_email_service
-        )
-
-        # Act
-        with patch(
-            "app.use_cases.email_verification.send_verification_email.OAuth2Service"
-        ) as MockOAuth:
-            MockOAuth.return_value.create_verification_token.return_value = "jwt-token"
-            result = await use_case.execute(input_data)
-
-        # Assert
-        assert result == "jwt-token"
-        mock_verification_repository.create.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_code_is_hashed_before_storing(
-        self,
-        mock_verification_repository,
-        mock_email_service,
-    ):
-        # Arrange
-        stored_entity = None
-
-        async def capture_create(entity):
-            nonlocal stored_entity
-            stored_entity = entity
-            return entity
-
-        mock_verification_repository.get_latest_by_user_id.return_value = None
-        mock_verification_repository.invalidate_all_by_user_id.return_value = None
-        mock_verification_repository.create.side_effect = capture_create
         mock_email_service.send_verification_email.return_value = None
 
         input_data = SendVerificationEmailInput(
@@ -120,6 +83,7 @@ class TestSendVerificationEmailUseCase:
         )
 
         # Act
+        before = datetime.now(timezone.utc)
         with patch(
             "app.use_cases.email_verification.send_verification_email.OAuth2Service"
         ) as MockOAuth:
@@ -131,9 +95,14 @@ class TestSendVerificationEmailUseCase:
                 await use_case.execute(input_data)
 
         # Assert — code stored as hash, not plain text
-        assert stored_entity is not None
-        expected_hash = hashlib.sha256("382910".encode()).hexdigest()
-        assert stored_entity.code_hash == expected_hash
+        _, code_hash, expires_at, _ = (
+            mock_verification_repository.issue_token.await_args.args
+        )
+        assert code_hash == hashlib.sha256("382910".encode()).hexdigest()
+        assert expires_at >= before + timedelta(minutes=15)
+        mock_email_service.send_verification_email.assert_called_once_with(
+            to_email="user@example.com", code="382910"
+        )
 
     # ------------------------------------------------------------------
     # Failure cases
@@ -144,13 +113,9 @@ class TestSendVerificationEmailUseCase:
         self,
         mock_verification_repository,
         mock_email_service,
-        sample_verification_token_entity,
     ):
-        # Arrange — resend_count at limit (3)
-        sample_verification_token_entity.resend_count = 3
-        mock_verification_repository.get_latest_by_user_id.return_value = (
-            sample_verification_token_entity
-        )
+        # Arrange — the repository refuses to issue past the limit
+        mock_verification_repository.issue_token.return_value = None
         input_data = SendVerificationEmailInput(
             user_id="user-123", email="user@example.com"
         )
@@ -162,7 +127,6 @@ class TestSendVerificationEmailUseCase:
         with pytest.raises(ValueError, match="Maximum number"):
             await use_case.execute(input_data)
 
-        mock_verification_repository.create.assert_not_called()
         mock_email_service.send_verification_email.assert_not_called()
 
     @pytest.mark.asyncio
@@ -170,11 +134,12 @@ class TestSendVerificationEmailUseCase:
         self,
         mock_verification_repository,
         mock_email_service,
+        sample_verification_token_entity,
     ):
         # Arrange
-        mock_verification_repository.get_latest_by_user_id.return_value = None
-        mock_verification_repository.invalidate_all_by_user_id.return_value = None
-        mock_verification_repository.create.return_value = MagicMock()
+        mock_verification_repository.issue_token.return_value = (
+            sample_verification_token_entity
+        )
         mock_email_service.send_verification_email.side_effect = Exception(
             "SMTP error"
         )
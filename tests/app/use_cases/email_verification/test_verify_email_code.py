@@ -2,11 +2,13 @@
 
 import hashlib
 import pytest
-from unittest.mock import AsyncMock, patch
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock, patch
 from datetime import datetime, timezone, timedelta
 
 from app.use_cases.email_verification.verify_email_code import VerifyEmailCodeUseCase
 from app.domain.dtos.email_verification_dtos import VerifyEmailCodeInput
+from app.domain.interfaces.transaction_manager_interface import ITransactionManager
 
 
 VALID_CODE = "382910"
@@ -14,13 +16,44 @@ VALID_HASH = hashlib.sha256(VALID_CODE.encode()).hexdigest()
 WRONG_CODE = "000000"
 
 
+class RecordingTransactionManager(ITransactionManager):
+    """Yields a sentinel session and records whether the block raised."""
+
+    def __init__(self):
+        self.session = MagicMock(name="session")
+        self.outcomes = []
+
+    @asynccontextmanager
+    async def transaction(self):
+        try:
+            yield self.session
+        except Exception:
+            self.outcomes.append("aborted")
+            raise
+        self.outcomes.append("committed")
+
+
+def patch_oauth():
+    patcher = patch("app.use_cases.email_verification.verify_email_code.OAuth2Service")
+    mock_oauth = patcher.start().return_value
+    mock_oauth.create_token_pair.return_value = (
+        "access-token",
+        "refresh-token",
+        datetime.now(timezone.utc) + timedelta(hours=1),
+    )
+    return patcher
+
+
 class TestVerifyEmailCodeUseCase:
     """Tests for VerifyEmailCodeUseCase."""
 
-    def _make_use_case(self, mock_user_repository, mock_verification_repository):
+    def _make_use_case(
+        self, mock_user_repository, mock_verification_repository, **kwargs
+    ):
         return VerifyEmailCodeUseCase(
             user_repository=mock_user_repository,
             verification_repository=mock_verification_repository,
+            **kwargs,
         )
 
     # ------------------------------------------------------------------
@@ -36,16 +69,13 @@ class TestVerifyEmailCodeUseCase:
         sample_unverified_user_entity,
     ):
         # Arrange
-        sample_verification_token_entity.code_hash = VALID_HASH
-        sample_verification_token_entity.attempts = 0
-        mock_verification_repository.get_valid_token_by_user_id.return_value = (
+        sample_verification_token_entity.is_used = True
+        mock_verification_repository.consume_code.return_value = (
             sample_verification_token_entity
         )
-        mock_verification_repository.mark_as_used.return_value = None
-        mock_user_repository.get_by_id_unverified.return_value = (
+        mock_user_repository.mark_email_verified.return_value = (
             sample_unverified_user_entity
         )
-        mock_user_repository.update.return_value = sample_unverified_user_entity
 
         input_data = VerifyEmailCodeInput(
             user_id=sample_unverified_user_entity.id, code=VALID_CODE
@@ -53,29 +83,74 @@ class TestVerifyEmailCodeUseCase:
         use_case = self._make_use_case(mock_user_repository, mock_verification_repository)
 
         # Act
-        with patch(
-            "app.use_cases.email_verification.verify_email_code.OAuth2Service"
-        ) as MockOAuth:
-            mock_oauth = MockOAuth.return_value
-            future_dt = datetime.now(timezone.utc) + timedelta(hours=1)
-            mock_oauth.create_token_pair.return_value = (
-                "access-token",
-                "refresh-token",
-                future_dt,
-            )
+        patcher = patch_oauth()
+        try:
             result = await use_case.execute(input_data)
+        finally:
+            patcher.stop()
 
         # Assert
         assert result.access_token == "access-token"
         assert result.refresh_token == "refresh-token"
         assert result.token_type == "bearer"
-        mock_verification_repository.mark_as_used.assert_called_once_with(
-            sample_verification_token_entity.id
+        user_id, code_hash, _, max_attempts = (
+            mock_verification_repository.consume_code.await_args.args
+        )
+        assert user_id == sample_unverified_user_entity.id
+        assert code_hash == VALID_HASH
+        assert max_attempts == 5
+        mock_user_repository.mark_email_verified.assert_awaited_once_with(
+            sample_unverified_user_entity.id, session=None
+        )
+        # Only targeted writes on the happy path
+        mock_verification_repository.get_valid_token_by_user_id.assert_not_called()
+        mock_user_repository.get_by_id_unverified.assert_not_called()
+        mock_user_repository.update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_writes_share_the_transaction_session(
+        self,
+        mock_user_repository,
+        mock_verification_repository,
+        sample_verification_token_entity,
+        sample_unverified_user_entity,
+    ):
+        # Arrange
+        transactions = RecordingTransactionManager()
+        sample_verification_token_entity.is_used = True
+        mock_verification_repository.consume_code.return_value = (
+            sample_verification_token_entity
+        )
+        mock_user_repository.mark_email_verified.return_value = (
+            sample_unverified_user_entity
+        )
+        use_case = self._make_use_case(
+            mock_user_repository,
+            mock_verification_repository,
+            transaction_manager=transactions,
+        )
+
+        # Act
+        patcher = patch_oauth()
+        try:
+            await use_case.execute(
+                VerifyEmailCodeInput(
+                    user_id=sample_unverified_user_entity.id, code=VALID_CODE
+                )
+            )
+        finally:
+            patcher.stop()
+
+        # Assert
+        assert (
+            mock_verification_repository.consume_code.await_args.kwargs["session"]
+            is transactions.session
         )
-        mock_user_repository.update.assert_called_once()
-        # User must be activated
-        assert sample_unverified_user_entity.is_active is True
-        assert sample_unverified_user_entity.is_email_verified is True
+        assert (
+            mock_user_repository.mark_email_verified.await_args.kwargs["session"]
+            is transactions.session
+        )
+        assert transactions.outcomes == ["committed"]
 
     # ------------------------------------------------------------------
     # Failure cases
@@ -86,6 +161,7 @@ class TestVerifyEmailCodeUseCase:
         self, mock_user_repository, mock_verification_repository
     ):
         # Arrange
+        mock_verification_repository.consume_code.return_value = None
         mock_verification_repository.get_valid_token_by_user_id.return_value = None
         use_case = self._make_use_case(mock_user_repository, mock_verification_repository)
 
@@ -94,7 +170,7 @@ class TestVerifyEmailCodeUseCase:
             await use_case.execute(
                 VerifyEmailCodeInput(user_id="user-123", code=VALID_CODE)
             )
-        mock_user_repository.update.assert_not_called()
+        mock_user_repository.mark_email_verified.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_raises_when_token_expired(
@@ -107,6 +183,7 @@ class TestVerifyEmailCodeUseCase:
         sample_verification_token_entity.expires_at = datetime.now(
             timezone.utc
         ) - timedelta(minutes=1)
+        mock_verification_repository.consume_code.return_value = None
         mock_verification_repository.get_valid_token_by_user_id.return_value = (
             sample_verification_token_entity
         )
@@ -119,7 +196,7 @@ class TestVerifyEmailCodeUseCase:
                     user_id=sample_verification_token_entity.user_id, code=VALID_CODE
                 )
             )
-        mock_user_repository.update.assert_not_called()
+        mock_user_repository.mark_email_verified.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_raises_when_max_attempts_exceeded(
@@ -128,8 +205,9 @@ class TestVerifyEmailCodeUseCase:
         mock_verification_repository,
         sample_verification_token_entity,
     ):
-        # Arrange — already at 5 attempts
+        # Arrange — already at 5 attempts, so the conditional update matches nothing
         sample_verification_token_entity.attempts = 5
+        mock_verification_repository.consume_code.return_value = None
         mock_verification_repository.get_valid_token_by_user_id.return_value = (
             sample_verification_token_entity
         )
@@ -142,22 +220,20 @@ class TestVerifyEmailCodeUseCase:
                     user_id=sample_verification_token_entity.user_id, code=VALID_CODE
                 )
             )
-        mock_user_repository.update.assert_not_called()
+        mock_user_repository.mark_email_verified.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_raises_and_increments_attempts_on_wrong_code(
+    async def test_raises_on_wrong_code_without_touching_user(
         self,
         mock_user_repository,
         mock_verification_repository,
         sample_verification_token_entity,
     ):
-        # Arrange
-        sample_verification_token_entity.code_hash = VALID_HASH
-        sample_verification_token_entity.attempts = 2
-        mock_verification_repository.get_valid_token_by_user_id.return_value = (
+        # Arrange — the update incremented attempts instead of consuming
+        sample_verification_token_entity.attempts = 3
+        mock_verification_repository.consume_code.return_value = (
             sample_verification_token_entity
         )
-        mock_verification_repository.increment_attempts.return_value = None
         use_case = self._make_use_case(mock_user_repository, mock_verification_repository)
 
         # Act & Assert
@@ -168,10 +244,37 @@ class TestVerifyEmailCodeUseCase:
                 )
             )
 
-        mock_verification_repository.increment_attempts.assert_called_once_with(
-            sample_verification_token_entity.id
+        code_hash = mock_verification_repository.consume_code.await_args.args[1]
+        assert code_hash == hashlib.sha256(WRONG_CODE.encode()).hexdigest()
+        mock_user_repository.mark_email_verified.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_wrong_code_attempt_is_committed(
+        self,
+        mock_user_repository,
+        mock_verification_repository,
+        sample_verification_token_entity,
+    ):
+        # Arrange
+        transactions = RecordingTransactionManager()
+        sample_verification_token_entity.attempts = 1
+        mock_verification_repository.consume_code.return_value = (
+            sample_verification_token_entity
+        )
+        use_case = self._make_use_case(
+            mock_user_repository,
+            mock_verification_repository,
+            transaction_manager=transactions,
         )
-        mock_user_repository.update.assert_not_called()
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Invalid verification code"):
+            await use_case.execute(
+                VerifyEmailCodeInput(
+                    user_id=sample_verification_token_entity.user_id, code=WRONG_CODE
+                )
+            )
+        assert transactions.outcomes == ["committed"]
 
     @pytest.mark.asyncio
     async def test_remaining_attempts_reported_correctly(
@@ -180,13 +283,11 @@ class TestVerifyEmailCodeUseCase:
         mock_verification_repository,
         sample_verification_token_entity,
     ):
-        # Arrange — 1 attempt already done, submit wrong code → 3 remaining
-        sample_verification_token_entity.code_hash = VALID_HASH
-        sample_verification_token_entity.attempts = 1
-        mock_verification_repository.get_valid_token_by_user_id.return_value = (
+        # Arrange — 1 attempt already done, wrong code stored as the 2nd → 3 remaining
+        sample_verification_token_entity.attempts = 2
+        mock_verification_repository.consume_code.return_value = (
             sample_verification_token_entity
         )
-        mock_verification_repository.increment_attempts.return_value = None
         use_case = self._make_use_case(mock_user_repository, mock_verification_repository)
 
         # Act & Assert
@@ -205,14 +306,17 @@ class TestVerifyEmailCodeUseCase:
         sample_verification_token_entity,
     ):
         # Arrange — token valid but user was deleted between steps
-        sample_verification_token_entity.code_hash = VALID_HASH
-        sample_verification_token_entity.attempts = 0
-        mock_verification_repository.get_valid_token_by_user_id.return_value = (
+        transactions = RecordingTransactionManager()
+        sample_verification_token_entity.is_used = True
+        mock_verification_repository.consume_code.return_value = (
             sample_verification_token_entity
         )
-        mock_verification_repository.mark_as_used.return_value = None
-        mock_user_repository.get_by_id_unverified.return_value = None
-        use_case = self._make_use_case(mock_user_repository, mock_verification_repository)
+        mock_user_repository.mark_email_verified.return_value = None
+        use_case = self._make_use_case(
+            mock_user_repository,
+            mock_verification_repository,
+            transaction_manager=transactions,
+        )
 
         # Act & Assert
         with pytest.raises(ValueError, match="User not found"):
@@ -221,4 +325,5 @@ class TestVerifyEmailCodeUseCase:
                     user_id=sample_verification_token_entity.user_id, code=VALID_CODE
                 )
             )
-        mock_user_repository.update.assert_not_called()
+        # The consumed token is rolled back with the transaction
+        assert transactions.outcomes == ["aborted"]
@@ -107,6 +107,29 @@ class TestCreateExpenseUseCase:
         with pytest.raises(Exception, match="DB error"):
             await use_case.execute(sample_expense_create)
 
+    @pytest.mark.asyncio
+    async def test_execute_adds_expense_to_group_summary(
+        self,
+        mock_expense_repository,
+        mock_group_summary_repository,
+        sample_expense_entity,
+        sample_expense_create,
+    ):
+        # Arrange
+        mock_expense_repository.create.return_value = sample_expense_entity
+        use_case = CreateExpenseUseCase(
+            mock_expense_repository, mock_group_summary_repository
+        )
+
+        # Act
+        await use_case.execute(sample_expense_create)
+
+        # Assert
+        mock_group_summary_repository.apply_change.assert_awaited_once_with(
+            sample_expense_entity.group_id, added=sample_expense_entity
+        )
+
+
 
 class TestCreateExpenseUseCaseStructure:
     """Test CreateExpenseUseCase structure"""
@@ -0,0 +1,121 @@
+"""Tests for use_cases/expense/create_expenses.py"""
+
+import pytest
+from app.use_cases.expense.create_expenses import CreateExpensesUseCase
+from app.domain.enums.expense_category_enum import ExpenseCategory
+from app.domain.enums.expense_type_enum import ExpenseType
+from app.models.expense_schema import ExpenseCreate
+
+
+def make_expense_create(group_id="507f1f77bcf86cd799439012", amount_cents=5000):
+    return ExpenseCreate(
+        group_id=group_id,
+        amount_cents=amount_cents,
+        category=ExpenseCategory.SHOPPING,
+        type_expense=ExpenseType.CASH,
+        spent_by="John Doe",
+    )
+
+
+def assign_ids(errors):
+    """Build a create_many side effect that sets IDs on the successful items."""
+
+    async def create_many(entities):
+        for index, entity in enumerate(entities):
+            if index not in errors:
+                entity.id = f"id-{index}"
+        return errors
+
+    return create_many
+
+
+class TestCreateExpensesUseCase:
+    """Test CreateExpensesUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_creates_all_items_in_one_batch(
+        self, mock_expense_repository, mock_group_summary_repository
+    ):
+        # Arrange
+        mock_expense_repository.create_many.side_effect = assign_ids({})
+        use_case = CreateExpensesUseCase(
+            mock_expense_repository, mock_group_summary_repository
+        )
+
+        # Act
+        results = await use_case.execute(
+            [make_expense_create(), make_expense_create(amount_cents=100)]
+        )
+
+        # Assert
+        assert [(r.index, r.id, r.error) for r in results] == [
+            (0, "id-0", None),
+            (1, "id-1", None),
+        ]
+        mock_expense_repository.create_many.assert_called_once()
+        mock_expense_repository.create.assert_not_called()
+        added = mock_group_summary_repository.apply_additions.call_args[0][0]
+        assert [expense.amount_cents for expense in added] == [5000, 100]
+
+    @pytest.mark.asyncio
+    async def test_execute_reports_failed_items(
+        self, mock_expense_repository, mock_group_summary_repository
+    ):
+        # Arrange
+        mock_expense_repository.create_many.side_effect = assign_ids(
+            {1: "duplicate key"}
+        )
+        use_case = CreateExpensesUseCase(
+            mock_expense_repository, mock_group_summary_repository
+        )
+
+        # Act
+        results = await use_case.execute(
+            [make_expense_create(), make_expense_create(), make_expense_create()]
+        )
+
+        # Assert
+        assert results[1].id is None
+        assert results[1].error == "duplicate key"
+        assert results[0].id == "id-0" and results[2].id == "id-2"
+        added = mock_group_summary_repository.apply_additions.call_args[0][0]
+        assert [expense.id for expense in added] == ["id-0", "id-2"]
+
+    @pytest.mark.asyncio
+    async def test_execute_all_failed_skips_summary(
+        self, mock_expense_repository, mock_group_summary_repository
+    ):
+        # Arrange
+        mock_expense_repository.create_many.return_value = {0: "boom"}
+        use_case = CreateExpensesUseCase(
+            mock_expense_repository, mock_group_summary_repository
+        )
+
+        # Act
+        results = await use_case.execute([make_expense_create()])
+
+        # Assert
+        assert results[0].error == "boom"
+        mock_group_summary_repository.apply_additions.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_empty_list_skips_database(self, mock_expense_repository):
+        # Arrange
+        use_case = CreateExpensesUseCase(mock_expense_repository)
+
+        # Act
+        results = await use_case.execute([])
+
+        # Assert
+        assert results == []
+        mock_expense_repository.create_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_propagates_exception(self, mock_expense_repository):
+        # Arrange
+        mock_expense_repository.create_many.side_effect = Exception("DB error")
+        use_case = CreateExpensesUseCase(mock_expense_repository)
+
+        # Act & Assert
+        with pytest.raises(Exception, match="DB error"):
+            await use_case.execute([make_expense_create()])
@@ -0,0 +1,45 @@
+"""Tests for use_cases/expense/cursor_utils.py"""
+
+import pytest
+from datetime import datetime, timezone
+from bson import ObjectId
+from app.use_cases.expense.cursor_utils import encode_cursor, decode_cursor
+
+
+class TestCursorUtils:
+    """Test cases for keyset pagination cursor encoding."""
+
+    def test_encode_decode_roundtrip(self):
+        # Arrange
+        date = datetime(2026, 2, 10, 12, 0, tzinfo=timezone.utc)
+        expense_id = str(ObjectId())
+
+        # Act
+        cursor = encode_cursor(date, expense_id)
+        decoded_date, decoded_id = decode_cursor(cursor)
+
+        # Assert
+        assert decoded_date == date
+        assert decoded_id == expense_id
+
+    def test_encode_is_url_safe(self):
+        # Act
+        cursor = encode_cursor(datetime(2026, 2, 10, 12, 0), str(ObjectId()))
+
+        # Assert
+        assert "=" not in cursor
+        assert "+" not in cursor
+        assert "/" not in cursor
+
+    def test_decode_invalid_cursor_raises_value_error(self):
+        # Act & Assert
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            decode_cursor("not-a-cursor")
+
+    def test_decode_cursor_with_invalid_id_raises_value_error(self):
+        # Arrange
+        cursor = encode_cursor(datetime(2026, 2, 10, 12, 0), "zzz")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            decode_cursor(cursor)
@@ -0,0 +1,74 @@
+"""Tests for use_cases/expense/date_range_utils.py"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from app.use_cases.expense.date_range_utils import as_utc, utc_date_range
+
+
+class TestUtcDateRange:
+    """Test cases for date range normalisation."""
+
+    def test_naive_bounds_are_taken_as_utc(self):
+        # Act
+        start, end = utc_date_range(datetime(2026, 1, 1), datetime(2026, 2, 1))
+
+        # Assert
+        assert start == datetime(2026, 1, 1, tzinfo=timezone.utc)
+        assert end == datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+    def test_aware_bounds_are_converted_to_utc(self):
+        # Arrange
+        brt = timezone(timedelta(hours=-3))
+
+        # Act
+        start, _ = utc_date_range(datetime(2026, 1, 1, tzinfo=brt), None)
+
+        # Assert
+        assert start == datetime(2026, 1, 1, 3, 0, tzinfo=timezone.utc)
+        assert start.tzinfo == timezone.utc
+
+    def test_mixed_bounds_are_compared_without_type_error(self):
+        # Act
+        start, end = utc_date_range(
+            datetime(2026, 1, 1, tzinfo=timezone.utc), datetime(2026, 2, 1)
+        )
+
+        # Assert
+        assert start < end
+
+    def test_missing_bounds_stay_missing(self):
+        # Act / Assert
+        assert utc_date_range(None, None) == (None, None)
+
+    def test_mixed_bounds_in_wrong_order_raise_value_error(self):
+        # Arrange
+        brt = timezone(timedelta(hours=-3))
+
+        # Act / Assert: 23:00 at -03:00 is 02:00 UTC the next day
+        with pytest.raises(ValueError, match="start_date must be before end_date"):
+            utc_date_range(
+                datetime(2026, 1, 31, 23, 0, tzinfo=brt), datetime(2026, 2, 1, 1, 0)
+            )
+
+
+class TestAsUtc:
+    """Test cases for the UTC conversion of a single datetime."""
+
+    def test_naive_value_is_taken_as_utc(self):
+        # Act / Assert
+        assert as_utc(datetime(2026, 1, 1)) == datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    def test_aware_value_is_converted_to_utc(self):
+        # Arrange
+        brt = timezone(timedelta(hours=-3))
+
+        # Act
+        value = as_utc(datetime(2026, 1, 1, tzinfo=brt))
+
+        # Assert
+        assert value == datetime(2026, 1, 1, 3, 0, tzinfo=timezone.utc)
+        assert value.tzinfo == timezone.utc
+
+    def test_none_stays_none(self):
+        # Act / Assert
+        assert as_utc(None) is None
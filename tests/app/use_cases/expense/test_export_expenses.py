@@ -0,0 +1,177 @@
+"""Tests for use_cases/expense/export_expenses.py"""
+
+import csv
+import io
+import json
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from app.domain.dtos.expense_dtos import ExportExpensesInput
+from app.domain.enums.export_format_enum import ExportFormat
+from app.use_cases.expense import export_expenses
+from app.use_cases.expense.export_expenses import (
+    EXPORT_FIELDS,
+    ExportExpensesUseCase,
+)
+
+GROUP_ID = "507f1f77bcf86cd799439012"
+
+
+def make_document(index=0, note="Lunch"):
+    return {
+        "id": f"id-{index}",
+        "group_id": GROUP_ID,
+        "amount_cents": 1000 + index,
+        "category": "food",
+        "type_expense": "cash",
+        "spent_by": "John Doe",
+        "date": datetime(2026, 1, 15, 12, 30),
+        "note": note,
+        "created_at": datetime(2026, 1, 15, 12, 30),
+        "updated_at": None,
+    }
+
+
+def stream_of(documents):
+    async def stream(*args, **kwargs):
+        for document in documents:
+            yield document
+
+    return MagicMock(side_effect=stream)
+
+
+async def collect(chunks):
+    return [chunk async for chunk in chunks]
+
+
+class TestExportExpensesUseCase:
+    """Test ExportExpensesUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_ndjson_one_object_per_line(self, mock_expense_repository):
+        # Arrange
+        mock_expense_repository.stream_documents = stream_of(
+            [make_document(0), make_document(1)]
+        )
+        use_case = ExportExpensesUseCase(mock_expense_repository)
+
+        # Act
+        chunks = await use_case.execute(ExportExpensesInput(group_id=GROUP_ID))
+        body = "".join(await collect(chunks))
+
+        # Assert
+        lines = [json.loads(line) for line in body.splitlines()]
+        assert [line["id"] for line in lines] == ["id-0", "id-1"]
+        assert list(lines[0]) == list(EXPORT_FIELDS)
+        assert lines[0]["date"] == "2026-01-15T12:30:00+00:00"
+        assert lines[0]["updated_at"] is None
+
+    @pytest.mark.asyncio
+    async def test_csv_header_then_rows(self, mock_expense_repository):
+        # Arrange
+        mock_expense_repository.stream_documents = stream_of([make_document(0)])
+        use_case = ExportExpensesUseCase(mock_expense_repository)
+
+        # Act
+        chunks = await use_case.execute(
+            ExportExpensesInput(group_id=GROUP_ID, export_format=ExportFormat.CSV)
+        )
+        body = "".join(await collect(chunks))
+
+        # Assert
+        rows = list(csv.reader(io.StringIO(body)))
+        assert rows[0] == list(EXPORT_FIELDS)
+        assert rows[1][EXPORT_FIELDS.index("amount_cents")] == "1000"
+        assert rows[1][EXPORT_FIELDS.index("updated_at")] == ""
+
+    @pytest.mark.asyncio
+    async def test_csv_neutralises_formulas(self, mock_expense_repository):
+        # Arrange
+        mock_expense_repository.stream_documents = stream_of(
+            [make_document(0, note="=HYPERLINK(\"http://x\")")]
+        )
+        use_case = ExportExpensesUseCase(mock_expense_repository)
+
+        # Act
+        chunks = await use_case.execute(
+            ExportExpensesInput(group_id=GROUP_ID, export_format=ExportFormat.CSV)
+        )
+        rows = list(csv.reader(io.StringIO("".join(await collect(chunks)))))
+
+        # Assert
+        assert rows[1][EXPORT_FIELDS.index("note")].startswith("'=")
+
+    @pytest.mark.asyncio
+    async def test_one_chunk_per_batch(self, mock_expense_repository, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(export_expenses, "EXPORT_BATCH_SIZE", 2)
+        mock_expense_repository.stream_documents = stream_of(
+            [make_document(i) for i in range(5)]
+        )
+        use_case = ExportExpensesUseCase(mock_expense_repository)
+
+        # Act
+        chunks = await collect(
+            await use_case.execute(ExportExpensesInput(group_id=GROUP_ID))
+        )
+
+        # Assert
+        assert [chunk.count("\n") for chunk in chunks] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_passes_date_range_and_batch_size(self, mock_expense_repository):
+        # Arrange
+        mock_expense_repository.stream_documents = stream_of([])
+        use_case = ExportExpensesUseCase(mock_expense_repository)
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+        # Act
+        await collect(
+            await use_case.execute(
+                ExportExpensesInput(group_id=GROUP_ID, start_date=start, end_date=end)
+            )
+        )
+
+        # Assert
+        mock_expense_repository.stream_documents.assert_called_once_with(
+            GROUP_ID,
+            start_date=start,
+            end_date=end,
+            batch_size=export_expenses.EXPORT_BATCH_SIZE,
+        )
+
+    @pytest.mark.asyncio
+    async def test_naive_bound_is_taken_as_utc(self, mock_expense_repository):
+        # Arrange
+        mock_expense_repository.stream_documents = stream_of([])
+        use_case = ExportExpensesUseCase(mock_expense_repository)
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        # Act
+        await collect(
+            await use_case.execute(
+                ExportExpensesInput(
+                    group_id=GROUP_ID, start_date=start, end_date=datetime(2026, 2, 1)
+                )
+            )
+        )
+
+        # Assert
+        kwargs = mock_expense_repository.stream_documents.call_args.kwargs
+        assert kwargs["end_date"] == datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+    @pytest.mark.asyncio
+    async def test_invalid_date_range_raises(self, mock_expense_repository):
+        # Arrange
+        mock_expense_repository.stream_documents = stream_of([])
+        use_case = ExportExpensesUseCase(mock_expense_repository)
+        start = datetime(2026, 2, 1, tzinfo=timezone.utc)
+        end = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="start_date must be before end_date"):
+            await use_case.execute(
+                ExportExpensesInput(group_id=GROUP_ID, start_date=start, end_date=end)
+            )
+        mock_expense_repository.stream_documents.assert_not_called()
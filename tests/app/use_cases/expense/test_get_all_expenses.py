@@ -1,10 +1,12 @@
 """Tests for use_cases/expense/get_all_expenses.py"""
 
 import pytest
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock
 from app.use_cases.expense.get_all_expenses import GetAllExpensesUseCase
 from app.domain.interfaces.expense_repository_interface import IExpenseRepository
 from app.domain.dtos.expense_dtos import GetAllExpensesInput
+from app.use_cases.expense.cursor_utils import encode_cursor
 
 
 class TestGetAllExpensesUseCase:
@@ -37,8 +39,8 @@ class TestGetAllExpensesUseCase:
         result = await use_case.execute(input_data)
 
         # Assert
-        assert len(result) == 1
-        assert result[0].group_id == sample_expense_entity.group_id
+        assert len(result.items) == 1
+        assert result.items[0].group_id == sample_expense_entity.group_id
         mock_expense_repository.get_all.assert_called_once_with(
             "507f1f77bcf86cd799439012", skip=0, limit=100
         )
@@ -54,7 +56,8 @@ class TestGetAllExpensesUseCase:
         result = await use_case.execute(input_data)
 
         # Assert
-        assert result == []
+        assert result.items == []
+        assert result.next_cursor is None
 
     @pytest.mark.asyncio
     async def test_execute_passes_pagination(
@@ -95,3 +98,71 @@ class TestGetAllExpensesStructure:
         mock_repo = AsyncMock()
         use_case = GetAllExpensesUseCase(mock_repo)
         assert isinstance(use_case, GetAllExpensesUseCase)
+
+
+class TestGetAllExpensesKeysetPagination:
+    """Test GetAllExpensesUseCase cursor mode"""
+
+    @pytest.mark.asyncio
+    async def test_full_page_returns_next_cursor(
+        self, mock_expense_repository, sample_expense_entity
+    ):
+        # Arrange
+        mock_expense_repository.get_all.return_value = [sample_expense_entity]
+        use_case = GetAllExpensesUseCase(mock_expense_repository)
+        input_data = GetAllExpensesInput(group_id="grp", limit=1)
+
+        # Act
+        result = await use_case.execute(input_data)
+
+        # Assert
+        assert result.next_cursor == encode_cursor(
+            sample_expense_entity.date, sample_expense_entity.id
+        )
+
+    @pytest.mark.asyncio
+    async def test_partial_page_has_no_next_cursor(
+        self, mock_expense_repository, sample_expense_entity
+    ):
+        # Arrange
+        mock_expense_repository.get_all.return_value = [sample_expense_entity]
+        use_case = GetAllExpensesUseCase(mock_expense_repository)
+        input_data = GetAllExpensesInput(group_id="grp", limit=10)
+
+        # Act
+        result = await use_case.execute(input_data)
+
+        # Assert
+        assert result.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_cursor_uses_keyset_query(
+        self, mock_expense_repository, sample_expense_entity
+    ):
+        # Arrange
+        date = datetime(2026, 2, 10, 12, 0, tzinfo=timezone.utc)
+        cursor = encode_cursor(date, "507f1f77bcf86cd799439011")
+        mock_expense_repository.get_all_after.return_value = [sample_expense_entity]
+        use_case = GetAllExpensesUseCase(mock_expense_repository)
+        input_data = GetAllExpensesInput(group_id="grp", limit=5, cursor=cursor)
+
+        # Act
+        result = await use_case.execute(input_data)
+
+        # Assert
+        assert len(result.items) == 1
+        mock_expense_repository.get_all_after.assert_called_once_with(
+            "grp", date, "507f1f77bcf86cd799439011", limit=5
+        )
+        mock_expense_repository.get_all.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_raises_value_error(self, mock_expense_repository):
+        # Arrange
+        use_case = GetAllExpensesUseCase(mock_expense_repository)
+        input_data = GetAllExpensesInput(group_id="grp", cursor="garbage")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            await use_case.execute(input_data)
+        mock_expense_repository.get_all_after.assert_not_called()
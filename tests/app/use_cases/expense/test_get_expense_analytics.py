@@ -0,0 +1,114 @@
+"""Tests for use_cases/expense/get_expense_analytics.py"""
+
+import pytest
+from datetime import datetime, timezone
+from app.use_cases.expense.get_expense_analytics import GetExpenseAnalyticsUseCase
+from app.domain.dtos.expense_dtos import GetExpenseAnalyticsInput
+from app.domain.enums.analytics_group_by_enum import AnalyticsGroupBy
+
+
+def make_row(key, total_cents, count, min_cents, max_cents):
+    return {
+        "key": key,
+        "total_cents": total_cents,
+        "count": count,
+        "average_cents": total_cents / count,
+        "min_cents": min_cents,
+        "max_cents": max_cents,
+    }
+
+
+class TestGetExpenseAnalyticsUseCase:
+    """Test GetExpenseAnalyticsUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_builds_buckets_and_totals(self, mock_expense_repository):
+        # Arrange
+        mock_expense_repository.aggregate_amounts.return_value = [
+            make_row("2026-01", 5000, 2, 1000, 4000),
+            make_row("2026-02", 2500, 1, 2500, 2500),
+        ]
+        use_case = GetExpenseAnalyticsUseCase(mock_expense_repository)
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        # Act
+        result = await use_case.execute(
+            GetExpenseAnalyticsInput(
+                group_id="group-123", group_by=AnalyticsGroupBy.MONTH, start_date=start
+            )
+        )
+
+        # Assert
+        assert result.total_cents == 7500
+        assert result.count == 3
+        assert [bucket.key for bucket in result.buckets] == ["2026-01", "2026-02"]
+        assert result.buckets[0].average_cents == 2500.0
+        mock_expense_repository.aggregate_amounts.assert_called_once_with(
+            "group-123", AnalyticsGroupBy.MONTH, start_date=start, end_date=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_empty(self, mock_expense_repository):
+        # Arrange
+        mock_expense_repository.aggregate_amounts.return_value = []
+        use_case = GetExpenseAnalyticsUseCase(mock_expense_repository)
+
+        # Act
+        result = await use_case.execute(GetExpenseAnalyticsInput(group_id="group-empty"))
+
+        # Assert
+        assert result.group_by == AnalyticsGroupBy.TYPE_EXPENSE
+        assert result.total_cents == 0
+        assert result.count == 0
+        assert result.buckets == []
+
+    @pytest.mark.asyncio
+    async def test_execute_rejects_inverted_range(self, mock_expense_repository):
+        # Arrange
+        use_case = GetExpenseAnalyticsUseCase(mock_expense_repository)
+        input_data = GetExpenseAnalyticsInput(
+            group_id="group-123",
+            start_date=datetime(2026, 2, 1, tzinfo=timezone.utc),
+            end_date=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="start_date must be before end_date"):
+            await use_case.execute(input_data)
+        mock_expense_repository.aggregate_amounts.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_accepts_aware_and_naive_bounds(
+        self, mock_expense_repository
+    ):
+        # Arrange
+        mock_expense_repository.aggregate_amounts.return_value = []
+        use_case = GetExpenseAnalyticsUseCase(mock_expense_repository)
+        input_data = GetExpenseAnalyticsInput(
+            group_id="group-123",
+            start_date=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            end_date=datetime(2026, 2, 1),
+        )
+
+        # Act
+        result = await use_case.execute(input_data)
+
+        # Assert
+        utc_end = datetime(2026, 2, 1, tzinfo=timezone.utc)
+        assert result.end_date == utc_end
+        mock_expense_repository.aggregate_amounts.assert_called_once_with(
+            "group-123",
+            AnalyticsGroupBy.TYPE_EXPENSE,
+            start_date=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            end_date=utc_end,
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_propagates_exception(self, mock_expense_repository):
+        # Arrange
+        mock_expense_repository.aggregate_amounts.side_effect = Exception("DB error")
+        use_case = GetExpenseAnalyticsUseCase(mock_expense_repository)
+
+        # Act & Assert
+        with pytest.raises(Exception, match="DB error"):
+            await use_case.execute(GetExpenseAnalyticsInput(group_id="group-123"))
@@ -0,0 +1,217 @@
+"""Tests for use_cases/expense/get_expense_changes.py"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from bson import ObjectId
+from app.domain.entities.expense_entity import Expense
+from app.domain.dtos.expense_dtos import GetExpenseChangesInput
+from app.use_cases.expense.cursor_utils import decode_cursor, encode_cursor
+from app.use_cases.expense.get_expense_changes import (
+    GetExpenseChangesUseCase,
+    SETTLE_SECONDS,
+)
+
+GROUP_ID = "507f1f77bcf86cd799439012"
+
+
+def make_expense(updated_at, is_deleted=False):
+    return Expense(
+        id=str(ObjectId()),
+        group_id=GROUP_ID,
+        amount_cents=1500,
+        category="shopping",
+        type_expense="cash",
+        spent_by="John Doe",
+        is_deleted=is_deleted,
+        updated_at=updated_at,
+    )
+
+
+class TestGetExpenseChangesUseCase:
+    """Test GetExpenseChangesUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_first_sync_has_no_watermark(self, mock_expense_repository):
+        # Arrange
+        old = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        expense = make_expense(old)
+        mock_expense_repository.get_changes.return_value = [expense]
+        use_case = GetExpenseChangesUseCase(mock_expense_repository)
+
+        # Act
+        result = await use_case.execute(GetExpenseChangesInput(group_id=GROUP_ID))
+
+        # Assert
+        mock_expense_repository.get_changes.assert_called_once_with(
+            GROUP_ID, None, None, limit=101
+        )
+        assert [item.id for item in result.items] == [expense.id]
+        assert result.has_more is False
+        assert decode_cursor(result.since) == (old, expense.id)
+
+    @pytest.mark.asyncio
+    async def test_sync_resumes_from_watermark(self, mock_expense_repository):
+        # Arrange
+        since_date = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        since_id = str(ObjectId())
+        tombstone = make_expense(since_date + timedelta(hours=1), is_deleted=True)
+        mock_expense_repository.get_changes.return_value = [tombstone]
+        use_case = GetExpenseChangesUseCase(mock_expense_repository)
+
+        # Act
+        result = await use_case.execute(
+            GetExpenseChangesInput(
+                group_id=GROUP_ID, since=encode_cursor(since_date, since_id), limit=10
+            )
+        )
+
+        # Assert
+        mock_expense_repository.get_changes.assert_called_once_with(
+            GROUP_ID, since_date, since_id, limit=11
+        )
+        assert result.items[0].is_deleted is True
+        assert decode_cursor(result.since) == (tombstone.updated_at, tombstone.id)
+
+    @pytest.mark.asyncio
+    async def test_more_changes_than_limit_sets_has_more(
+        self, mock_expense_repository
+    ):
+        # Arrange
+        now = datetime.now(timezone.utc)
+        expenses = [make_expense(now), make_expense(now), make_expense(now)]
+        mock_expense_repository.get_changes.return_value = expenses
+        use_case = GetExpenseChangesUseCase(mock_expense_repository)
+
+        # Act
+        result = await use_case.execute(
+            GetExpenseChangesInput(group_id=GROUP_ID, limit=2)
+        )
+
+        # Assert
+        assert len(result.items) == 2
+        assert result.has_more is True
+        # Mid-sync watermarks follow the last item, even inside the settle window
+        assert decode_cursor(result.since) == (now, expenses[1].id)
+
+    @pytest.mark.asyncio
+    async def test_final_watermark_stays_behind_recent_writes(
+        self, mock_expense_repository
+    ):
+        # Arrange
+        recent = make_expense(datetime.now(timezone.utc))
+        mock_expense_repository.get_changes.return_value = [recent]
+        use_case = GetExpenseChangesUseCase(mock_expense_repository)
+
+        # Act
+        result = await use_case.execute(GetExpenseChangesInput(group_id=GROUP_ID))
+
+        # Assert
+        watermark_date, _ = decode_cursor(result.since)
+        assert watermark_date <= datetime.now(timezone.utc) - timedelta(
+            seconds=SETTLE_SECONDS
+        )
+
+    @pytest.mark.asyncio
+    async def test_watermark_never_moves_backwards(self, mock_expense_repository):
+        # Arrange
+        since_date = datetime.now(timezone.utc)
+        since_id = str(ObjectId())
+        recent = make_expense(since_date + timedelta(milliseconds=1))
+        mock_expense_repository.get_changes.return_value = [recent]
+        use_case = GetExpenseChangesUseCase(mock_expense_repository)
+
+        # Act
+        result = await use_case.execute(
+            GetExpenseChangesInput(
+                group_id=GROUP_ID, since=encode_cursor(since_date, since_id)
+            )
+        )
+
+        # Assert
+        assert decode_cursor(result.since) == (since_date, since_id)
+
+    @pytest.mark.asyncio
+    async def test_no_changes_keeps_watermark(self, mock_expense_repository):
+        # Arrange
+        since = encode_cursor(
+            datetime(2026, 1, 1, tzinfo=timezone.utc), "507f1f77bcf86cd799439099"
+        )
+        mock_expense_repository.get_changes.return_value = []
+        use_case = GetExpenseChangesUseCase(mock_expense_repository)
+
+        # Act
+        result = await use_case.execute(
+            GetExpenseChangesInput(group_id=GROUP_ID, since=since)
+        )
+
+        # Assert
+        assert result.items == []
+        assert result.since == since
+        assert result.has_more is False
+
+    @pytest.mark.asyncio
+    async def test_naive_timestamps_are_treated_as_utc(self, mock_expense_repository):
+        # Arrange
+        naive = datetime(2026, 1, 1, 12, 0)
+        expense = make_expense(naive)
+        mock_expense_repository.get_changes.return_value = [expense]
+        use_case = GetExpenseChangesUseCase(mock_expense_repository)
+
+        # Act
+        result = await use_case.execute(GetExpenseChangesInput(group_id=GROUP_ID))
+
+        # Assert
+        assert decode_cursor(result.since)[0] == naive.replace(tzinfo=timezone.utc)
+
+    @pytest.mark.asyncio
+    async def test_invalid_watermark_raises_value_error(
+        self, mock_expense_repository
+    ):
+        # Arrange
+        use_case = GetExpenseChangesUseCase(mock_expense_repository)
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="Invalid sync watermark"):
+            await use_case.execute(
+                GetExpenseChangesInput(group_id=GROUP_ID, since="not-a-token")
+            )
+        mock_expense_repository.get_changes.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_watermark_with_invalid_id_raises_value_error(
+        self, mock_expense_repository
+    ):
+        # Arrange
+        since = encode_cursor(datetime(2026, 1, 1, tzinfo=timezone.utc), "zzz")
+        use_case = GetExpenseChangesUseCase(mock_expense_repository)
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="Invalid sync watermark"):
+            await use_case.execute(
+                GetExpenseChangesInput(group_id=GROUP_ID, since=since)
+            )
+        mock_expense_repository.get_changes.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("limit", [0, 1001])
+    async def test_limit_out_of_range_raises_value_error(
+        self, mock_expense_repository, limit
+    ):
+        # Arrange
+        use_case = GetExpenseChangesUseCase(mock_expense_repository)
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="limit"):
+            await use_case.execute(
+                GetExpenseChangesInput(group_id=GROUP_ID, limit=limit)
+            )
+
+    @pytest.mark.asyncio
+    async def test_execute_propagates_exception(self, mock_expense_repository):
+        # Arrange
+        mock_expense_repository.get_changes.side_effect = Exception("DB error")
+        use_case = GetExpenseChangesUseCase(mock_expense_repository)
+
+        # Act / Assert
+        with pytest.raises(Exception, match="DB error"):
+            await use_case.execute(GetExpenseChangesInput(group_id=GROUP_ID))
@@ -0,0 +1,86 @@
+"""Tests for use_cases/expense/get_group_summary.py"""
+
+import pytest
+from app.use_cases.expense.get_group_summary import GetGroupSummaryUseCase
+from app.domain.entities.group_summary_entity import GroupSummary, SummaryTotals
+
+
+class TestGetGroupSummaryUseCase:
+    """Test GetGroupSummaryUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_summary(self, mock_group_summary_repository):
+        # Arrange
+        mock_group_summary_repository.get_by_group_id.return_value = GroupSummary(
+            group_id="group-123",
+            total_cents=7500,
+            count=3,
+            by_category={"food": SummaryTotals(total_cents=7500, count=3)},
+            by_type={
+                "cash": SummaryTotals(total_cents=2500, count=1),
+                "credit_card": SummaryTotals(total_cents=5000, count=2),
+            },
+            by_month={"2026-02": SummaryTotals(total_cents=7500, count=3)},
+        )
+        use_case = GetGroupSummaryUseCase(mock_group_summary_repository)
+
+        # Act
+        result = await use_case.execute("group-123")
+
+        # Assert
+        assert result.total_cents == 7500
+        assert result.count == 3
+        assert result.by_type["credit_card"].total_cents == 5000
+        assert list(result.by_month) == ["2026-02"]
+        mock_group_summary_repository.get_by_group_id.assert_called_once_with(
+            "group-123"
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_omits_emptied_buckets(self, mock_group_summary_repository):
+        # Arrange
+        mock_group_summary_repository.get_by_group_id.return_value = GroupSummary(
+            group_id="group-123",
+            total_cents=2500,
+            count=1,
+            by_category={
+                "food": SummaryTotals(total_cents=2500, count=1),
+                "travel": SummaryTotals(total_cents=0, count=0),
+            },
+        )
+        use_case = GetGroupSummaryUseCase(mock_group_summary_repository)
+
+        # Act
+        result = await use_case.execute("group-123")
+
+        # Assert
+        assert list(result.by_category) == ["food"]
+
+    @pytest.mark.asyncio
+    async def test_execute_without_summary_returns_zeros(
+        self, mock_group_summary_repository
+    ):
+        # Arrange
+        mock_group_summary_repository.get_by_group_id.return_value = None
+        use_case = GetGroupSummaryUseCase(mock_group_summary_repository)
+
+        # Act
+        result = await use_case.execute("group-empty")
+
+        # Assert
+        assert result.group_id == "group-empty"
+        assert result.total_cents == 0
+        assert result.count == 0
+        assert result.by_category == {}
+
+    @pytest.mark.asyncio
+    async def test_execute_propagates_exception(self, mock_group_summary_repository):
+        # Arrange
+        mock_group_summary_repository.get_by_group_id.side_effect = Exception(
+            "DB error"
+        )
+        use_case = GetGroupSummaryUseCase(mock_group_summary_repository)
+
+        # Act & Assert
+        with pytest.raises(Exception, match="DB error"):
+            await use_case.execute("group-123")
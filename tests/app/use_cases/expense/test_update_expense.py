@@ -6,6 +6,7 @@ from app.use_cases.expense.update_expense import UpdateExpenseUseCase
 from app.domain.interfaces.expense_repository_interface import IExpenseRepository
 from app.domain.dtos.expense_dtos import UpdateExpenseInput
 from app.models.expense_schema import ExpenseUpdate
+from app.domain.enums.expense_category_enum import ExpenseCategory
 
 
 class TestUpdateExpenseUseCase:
@@ -34,8 +35,7 @@ class TestUpdateExpenseUseCase:
         )
         updated_entity = sample_expense_entity
         updated_entity.amount_cents = 9999
-        mock_expense_repository.get_by_id.return_value = sample_expense_entity
-        mock_expense_repository.update.return_value = updated_entity
+        mock_expense_repository.update_fields.return_value = updated_entity
         use_case = UpdateExpenseUseCase(mock_expense_repository)
 
         # Act
@@ -44,39 +44,39 @@ class TestUpdateExpenseUseCase:
         # Assert
         assert result is not None
         assert result.amount_cents == 9999
-        mock_expense_repository.get_by_id.assert_called_once_with(
-            sample_expense_entity.id
+        mock_expense_repository.get_by_id.assert_not_called()
+        mock_expense_repository.update_fields.assert_called_once_with(
+            sample_expense_entity.id, {"amount_cents": 9999}
         )
-        mock_expense_repository.update.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_execute_not_found_returns_none(self, mock_expense_repository):
+    async def test_execute_sets_only_provided_fields_as_plain_values(
+        self, mock_expense_repository, sample_expense_entity
+    ):
         # Arrange
-        update_data = ExpenseUpdate(amount_cents=100)
+        update_data = ExpenseUpdate(category=ExpenseCategory.SHOPPING, note=None)
         input_data = UpdateExpenseInput(
-            expense_id="nonexistent", expense_data=update_data
+            expense_id=sample_expense_entity.id, expense_data=update_data
         )
-        mock_expense_repository.get_by_id.return_value = None
+        mock_expense_repository.update_fields.return_value = sample_expense_entity
         use_case = UpdateExpenseUseCase(mock_expense_repository)
 
         # Act
-        result = await use_case.execute(input_data)
+        await use_case.execute(input_data)
 
         # Assert
-        assert result is None
-        mock_expense_repository.update.assert_not_called()
+        fields = mock_expense_repository.update_fields.call_args.args[1]
+        assert fields == {"category": "shopping"}
+        assert type(fields["category"]) is str
 
     @pytest.mark.asyncio
-    async def test_execute_update_returns_none(
-        self, mock_expense_repository, sample_expense_entity
-    ):
-        # Arrange — repo.update returns None (concurrent delete scenario)
-        update_data = ExpenseUpdate(note="new note")
+    async def test_execute_not_found_returns_none(self, mock_expense_repository):
+        # Arrange
+        update_data = ExpenseUpdate(amount_cents=100)
         input_data = UpdateExpenseInput(
-            expense_id=sample_expense_entity.id, expense_data=update_data
+            expense_id="nonexistent", expense_data=update_data
         )
-        mock_expense_repository.get_by_id.return_value = sample_expense_entity
-        mock_expense_repository.update.return_value = None
+        mock_expense_repository.update_fields.return_value = None
         use_case = UpdateExpenseUseCase(mock_expense_repository)
 
         # Act
@@ -94,13 +94,90 @@ class TestUpdateExpenseUseCase:
         input_data = UpdateExpenseInput(
             expense_id=sample_expense_entity.id, expense_data=update_data
         )
-        mock_expense_repository.get_by_id.side_effect = Exception("DB error")
+        mock_expense_repository.update_fields.side_effect = Exception("DB error")
         use_case = UpdateExpenseUseCase(mock_expense_repository)
 
         # Act & Assert
         with pytest.raises(Exception, match="DB error"):
             await use_case.execute(input_data)
 
+    @pytest.mark.asyncio
+    async def test_execute_moves_amount_in_group_summary(
+        self,
+        mock_expense_repository,
+        mock_group_summary_repository,
+        sample_expense_entity,
+    ):
+        # Arrange
+        input_data = UpdateExpenseInput(
+            expense_id=sample_expense_entity.id,
+            expense_data=ExpenseUpdate(amount_cents=9999),
+        )
+        mock_expense_repository.update_fields_with_previous.return_value = (
+            sample_expense_entity,
+            sample_expense_entity.model_copy(update={"amount_cents": 9999}),
+        )
+        use_case = UpdateExpenseUseCase(
+            mock_expense_repository, mock_group_summary_repository
+        )
+
+        # Act
+        result = await use_case.execute(input_data)
+
+        # Assert
+        assert result.amount_cents == 9999
+        mock_expense_repository.get_by_id.assert_not_called()
+        mock_expense_repository.update_fields.assert_not_called()
+        call = mock_group_summary_repository.apply_change.call_args
+        assert call.args == (sample_expense_entity.group_id,)
+        assert call.kwargs["removed"].amount_cents == 5000
+        assert call.kwargs["added"].amount_cents == 9999
+
+    @pytest.mark.asyncio
+    async def test_execute_skips_pre_read_when_summary_fields_unchanged(
+        self,
+        mock_expense_repository,
+        mock_group_summary_repository,
+        sample_expense_entity,
+    ):
+        # Arrange
+        input_data = UpdateExpenseInput(
+            expense_id=sample_expense_entity.id,
+            expense_data=ExpenseUpdate(note="new note", spent_by="Bob"),
+        )
+        mock_expense_repository.update_fields.return_value = sample_expense_entity
+        use_case = UpdateExpenseUseCase(
+            mock_expense_repository, mock_group_summary_repository
+        )
+
+        # Act
+        result = await use_case.execute(input_data)
+
+        # Assert
+        assert result is not None
+        mock_expense_repository.get_by_id.assert_not_called()
+        mock_group_summary_repository.apply_change.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_not_found_leaves_summary_untouched(
+        self, mock_expense_repository, mock_group_summary_repository
+    ):
+        # Arrange
+        input_data = UpdateExpenseInput(
+            expense_id="nonexistent", expense_data=ExpenseUpdate(amount_cents=100)
+        )
+        mock_expense_repository.update_fields_with_previous.return_value = None
+        use_case = UpdateExpenseUseCase(
+            mock_expense_repository, mock_group_summary_repository
+        )
+
+        # Act
+        result = await use_case.execute(input_data)
+
+        # Assert
+        assert result is None
+        mock_group_summary_repository.apply_change.assert_not_called()
+
 
 class TestUpdateExpenseStructure:
     """Test UpdateExpenseUseCase structure"""
@@ -0,0 +1,101 @@
+"""Tests for use_cases/group/add_users_to_group.py"""
+
+import pytest
+from unittest.mock import MagicMock
+from app.domain.interfaces.membership_cache_interface import IMembershipCache
+from app.use_cases.group.add_users_to_group import AddUsersToGroupUseCase
+from app.domain.dtos.group_dtos import AddUsersToGroupInput
+
+
+class TestAddUsersToGroupUseCase:
+    async def test_add_users_success(
+        self, mock_group_repository, sample_group_entity
+    ):
+        # Arrange
+        new_ids = ["new-1", "new-2"]
+        group_after = sample_group_entity.model_copy(
+            update={"user_ids": sample_group_entity.user_ids + new_ids}
+        )
+        mock_group_repository.add_members.return_value = group_after
+        use_case = AddUsersToGroupUseCase(mock_group_repository)
+        input_data = AddUsersToGroupInput(
+            group_id=sample_group_entity.id, user_ids=new_ids
+        )
+
+        # Act
+        result = await use_case.execute(input_data)
+
+        # Assert
+        assert result is group_after
+        mock_group_repository.add_members.assert_called_once_with(
+            sample_group_entity.id, new_ids
+        )
+
+    async def test_add_users_deduplicates_ids(
+        self, mock_group_repository, sample_group_entity
+    ):
+        # Arrange
+        mock_group_repository.add_members.return_value = sample_group_entity
+        use_case = AddUsersToGroupUseCase(mock_group_repository)
+        input_data = AddUsersToGroupInput(
+            group_id=sample_group_entity.id, user_ids=["b", "a", "b"]
+        )
+
+        # Act
+        await use_case.execute(input_data)
+
+        # Assert
+        assert mock_group_repository.add_members.call_args[0][1] == ["b", "a"]
+
+    async def test_add_users_empty_list_raises_value_error(
+        self, mock_group_repository
+    ):
+        # Arrange
+        use_case = AddUsersToGroupUseCase(mock_group_repository)
+        input_data = AddUsersToGroupInput(group_id="group-id", user_ids=[])
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="At least one user ID"):
+            await use_case.execute(input_data)
+        mock_group_repository.add_members.assert_not_called()
+
+    async def test_add_users_group_not_found_returns_none(self, mock_group_repository):
+        # Arrange
+        membership_cache = MagicMock(spec=IMembershipCache)
+        mock_group_repository.add_members.return_value = None
+        use_case = AddUsersToGroupUseCase(mock_group_repository, membership_cache)
+        input_data = AddUsersToGroupInput(group_id="nonexistent", user_ids=["u1"])
+
+        # Act
+        result = await use_case.execute(input_data)
+
+        # Assert
+        assert result is None
+        membership_cache.invalidate.assert_not_called()
+
+    async def test_add_users_invalidates_membership_cache(
+        self, mock_group_repository, sample_group_entity
+    ):
+        # Arrange
+        membership_cache = MagicMock(spec=IMembershipCache)
+        mock_group_repository.add_members.return_value = sample_group_entity
+        use_case = AddUsersToGroupUseCase(mock_group_repository, membership_cache)
+        input_data = AddUsersToGroupInput(
+            group_id=sample_group_entity.id, user_ids=["u1"]
+        )
+
+        # Act
+        await use_case.execute(input_data)
+
+        # Assert
+        membership_cache.invalidate.assert_called_once_with(sample_group_entity.id)
+
+    async def test_add_users_propagates_db_exception(self, mock_group_repository):
+        # Arrange
+        mock_group_repository.add_members.side_effect = RuntimeError("DB error")
+        use_case = AddUsersToGroupUseCase(mock_group_repository)
+        input_data = AddUsersToGroupInput(group_id="group-id", user_ids=["u1"])
+
+        # Act / Assert
+        with pytest.raises(RuntimeError, match="DB error"):
+            await use_case.execute(input_data)
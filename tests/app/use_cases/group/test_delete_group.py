@@ -1,6 +1,8 @@
 """Tests for use_cases/group/delete_group.py"""
 
 import pytest
+from unittest.mock import MagicMock
+from app.domain.interfaces.membership_cache_interface import IMembershipCache
 from app.use_cases.group.delete_group import DeleteGroupUseCase
 
 
@@ -45,3 +47,15 @@ class TestDeleteGroupUseCase:
         # Act / Assert
         with pytest.raises(RuntimeError, match="DB error"):
             await use_case.execute("group-id")
+
+    async def test_delete_invalidates_membership_cache(self, mock_group_repository):
+        # Arrange
+        membership_cache = MagicMock(spec=IMembershipCache)
+        mock_group_repository.delete.return_value = True
+        use_case = DeleteGroupUseCase(mock_group_repository, membership_cache)
+
+        # Act
+        await use_case.execute("group-id")
+
+        # Assert
+        membership_cache.invalidate.assert_called_once_with("group-id")
@@ -1,6 +1,8 @@
 """Tests for use_cases/group/remove_user_from_group.py"""
 
 import pytest
+from unittest.mock import MagicMock
+from app.domain.interfaces.membership_cache_interface import IMembershipCache
 from app.use_cases.group.remove_user_from_group import RemoveUserFromGroupUseCase
 from app.domain.dtos.group_dtos import RemoveUserFromGroupInput
 
@@ -24,8 +26,7 @@ class TestRemoveUserFromGroupUseCase:
         group_after_removal = sample_group_entity.model_copy(
             update={"user_ids": remaining_ids}
         )
-        mock_group_repository.get_by_id.return_value = sample_group_entity
-        mock_group_repository.update.return_value = group_after_removal
+        mock_group_repository.remove_member.return_value = group_after_removal
         use_case = RemoveUserFromGroupUseCase(mock_group_repository)
         input_data = RemoveUserFromGroupInput(
             group_id=sample_group_entity.id, user_id=user_to_remove
@@ -35,33 +36,19 @@ class TestRemoveUserFromGroupUseCase:
         result = await use_case.execute(input_data)
 
         # Assert
-        assert result is not None
-        mock_group_repository.update.assert_called_once()
-
-    async def test_remove_user_removes_from_user_ids(
-        self, mock_group_repository, sample_group_entity
-    ):
-        # Arrange
-        user_to_remove = sample_group_entity.user_ids[0]
-        mock_group_repository.get_by_id.return_value = sample_group_entity
-        mock_group_repository.update.return_value = sample_group_entity
-        use_case = RemoveUserFromGroupUseCase(mock_group_repository)
-        input_data = RemoveUserFromGroupInput(
-            group_id=sample_group_entity.id, user_id=user_to_remove
+        assert result is group_after_removal
+        mock_group_repository.remove_member.assert_called_once_with(
+            sample_group_entity.id, user_to_remove
         )
-
-        # Act
-        await use_case.execute(input_data)
-
-        # Assert — entity passed to update should NOT contain the removed user
-        called_entity = mock_group_repository.update.call_args[0][1]
-        assert user_to_remove not in called_entity.user_ids
+        mock_group_repository.get_by_id.assert_not_called()
+        mock_group_repository.update.assert_not_called()
 
     async def test_remove_user_group_not_found_returns_none(
         self, mock_group_repository
     ):
         # Arrange
-        mock_group_repository.get_by_id.return_value = None
+        mock_group_repository.remove_member.return_value = None
+        mock_group_repository.exists.return_value = False
         use_case = RemoveUserFromGroupUseCase(mock_group_repository)
         input_data = RemoveUserFromGroupInput(group_id="nonexistent", user_id="user1")
 
@@ -70,13 +57,13 @@ class TestRemoveUserFromGroupUseCase:
 
         # Assert
         assert result is None
-        mock_group_repository.update.assert_not_called()
 
     async def test_remove_user_not_member_raises_value_error(
         self, mock_group_repository, sample_group_entity
     ):
         # Arrange
-        mock_group_repository.get_by_id.return_value = sample_group_entity
+        mock_group_repository.remove_member.return_value = None
+        mock_group_repository.exists.return_value = True
         use_case = RemoveUserFromGroupUseCase(mock_group_repository)
         input_data = RemoveUserFromGroupInput(
             group_id=sample_group_entity.id, user_id="user-not-in-group"
@@ -85,15 +72,13 @@ class TestRemoveUserFromGroupUseCase:
         # Act / Assert
         with pytest.raises(ValueError, match="not a member"):
             await use_case.execute(input_data)
-        mock_group_repository.update.assert_not_called()
 
     async def test_remove_user_propagates_db_exception(
         self, mock_group_repository, sample_group_entity
     ):
         # Arrange
         user_to_remove = sample_group_entity.user_ids[0]
-        mock_group_repository.get_by_id.return_value = sample_group_entity
-        mock_group_repository.update.side_effect = RuntimeError("DB error")
+        mock_group_repository.remove_member.side_effect = RuntimeError("DB error")
         use_case = RemoveUserFromGroupUseCase(mock_group_repository)
         input_data = RemoveUserFromGroupInput(
             group_id=sample_group_entity.id, user_id=user_to_remove
@@ -102,3 +87,20 @@ class TestRemoveUserFromGroupUseCase:
         # Act / Assert
         with pytest.raises(RuntimeError, match="DB error"):
             await use_case.execute(input_data)
+
+    async def test_remove_user_invalidates_membership_cache(
+        self, mock_group_repository, sample_group_entity
+    ):
+        # Arrange
+        membership_cache = MagicMock(spec=IMembershipCache)
+        mock_group_repository.remove_member.return_value = sample_group_entity
+        use_case = RemoveUserFromGroupUseCase(mock_group_repository, membership_cache)
+        input_data = RemoveUserFromGroupInput(
+            group_id=sample_group_entity.id, user_id=sample_group_entity.user_ids[0]
+        )
+
+        # Act
+        await use_case.execute(input_data)
+
+        # Assert
+        membership_cache.invalidate.assert_called_once_with(sample_group_entity.id)
@@ -21,8 +21,7 @@ class TestUpdateGroupUseCase:
     ):
         # Arrange
         updated_entity = sample_group_entity.model_copy(update={"group_name": "Novo Nome"})
-        mock_group_repository.get_by_id.return_value = sample_group_entity
-        mock_group_repository.update.return_value = updated_entity
+        mock_group_repository.update_fields.return_value = updated_entity
         use_case = UpdateGroupUseCase(mock_group_repository)
         input_data = UpdateGroupInput(
             group_id=sample_group_entity.id,
@@ -33,16 +32,15 @@ class TestUpdateGroupUseCase:
         result = await use_case.execute(input_data)
 
         # Assert
-        assert result is not None
-        mock_group_repository.get_by_id.assert_called_once_with(sample_group_entity.id)
-        mock_group_repository.update.assert_called_once()
+        assert result is updated_entity
+        mock_group_repository.get_by_id.assert_not_called()
+        mock_group_repository.update.assert_not_called()
 
     async def test_update_applies_new_name(
         self, mock_group_repository, sample_group_entity
     ):
         # Arrange
-        mock_group_repository.get_by_id.return_value = sample_group_entity
-        mock_group_repository.update.return_value = sample_group_entity
+        mock_group_repository.update_fields.return_value = sample_group_entity
         use_case = UpdateGroupUseCase(mock_group_repository)
         input_data = UpdateGroupInput(
             group_id=sample_group_entity.id,
@@ -52,15 +50,16 @@ class TestUpdateGroupUseCase:
         # Act
         await use_case.execute(input_data)
 
-        # Assert — entity passed to update should have new name
-        called_entity = mock_group_repository.update.call_args[0][1]
-        assert called_entity.group_name == "Nome Atualizado"
+        # Assert — only the new name is sent to the repository
+        mock_group_repository.update_fields.assert_called_once_with(
+            sample_group_entity.id, {"group_name": "Nome Atualizado"}
+        )
 
     async def test_update_returns_none_when_group_not_found(
         self, mock_group_repository
     ):
         # Arrange
-        mock_group_repository.get_by_id.return_value = None
+        mock_group_repository.update_fields.return_value = None
         use_case = UpdateGroupUseCase(mock_group_repository)
         input_data = UpdateGroupInput(
             group_id="nonexistent",
@@ -72,14 +71,12 @@ class TestUpdateGroupUseCase:
 
         # Assert
         assert result is None
-        mock_group_repository.update.assert_not_called()
 
     async def test_update_propagates_exception(
         self, mock_group_repository, sample_group_entity
     ):
         # Arrange
-        mock_group_repository.get_by_id.return_value = sample_group_entity
-        mock_group_repository.update.side_effect = RuntimeError("DB error")
+        mock_group_repository.update_fields.side_effect = RuntimeError("DB error")
         use_case = UpdateGroupUseCase(mock_group_repository)
         input_data = UpdateGroupInput(
             group_id=sample_group_entity.id,
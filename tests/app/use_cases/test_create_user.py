@@ -16,7 +16,6 @@ class TestCreateUserUseCase:
     ):
         """Test successful user creation."""
         # Arrange
-        mock_user_repository.get_by_email.return_value = None
         mock_user_repository.create.return_value = sample_user_response
         use_case = CreateUserUseCase(mock_user_repository)
 
@@ -26,7 +25,7 @@ class TestCreateUserUseCase:
         # Assert
         assert result.name == sample_user_response.name
         assert result.email == sample_user_response.email
-        mock_user_repository.get_by_email.assert_called_once()
+        mock_user_repository.get_by_email.assert_not_called()
         mock_user_repository.create.assert_called_once()
 
     @pytest.mark.asyncio
@@ -35,15 +34,17 @@ class TestCreateUserUseCase:
     ):
         """Test that creating user with existing email raises error."""
         # Arrange
-        mock_user_repository.get_by_email.return_value = sample_user_entity
+        mock_user_repository.create.side_effect = ValueError(
+            f"Email {sample_user_create.email} is already registered"
+        )
         use_case = CreateUserUseCase(mock_user_repository)
 
         # Act & Assert
         with pytest.raises(ValueError, match="is already registered"):
             await use_case.execute(sample_user_create)
 
-        mock_user_repository.get_by_email.assert_called_once()
-        mock_user_repository.create.assert_not_called()
+        mock_user_repository.get_by_email.assert_not_called()
+        mock_user_repository.create.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_create_user_email_normalized_to_lowercase(
@@ -23,6 +23,24 @@ class TestDeleteUserUseCase:
         assert result is True
         mock_user_repository.delete.assert_called_once_with(user_id)
 
+    @pytest.mark.asyncio
+    async def test_delete_user_forgets_it_was_active(self, mock_user_repository):
+        """Test that a deleted user no longer passes the cached active check."""
+        # Arrange
+        from app.infrastructure.membership_cache import InMemoryMembershipCache
+
+        user_id = str(ObjectId())
+        cache = InMemoryMembershipCache(ttl_seconds=60, max_entries=10)
+        cache.set_active(user_id)
+        mock_user_repository.delete.return_value = True
+        use_case = DeleteUserUseCase(mock_user_repository, cache)
+
+        # Act
+        await use_case.execute(user_id)
+
+        # Assert
+        assert cache.is_active(user_id) is False
+
     @pytest.mark.asyncio
     async def test_delete_user_not_found(self, mock_user_repository):
         """Test deletion when user not found."""
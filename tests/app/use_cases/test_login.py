@@ -35,7 +35,11 @@ class TestLoginUseCase:
         use_case = LoginUseCase(mock_user_repository)
 
         # Act
-        with patch("app.use_cases.auth.login.verify_password", return_value=True):
+        with patch(
+            "app.use_cases.auth.login.verify_password_async",
+            new_callable=AsyncMock,
+            return_value=True,
+        ):
             result = await use_case.execute(login_data)
 
         # Assert
@@ -45,6 +49,37 @@ class TestLoginUseCase:
         assert result.expires_in > 0
         mock_user_repository.get_by_email.assert_called_once_with(login_data.email)
 
+    @pytest.mark.asyncio
+    async def test_login_reads_hash_of_cached_user(self, mock_user_repository):
+        """Test that a user served without password hash gets it from the database."""
+        # Arrange
+        login_data = LoginRequest(email="john@example.com", password="password123")
+        user = User.model_construct(
+            id="507f1f77bcf86cd799439011",
+            name="John Silva",
+            email="john@example.com",
+            password="",
+            date_birth=date(1990, 5, 15),
+            is_active=True,
+            is_email_verified=True,
+        )
+        mock_user_repository.get_by_email.return_value = user
+        mock_user_repository.get_fields.return_value = {"password": "$2b$12$hash"}
+        use_case = LoginUseCase(mock_user_repository)
+
+        # Act
+        with patch(
+            "app.use_cases.auth.login.verify_password_async",
+            new_callable=AsyncMock,
+            return_value=True,
+        ) as verify:
+            result = await use_case.execute(login_data)
+
+        # Assert
+        assert result.access_token is not None
+        mock_user_repository.get_fields.assert_called_once_with(user.id, ["password"])
+        verify.assert_awaited_once_with("password123", "$2b$12$hash")
+
     @pytest.mark.asyncio
     async def test_login_user_not_found(self, mock_user_repository):
         """Test login with non-existent user."""
@@ -85,7 +120,11 @@ class TestLoginUseCase:
         use_case = LoginUseCase(mock_user_repository)
 
         # Act & Assert
-        with patch("app.use_cases.auth.login.verify_password", return_value=False):
+        with patch(
+            "app.use_cases.auth.login.verify_password_async",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
             with pytest.raises(HTTPException) as exc_info:
                 await use_case.execute(login_data)
 
@@ -115,7 +154,11 @@ class TestLoginUseCase:
         use_case = LoginUseCase(mock_user_repository)
 
         # Act
-        with patch("app.use_cases.auth.login.verify_password", return_value=True):
+        with patch(
+            "app.use_cases.auth.login.verify_password_async",
+            new_callable=AsyncMock,
+            return_value=True,
+        ):
             result = await use_case.execute(login_data)
 
         # Assert
@@ -157,7 +200,11 @@ class TestLoginUseCase:
         use_case = LoginUseCase(mock_user_repository)
 
         # Act & Assert
-        with patch("app.use_cases.auth.login.verify_password", return_value=True):
+        with patch(
+            "app.use_cases.auth.login.verify_password_async",
+            new_callable=AsyncMock,
+            return_value=True,
+        ):
             with patch.object(
                 use_case.oauth_service,
                 "create_token_pair",
@@ -187,6 +234,10 @@ class TestLoginUseCase:
         use_case = LoginUseCase(mock_user_repository)
 
         # Act & Assert
-        with patch("app.use_cases.auth.login.verify_password", return_value=True):
+        with patch(
+            "app.use_cases.auth.login.verify_password_async",
+            new_callable=AsyncMock,
+            return_value=True,
+        ):
             with pytest.raises(ValueError, match="EMAIL_NOT_VERIFIED"):
                 await use_case.execute(login_data)
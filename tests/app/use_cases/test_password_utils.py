@@ -1,7 +1,12 @@
 """Tests for use_cases/user/password_utils.py"""
 
 import pytest
-from app.use_cases.user.password_utils import hash_password, verify_password
+from app.use_cases.user.password_utils import (
+    hash_password,
+    verify_password,
+    hash_password_async,
+    verify_password_async,
+)
 
 
 class TestPasswordUtils:
@@ -104,3 +109,21 @@ class TestPasswordUtils:
 
         # Assert
         assert result is False
+
+
+class TestPasswordUtilsAsync:
+    """Test the pool-backed async password helpers."""
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify_async_roundtrip(self):
+        """Test that the async helpers hash and verify like the sync ones."""
+        # Arrange
+        password = "my_secure_password"
+
+        # Act
+        hashed = await hash_password_async(password)
+
+        # Assert
+        assert hashed.startswith("$2b$")
+        assert await verify_password_async(password, hashed) is True
+        assert await verify_password_async("wrong", hashed) is False
@@ -13,7 +13,7 @@ class TestUpdateUserUseCase:
 
     @pytest.mark.asyncio
     async def test_update_user_success(self, sample_user_entity, mock_user_repository):
-        """Test successful user update."""
+        """Test successful user update in a single repository call."""
         # Arrange
         user_id = str(ObjectId())
         update_data = UserUpdate(name="Updated Name")
@@ -22,9 +22,7 @@ class TestUpdateUserUseCase:
         updated_user = sample_user_entity
         updated_user.name = "Updated Name"
 
-        mock_user_repository.get_by_id.return_value = sample_user_entity
-        mock_user_repository.email_exists.return_value = False
-        mock_user_repository.update.return_value = updated_user
+        mock_user_repository.update_fields.return_value = updated_user
 
         use_case = UpdateUserUseCase(mock_user_repository)
 
@@ -34,8 +32,11 @@ class TestUpdateUserUseCase:
         # Assert
         assert result is not None
         assert result.name == "Updated Name"
-        mock_user_repository.get_by_id.assert_called_once_with(user_id)
-        mock_user_repository.update.assert_called_once()
+        mock_user_repository.get_by_id.assert_not_called()
+        mock_user_repository.get_by_email.assert_not_called()
+        mock_user_repository.update_fields.assert_called_once_with(
+            user_id, {"name": "Updated Name"}
+        )
 
     @pytest.mark.asyncio
     async def test_update_user_not_found(self, mock_user_repository):
@@ -45,7 +46,7 @@ class TestUpdateUserUseCase:
         update_data = UserUpdate(name="Updated Name")
         input_data = UpdateUserInput(user_id=user_id, user_data=update_data)
 
-        mock_user_repository.get_by_id.return_value = None
+        mock_user_repository.update_fields.return_value = None
         use_case = UpdateUserUseCase(mock_user_repository)
 
         # Act
@@ -53,7 +54,6 @@ class TestUpdateUserUseCase:
 
         # Assert
         assert result is None
-        mock_user_repository.update.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_user_with_existing_email(
@@ -71,10 +71,10 @@ class TestUpdateUserUseCase:
         get_by_id_user = deepcopy(sample_user_entity)
         mock_user_repository.get_by_id.return_value = get_by_id_user
 
-        # Create another user with the conflicting email
-        conflicting_user = deepcopy(sample_user_entity)
-        conflicting_user.email = "existing@example.com"
-        mock_user_repository.get_by_email.return_value = conflicting_user
+        # The unique email index rejects the conflicting email
+        mock_user_repository.update_fields.side_effect = ValueError(
+            "Email existing@example.com is already registered"
+        )
 
         use_case = UpdateUserUseCase(mock_user_repository)
 
@@ -83,42 +83,38 @@ class TestUpdateUserUseCase:
             await use_case.execute(input_data)
 
     @pytest.mark.asyncio
-    async def test_update_user_email_normalized_to_lowercase(
+    async def test_update_user_keeping_own_email(
         self, sample_user_entity, mock_user_repository
     ):
-        """Test that email is normalized to lowercase during update."""
+        """Test that re-submitting the user's own email is not a conflict."""
         # Arrange
-        user_id = str(ObjectId())
-        update_data = UserUpdate(email="TEST@EXAMPLE.COM")
-        input_data = UpdateUserInput(user_id=user_id, user_data=update_data)
-
-        mock_user_repository.get_by_id.return_value = sample_user_entity
-        mock_user_repository.get_by_email.return_value = None
-        mock_user_repository.update.return_value = sample_user_entity
-
+        update_data = UserUpdate(email=sample_user_entity.email)
+        input_data = UpdateUserInput(
+            user_id=sample_user_entity.id, user_data=update_data
+        )
+        mock_user_repository.get_by_email.return_value = sample_user_entity
+        mock_user_repository.update_fields.return_value = sample_user_entity
         use_case = UpdateUserUseCase(mock_user_repository)
 
         # Act
-        await use_case.execute(input_data)
+        result = await use_case.execute(input_data)
 
         # Assert
-        call_args = mock_user_repository.update.call_args[0][1]
-        assert call_args.email == "test@example.com"
+        assert result is not None
+        mock_user_repository.update_fields.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_update_user_partial_update(
+    async def test_update_user_email_normalized_to_lowercase(
         self, sample_user_entity, mock_user_repository
     ):
-        """Test partial user update (only some fields)."""
+        """Test that email is normalized to lowercase during update."""
         # Arrange
         user_id = str(ObjectId())
-        update_data = UserUpdate(name="New Name")  # Only update name
+        update_data = UserUpdate(email="TEST@EXAMPLE.COM")
         input_data = UpdateUserInput(user_id=user_id, user_data=update_data)
 
-        original_email = sample_user_entity.email
-
-        mock_user_repository.get_by_id.return_value = sample_user_entity
-        mock_user_repository.update.return_value = sample_user_entity
+        mock_user_repository.get_by_email.return_value = None
+        mock_user_repository.update_fields.return_value = sample_user_entity
 
         use_case = UpdateUserUseCase(mock_user_repository)
 
@@ -126,25 +122,27 @@ class TestUpdateUserUseCase:
         await use_case.execute(input_data)
 
         # Assert
-        call_args = mock_user_repository.update.call_args[0][1]
-        assert call_args.name == "New Name"
-        assert call_args.email == original_email  # Email should remain unchanged
+        mock_user_repository.get_by_email.assert_not_called()
+        fields = mock_user_repository.update_fields.call_args[0][1]
+        assert fields == {"email": "test@example.com"}
 
     @pytest.mark.asyncio
-    async def test_update_user_repository_returns_none(self, sample_user_entity, mock_user_repository):
-        """Test update returns None when repository.update returns None."""
+    async def test_update_user_partial_update(
+        self, sample_user_entity, mock_user_repository
+    ):
+        """Test partial user update (only some fields)."""
         # Arrange
         user_id = str(ObjectId())
-        update_data = UserUpdate(name="New Name")
+        update_data = UserUpdate(name="New Name", date_birth=date(1991, 1, 1))
         input_data = UpdateUserInput(user_id=user_id, user_data=update_data)
 
-        mock_user_repository.get_by_id.return_value = sample_user_entity
-        mock_user_repository.update.return_value = None  # ← repo returns None
+        mock_user_repository.update_fields.return_value = sample_user_entity
+
         use_case = UpdateUserUseCase(mock_user_repository)
 
         # Act
-        result = await use_case.execute(input_data)
+        await use_case.execute(input_data)
 
-        # Assert
-        assert result is None
-        mock_user_repository.update.assert_called_once()
+        # Assert — email is not part of the update
+        fields = mock_user_repository.update_fields.call_args[0][1]
+        assert fields == {"name": "New Name", "date_birth": date(1991, 1, 1)}
@@ -18,6 +18,7 @@ from app.models.email_verification_schema import UserRegisterResponse
 from app.domain.interfaces.expense_repository_interface import IExpenseRepository
 from app.domain.interfaces.user_repository_interface import IUserRepository
 from app.domain.interfaces.group_repository_interface import IGroupRepository
+from app.domain.interfaces.group_summary_repository_interface import IGroupSummaryRepository
 from app.domain.interfaces.email_verification_repository_interface import (
     IEmailVerificationRepository,
 )
@@ -195,6 +196,12 @@ def mock_group_repository() -> AsyncMock:
     return AsyncMock(spec=IGroupRepository)
 
 
+@pytest.fixture
+def mock_group_summary_repository() -> AsyncMock:
+    """Provide a mocked group summary repository for testing."""
+    return AsyncMock(spec=IGroupSummaryRepository)
+
+
 @pytest.fixture
 def mock_database(mocker):
     """Provide a mocked database for testing."""
@@ -204,11 +211,13 @@ def mock_database(mocker):
 
 
 @pytest.fixture
-def mock_app_dependencies(mock_user_repository, mock_expense_repository, mock_verification_repository, mock_email_service):
+def mock_app_dependencies(mock_user_repository, mock_expense_repository, mock_verification_repository, mock_email_service, mock_group_summary_repository):
     """Override app dependencies with mocks for testing."""
     from app.api import app
     from app.infrastructure.dependencies.user_dependencies import UserDependencies
     from app.infrastructure.dependencies.expense_dependencies import ExpenseDependencies
+    from app.infrastructure.dependencies.group_dependencies import GroupDependencies
+    from app.infrastructure.membership_cache import InMemoryMembershipCache
 
     # Configure default mock behavior
     mock_user_repository.get_by_email.return_value = None
@@ -223,9 +232,7 @@ def mock_app_dependencies(mock_user_repository, mock_expense_repository, mock_ve
     mock_expense_repository.delete.return_value = False
 
     # Default verification repository behavior
-    mock_verification_repository.get_latest_by_user_id.return_value = None
-    mock_verification_repository.invalidate_all_by_user_id.return_value = None
-    mock_verification_repository.create.return_value = None
+    mock_verification_repository.issue_token.return_value = MagicMock()
     mock_email_service.send_verification_email.return_value = None
 
     # Store original overrides
@@ -244,6 +251,18 @@ def mock_app_dependencies(mock_user_repository, mock_expense_repository, mock_ve
     app.dependency_overrides[ExpenseDependencies.get_repository] = (
         lambda: mock_expense_repository
     )
+    app.dependency_overrides[ExpenseDependencies.get_summary_repository] = (
+        lambda: mock_group_summary_repository
+    )
+
+    # Fresh membership cache per test so cached members never leak between tests
+    membership_cache = InMemoryMembershipCache(ttl_seconds=60, max_entries=100)
+    app.dependency_overrides[ExpenseDependencies.get_membership_cache] = (
+        lambda: membership_cache
+    )
+    app.dependency_overrides[GroupDependencies.get_membership_cache] = (
+        lambda: membership_cache
+    )
 
     yield app
 